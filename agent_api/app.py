@@ -3,6 +3,7 @@ import os
 from flask import Flask
 
 from agent_api.helpers.health import readiness_probe
+from agent_api.helpers.heartbeats import HeartbeatBuffer
 from agent_api.routes import build_v1_routes
 from common.api.flask_ext.authentication import ServiceAccountAuth
 from common.api.flask_ext.config import Config
@@ -22,6 +23,7 @@ ExceptionHandling(app)
 Timing(app)
 Health(app, prefix=app.config["API_PREFIX"], readiness_callback=readiness_probe)
 DatabaseConnection(app)
+HeartbeatBuffer(app)
 ServiceAccountAuth(app)
 
 os.makedirs(app.instance_path, exist_ok=True)  # Ensure the instance folder exists
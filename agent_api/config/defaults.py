@@ -26,3 +26,6 @@ SERVICE_NAME: str = Service.AGENT_API.name
 
 MAX_REQUEST_BODY_SIZE: int = 102_400  # 100KB (100 * 1024)
 """HTTP request max body size in bytes."""
+
+AGENT_HEARTBEAT_FLUSH_INTERVAL_SECONDS: float = 5
+"""How often the agent heartbeats buffered by each worker are written to the database; 0 writes them immediately."""
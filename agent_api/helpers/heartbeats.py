@@ -0,0 +1,260 @@
+__all__ = ["HeartbeatBuffer", "update_or_create_agent"]
+
+import atexit
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Optional, Union, cast
+from uuid import UUID
+
+from flask import Flask, current_app
+from peewee import EXCLUDED, Case, DoesNotExist, Expression, Field, SqliteDatabase, chunked, fn
+
+from common.api.flask_ext.base_extension import BaseExtension
+from common.cache import TTLCache
+from common.constants import BATCH_SIZE
+from common.entities import DB, Agent
+from common.entities.agent import AgentStatus
+from common.peewee_extensions.fields import UTCTimestampField
+from conf import init_db
+
+LOG = logging.getLogger(__name__)
+
+EXTENSION_NAME = "heartbeat_buffer"
+
+KNOWN_AGENTS_CACHE_SIZE: int = 10_000
+"""Maximum number of agents whose version is remembered by each worker to detect changes."""
+
+KNOWN_AGENTS_CACHE_TTL_SECS: float = 3600
+"""How long the version of an agent is remembered; heartbeats of forgotten agents are written immediately."""
+
+AgentIdentity = tuple[UUID, str, str]
+"""The project id, key and tool identifying an agent."""
+
+
+@dataclass(frozen=True)
+class _Heartbeat:
+    key: str
+    tool: str
+    version: str
+    project: Union[str, UUID]
+    latest_heartbeat: datetime
+    latest_event_timestamp: Optional[datetime]
+
+
+def update_or_create_agent(
+    *,
+    key: str,
+    tool: str,
+    version: str,
+    project_id: Union[str, UUID],
+    latest_heartbeat: datetime,
+    latest_event_timestamp: Optional[datetime],
+) -> None:
+    try:
+        agent = Agent.select().where(Agent.key == key, Agent.tool == tool, Agent.project_id == project_id).get()
+    except DoesNotExist:
+        agent = Agent(
+            key=key,
+            tool=tool,
+            version=version,
+            project_id=project_id,
+            status=AgentStatus.ONLINE,
+            latest_heartbeat=latest_heartbeat,
+            latest_event_timestamp=latest_event_timestamp,
+        )
+        agent.save(force_insert=True)
+
+    agent.latest_heartbeat = cast(UTCTimestampField, latest_heartbeat)
+    # Only set if changed, so it doesn't always get flagged as "dirty"
+    if agent.version != version:
+        agent.version = version
+    if agent.latest_event_timestamp != latest_event_timestamp:
+        agent.latest_event_timestamp = cast(UTCTimestampField, latest_event_timestamp)
+    if agent.status != AgentStatus.ONLINE:
+        agent.status = AgentStatus.ONLINE
+    agent.save()
+
+
+def _incoming(field: Field) -> Expression:
+    """Refers to the value an upsert attempted to insert in the given column."""
+    if isinstance(DB.obj, SqliteDatabase):
+        return cast(Expression, getattr(EXCLUDED, field.column_name))
+    return cast(Expression, fn.VALUES(field))
+
+
+def _monotonic_upsert() -> dict[Field, Expression]:
+    """
+    Builds the updates of the agent heartbeats upsert, so that heartbeats never move an agent back in time.
+
+    Heartbeats of the same agent can reach different workers, and be flushed in any order. The version and the status
+    are taken from the incoming heartbeat only when it is newer than the stored one. MySQL assigns the columns in order,
+    each assignment seeing the previous ones, so the latest heartbeat must be updated last.
+    """
+    is_newer = Agent.latest_heartbeat.is_null() | (_incoming(Agent.latest_heartbeat) > Agent.latest_heartbeat)
+    return {
+        Agent.version: Case(None, [(is_newer, _incoming(Agent.version))], Agent.version),
+        Agent.status: Case(None, [(is_newer, _incoming(Agent.status))], Agent.status),
+        Agent.latest_event_timestamp: Case(
+            None,
+            [
+                (
+                    Agent.latest_event_timestamp.is_null()
+                    | (_incoming(Agent.latest_event_timestamp) > Agent.latest_event_timestamp),
+                    _incoming(Agent.latest_event_timestamp),
+                )
+            ],
+            Agent.latest_event_timestamp,
+        ),
+        Agent.latest_heartbeat: Case(None, [(is_newer, _incoming(Agent.latest_heartbeat))], Agent.latest_heartbeat),
+    }
+
+
+class HeartbeatBuffer(BaseExtension):
+    """
+    Absorbs the agent heartbeats of a worker process and writes them in bulk at a fixed interval.
+
+    Only the latest heartbeat of each agent is kept. The heartbeats of agents unknown to the worker and of agents
+    whose version changed are written immediately, so that new agents and upgrades show up at once. Buffered
+    heartbeats are written with an upsert that also brings the agent back ONLINE, in case the scheduler degraded it
+    in the meantime. The upsert never replaces a heartbeat with an older one.
+
+    The agent status check compares the latest heartbeat with the project's check interval, so the lag added by the
+    buffer must stay well below it. Heartbeats of projects whose check interval is not larger than the flush interval
+    are therefore written immediately too.
+
+    The flush interval is read from the `AGENT_HEARTBEAT_FLUSH_INTERVAL_SECONDS` configuration value; 0 disables the
+    buffer. Like `SharedKafkaProducer`, the buffer is tied to the process that created it so it is safe to use with
+    pre-forking servers. Pending heartbeats are flushed when the worker process exits. The `Config` plugin must be
+    added to the Flask app BEFORE this plugin.
+    """
+
+    def __init__(self, app: Optional[Flask] = None) -> None:
+        self._pending: dict[AgentIdentity, _Heartbeat] = {}
+        self._known_versions: TTLCache[AgentIdentity, str] = TTLCache(
+            max_size=KNOWN_AGENTS_CACHE_SIZE, ttl=KNOWN_AGENTS_CACHE_TTL_SECS
+        )
+        self._lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._stopped = threading.Event()
+        super().__init__(app)
+
+    @property
+    def flush_interval(self) -> float:
+        return float(self.app.config.get("AGENT_HEARTBEAT_FLUSH_INTERVAL_SECONDS", 0))
+
+    def record(
+        self,
+        *,
+        key: str,
+        tool: str,
+        version: str,
+        project_id: UUID,
+        latest_heartbeat: datetime,
+        latest_event_timestamp: Optional[datetime],
+        check_interval: float,
+    ) -> None:
+        """Buffer the heartbeat of an agent, or write it immediately when it cannot wait."""
+        identity = (project_id, key, tool)
+        flush_interval = self.flush_interval
+        if flush_interval <= 0 or check_interval <= flush_interval or self._known_versions.get(identity) != version:
+            with self._lock:
+                # An older heartbeat of the agent must not overwrite this one when flushed
+                self._pending.pop(identity, None)
+            update_or_create_agent(
+                key=key,
+                tool=tool,
+                version=version,
+                project_id=project_id,
+                latest_heartbeat=latest_heartbeat,
+                latest_event_timestamp=latest_event_timestamp,
+            )
+            self._known_versions.set(identity, version)
+            return
+
+        self._ensure_flusher()
+        with self._lock:
+            self._pending[identity] = _Heartbeat(
+                key=key,
+                tool=tool,
+                version=version,
+                project=project_id,
+                latest_heartbeat=latest_heartbeat,
+                latest_event_timestamp=latest_event_timestamp,
+            )
+
+    def flush(self) -> int:
+        """Write the buffered heartbeats, returning how many were written."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        conflict_kwargs: dict[str, object] = {"update": _monotonic_upsert()}
+        if isinstance(DB.obj, SqliteDatabase):  # Sqlite requires setting a conflict_target
+            conflict_kwargs["conflict_target"] = [Agent.key, Agent.tool, Agent.project]
+        try:
+            with DB.atomic():
+                for batch in chunked(pending.values(), BATCH_SIZE):
+                    Agent.insert_many(
+                        [{**asdict(heartbeat), "status": AgentStatus.ONLINE} for heartbeat in batch]
+                    ).on_conflict(**conflict_kwargs).execute()
+        except Exception:
+            LOG.exception("Error writing %s agent heartbeats", len(pending))
+            with self._lock:
+                # Keep the heartbeats for the next flush, unless newer ones were received meanwhile
+                for identity, heartbeat in pending.items():
+                    self._pending.setdefault(identity, heartbeat)
+            return 0
+        LOG.debug("Wrote %s agent heartbeats", len(pending))
+        return len(pending)
+
+    def _ensure_flusher(self) -> None:
+        pid = os.getpid()
+        if self._flusher is None or self._pid != pid:
+            with self._lock:
+                if self._flusher is None or self._pid != pid:
+                    # Threads do not survive a fork, and the heartbeats buffered by the parent process are its own
+                    self._pending.clear()
+                    self._stopped.clear()
+                    self._flusher = threading.Thread(
+                        target=self._flush_periodically, name="heartbeat-flusher", daemon=True
+                    )
+                    self._flusher.start()
+                    self._pid = pid
+
+    def _flush_periodically(self) -> None:
+        while not self._stopped.wait(self.flush_interval):
+            self._flush_with_connection()
+
+    def _flush_with_connection(self) -> None:
+        try:
+            init_db()
+            self.flush()
+        except Exception:
+            LOG.exception("Error flushing the agent heartbeats")
+        finally:
+            try:
+                DB.close()
+            except Exception:
+                pass  # It probably wasn't open
+
+    def shutdown(self) -> None:
+        self._stopped.set()
+        if self._flusher is not None and self._pid == os.getpid():
+            self._flusher.join()
+            self._flush_with_connection()
+        self._flusher = None
+        self._pid = None
+
+    @staticmethod
+    def get_buffer() -> "HeartbeatBuffer":
+        """Returns the heartbeat buffer of the current app."""
+        return cast(HeartbeatBuffer, current_app.extensions[EXTENSION_NAME])
+
+    def init_app(self) -> None:
+        self.app.extensions[EXTENSION_NAME] = self
+        atexit.register(self.shutdown)
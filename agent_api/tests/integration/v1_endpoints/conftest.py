@@ -6,6 +6,7 @@ import pytest
 from flask import Flask
 
 from agent_api.config.defaults import API_PREFIX
+from agent_api.helpers.heartbeats import HeartbeatBuffer
 from agent_api.routes import build_v1_routes
 from common.api.flask_ext.authentication import ServiceAccountAuth
 from common.api.flask_ext.config import Config
@@ -36,13 +37,20 @@ def flask_app():
     build_v1_routes(app, prefix=API_PREFIX)
     Config(app, config_module="agent_api.config")
     app.config["DEBUG"] = True
+    heartbeat_buffer = HeartbeatBuffer(app)
     Health(app, prefix=API_PREFIX, readiness_callback=lambda: None)
     ServiceAccountAuth(app)
 
     yield app
+    heartbeat_buffer.shutdown()
     shutil.rmtree(app.instance_path, ignore_errors=True)
 
 
+@pytest.fixture
+def heartbeat_buffer(flask_app):
+    return flask_app.extensions["heartbeat_buffer"]
+
+
 @pytest.fixture
 def database_ctx(flask_app):
     company = Company.create(name="ExampleCompany")
@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
 
 import pytest
@@ -34,7 +34,7 @@ def test_agent_heartbeat_no_event_timestamp(client, database_ctx, headers):
 
 
 @pytest.mark.integration
-def test_agent_heartbeat_update(client, database_ctx, headers):
+def test_agent_heartbeat_update(client, database_ctx, headers, heartbeat_buffer):
     last_event_timestamp = datetime(2023, 10, 20, 4, 42, 42, tzinfo=timezone.utc)
     data = {
         "key": "test-key",
@@ -52,9 +52,10 @@ def test_agent_heartbeat_update(client, database_ctx, headers):
     assert agent_1.latest_heartbeat < now
     assert agent_1.status == AgentStatus.ONLINE
 
-    # We hit the API again so now latest_event_timestamp should be newer than "now"
+    # We hit the API again so now latest_event_timestamp should be newer than "now" once the buffer is flushed
     response_2 = client.post("/agent/v1/heartbeat", json=data, headers=headers)
     assert HTTPStatus.NO_CONTENT == response_2.status_code, response_2.json
+    assert heartbeat_buffer.flush() == 1
     agent_2 = Agent.select().get()
     assert agent_2.latest_heartbeat > now
     assert agent_2.status == AgentStatus.ONLINE
@@ -89,3 +90,96 @@ def test_agent_heartbeat_existing_update(client, database_ctx, headers):
     assert agent_2.latest_heartbeat is not None
     assert agent_1.latest_event_timestamp is not None
     assert agent_1.version != agent_2.version, "Expected agent version to change"
+
+
+@pytest.mark.integration
+def test_agent_heartbeat_buffered(client, database_ctx, headers, heartbeat_buffer):
+    data = {"key": "test-key", "tool": "test-tool", "version": "0.1.0"}
+    client.post("/agent/v1/heartbeat", json=data, headers=headers)
+    agent_1 = Agent.select().get()
+    Agent.update(status=AgentStatus.OFFLINE).execute()
+
+    event_timestamp = datetime(2023, 10, 20, 4, 42, 42, tzinfo=timezone.utc)
+    for _ in range(3):
+        response = client.post(
+            "/agent/v1/heartbeat", json={**data, "latest_event_timestamp": event_timestamp.isoformat()}, headers=headers
+        )
+        assert HTTPStatus.NO_CONTENT == response.status_code, response.json
+    assert Agent.select().get().latest_heartbeat == agent_1.latest_heartbeat
+
+    assert heartbeat_buffer.flush() == 1
+    assert heartbeat_buffer.flush() == 0
+    agent_2 = Agent.select().get()
+    assert agent_2.id == agent_1.id
+    assert agent_2.latest_heartbeat > agent_1.latest_heartbeat
+    assert agent_2.latest_event_timestamp == event_timestamp
+    assert agent_2.status == AgentStatus.ONLINE
+
+
+@pytest.mark.integration
+def test_agent_heartbeat_version_change_not_buffered(client, database_ctx, headers, heartbeat_buffer):
+    data = {"key": "test-key", "tool": "test-tool", "version": "0.1.0"}
+    client.post("/agent/v1/heartbeat", json=data, headers=headers)
+    client.post("/agent/v1/heartbeat", json=data, headers=headers)
+
+    client.post("/agent/v1/heartbeat", json={**data, "version": "0.2.0"}, headers=headers)
+
+    assert Agent.select().get().version == "0.2.0"
+    assert heartbeat_buffer.flush() == 0
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("flush_interval", (0, 300, 600))
+def test_agent_heartbeat_not_buffered(flask_app, client, database_ctx, headers, heartbeat_buffer, flush_interval):
+    flask_app.config["AGENT_HEARTBEAT_FLUSH_INTERVAL_SECONDS"] = flush_interval
+    database_ctx.project.agent_check_interval = 300
+    database_ctx.project.save()
+    data = {"key": "test-key", "tool": "test-tool", "version": "0.1.0"}
+    client.post("/agent/v1/heartbeat", json=data, headers=headers)
+    Agent.update(latest_heartbeat=datetime.now(timezone.utc) - timedelta(hours=1)).execute()
+
+    client.post("/agent/v1/heartbeat", json=data, headers=headers)
+
+    assert Agent.select().get().latest_heartbeat > datetime.now(timezone.utc) - timedelta(minutes=1)
+    assert heartbeat_buffer.flush() == 0
+
+
+@pytest.mark.integration
+def test_agent_heartbeat_flush_keeps_newer_heartbeat(client, database_ctx, headers, heartbeat_buffer):
+    data = {"key": "test-key", "tool": "test-tool", "version": "0.1.0"}
+    client.post("/agent/v1/heartbeat", json=data, headers=headers)
+    newer = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(minutes=1)
+    Agent.update(
+        version="0.2.0", status=AgentStatus.UNHEALTHY, latest_heartbeat=newer, latest_event_timestamp=newer
+    ).execute()
+
+    # A heartbeat which took longer to reach another worker is flushed afterwards
+    heartbeat_buffer.record(
+        key="test-key",
+        tool="test-tool",
+        version="0.1.0",
+        project_id=database_ctx.project.id,
+        latest_heartbeat=newer - timedelta(seconds=30),
+        latest_event_timestamp=newer - timedelta(seconds=30),
+        check_interval=database_ctx.project.agent_check_interval,
+    )
+    assert heartbeat_buffer.flush() == 1
+
+    agent = Agent.select().get()
+    assert agent.latest_heartbeat == newer
+    assert agent.latest_event_timestamp == newer
+    assert agent.version == "0.2.0"
+    assert agent.status == AgentStatus.UNHEALTHY
+
+
+@pytest.mark.integration
+def test_agent_heartbeat_flush_sets_missing_event_timestamp(client, database_ctx, headers, heartbeat_buffer):
+    data = {"key": "test-key", "tool": "test-tool", "version": "0.1.0"}
+    client.post("/agent/v1/heartbeat", json=data, headers=headers)
+    event_timestamp = datetime(2023, 10, 20, 4, 42, 42, tzinfo=timezone.utc)
+
+    client.post(
+        "/agent/v1/heartbeat", json={**data, "latest_event_timestamp": event_timestamp.isoformat()}, headers=headers
+    )
+    assert heartbeat_buffer.flush() == 1
+    assert Agent.select().get().latest_event_timestamp == event_timestamp
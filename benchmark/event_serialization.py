@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from unittest.mock import patch
+from uuid import uuid4
+
+import pyperf
+
+from cli.entry_points.gen_events import EVENTS_MAP
+from cli.entry_points.loadgen import build_event
+from common.events.v1 import Event
+from common.kafka.topic import TOPIC_IDENTIFIED_EVENTS, ProduceMessageArgs
+from conf import settings
+
+# Compares the time it takes to serialize and deserialize the v1 events through the events topics, as JSON validated
+# by the event schemas and as msgpack. The events are shaped as the run manager produces them to the identified
+# events topic, with their ids set.
+
+
+class FakeMessage:
+    """Stands in for the confluent_kafka Message, which cannot be instantiated."""
+
+    def __init__(self, args: ProduceMessageArgs) -> None:
+        self._value = args.value
+        self._headers = [(k, v.encode("utf-8")) for k, v in args.headers.items()]
+
+    def value(self) -> bytes:
+        return self._value
+
+    def headers(self) -> list[tuple[str, bytes]]:
+        return self._headers
+
+    def topic(self) -> str:
+        return TOPIC_IDENTIFIED_EVENTS.name
+
+    def partition(self) -> int:
+        return 0
+
+    def offset(self) -> int:
+        return 0
+
+    def key(self) -> None:
+        return None
+
+
+def make_event(name: str) -> Event:
+    _, payload = build_event(name, "P1", "R1", "benchmark")
+    event = EVENTS_MAP[name].event_type.as_event_from_request(payload)
+    event.project_id = uuid4()
+    event.pipeline_id = uuid4()
+    event.run_id = uuid4()
+    event.task_id = uuid4()
+    event.run_task_id = uuid4()
+    return event
+
+
+def serialize(event: Event, binary: bool) -> Callable[[int], float]:
+    def inner(loops: int) -> float:
+        with patch.object(settings, "KAFKA_BINARY_V1_EVENTS", binary):
+            t0 = pyperf.perf_counter()
+            for _ in range(loops):
+                TOPIC_IDENTIFIED_EVENTS.serialize(event)
+            return pyperf.perf_counter() - t0
+
+    return inner
+
+
+def deserialize(event: Event, binary: bool) -> Callable[[int], float]:
+    with patch.object(settings, "KAFKA_BINARY_V1_EVENTS", binary):
+        message = FakeMessage(TOPIC_IDENTIFIED_EVENTS.serialize(event))
+
+    def inner(loops: int) -> float:
+        t0 = pyperf.perf_counter()
+        for _ in range(loops):
+            TOPIC_IDENTIFIED_EVENTS.deserialize(message)
+        return pyperf.perf_counter() - t0
+
+    return inner
+
+
+if __name__ == "__main__":
+    runner = pyperf.Runner()
+    runner.metadata["description"] = "Time to serialize and deserialize one v1 event through the events topics"
+    for name in EVENTS_MAP:
+        event = make_event(name)
+        for binary, wire_format in ((False, "json"), (True, "msgpack")):
+            runner.bench_time_func(f"{name}-{wire_format}-serialize", serialize(event, binary))
+            runner.bench_time_func(f"{name}-{wire_format}-deserialize", deserialize(event, binary))
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from uuid import uuid4
+
+import pyperf
+from peewee import BigIntegerField, Model, SqliteDatabase, TextField, UUIDField
+
+from common.peewee_extensions.fields import TimeOrderedUUIDField
+from common.uuid_utils import uuid7
+
+# Compares the insert throughput and the size of the tables keyed by random UUIDs stored as hex, which is how most
+# entities are stored, with time-ordered UUIDs stored as hex and as 16 bytes. SQLite WITHOUT ROWID tables are used as a
+# stand-in for InnoDB: the rows are stored in the primary key index and the secondary indexes embed the primary key.
+
+ROWS = 50_000
+BATCH_SIZE = 1_000
+PAYLOAD = "x" * 100
+
+# A file database with a page cache much smaller than the table, so that scattered inserts have to read and write
+# pages, as they do in a production database which doesn't fit in memory.
+DB_PATH = os.path.join(tempfile.gettempdir(), "observability_primary_keys.db")
+DB = SqliteDatabase(DB_PATH, pragmas={"cache_size": -1024, "journal_mode": "off", "synchronous": "off"})
+
+
+class BaseEvent(Model):
+    created_timestamp = BigIntegerField(index=True)
+    payload = TextField()
+
+    class Meta:
+        database = DB
+        without_rowid = True
+
+
+class RandomHexEvent(BaseEvent):
+    id = UUIDField(primary_key=True, default=uuid4)
+
+
+class OrderedHexEvent(BaseEvent):
+    id = UUIDField(primary_key=True, default=uuid7)
+
+
+class OrderedBinaryEvent(BaseEvent):
+    id = TimeOrderedUUIDField(primary_key=True)
+
+
+MODELS = (RandomHexEvent, OrderedHexEvent, OrderedBinaryEvent)
+
+
+def insert_rows(model: type[BaseEvent]) -> None:
+    for start in range(0, ROWS, BATCH_SIZE):
+        rows = [
+            {"id": model.id.default(), "created_timestamp": ts, "payload": PAYLOAD}
+            for ts in range(start, start + BATCH_SIZE)
+        ]
+        with DB.atomic():
+            model.insert_many(rows).execute()
+
+
+@contextmanager
+def empty_table(model: type[BaseEvent]) -> Iterator[None]:
+    if os.path.exists(DB_PATH):
+        os.remove(DB_PATH)
+    DB.connect()
+    DB.create_tables([model])
+    try:
+        yield
+    finally:
+        DB.close()
+        os.remove(DB_PATH)
+
+
+def table_size(model: type[BaseEvent]) -> int:
+    """Size in bytes of the table, which is the primary key index, and of its secondary index."""
+    with empty_table(model):
+        insert_rows(model)
+        page_size = DB.execute_sql("PRAGMA page_size").fetchone()[0]
+        return int(DB.execute_sql("PRAGMA page_count").fetchone()[0] * page_size)
+
+
+def bench_inserts(model: type[BaseEvent]) -> Callable[[int], float]:
+    def inner(loops: int) -> float:
+        elapsed = 0.0
+        for _ in range(loops):
+            with empty_table(model):
+                t0 = pyperf.perf_counter()
+                insert_rows(model)
+                elapsed += pyperf.perf_counter() - t0
+        return elapsed
+
+    return inner
+
+
+if __name__ == "__main__":
+    runner = pyperf.Runner()
+    runner.metadata["description"] = f"Insert {ROWS} rows keyed by each primary key strategy"
+    for model in MODELS:
+        runner.bench_time_func(f"insert_{model.__name__}", bench_inserts(model))
+
+    if not runner.args.worker:
+        for model in MODELS:
+            print(f"size_{model.__name__}: {table_size(model) / 1024:.0f} KiB")
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from types import SimpleNamespace
+
+import pyperf
+
+from common.entities import RunState
+from common.predicate_engine.compilers.simple_v1 import compile_simple_v1_schema
+from common.predicate_engine.query import R, compile_rule
+
+# Compares the evaluation of the rules of a journey by interpreting the R trees, which rebuilds the predicates for
+# every event, with evaluators compiled once per rule by `compile_rule`. The events and the database namespace are
+# plain objects, so that only the cost of the predicate engine itself is measured.
+
+RULES_DATA = (
+    {
+        "when": "all",
+        "conditions": [{"message_log": {"level": ["ERROR", "WARNING"], "matches": r"(?i)timeout|refused"}}],
+    },
+    {"when": "all", "conditions": [{"metric_log": {"key": "row_count", "operator": "lt", "static_value": 100}}]},
+    {"when": "any", "conditions": [{"task_status": {"matches": "FAILED"}}, {"task_status": {"matches": "WARNING"}}]},
+    {
+        "when": "all",
+        "conditions": [
+            {
+                "run_state": {
+                    "matches": RunState.FAILED,
+                    "count": 3,
+                    "group_run_name": False,
+                    "trigger_successive": True,
+                }
+            }
+        ],
+    },
+)
+
+EVENTS = (
+    SimpleNamespace(
+        log_level="ERROR", message="Connection refused by host", metric_key=None, metric_value=None, task_key=None
+    ),
+    SimpleNamespace(log_level=None, message=None, metric_key="row_count", metric_value=42, task_key=None),
+    SimpleNamespace(status="FAILED", run_key="R1", task_key="T1", log_level=None, message=None, metric_value=None),
+    SimpleNamespace(status="COMPLETED", run_key="R1", task_key=None, log_level=None, message=None, metric_value=None),
+)
+
+
+class FakeQuery(list):
+    def limit(self, limit: int) -> FakeQuery:
+        return FakeQuery(self[:limit])
+
+
+class FakeDatabase:
+    @property
+    def runs(self) -> FakeQuery:
+        return FakeQuery(SimpleNamespace(status="FAILED") for _ in range(5))
+
+
+RULES: tuple[R, ...] = tuple(compile_simple_v1_schema(rule_data) for rule_data in RULES_DATA)
+DATA = tuple(SimpleNamespace(event=event, database=FakeDatabase()) for event in EVENTS)
+EVALUATIONS = len(RULES) * len(DATA)
+
+
+def bench(predicates: tuple[Callable[[object], bool], ...]) -> Callable[[int], float]:
+    def inner(loops: int) -> float:
+        t0 = pyperf.perf_counter()
+        for _ in range(loops):
+            for data in DATA:
+                for predicate in predicates:
+                    predicate(data)
+        return pyperf.perf_counter() - t0
+
+    return inner
+
+
+if __name__ == "__main__":
+    runner = pyperf.Runner()
+    runner.metadata["description"] = f"Time per evaluation of {len(RULES)} rules against {len(DATA)} events"
+    runner.bench_time_func("interpreted", bench(tuple(r.matches for r in RULES)), inner_loops=EVALUATIONS)
+    runner.bench_time_func("compiled", bench(tuple(compile_rule(r) for r in RULES)), inner_loops=EVALUATIONS)
@@ -46,7 +46,9 @@ modules: tuple[str, ...] = (
     "cli.entry_points.gen_events",
     "cli.entry_points.graph_schema",
     "cli.entry_points.load_fixture",
+    "cli.entry_points.loadgen",
     "cli.entry_points.migration_check",
+    "cli.entry_points.rebuild_summaries",
     "cli.entry_points.service_account_key",
     "cli.entry_points.shell",
     "cli.entry_points.init",
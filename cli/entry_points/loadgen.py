@@ -0,0 +1,380 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from argparse import ArgumentParser, ArgumentTypeError
+from collections import Counter
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from itertools import count
+from math import ceil
+from typing import Any, Optional
+from uuid import uuid4
+
+from requests_extensions import get_session
+
+from cli.base import ScriptBase
+from cli.entry_points.gen_events import EVENTS_MAP, SA_KEY_ENV_NAME
+from common.api.flask_ext.authentication import ServiceAccountAuth
+from common.kafka import TOPIC_IDENTIFIED_EVENTS, KafkaConsumer
+
+LOG = logging.getLogger(__name__)
+
+LOADGEN_METADATA_KEY = "loadgen_id"
+"""Key of the event metadata used to match the identified events with the sent ones"""
+
+TAIL_READY_TIMEOUT = 30.0
+"""Seconds to wait for the identified events consumer to be assigned its partitions"""
+
+
+def _v2_component(pipeline: str, run_key: str) -> dict[str, Any]:
+    return {"batch_pipeline": {"batch_key": pipeline, "run_key": run_key}}
+
+
+V2_EVENTS_MAP: dict[str, tuple[str, Callable[[str, str], dict[str, Any]]]] = {
+    "message-v2": (
+        "message-log",
+        lambda pipeline, run_key: {
+            "component": _v2_component(pipeline, run_key),
+            "log_entries": [{"level": "INFO", "message": "a log message"}],
+        },
+    ),
+    "metric-v2": (
+        "metric-log",
+        lambda pipeline, run_key: {
+            "component": _v2_component(pipeline, run_key),
+            "metric_entries": [{"key": "a key", "value": 10}],
+        },
+    ),
+    "testoutcomes-v2": (
+        "test-outcomes",
+        lambda pipeline, run_key: {
+            "component": _v2_component(pipeline, run_key),
+            "test_outcomes": [{"name": "test name", "status": "PASSED"}],
+        },
+    ),
+    "runstatus-v2": (
+        "batch-pipeline-status",
+        lambda pipeline, run_key: {
+            "batch_pipeline_component": {"batch_key": pipeline, "run_key": run_key},
+            "status": "RUNNING",
+        },
+    ),
+}
+"""The v2 event types, mapped to their endpoint and to a function building their payload"""
+
+EVENT_TYPES: tuple[str, ...] = (*EVENTS_MAP.keys(), *V2_EVENTS_MAP.keys())
+
+
+def build_event(name: str, pipeline: str, run_key: str, loadgen_id: str) -> tuple[str, dict[str, Any]]:
+    """Return the endpoint path and the payload of an event of the given type."""
+    metadata = {LOADGEN_METADATA_KEY: loadgen_id}
+    if name in V2_EVENTS_MAP:
+        endpoint, build_payload = V2_EVENTS_MAP[name]
+        payload = build_payload(pipeline, run_key)
+        payload["event_timestamp"] = datetime.now(tz=timezone.utc).isoformat()
+        payload["metadata"] = metadata
+        return f"events/v2/{endpoint}", payload
+    event = EVENTS_MAP[name]({"run_key": run_key, "metadata": metadata}, [])
+    return f"{event.base_endpoint}/{event.endpoint}", event.get_data(pipeline)
+
+
+def mix_item(value: str) -> tuple[str, int]:
+    """Parse a `<event type>=<weight>` command line argument."""
+    name, _, weight = value.partition("=")
+    if name not in EVENT_TYPES:
+        raise ArgumentTypeError(f"Unknown event type '{name}'; expected one of {', '.join(EVENT_TYPES)}")
+    try:
+        parsed_weight = int(weight) if weight else 1
+    except ValueError as e:
+        raise ArgumentTypeError(f"Invalid weight '{weight}' for '{name}'") from e
+    if parsed_weight < 0:
+        raise ArgumentTypeError(f"Invalid weight '{weight}' for '{name}'")
+    return name, parsed_weight
+
+
+def make_schedule(mix: Sequence[tuple[str, int]]) -> list[str]:
+    """
+    Spread the event types over a cycle according to their weights, so that any window of the load has roughly the
+    requested mix. The i-th event sent is of type `schedule[i % len(schedule)]`.
+    """
+    total = sum(weight for _, weight in mix)
+    if total == 0:
+        raise ValueError("At least one event type needs a positive weight")
+    slots: list[tuple[float, str]] = []
+    for name, weight in mix:
+        slots.extend(((i + 0.5) / weight, name) for i in range(weight))
+    return [name for _, name in sorted(slots, key=lambda s: s[0])]
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of the values, which must be sorted."""
+    if not values:
+        return float("nan")
+    return values[max(ceil(pct / 100 * len(values)) - 1, 0)]
+
+
+@dataclass
+class LoadResults:
+    """What happened to the sent events, updated concurrently by the senders and the identified events tail"""
+
+    accept_latencies: list[float] = field(default_factory=list)
+    errors: Counter[str] = field(default_factory=Counter)
+    accepted: dict[str, float] = field(default_factory=dict)
+    """Scheduled time of the accepted events, by loadgen id"""
+    identified: dict[str, float] = field(default_factory=dict)
+    """Time the events were read from the identified events topic, by loadgen id"""
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add_response(self, loadgen_id: str, scheduled: float, status: Optional[str]) -> None:
+        latency = time.monotonic() - scheduled
+        with self.lock:
+            if status is None:
+                self.accept_latencies.append(latency)
+                self.accepted[loadgen_id] = scheduled
+            else:
+                self.errors[status] += 1
+
+    def add_identified(self, loadgen_id: str) -> None:
+        received = time.monotonic()
+        with self.lock:
+            self.identified.setdefault(loadgen_id, received)
+
+    @property
+    def pending(self) -> int:
+        with self.lock:
+            return len(self.accepted.keys() - self.identified.keys())
+
+    def pipeline_latencies(self) -> list[float]:
+        with self.lock:
+            return sorted(
+                received - self.accepted[loadgen_id]
+                for loadgen_id, received in self.identified.items()
+                if loadgen_id in self.accepted
+            )
+
+
+class IdentifiedEventsTail:
+    """Reads the identified events topic in a background thread, recording when the sent events get there."""
+
+    def __init__(self, results: LoadResults) -> None:
+        self.results = results
+        self.consumer = KafkaConsumer(
+            {
+                "group.id": f"loadgen-{uuid4()}",
+                "auto.offset.reset": "latest",
+                "enable.auto.commit": False,
+            },
+            [TOPIC_IDENTIFIED_EVENTS],
+        )
+        self.ready = threading.Event()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="loadgen-tail", daemon=True)
+
+    def start(self) -> bool:
+        """Start tailing, returning whether the consumer was assigned its partitions in time."""
+        self.thread.start()
+        return self.ready.wait(TAIL_READY_TIMEOUT)
+
+    def stop(self) -> None:
+        self.stopped.set()
+        self.thread.join()
+
+    def _run(self) -> None:
+        self.consumer.connect()
+        try:
+            while not self.stopped.is_set():
+                message = self.consumer.poll()
+                if not self.ready.is_set() and self.consumer.consumer.assignment():
+                    self.ready.set()
+                if message is None:
+                    continue
+                metadata = getattr(message.payload, "metadata", None) or {}
+                if loadgen_id := metadata.get(LOADGEN_METADATA_KEY):
+                    self.results.add_identified(loadgen_id)
+        except Exception:
+            LOG.exception("#r<\u2718> Error reading the identified events")
+        finally:
+            self.consumer.disconnect()
+
+
+class LoadGen(ScriptBase):
+    """Generate a sustained load of events to the Event API and measure its latency"""
+
+    subcommand: str = "loadgen"
+
+    @staticmethod
+    def args(parser: ArgumentParser) -> None:
+        parser.description = "Send a load of events to the Event API and report the throughput and latency"
+        parser.usage = """$ cli loadgen [URL] [SA KEY] [OPTIONS]
+
+        Send events of a configurable mix of types, spread over synthetic pipelines and runs, at a target rate
+        using a pool of concurrent senders. The throughput and the latency of the HTTP requests are reported.
+
+        With --tail, the identified events topic is also read to report the latency from the event being sent to
+        it being identified by the run manager. Kafka connection settings are read from the environment.
+
+        The latencies are measured from the time each event was scheduled to be sent, so that senders falling
+        behind the target rate show up as latency rather than as a lower rate.
+
+        Examples:
+        # Send 100 events per second for a minute, with 20 senders
+        cli loadgen <base URL> <SA key> --rate 100 --duration 60 --concurrency 20
+
+        # Send mostly v2 message logs, to two projects, and measure the ingestion latency
+        cli loadgen <base URL> --key <SA key 1> --key <SA key 2> --mix message-v2=8 runstatus-v2=1 --tail
+        """
+        parser.add_argument("URL", help="event API URL e.g. 'http://localhost:5001'")
+        parser.add_argument(
+            "SA KEY", nargs="?", help=f"Service account key, or use environment variable {SA_KEY_ENV_NAME}"
+        )
+        parser.add_argument(
+            "-k",
+            "--key",
+            dest="keys",
+            action="append",
+            default=[],
+            help="Service account key of an additional project; the pipelines are spread over the projects",
+        )
+        parser.add_argument(
+            "-m",
+            "--mix",
+            nargs="+",
+            type=mix_item,
+            default=[(name, 1) for name in EVENTS_MAP],
+            help=f"Event types to send, as <type>[=<weight>]. Types: {', '.join(EVENT_TYPES)}. Default: all v1 types",
+        )
+        parser.add_argument("-r", "--rate", type=float, default=0, help="Target events per second; 0 for no limit")
+        parser.add_argument("-d", "--duration", type=float, default=10, help="Seconds to send events for")
+        parser.add_argument("-n", "--count", type=int, default=None, help="Stop after sending this many events")
+        parser.add_argument("-c", "--concurrency", type=int, default=10, help="Number of concurrent senders")
+        parser.add_argument("--pipelines", type=int, default=10, help="Number of synthetic pipelines")
+        parser.add_argument("--runs", type=int, default=5, help="Number of synthetic runs per pipeline")
+        parser.add_argument(
+            "--tail", action="store_true", help="Measure the latency until the events are identified by run manager"
+        )
+        parser.add_argument(
+            "--tail-timeout",
+            type=float,
+            default=30,
+            help="Seconds to wait for the sent events to be identified after the last one was sent",
+        )
+
+    def subcmd_entry_point(self) -> None:
+        self.url = self.kwargs["URL"].rstrip("/")
+        keys = [k for k in (self.kwargs["SA KEY"] or os.environ.get(SA_KEY_ENV_NAME),) if k] + self.kwargs["keys"]
+        if not keys:
+            LOG.error("#r<\u2718> A service account key is required")
+            return
+        self.keys = keys
+        self.schedule = make_schedule(self.kwargs["mix"])
+        self.rate: float = self.kwargs["rate"]
+        self.duration: float = self.kwargs["duration"]
+        self.count: Optional[int] = self.kwargs["count"]
+        self.pipelines: int = self.kwargs["pipelines"]
+        self.runs: int = self.kwargs["runs"]
+        self.token = uuid4().hex[:8]
+        self.results = LoadResults()
+        self._counter = count()
+        self._counter_lock = threading.Lock()
+        self._local = threading.local()
+
+        tail: Optional[IdentifiedEventsTail] = None
+        if self.kwargs["tail"]:
+            tail = IdentifiedEventsTail(self.results)
+            if not tail.start():
+                LOG.warning("#y<Identified events consumer not assigned after %ss>", TAIL_READY_TIMEOUT)
+
+        LOG.info(
+            "Sending #c<%s> to #c<%s> pipelines and #c<%s> projects with #c<%s> senders",
+            ", ".join(f"{name}={weight}" for name, weight in self.kwargs["mix"] if weight),
+            self.pipelines,
+            len(self.keys),
+            self.kwargs["concurrency"],
+        )
+        elapsed = self.send_events(self.kwargs["concurrency"])
+
+        if tail:
+            deadline = time.monotonic() + self.kwargs["tail_timeout"]
+            while self.results.pending and time.monotonic() < deadline:
+                time.sleep(0.1)
+            tail.stop()
+        self.report(elapsed, tail is not None)
+
+    def send_events(self, concurrency: int) -> float:
+        """Send the events with a pool of senders, returning how many seconds it took."""
+        self.start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="loadgen") as executor:
+            for future in [executor.submit(self._sender) for _ in range(concurrency)]:
+                future.result()
+        return time.monotonic() - self.start
+
+    def _next_event(self) -> Optional[tuple[int, float]]:
+        """Return the index and the scheduled time of the next event to send, or None when done."""
+        with self._counter_lock:
+            index = next(self._counter)
+        if self.count is not None and index >= self.count:
+            return None
+        scheduled = self.start + index / self.rate if self.rate else time.monotonic()
+        if scheduled - self.start >= self.duration:
+            return None
+        return index, scheduled
+
+    def _sender(self) -> None:
+        while next_event := self._next_event():
+            index, scheduled = next_event
+            if (delay := scheduled - time.monotonic()) > 0:
+                time.sleep(delay)
+            self.send_event(index, scheduled)
+
+    def send_event(self, index: int, scheduled: float) -> None:
+        if not hasattr(self._local, "session"):
+            self._local.session = get_session()
+        pipeline_index = index % self.pipelines
+        pipeline = f"loadgen-pipeline-{pipeline_index}"
+        run_key = f"loadgen-{self.token}-run-{(index // self.pipelines) % self.runs}"
+        loadgen_id = f"{self.token}-{index}"
+        path, payload = build_event(self.schedule[index % len(self.schedule)], pipeline, run_key, loadgen_id)
+        headers = {
+            "Content-Type": "application/json",
+            ServiceAccountAuth.header_name: self.keys[pipeline_index % len(self.keys)],
+        }
+        try:
+            response = self._local.session.post(f"{self.url}/{path}", headers=headers, json=payload)
+        except Exception as e:
+            LOG.debug("Error sending event %s: %s", loadgen_id, e)
+            self.results.add_response(loadgen_id, scheduled, e.__class__.__name__)
+        else:
+            self.results.add_response(loadgen_id, scheduled, None if response.ok else str(response.status_code))
+
+    def report(self, elapsed: float, tailed: bool) -> None:
+        results = self.results
+        accepted = len(results.accept_latencies)
+        LOG.info(
+            "Sent #c<%s> events in #c<%.1f>s: #c<%.1f> accepted/s",
+            accepted + sum(results.errors.values()),
+            elapsed,
+            accepted / elapsed if elapsed else 0,
+        )
+        for error, error_count in results.errors.most_common():
+            LOG.info("#r<%s> errors: #r<%s>", error, error_count)
+        self._report_latencies("HTTP accept", sorted(results.accept_latencies))
+        if tailed:
+            latencies = results.pipeline_latencies()
+            LOG.info("Identified #c<%s> of #c<%s> accepted events", len(latencies), accepted)
+            self._report_latencies("Ingest to identified", latencies)
+
+    @staticmethod
+    def _report_latencies(name: str, latencies: list[float]) -> None:
+        if not latencies:
+            return
+        LOG.info(
+            "%s latency: p50 #c<%.1f>ms, p95 #c<%.1f>ms, p99 #c<%.1f>ms, max #c<%.1f>ms",
+            name,
+            *(percentile(latencies, pct) * 1000 for pct in (50, 95, 99)),
+            latencies[-1] * 1000,
+        )
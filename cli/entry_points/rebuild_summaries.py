@@ -0,0 +1,35 @@
+import logging
+from argparse import ArgumentParser
+
+from cli.base import DatabaseScriptBase
+from cli.lib import uuid_type
+from common.entity_services import InstanceSummaryService
+
+LOG = logging.getLogger(__name__)
+
+
+class RebuildSummaries(DatabaseScriptBase):
+    """Recompute the run, test and alert summaries of the instances."""
+
+    subcommand: str = "rebuild-summaries"
+
+    @staticmethod
+    def args(parser: ArgumentParser) -> None:
+        parser.description = (
+            "Recompute the run, test and alert summaries of the instances from their runs, test outcomes and alerts. "
+            "The summaries are kept up to date while events are processed; rebuild them after deleting or changing "
+            "these entities by other means."
+        )
+        parser.usage = "$ cli rebuild-summaries [INSTANCE_ID]..."
+        parser.add_argument(
+            "INSTANCE_ID",
+            nargs="*",
+            type=uuid_type,
+            help="The ID of an instance to rebuild the summaries of. All the instances are rebuilt when omitted.",
+        )
+
+    def subcmd_entry_point(self) -> None:
+        instance_ids = self.kwargs.get("INSTANCE_ID") or None
+        LOG.info("#c<Rebuilding the instance summaries...>")
+        count = InstanceSummaryService.rebuild(instance_ids)
+        LOG.info("#g<\u2714> Rebuilt the summaries of #c<%s> instances", count)
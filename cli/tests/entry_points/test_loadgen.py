@@ -0,0 +1,128 @@
+from argparse import ArgumentTypeError
+from collections import Counter
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cli.entry_points.gen_events import EVENTS_MAP
+from cli.entry_points.loadgen import (
+    LOADGEN_METADATA_KEY,
+    V2_EVENTS_MAP,
+    LoadGen,
+    LoadResults,
+    build_event,
+    make_schedule,
+    mix_item,
+    percentile,
+)
+from common.api.flask_ext.authentication import ServiceAccountAuth
+from common.events.v2 import BatchPipelineStatusSchema, MessageLogSchema, MetricLogSchema, TestOutcomesSchema
+
+V2_SCHEMAS = {
+    "message-v2": MessageLogSchema,
+    "metric-v2": MetricLogSchema,
+    "testoutcomes-v2": TestOutcomesSchema,
+    "runstatus-v2": BatchPipelineStatusSchema,
+}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("name", EVENTS_MAP.keys())
+def test_build_event_v1(name):
+    path, payload = build_event(name, "P1", "R1", "id-1")
+
+    assert path == f"events/v1/{EVENTS_MAP[name].endpoint}"
+    event = EVENTS_MAP[name].event_type.as_event_from_request(payload)
+    assert event.pipeline_key == "P1"
+    assert event.run_key == "R1"
+    assert event.metadata == {LOADGEN_METADATA_KEY: "id-1"}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("name", V2_EVENTS_MAP.keys())
+def test_build_event_v2(name):
+    path, payload = build_event(name, "P1", "R1", "id-1")
+
+    assert path == f"events/v2/{V2_EVENTS_MAP[name][0]}"
+    event_payload = V2_SCHEMAS[name]().load(payload)
+    assert event_payload.metadata == {LOADGEN_METADATA_KEY: "id-1"}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    (("message", ("message", 1)), ("message-v2=3", ("message-v2", 3)), ("runstatus=0", ("runstatus", 0))),
+)
+def test_mix_item(value, expected):
+    assert mix_item(value) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("value", ("unknown=1", "message=a", "message=-1"))
+def test_mix_item_invalid(value):
+    with pytest.raises(ArgumentTypeError):
+        mix_item(value)
+
+
+@pytest.mark.unit
+def test_make_schedule():
+    schedule = make_schedule([("message", 3), ("metric", 1), ("runstatus", 0)])
+
+    assert schedule == ["message", "message", "metric", "message"]
+
+
+@pytest.mark.unit
+def test_make_schedule_no_weight():
+    with pytest.raises(ValueError):
+        make_schedule([("message", 0)])
+
+
+@pytest.mark.unit
+def test_percentile():
+    values = [float(v) for v in range(1, 101)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 100) == 100.0
+    assert percentile([1.0], 50) == 1.0
+
+
+@pytest.mark.unit
+def test_load_results_pipeline_latencies():
+    results = LoadResults()
+    results.accepted = {"a": 1.0, "b": 2.0, "c": 3.0}
+    results.identified = {"a": 1.5, "b": 4.0, "x": 9.0}
+
+    assert results.pending == 1
+    assert results.pipeline_latencies() == [0.5, 2.0]
+
+
+@pytest.mark.unit
+def test_loadgen_send_events():
+    session = Mock()
+    session.post.side_effect = [Mock(ok=True)] * 9 + [Mock(ok=False, status_code=503)]
+    loadgen = LoadGen(
+        URL="http://localhost:5001/",
+        keys=["key-1", "key-2"],
+        mix=[("message", 1), ("message-v2", 1)],
+        rate=0,
+        duration=10,
+        count=10,
+        concurrency=3,
+        pipelines=2,
+        runs=1,
+        tail=False,
+        tail_timeout=0,
+        **{"SA KEY": None},
+    )
+
+    with patch("cli.entry_points.loadgen.get_session", return_value=session):
+        loadgen.subcmd_entry_point()
+
+    assert session.post.call_count == 10
+    assert len(loadgen.results.accept_latencies) == 9
+    assert loadgen.results.errors == {"503": 1}
+    urls = Counter(call.args[0] for call in session.post.call_args_list)
+    assert urls == {"http://localhost:5001/events/v1/message-log": 5, "http://localhost:5001/events/v2/message-log": 5}
+    keys = Counter(call.kwargs["headers"][ServiceAccountAuth.header_name] for call in session.post.call_args_list)
+    assert keys == {"key-1": 5, "key-2": 5}
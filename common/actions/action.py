@@ -70,6 +70,15 @@ class BaseAction:
         if missing_args:
             raise ValueError(f"Required arguments {missing_args} missing for {self.__class__.__name__}")
 
+    @property
+    def destination(self) -> str:
+        """Identifies the external system the action talks to. Used to limit the concurrent calls to each system."""
+        return self.__class__.__name__
+
+    def is_retryable(self, action_result: ActionResult) -> bool:
+        """Tells whether a failed execution is likely to succeed if attempted again."""
+        return False
+
     def _run(self, event: EVENT_TYPE, rule: Rule, journey_id: Optional[UUID]) -> ActionResult:
         raise NotImplementedError("Base Action cannot be executed")
 
@@ -88,7 +97,10 @@ class BaseAction:
                 exc_info=action_result.exception,
             )
 
-    def execute(self, event: EVENT_TYPE, rule: Rule, journey_id: Optional[UUID]) -> bool:
+    def run(self, event: EVENT_TYPE, rule: Rule, journey_id: Optional[UUID]) -> ActionResult:
         action_result = self._run(event, rule, journey_id)
         self._store_action_result(action_result)
-        return action_result.result
+        return action_result
+
+    def execute(self, event: EVENT_TYPE, rule: Rule, journey_id: Optional[UUID]) -> bool:
+        return self.run(event, rule, journey_id).result
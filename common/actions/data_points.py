@@ -2,13 +2,14 @@ import logging
 from collections.abc import Mapping
 from datetime import datetime
 from typing import Any, Optional, cast
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Collection, Iterator
 from uuid import UUID
 
-from peewee import DoesNotExist
+from peewee import JOIN, DoesNotExist
 
 from common.datetime_utils import datetime_formatted, datetime_iso8601
-from common.entities import Rule, AuthProvider, Company, Organization, Project
+from common.decorators import cached_property
+from common.entities import Rule, AuthProvider, Company, Organization, Pipeline, Project, Run, RunTask, Task
 from common.events.internal import RunAlert, AgentStatusChangeEvent
 from common.events.v1 import Event
 from rules_engine.typing import ALERT_EVENT, EVENT_TYPE
@@ -16,6 +17,12 @@ from rules_engine.typing import ALERT_EVENT, EVENT_TYPE
 LOG = logging.getLogger(__name__)
 
 
+def _prime(event: object, name: str, value: Any) -> None:
+    """Store a value in a `cached_property` of the event, so that accessing it does not query the database."""
+    if isinstance(getattr(type(event), name, None), cached_property):
+        event.__dict__[name] = value
+
+
 class NamespacedDataPointsBase:
     mappings: dict[str, Callable]
 
@@ -313,11 +320,14 @@ class RunTaskDataPoints(NamespacedDataPointsBase):
 class CompanyDataPoints(NamespacedDataPointsBase):
     def __init__(self, event: EVENT_TYPE) -> None:
         self.event = event
+        self.domain: Optional[str] = None
         self.mappings = {
             "ui_url": self._ui_url,
         }
 
     def _ui_url(self) -> str:
+        if self.domain is not None:
+            return self.domain
         # Multiple auth providers is not something we support atm so we can assume to take the first one
         try:
             auth_provider = (
@@ -328,15 +338,49 @@ class CompanyDataPoints(NamespacedDataPointsBase):
                 .where(Project.id == self.event.project_id)
                 .get()
             )
-            return cast(str, auth_provider.domain)
+            self.domain = cast(str, auth_provider.domain)
         except DoesNotExist:
-            return ""
+            self.domain = ""
+        return self.domain
 
 
 class BaseDataPoints(Mapping):
     def __init__(self, event: EVENT_TYPE, rule: Rule):
+        # Not named `event`, which is the name of a namespace
+        self._event = event
         self.namespaces = self.get_namespaces(event, rule)
 
+    def prefetch(self, references: Collection[str]) -> None:
+        """
+        Load ahead of rendering the rows backing the given data points, named as "namespace.data_point".
+
+        Related rows are joined into a single query, and stored where the data points look for them, so that rendering
+        does not issue a query per data point. Errors are left for the data points to raise when rendered.
+        """
+        try:
+            self._prefetch({ref.partition(".")[0] for ref in references}, references)
+        except Exception:
+            LOG.warning("Error prefetching data points %s", sorted(references), exc_info=True)
+
+    def _prefetch(self, namespaces: set[str], references: Collection[str]) -> None:
+        if "project.name" not in references and "company" not in namespaces:
+            return
+        # Multiple auth providers is not something we support atm so we can assume to take the first one
+        project = (
+            Project.select(Project, AuthProvider.domain)
+            .join(Organization)
+            .join(Company)
+            .join(AuthProvider, JOIN.LEFT_OUTER, on=(AuthProvider.company == Company.id))
+            .where(Project.id == self._event.project_id)
+            .objects()
+            .first()
+        )
+        if project is None:
+            return
+        _prime(self._event, "project", project)
+        if isinstance(company := self.namespaces.get("company"), CompanyDataPoints):
+            company.domain = project.domain or ""
+
     def __getattr__(self, attr: str) -> Any:
         return self.namespaces[attr]
 
@@ -370,6 +414,30 @@ class DataPoints(BaseDataPoints):
             "task": TaskDataPoints(event),
         }
 
+    def _prefetch(self, namespaces: set[str], references: Collection[str]) -> None:
+        super()._prefetch(namespaces, references)
+        event = cast(Event, self._event)
+        if "run_task" in namespaces and event.run_task_id:
+            if run_task := (
+                RunTask.select(RunTask, Run, Task)
+                .join(Run)
+                .switch(RunTask)
+                .join(Task)
+                .where(RunTask.id == event.run_task_id)
+                .first()
+            ):
+                _prime(event, "run_task", run_task)
+                if run_task.run_id == event.run_id:
+                    _prime(event, "run", run_task.run)
+                if run_task.task_id == event.task_id:
+                    _prime(event, "task", run_task.task)
+        if namespaces & {"run", "component", "pipeline"} and event.run_id and "run" not in event.__dict__:
+            if run := Run.select(Run, Pipeline).join(Pipeline).where(Run.id == event.run_id).first():
+                _prime(event, "run", run)
+                _prime(event, "pipeline", run.pipeline)
+                if event.component_model is Pipeline and event.component_id == run.pipeline_id:
+                    _prime(event, "component", run.pipeline)
+
 
 class InternalEventDataPoints(NamespacedDataPointsBase):
     def __init__(self, event: ALERT_EVENT) -> None:
@@ -533,6 +601,15 @@ class AlertDataPoints(DataPoints):
 
         return namespaces
 
+    def _prefetch(self, namespaces: set[str], references: Collection[str]) -> None:
+        BaseDataPoints._prefetch(self, namespaces, references)
+        event = self._event
+        if isinstance(event, RunAlert) and namespaces & {"run", "component"} and event.run_id:
+            if run := Run.select(Run, Pipeline).join(Pipeline).where(Run.id == event.run_id).first():
+                _prime(event, "run", run)
+                if run.pipeline_id == event.batch_pipeline_id:
+                    _prime(event, "batch_pipeline", run.pipeline)
+
 
 class AgentDataPoints(NamespacedDataPointsBase):
     def __init__(self, event: AgentStatusChangeEvent) -> None:
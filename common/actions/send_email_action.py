@@ -1,5 +1,6 @@
 __all__ = ["SendEmailAction"]
 import logging
+import smtplib
 from dataclasses import asdict
 from typing import Optional
 from uuid import UUID
@@ -10,6 +11,7 @@ from common.email.email_service import EmailService
 from common.entities import Journey, Rule
 from common.events.internal import InstanceAlert, RunAlert, AgentStatusChangeEvent
 from common.events.v1 import Event
+from conf import settings
 from rules_engine.typing import EVENT_TYPE
 from common.actions.data_points import AlertDataPoints, DataPoints, AgentStatusChangeDataPoints
 
@@ -17,11 +19,33 @@ from common.actions.action import ActionResult, BaseAction
 
 LOG = logging.getLogger(__name__)
 
+ALERT_DATA_POINTS = frozenset({"project.name", "company.ui_url", "run.key", "component.name"})
+"""The data points that the alert email templates are rendered with, fetched ahead of building the context."""
+
+EVENT_DATA_POINTS = frozenset(
+    {"project.name", "company.ui_url", "component.name", "run.expected_start_time", "task.name", "run_task.start_time"}
+)
+"""The data points that the event email templates are rendered with, fetched ahead of building the context."""
+
 
 class SendEmailAction(BaseAction):
     required_arguments = {"recipients", "template"}
     requires_action_template = True
 
+    @property
+    def destination(self) -> str:
+        return str(self.arguments.get("smtp_config", {}).get("endpoint") or settings.SMTP["endpoint"])
+
+    def is_retryable(self, action_result: ActionResult) -> bool:
+        match action_result.exception:
+            case smtplib.SMTPServerDisconnected() | smtplib.SMTPConnectError() | ConnectionError() | TimeoutError():
+                return True
+            case smtplib.SMTPResponseException(smtp_code=code):
+                # 4xx replies are transient failures, such as the server being too busy
+                return 400 <= code < 500
+            case _:
+                return False
+
     def _run(self, event: EVENT_TYPE, rule: Rule, journey_id: Optional[UUID]) -> ActionResult:
         try:
             context = self._get_data_points(event, rule, journey_id)
@@ -57,6 +81,7 @@ class SendEmailAction(BaseAction):
 
                 context.update(asdict(event))
                 alert_data_points = AlertDataPoints(event, rule)
+                alert_data_points.prefetch(ALERT_DATA_POINTS)
                 context["alert_level"] = alert_data_points.alert.level
                 context["project_name"] = alert_data_points.project.name
                 context["alert_type"] = alert_data_points.alert.type
@@ -91,6 +116,7 @@ class SendEmailAction(BaseAction):
 
                 context.update(event.as_dict())
                 event_data_points = DataPoints(event, rule)
+                event_data_points.prefetch(EVENT_DATA_POINTS)
                 context["component_key"] = event_data_points.component.key
                 context["component_name"] = event_data_points.component.name
                 context["project_name"] = event_data_points.project.name
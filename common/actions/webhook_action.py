@@ -1,10 +1,16 @@
-__all__ = ["WebhookAction"]
+__all__ = ["WebhookAction", "TemplateString", "compile_template", "format_data", "get_references"]
 
 import logging
+import re
+from functools import lru_cache
+from string import Formatter
 from typing import Any, Optional, Union
 from collections.abc import Mapping
+from http import HTTPStatus
+from urllib.parse import urlparse
 from uuid import UUID
 
+from requests import exceptions as requests_exceptions
 from requests_extensions import get_session
 
 from common.entities import Rule
@@ -12,17 +18,79 @@ from common.events.internal import InstanceAlert, RunAlert, AgentStatusChangeEve
 from common.events.v1 import Event
 from rules_engine.typing import EVENT_TYPE
 from common.actions.action import ActionResult, BaseAction
-from common.actions.data_points import AlertDataPoints, DataPoints, AgentStatusChangeDataPoints
+from common.actions.data_points import AlertDataPoints, BaseDataPoints, DataPoints, AgentStatusChangeDataPoints
 
 LOG = logging.getLogger(__name__)
 
+FORMATTER = Formatter()
+
+DATA_POINT_RE = re.compile(r"([^.\[]*)(?:\.([^.\[]+))?")
+"""Extracts the namespace and data point from a replacement field name, e.g. `run` and `status` from `run.status`."""
+
+
+class TemplateString:
+    """
+    A string parsed once to be formatted with `str.format` semantics, and the data points it references.
+
+    Strings that `str.format` would fail to parse, or that nest replacement fields within format specs, are formatted
+    with `str.format` itself so that they behave (and fail) exactly the same.
+    """
+
+    __slots__ = ("template", "parts", "references")
+
+    def __init__(self, template: str) -> None:
+        self.template = template
+        self.parts: Optional[list[tuple[str, Optional[str], Optional[str], Optional[str]]]]
+        try:
+            self.parts = list(FORMATTER.parse(template))
+        except ValueError:
+            self.parts = None
+        else:
+            if any(spec and "{" in spec for _, _, spec, _ in self.parts):
+                self.parts = None
+        self.references = frozenset(
+            ".".join(filter(None, match.groups()))
+            for _, field, _, _ in (self.parts or ())
+            if field and (match := DATA_POINT_RE.match(field))
+        )
+
+    def render(self, data_points: Mapping) -> str:
+        if self.parts is None:
+            return self.template.format(**data_points)
+        rendered: list[str] = []
+        for literal, field, spec, conversion in self.parts:
+            rendered.append(literal)
+            if field is not None:
+                value, _ = FORMATTER.get_field(field, (), data_points)
+                value = FORMATTER.convert_field(value, conversion) if conversion else value
+                rendered.append(FORMATTER.format_field(value, spec or ""))
+        return "".join(rendered)
+
+
+@lru_cache(maxsize=1024)
+def compile_template(template: str) -> TemplateString:
+    """Parse the template once; the action arguments of a rule are formatted with every matching event."""
+    return TemplateString(template)
+
+
+def get_references(data: Union[None, list, dict, str]) -> set[str]:
+    """Return the data points referenced by the strings found in the data structure."""
+    if isinstance(data, list):
+        return set().union(*(get_references(v) for v in data))
+    elif isinstance(data, dict):
+        return set().union(*(get_references(v) for v in data.values()))
+    elif isinstance(data, str):
+        return set(compile_template(data).references)
+    else:
+        return set()
+
 
 def format_data(data: Union[None, list, dict, str], data_points: Mapping) -> Any:
     """
     Format strings found in data structure with the given data points
 
     The function recursively iterates the given data structure to find strings
-    to format using Python's str.format function. It returns a formatted copy
+    to format using Python's str.format semantics. It returns a formatted copy
     of data
     """
     # Recursion depth error is caught by _run()
@@ -32,7 +100,7 @@ def format_data(data: Union[None, list, dict, str], data_points: Mapping) -> Any
         return {k: format_data(v, data_points) for k, v in data.items()}
     elif isinstance(data, str):
         try:
-            return data.format(**data_points)
+            return compile_template(data).render(data_points)
         except (ValueError, AttributeError, KeyError):
             LOG.warning("User supplied string could not be formatted", exc_info=True)
             # Prioritize action execution by suppressing formatting errors
@@ -44,6 +112,24 @@ def format_data(data: Union[None, list, dict, str], data_points: Mapping) -> Any
 class WebhookAction(BaseAction):
     required_arguments = {"url", "method"}
 
+    @property
+    def references(self) -> set[str]:
+        """The data points referenced by the URL, headers and payload of the webhook."""
+        headers = [h["value"] for h in self.arguments.get("headers") or ()]
+        return get_references([self.arguments["url"], headers, self.arguments.get("payload")])
+
+    @property
+    def destination(self) -> str:
+        return str(urlparse(self.arguments["url"]).netloc or self.arguments["url"])
+
+    def is_retryable(self, action_result: ActionResult) -> bool:
+        match action_result.exception:
+            case requests_exceptions.ConnectionError() | requests_exceptions.Timeout():
+                return True
+            case requests_exceptions.HTTPError(response=response) if response is not None:
+                return bool(response.status_code >= 500 or response.status_code == HTTPStatus.TOO_MANY_REQUESTS)
+        return False
+
     def _run(self, event: EVENT_TYPE, rule: Rule, _: Optional[UUID]) -> ActionResult:
         data_points: Mapping
         match event:
@@ -56,6 +142,8 @@ class WebhookAction(BaseAction):
             case _:
                 data_points = {}  # type: ignore[unreachable]
         try:
+            if isinstance(data_points, BaseDataPoints):
+                data_points.prefetch(self.references)
             response = get_session().request(
                 self.arguments["method"],
                 format_data(self.arguments["url"], data_points),
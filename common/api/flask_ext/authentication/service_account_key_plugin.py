@@ -2,11 +2,9 @@ __all__ = ["ServiceAccountAuth"]
 import logging
 
 from flask import g
-from peewee import DoesNotExist
 from werkzeug.exceptions import Unauthorized
 
-from common.auth.keys.service_key import validate_key
-from common.entities import Project
+from common.auth.keys.service_key import validate_key_cached
 
 from .common import BaseAuthPlugin
 
@@ -24,12 +22,9 @@ class ServiceAccountAuth(BaseAuthPlugin):
         if sa_key is None:
             return
 
-        key_data = validate_key(sa_key)
-        if not key_data.valid:
+        validated_key = validate_key_cached(sa_key)
+        if validated_key is None:
             raise Unauthorized("Invalid service account key")
 
-        try:
-            g.project = Project.get_by_id(key_data.project_id)
-            g.allowed_services = key_data.allowed_services
-        except DoesNotExist as dne:
-            raise Unauthorized("Invalid service account key") from dne
+        g.project = validated_key.project
+        g.allowed_services = validated_key.key_data.allowed_services
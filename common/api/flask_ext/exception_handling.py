@@ -40,7 +40,9 @@ class ExceptionHandling(BaseExtension):
         response: dict[str, object] = {"error": e.description, "details": {}}
         if hasattr(e, "details"):
             response["details"] = getattr(e, "details")
-        return make_response(response, e.code)
+        # Keep headers such as Retry-After or Allow, the body is replaced so its Content-Type is not relevant
+        headers = [(name, value) for name, value in e.get_headers() if name != "Content-Type"]
+        return make_response(response, e.code, headers)
 
     @staticmethod
     def handle_deserialization_errors(e: ValidationError) -> ResponseReturnValue:
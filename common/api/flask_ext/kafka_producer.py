@@ -0,0 +1,83 @@
+__all__ = ["SharedKafkaProducer"]
+
+import atexit
+import logging
+import os
+import threading
+from typing import Optional, cast
+
+from confluent_kafka import KafkaError, Message
+from flask import Flask, current_app
+
+from common.api.flask_ext.base_extension import BaseExtension
+from common.kafka import KafkaProducer
+from common.kafka.settings import PRODUCER_SHUTDOWN_FLUSH_TIMEOUT_SECS
+
+LOG = logging.getLogger(__name__)
+
+EXTENSION_NAME = "kafka_producer"
+
+
+class SharedKafkaProducer(BaseExtension):
+    """
+    Keeps a single, long-lived Kafka producer per worker process, shared by every request it handles.
+
+    Creating a producer is expensive: it bootstraps the broker connections and, when used as a context manager, blocks
+    until every message is delivered. Sharing one producer lets librdkafka batch and deliver messages in the background
+    while the request returns. Delivery failures are logged by the delivery report instead of being raised.
+
+    The producer is created lazily and is tied to the process that created it, so it is safe to use with pre-forking
+    servers such as gunicorn. The local queue is bounded by the `queue.buffering.max.messages` setting; when it is full
+    `produce` raises `ProducerQueueFullError` and the caller is expected to ask the client to retry later. Pending
+    messages are flushed when the worker process exits.
+
+    Producer settings are read from the `KAFKA_PRODUCER_SETTINGS` configuration value. The `Config` plugin must be
+    added to the Flask app BEFORE this plugin.
+    """
+
+    def __init__(self, app: Optional[Flask] = None) -> None:
+        self._producer: Optional[KafkaProducer] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        super().__init__(app)
+
+    @staticmethod
+    def delivery_report(err: Optional[KafkaError], message: Message) -> None:
+        if err is not None:
+            LOG.error("Failed to deliver message to '%s': %s", message.topic(), err)
+        else:
+            LOG.debug("Message delivered to %s [%s]", message.topic(), message.partition())
+
+    @property
+    def producer(self) -> KafkaProducer:
+        pid = os.getpid()
+        if self._producer is None or self._pid != pid:
+            with self._lock:
+                if self._producer is None or self._pid != pid:
+                    # librdkafka background threads do not survive a fork, so a producer inherited from the parent
+                    # process is never reused
+                    producer = KafkaProducer(
+                        self.app.config.get("KAFKA_PRODUCER_SETTINGS", {}), delivery_callback=self.delivery_report
+                    )
+                    producer.connect()
+                    self._producer, self._pid = producer, pid
+        return self._producer
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._producer is not None and self._pid == os.getpid():
+                try:
+                    self._producer.disconnect(timeout=PRODUCER_SHUTDOWN_FLUSH_TIMEOUT_SECS)
+                except Exception:
+                    LOG.exception("Error flushing the shared Kafka producer")
+            self._producer = None
+            self._pid = None
+
+    @staticmethod
+    def get_producer() -> KafkaProducer:
+        """Returns the producer for the current app and process."""
+        return cast(SharedKafkaProducer, current_app.extensions[EXTENSION_NAME]).producer
+
+    def init_app(self) -> None:
+        self.app.extensions[EXTENSION_NAME] = self
+        atexit.register(self.shutdown)
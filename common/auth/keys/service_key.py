@@ -1,19 +1,26 @@
+import hmac
 import logging
+import os
 from base64 import b64encode
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import NamedTuple, Optional
-from uuid import uuid4
+from hashlib import sha256
+from typing import NamedTuple, Optional, Union
+from uuid import UUID, uuid4
 
 from peewee import DoesNotExist
 
+from common.cache import TTLCache
 from common.entities import Project, ServiceAccountKey
 
 from .lib import create_digest, extract_digest, extract_key, generate_passphrase, hash_value
-from .settings import DEFAULT_EXPIRY_DAYS, HASH_ITERATIONS
+from .settings import DEFAULT_EXPIRY_DAYS, HASH_ITERATIONS, VALIDATED_KEY_CACHE_SIZE, VALIDATED_KEY_CACHE_TTL_SECS
 
 LOG = logging.getLogger(__name__)
 
+_CACHE_SECRET: bytes = os.urandom(32)
+"""Per-process secret used to derive cache keys, so presented keys are never stored in memory as-is."""
+
 
 class ServiceAccountKeyData(NamedTuple):
     valid: bool
@@ -21,6 +28,16 @@ class ServiceAccountKeyData(NamedTuple):
     project_id: str
 
 
+class ValidatedKey(NamedTuple):
+    key_id: str
+    key_data: ServiceAccountKeyData
+    project: Project
+
+
+VALIDATED_KEYS: TTLCache[bytes, str] = TTLCache(max_size=VALIDATED_KEY_CACHE_SIZE, ttl=VALIDATED_KEY_CACHE_TTL_SECS)
+"""Ids of the keys whose passphrase was successfully validated, indexed by a keyed hash of the presented key."""
+
+
 @dataclass
 class KeyPair:
     key_entity: ServiceAccountKey
@@ -62,8 +79,65 @@ def generate_key(
 
 
 def validate_key(api_key: str) -> ServiceAccountKeyData:
+    """Validate a service account key. See `_validate_key`."""
+    if (db_entry := _validate_key(api_key)) is None:
+        return ServiceAccountKeyData(False, [""], "")
+    return ServiceAccountKeyData(True, db_entry.allowed_services, str(db_entry.project_id))
+
+
+def validate_key_cached(api_key: str) -> Optional[ValidatedKey]:
+    """
+    Validate a service account key, returning its data and project, or None when the key is not valid.
+
+    Hashing the passphrase is intentionally slow, so the ids of the keys whose passphrase was validated are cached
+    in-process for a while. The cache is indexed by an HMAC of the presented key; a cache hit means the exact same key
+    was already validated. The key and its project are still loaded on every call, so a key which is deleted, expires
+    or belongs to a deleted project is rejected right away by every process. Failed validations are never cached, so
+    the work factor is always paid for invalid keys.
     """
-    Validate a service account key.
+    cache_key = hmac.new(_CACHE_SECRET, api_key.encode("utf-8"), sha256).digest()
+    if (key_id := VALIDATED_KEYS.get(cache_key)) is not None:
+        try:
+            db_entry = (
+                ServiceAccountKey.select(ServiceAccountKey, Project)
+                .join(Project)
+                .where(ServiceAccountKey.id == key_id)
+                .get()
+            )
+        except DoesNotExist:
+            LOG.warning("ServiceAccountKey `%s` or its project does not exist anymore.", key_id)
+            VALIDATED_KEYS.invalidate(cache_key)
+            return None
+        if db_entry.is_expired():
+            LOG.debug("ServiceAccountKey with primary key `%s` is expired", key_id)
+            VALIDATED_KEYS.invalidate(cache_key)
+            return None
+    else:
+        if (db_entry := _validate_key(api_key)) is None:
+            return None
+        VALIDATED_KEYS.set(cache_key, str(db_entry.id))
+        LOG.debug("Validated ServiceAccountKey `%s`; cache stats: %s", db_entry.id, VALIDATED_KEYS.stats)
+
+    try:
+        project = db_entry.project
+    except DoesNotExist:
+        LOG.warning("Project of ServiceAccountKey `%s` does not exist.", db_entry.id)
+        VALIDATED_KEYS.invalidate(cache_key)
+        return None
+    return ValidatedKey(
+        str(db_entry.id), ServiceAccountKeyData(True, db_entry.allowed_services, str(project.id)), project
+    )
+
+
+def invalidate_key(key_id: Union[str, UUID]) -> None:
+    """Drop a key from the validated keys cache of the current process."""
+    key_id = str(key_id)
+    VALIDATED_KEYS.invalidate_where(lambda _, validated_key_id: validated_key_id == key_id)
+
+
+def _validate_key(api_key: str) -> Optional[ServiceAccountKey]:
+    """
+    Validate a service account key, returning its database entry when valid.
 
     NOTE: This function is rather paranoid about exception handling. The work-factor of repeatedly hashing the
     passphrase of a key is part of the security. If the system fails fast for any reason then the work factor could be
@@ -80,30 +154,30 @@ def validate_key(api_key: str) -> ServiceAccountKeyData:
     except Exception:
         LOG.exception("Unable to decode the Service Account key.")
         hash_value(value=fake_pass, salt=fake_salt)  # Fake a work-factor before failing
-        return ServiceAccountKeyData(False, [""], "")
+        return None
 
     try:
-        db_entry = ServiceAccountKey.get(id=key.db_key)
+        db_entry: ServiceAccountKey = ServiceAccountKey.get(id=key.db_key)
     except DoesNotExist:
         LOG.warning("ServiceAccountKey with primary key `%s` does not exist.", key.db_key)
         hash_value(value=fake_pass, salt=fake_salt)  # Fake a work-factor before failing
-        return ServiceAccountKeyData(False, [""], "")
+        return None
     except Exception:
         LOG.exception("Error looking up ServiceAccountKey")
         hash_value(value=fake_pass, salt=fake_salt)  # Fake a work-factor before failing
-        return ServiceAccountKeyData(False, [""], "")
+        return None
 
     if db_entry.is_expired():
         LOG.debug("ServiceAccountKey with primary key `%s` is expired", key.db_key)
         hash_value(value=fake_pass, salt=fake_salt)  # Fake a work-factor before failing
-        return ServiceAccountKeyData(False, [""], "")
+        return None
 
     try:
         digest_parts = extract_digest(db_entry.digest)
     except Exception:
         LOG.exception("Unable to extract digest from ServiceAccountKey database entry.")
         hash_value(value=fake_pass, salt=fake_salt)  # Fake a work-factor before failing
-        return ServiceAccountKeyData(False, [""], "")
+        return None
 
     try:
         passphrase_hash = hash_value(
@@ -112,10 +186,10 @@ def validate_key(api_key: str) -> ServiceAccountKeyData:
     except Exception:
         LOG.exception("Unable to hash the given Service Account key.")
         hash_value(value=fake_pass, salt=fake_salt)  # Fake a work-factor before failing
-        return ServiceAccountKeyData(False, [""], "")
+        return None
 
     # Compare the hash values
     if digest_parts.passphrase_hash == passphrase_hash:
-        return ServiceAccountKeyData(True, db_entry.allowed_services, str(db_entry.project.id))
+        return db_entry
     else:
-        return ServiceAccountKeyData(False, [""], "")
+        return None
@@ -8,3 +8,13 @@ but the exact value doesn't matter.
 
 DEFAULT_EXPIRY_DAYS: int = 365
 """Default length of time an API key is valid; defaults to 1 year (365 days)."""
+
+VALIDATED_KEY_CACHE_SIZE: int = 1024
+"""Maximum number of successfully validated keys kept in the in-process cache."""
+
+VALIDATED_KEY_CACHE_TTL_SECS: float = 60
+"""
+How long the passphrase of a successfully validated key is trusted without being hashed again.
+
+The key itself is still loaded on every request, so deleting or expiring a key takes effect right away.
+"""
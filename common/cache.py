@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+__all__ = ["CacheStats", "TTLCache"]
+
+import threading
+from collections import OrderedDict
+from typing import Generic, NamedTuple, Optional, TypeVar, Union
+from collections.abc import Callable, Hashable
+from time import monotonic
+
+from common.sentinel import SENTINEL, Sentinel
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+ValueType = TypeVar("ValueType")
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+
+class TTLCache(Generic[KeyType, ValueType]):
+    """
+    A thread-safe, bounded, in-process cache where entries expire after a fixed time-to-live.
+
+    When the cache is full, the least recently used entry is evicted. Hit, miss and eviction counters are kept so the
+    cache effectiveness can be reported through `stats`.
+
+    Usage::
+
+        >>> cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=30)
+        >>> cache.get_or_set("a", lambda: 1)
+        1
+        >>> cache.get("a")
+        1
+        >>> cache.invalidate("a")
+        >>> cache.get("a") is None
+        True
+    """
+
+    def __init__(self, *, max_size: int, ttl: float, clock: Callable[[], float] = monotonic) -> None:
+        if max_size <= 0:
+            raise ValueError("TTLCache max_size must be greater than 0")
+        if ttl <= 0:
+            raise ValueError("TTLCache ttl must be greater than 0")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._data: OrderedDict[KeyType, tuple[float, ValueType]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: KeyType) -> bool:
+        return self._lookup(key, count=False) is not SENTINEL
+
+    def _lookup(self, key: KeyType, *, count: bool = True) -> Union[ValueType, Sentinel]:
+        with self._lock:
+            try:
+                expires_at, value = self._data[key]
+            except KeyError:
+                if count:
+                    self.misses += 1
+                return SENTINEL
+            if expires_at <= self._clock():
+                del self._data[key]
+                if count:
+                    self.misses += 1
+                return SENTINEL
+            self._data.move_to_end(key)
+            if count:
+                self.hits += 1
+            return value
+
+    def get(self, key: KeyType, default: Optional[ValueType] = None) -> Optional[ValueType]:
+        value = self._lookup(key)
+        return default if value is SENTINEL else value
+
+    def set(self, key: KeyType, value: ValueType, ttl: Optional[float] = None) -> None:
+        """Add or replace a cache entry. A custom `ttl` can be given for entries which should expire sooner."""
+        expires_at = self._clock() + (self.ttl if ttl is None else min(ttl, self.ttl))
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_set(self, key: KeyType, factory: Callable[[], ValueType]) -> ValueType:
+        """
+        Return the cached value for the key, calling `factory` to produce (and cache) it when missing.
+
+        The factory is called without holding the cache lock, so concurrent misses for the same key may call it more
+        than once; the last produced value wins.
+        """
+        value = self._lookup(key)
+        if value is SENTINEL:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: KeyType) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[KeyType, ValueType], bool]) -> int:
+        """Remove all the entries that match the predicate. Returns the number of entries removed."""
+        with self._lock:
+            keys = [k for k, (_, v) in self._data.items() if predicate(k, v)]
+            for k in keys:
+                del self._data[k]
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, self.evictions, len(self._data), self.max_size)
@@ -1,4 +1,7 @@
+import threading
 from collections.abc import Callable, Mapping
+from functools import lru_cache
+from typing import cast
 
 from pybars import Compiler
 
@@ -21,6 +24,17 @@ TEMPLATES: dict[str, type[BaseTemplate]] = {
 }
 
 
+_COMPILER_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=len(TEMPLATES))
+def get_compiled_template(template_name: str) -> Callable[..., str]:
+    """Compile the template once; compiling is much slower than rendering."""
+    # The compiler is not thread-safe, while the compiled templates are
+    with _COMPILER_LOCK:
+        return cast(Callable[..., str], Compiler().compile(TEMPLATES[template_name].content))
+
+
 class HandlebarsEmailRenderer:
     @staticmethod
     def render(template_name: str, context_vars: Mapping) -> tuple[str, str]:
@@ -28,6 +42,5 @@ class HandlebarsEmailRenderer:
             raise ValueError(f"Template name {template_name} is not a valid selection for email action")
         template = TEMPLATES[template_name]
         template(**context_vars)
-        compiled_template: Callable[..., str] = Compiler().compile(template.content)
-        rendered_template = compiled_template(context_vars)
+        rendered_template = get_compiled_template(template_name)(context_vars)
         return rendered_template, template.subject
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+__all__ = ["SMTPConnectionPool", "SMTP_POOL"]
+
+import atexit
+import logging
+import smtplib
+import ssl
+import threading
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from time import monotonic
+from typing import NamedTuple
+
+LOG = logging.getLogger(__name__)
+
+SMTP_POOL_MAX_IDLE_CONNECTIONS: int = 4
+"""Maximum number of idle connections kept open for each SMTP server and account."""
+
+SMTP_POOL_MAX_IDLE_SECS: float = 60
+"""Idle connections older than this are closed instead of being reused, since servers drop idle clients."""
+
+SMTP_POOL_CHECK_AFTER_IDLE_SECS: float = 10
+"""Idle connections older than this are checked with a NOOP command before being reused."""
+
+
+class SMTPServer(NamedTuple):
+    host: str
+    port: int
+    username: str
+    password: str
+
+
+class _IdleConnection(NamedTuple):
+    client: smtplib.SMTP_SSL
+    released_at: float
+
+
+class SMTPConnectionPool:
+    """
+    Keeps logged-in SMTP connections open so that consecutive emails sent through the same server and account reuse
+    the same session, instead of performing the TLS handshake and login for each email.
+
+    Connections are discarded when an error happens while they are in use, when they were idle for too long, or when
+    they don't answer a keep-alive check.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_idle: int = SMTP_POOL_MAX_IDLE_CONNECTIONS,
+        max_idle_secs: float = SMTP_POOL_MAX_IDLE_SECS,
+        check_after_idle_secs: float = SMTP_POOL_CHECK_AFTER_IDLE_SECS,
+    ) -> None:
+        self.max_idle = max_idle
+        self.max_idle_secs = max_idle_secs
+        self.check_after_idle_secs = check_after_idle_secs
+        self._idle: defaultdict[SMTPServer, list[_IdleConnection]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _connect(server: SMTPServer) -> smtplib.SMTP_SSL:
+        client = smtplib.SMTP_SSL(host=server.host, port=server.port, context=ssl.SSLContext(ssl.PROTOCOL_SSLv23))
+        try:
+            client.login(server.username, server.password)
+        except Exception:
+            SMTPConnectionPool._close(client)
+            raise
+        return client
+
+    @staticmethod
+    def _close(client: smtplib.SMTP_SSL) -> None:
+        try:
+            client.quit()
+        except Exception:
+            client.close()
+
+    def _is_alive(self, idle: _IdleConnection, now: float) -> bool:
+        if now - idle.released_at > self.max_idle_secs:
+            return False
+        if now - idle.released_at > self.check_after_idle_secs:
+            try:
+                return bool(idle.client.noop()[0] == 250)
+            except Exception:
+                return False
+        return True
+
+    def _acquire(self, server: SMTPServer) -> smtplib.SMTP_SSL:
+        while True:
+            with self._lock:
+                if not self._idle[server]:
+                    break
+                idle = self._idle[server].pop()
+            if self._is_alive(idle, monotonic()):
+                return idle.client
+            self._close(idle.client)
+        return self._connect(server)
+
+    def _release(self, server: SMTPServer, client: smtplib.SMTP_SSL) -> None:
+        with self._lock:
+            if len(self._idle[server]) < self.max_idle:
+                self._idle[server].append(_IdleConnection(client, monotonic()))
+                return
+        self._close(client)
+
+    @contextmanager
+    def connection(self, server: SMTPServer) -> Iterator[smtplib.SMTP_SSL]:
+        """Borrow a logged-in connection to the server. It is given back to the pool unless an error is raised."""
+        client = self._acquire(server)
+        try:
+            yield client
+        except BaseException:
+            self._close(client)
+            raise
+        self._release(server, client)
+
+    def close(self) -> None:
+        with self._lock:
+            connections = [idle.client for idles in self._idle.values() for idle in idles]
+            self._idle.clear()
+        for client in connections:
+            self._close(client)
+
+
+SMTP_POOL = SMTPConnectionPool()
+atexit.register(SMTP_POOL.close)
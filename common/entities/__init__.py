@@ -13,6 +13,7 @@ from .dataset_operation import *
 from .event import *
 from .instance import *
 from .instance_rule import *
+from .instance_summary import *
 from .journey import *
 from .organization import *
 from .pipeline import *
@@ -45,6 +46,7 @@ ALL_MODELS: list[type[BaseEntity]] = [
     InstanceAlertsComponents,
     InstanceRule,
     InstanceSet,
+    InstanceSummary,
     InstancesInstanceSets,
     Journey,
     JourneyDagEdge,
@@ -1,14 +1,24 @@
-__all__ = ["ActivableEntityMixin", "AuditEntityMixin", "AuditUpdateTimeEntityMixin", "BaseEntity", "BaseModel", "DB"]
+__all__ = [
+    "ActivableEntityMixin",
+    "AuditEntityMixin",
+    "AuditUpdateTimeEntityMixin",
+    "BaseEntity",
+    "BaseModel",
+    "DB",
+    "TimeOrderedEntity",
+]
 
 from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
 
-from peewee import BooleanField, DatabaseProxy, DeferredForeignKey, Model, UUIDField
+from peewee import BooleanField, DeferredForeignKey, Model, UUIDField
 
 from common.peewee_extensions.fields import UTCTimestampField
+from common.peewee_extensions.proxy import TransactionalDatabaseProxy
+from common.uuid_utils import uuid7
 
-DB = DatabaseProxy()
+DB = TransactionalDatabaseProxy()
 """Proxy to defer database initialization."""
 
 
@@ -33,6 +43,15 @@ class BaseEntity(BaseModel):
     id = UUIDField(primary_key=True, null=False, index=True, unique=True, default=uuid4)
 
 
+class TimeOrderedEntity(BaseEntity):
+    """
+    Base class for write-heavy entities, whose ids are time-ordered so that new rows are appended to the primary key
+    index instead of being scattered across it.
+    """
+
+    id = UUIDField(primary_key=True, null=False, index=True, unique=True, default=uuid7)
+
+
 class AuditEntityMixin(Model):
     """Mixin class for all entities that we want to track who created and when."""
 
@@ -5,7 +5,7 @@ from enum import Enum, IntEnum
 from peewee import ForeignKeyField
 from playhouse.mysql_ext import JSONField
 
-from common.peewee_extensions.fields import EnumIntField, EnumStrField, UTCTimestampField
+from common.peewee_extensions.fields import EnumIntField, EnumStrField, TimeOrderedUUIDField, UTCTimestampField
 
 from ..constants import MAX_EVENT_TYPE_LENGTH
 from .base_entity import BaseEntity
@@ -32,6 +32,7 @@ class ApiEventType(Enum):
 class EventEntity(BaseEntity):
     """An Observability Event."""
 
+    id = TimeOrderedUUIDField(primary_key=True, null=False)
     version = EnumIntField(EventVersion)
     type = EnumStrField(ApiEventType, max_length=MAX_EVENT_TYPE_LENGTH)
     created_timestamp = UTCTimestampField(null=False, index=True)
@@ -1,17 +1,18 @@
 __all__ = ["Instance", "InstanceSet", "InstancesInstanceSets", "InstanceStatus", "InstanceStartType"]
 
-import json
 from enum import Enum
+from hashlib import sha256
 from typing import Union, cast
 from collections.abc import Iterable
 from uuid import UUID
 
-from peewee import BooleanField, CharField, CompositeKey, Expression, ForeignKeyField, fn
+from peewee import BooleanField, CharField, CompositeKey, Expression, ForeignKeyField, IntegrityError
 from playhouse.hybrid import hybrid_property
 
+from common.cache import TTLCache
 from common.peewee_extensions.fields import EnumStrField, UTCTimestampField
 
-from .base_entity import AuditUpdateTimeEntityMixin, BaseEntity, BaseModel
+from .base_entity import DB, AuditUpdateTimeEntityMixin, BaseEntity, BaseModel
 from .component import Component
 from .journey import Journey, JourneyDagEdge
 from collections import defaultdict
@@ -88,6 +89,24 @@ class Instance(BaseEntity, AuditUpdateTimeEntityMixin):
         return memberships
 
 
+INSTANCE_SET_CACHE_SIZE: int = 4096
+"""Maximum number of instance sets kept in the in-process cache."""
+
+INSTANCE_SET_CACHE_TTL_SECS: float = 300
+"""How long a cached instance set is used without being read again from the database."""
+
+INSTANCE_SET_CACHE: TTLCache[str, "InstanceSet"] = TTLCache(
+    max_size=INSTANCE_SET_CACHE_SIZE, ttl=INSTANCE_SET_CACHE_TTL_SECS
+)
+"""
+Recently used instance sets, indexed by digest.
+
+The entries can only be trusted as long as the transaction in which they were read or written is committed, so the
+cache is cleared whenever a transaction is rolled back.
+"""
+DB.on_rollback(INSTANCE_SET_CACHE.clear)
+
+
 class InstanceSet(BaseEntity, AuditUpdateTimeEntityMixin):
     """
     Represents a set of Instances.
@@ -96,44 +115,60 @@ class InstanceSet(BaseEntity, AuditUpdateTimeEntityMixin):
     a set of Instances under an single entity that can be referenced by a Foreign Key.
     """
 
+    digest = CharField(max_length=64, null=True, unique=True)
+    """
+    Digest of the member instance ids, see `get_digest`. Only NULL for duplicated sets created before the digest was
+    introduced.
+    """
+
     class Meta:
         table_name = "instance_set"
 
-    @classmethod
-    def get_or_create(cls, instance_ids: Iterable[UUID]) -> "InstanceSet":
-        if not instance_ids:
-            raise ValueError("An InstanceSet can not be empty.")
+    @staticmethod
+    def _as_uuid(instance: Union[UUID, str, Instance]) -> UUID:
+        if isinstance(instance, Instance):
+            return cast(UUID, instance.id)
+        return instance if isinstance(instance, UUID) else UUID(instance)
 
-        instance_ids_json_array = fn.JSON_ARRAYAGG(InstancesInstanceSets.instance).alias("id_array")
-        instance_ids_json_value = json.dumps([i_id.hex for i_id in instance_ids])
+    @classmethod
+    def get_digest(cls, instance_ids: Iterable[Union[UUID, str, Instance]]) -> str:
+        """Deterministic digest of a set of instance ids: the SHA-256 of the sorted, comma separated, hex ids."""
+        return sha256(",".join(sorted({cls._as_uuid(i_id).hex for i_id in instance_ids})).encode()).hexdigest()
 
-        iis_inner = InstancesInstanceSets.alias("inner")
-        iis_inner_query = iis_inner.select(iis_inner.instance_set).distinct().where(iis_inner.instance << instance_ids)
+    @classmethod
+    def get_or_create(cls, instance_ids: Iterable[Union[UUID, str, Instance]]) -> "InstanceSet":
+        if not (instance_ids := {cls._as_uuid(i_id) for i_id in instance_ids}):
+            raise ValueError("An InstanceSet can not be empty.")
 
-        iis_query = (
-            InstancesInstanceSets.select(InstancesInstanceSets.instance_set, InstanceSet, instance_ids_json_array)
-            .left_outer_join(InstanceSet)
-            .where(InstancesInstanceSets.instance_set << iis_inner_query)
-            .group_by(cls.id, InstancesInstanceSets.instance_set)
-            .having(
-                fn.JSON_CONTAINS(instance_ids_json_array, instance_ids_json_value)
-                & fn.JSON_CONTAINS(instance_ids_json_value, instance_ids_json_array)
-            )
-        )
+        digest = cls.get_digest(instance_ids)
+        if (cached := INSTANCE_SET_CACHE.get(digest)) is not None:
+            return cached
 
         try:
-            return cast(InstanceSet, iis_query.get().instance_set)
-        except InstancesInstanceSets.DoesNotExist:
-            pass
-
-        new_instance_set: InstanceSet = cls.create()
-        InstancesInstanceSets.bulk_create(
-            [
-                InstancesInstanceSets(instance_set=new_instance_set.id, instance=instance_id)
-                for instance_id in instance_ids
-            ]
-        )
-        return new_instance_set
+            instance_set: InstanceSet = cls.get(cls.digest == digest)
+        except cls.DoesNotExist:
+            try:
+                with cls._meta.database.atomic():
+                    instance_set = cls.create(digest=digest)
+                    InstancesInstanceSets.bulk_create(
+                        [
+                            InstancesInstanceSets(instance_set=instance_set.id, instance=instance_id)
+                            for instance_id in instance_ids
+                        ]
+                    )
+            except IntegrityError as e:
+                # Most likely created concurrently. A locking read is needed to see it when the transaction started
+                # before it was committed.
+                query = cls.select().where(cls.digest == digest)
+                if cls._meta.database.for_update:
+                    query = query.for_update()
+                try:
+                    instance_set = query.get()
+                except cls.DoesNotExist:
+                    raise e from None
+
+        INSTANCE_SET_CACHE.set(digest, instance_set)
+        return instance_set
 
 
 class InstancesInstanceSets(BaseModel, AuditUpdateTimeEntityMixin):
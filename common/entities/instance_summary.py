@@ -0,0 +1,56 @@
+__all__ = ["InstanceSummary", "InstanceSummaryKind"]
+
+from enum import Enum
+from hashlib import sha256
+from typing import Optional
+from uuid import UUID
+
+from peewee import CharField, CompositeKey, ForeignKeyField, IntegerField
+
+from common.peewee_extensions.fields import EnumStrField
+
+from ..constants import MAX_DESCRIPTION_LENGTH
+from .base_entity import BaseModel
+from .component import Component
+from .instance import Instance
+
+
+class InstanceSummaryKind(Enum):
+    RUNS = "RUNS"
+    """Runs of the instance, by pipeline and run status."""
+    TESTS = "TESTS"
+    """Test outcomes of the instance, by component and test status."""
+    ALERTS = "ALERTS"
+    """Run and instance alerts of the instance, by level and description. Each alert is counted once."""
+    COMPONENT_ALERTS = "COMPONENT_ALERTS"
+    """Run and instance alerts of the instance, by component, level and description."""
+
+
+class InstanceSummary(BaseModel):
+    """
+    Counter of the runs, test outcomes or alerts of an instance sharing the same component and status.
+
+    The counters are updated along with the entities they count, so that the summaries of the instances are read
+    without aggregating their runs, test outcomes and alerts.
+    """
+
+    instance = ForeignKeyField(Instance, backref="summaries", on_delete="CASCADE")
+    key = CharField(max_length=64)
+    """Digest of the other columns identifying the counter. See `get_key`."""
+    kind = EnumStrField(InstanceSummaryKind, max_length=20, null=False)
+    component = ForeignKeyField(Component, null=True, backref="instance_summaries", on_delete="CASCADE")
+    status = CharField(max_length=50, null=False)
+    """The run or test status, or the alert level."""
+    description = CharField(max_length=MAX_DESCRIPTION_LENGTH, null=True)
+    count = IntegerField(null=False, default=0)
+
+    class Meta:
+        table_name = "instance_summary"
+        primary_key = CompositeKey("instance", "key")
+
+    @staticmethod
+    def get_key(
+        kind: InstanceSummaryKind, component_id: Optional[UUID], status: str, description: Optional[str] = None
+    ) -> str:
+        value = "\n".join((kind.value, component_id.hex if component_id else "", status, description or ""))
+        return sha256(value.encode()).hexdigest()
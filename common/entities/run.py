@@ -7,7 +7,7 @@ from peewee import CharField, Check, ForeignKeyField
 from common.constants import MAX_RUN_NAME_LENGTH
 from common.peewee_extensions.fields import UTCTimestampField
 
-from .base_entity import AuditUpdateTimeEntityMixin, BaseEntity
+from .base_entity import AuditUpdateTimeEntityMixin, TimeOrderedEntity
 from .instance import InstanceSet
 from .pipeline import Pipeline
 
@@ -43,7 +43,7 @@ END_RUN_STATUSES = (
 """End run statuses. I.e. statuses for runs that are not expected to receive a new status."""
 
 
-class Run(BaseEntity, AuditUpdateTimeEntityMixin):
+class Run(TimeOrderedEntity, AuditUpdateTimeEntityMixin):
     """Represents a single instance of a pipeline execution."""
 
     key = CharField(null=True, index=True)
@@ -8,7 +8,7 @@ from peewee import BooleanField, CharField, ForeignKeyField, TextField
 
 from common.peewee_extensions.fields import UTCTimestampField
 
-from .base_entity import BaseEntity
+from .base_entity import BaseEntity, TimeOrderedEntity
 from .pipeline import Pipeline
 from .run import Run
 
@@ -57,7 +57,7 @@ class Task(BaseEntity):
         return value
 
 
-class RunTask(BaseEntity):
+class RunTask(TimeOrderedEntity):
     """Represents a single instance of a pipeline task execution."""
 
     required = BooleanField(default=False, null=False)
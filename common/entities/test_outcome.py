@@ -10,14 +10,14 @@ from ..constants import (
     MAX_TEST_OUTCOME_TYPE_LENGTH,
 )
 from ..peewee_extensions.fields import JSONStrListField, UTCTimestampField
-from .base_entity import AuditUpdateTimeEntityMixin, BaseEntity
+from .base_entity import AuditUpdateTimeEntityMixin, TimeOrderedEntity
 from .component import Component
 from .instance import InstanceSet
 from .run import Run
 from .task import Task
 
 
-class TestOutcome(BaseEntity, AuditUpdateTimeEntityMixin):
+class TestOutcome(TimeOrderedEntity, AuditUpdateTimeEntityMixin):
     """Represents a Test Outcome in the application."""
 
     component = ForeignKeyField(Component, null=False, backref="test_outcome_component", on_delete="CASCADE")
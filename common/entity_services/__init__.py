@@ -2,6 +2,7 @@ from .company_service import *
 from .component_service import *
 from .event_service import *
 from .instance_service import *
+from .instance_summary_service import *
 from .journey_service import *
 from .organization_service import *
 from .pipeline_service import *
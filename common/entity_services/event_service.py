@@ -1,6 +1,7 @@
 __all__ = ["EventService"]
 
 from collections import defaultdict
+from uuid import UUID
 
 from peewee import JOIN, fn
 
@@ -49,7 +50,7 @@ class EventService:
         if filters.component_ids:
             filter_list.append(EventEntity.component << filters.component_ids)
         if filters.event_ids:
-            filter_list.append(EventEntity.id << filters.event_ids)
+            filter_list.append(EventEntity.id << [UUID(event_id) for event_id in filters.event_ids])
         if filters.run_ids:
             filter_list.append(EventEntity.run << filters.run_ids)
         if filters.task_ids:
@@ -188,6 +188,22 @@ class Filters:
                 }
             )
 
+    @staticmethod
+    def validate_uuids(values: list[str], query_name: str) -> None:
+        invalid_ids = []
+        for value in values:
+            try:
+                UUID(value)
+            except ValueError:
+                invalid_ids.append(value)
+        if invalid_ids:
+            raise ValidationError(
+                {
+                    invalid: f"Invalid '{query_name}' query parameter. Consult the API Documentation."
+                    for invalid in invalid_ids
+                }
+            )
+
     @staticmethod
     def validate_component_types(component_types_param: list[str]) -> None:
         COMPONENT_TYPES = [comp_type.name for comp_type in ComponentType]
@@ -341,6 +357,7 @@ class ProjectEventFilters(Filters):
         filters.project_ids = [str(u) for u in project_id_list]
 
         cls.validate_event_types(filters.event_types)
+        cls.validate_uuids(filters.event_ids, EVENT_ID_QUERY_NAME)
         cls.validate_time_range(filters.date_range_start, filters.date_range_end, DATE_RANGE_START_QUERY_NAME)
         return filters
 
@@ -1,15 +1,30 @@
 from __future__ import annotations
 
-__all__ = ["ListRules", "Page", "SortOrder", "DEFAULT_PAGE", "DEFAULT_COUNT", "ListSchema"]
+__all__ = [
+    "Cursor",
+    "ListRules",
+    "Page",
+    "SortOrder",
+    "DEFAULT_PAGE",
+    "DEFAULT_COUNT",
+    "ListSchema",
+    "decode_cursor",
+    "encode_cursor",
+]
+
+import binascii
+import json
+import operator
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from dataclasses import dataclass
 from enum import Enum as std_Enum
 from enum import auto
-from typing import Generic, Optional, TypeVar
-from collections.abc import Generator
+from typing import Any, Generic, NamedTuple, Optional, TypeVar
+from collections.abc import Callable, Generator
 
-from marshmallow import EXCLUDE, Schema
-from marshmallow.fields import Enum, Int
-from peewee import JOIN, Field, Ordering, Select
+from marshmallow import EXCLUDE, Schema, ValidationError
+from marshmallow.fields import Bool, Enum, Field as SchemaField, Int
+from peewee import JOIN, ColumnBase, Expression, Field, Ordering, Select, Value
 from werkzeug.datastructures import MultiDict
 
 from common.entities import BaseEntity
@@ -24,12 +39,50 @@ class SortOrder(std_Enum):
     DESC = auto()
 
 
+class Cursor(NamedTuple):
+    """Position in a sorted list: the database values of the sort key and of the id of the last row seen."""
+
+    value: Any
+    id: Any
+
+
+def encode_cursor(value: Any, id: Any) -> str:
+    return urlsafe_b64encode(json.dumps([value, id], separators=(",", ":")).encode()).decode()
+
+
+def decode_cursor(token: str) -> Cursor:
+    try:
+        value, id = json.loads(urlsafe_b64decode(token.encode()))
+    except (binascii.Error, UnicodeError, ValueError, TypeError) as e:
+        raise ValidationError({"cursor": ["Invalid cursor"]}) from e
+    if not all(v is None or isinstance(v, str | int | float) for v in (value, id)):
+        raise ValidationError({"cursor": ["Invalid cursor"]})
+    return Cursor(value, id)
+
+
+class CursorField(SchemaField):
+    def _deserialize(self, value: Any, attr: Optional[str], data: Any, **kwargs: Any) -> Cursor:
+        if not isinstance(value, str):
+            raise ValidationError("Invalid cursor")
+        return decode_cursor(value)
+
+
 class ListSchema(Schema):
     page = Int(
         load_default=1, metadata={"description": "A page number to use for pagination. All pagination starts with 1."}
     )
     count = Int(load_default=10, metadata={"description": "The number of results to display per page."})
     sort = Enum(SortOrder, load_default=SortOrder.ASC, metadata={"description": "The sort order for the list."})
+    cursor = CursorField(
+        load_default=None,
+        metadata={
+            "description": "The `next_cursor` of the previous page. When given, the results after the cursor are listed "
+            "and `page` is ignored."
+        },
+    )
+    include_total = Bool(
+        load_default=True, metadata={"description": "Whether the total number of results should be counted."}
+    )
 
     class Meta:
         unknown = EXCLUDE
@@ -43,7 +96,8 @@ class Page(Generic[T]):
     """
 
     results: list[T]
-    total: int
+    total: Optional[int]
+    next_cursor: Optional[str] = None
 
     def __iter__(self) -> Generator[T, None, None]:
         yield from self.results
@@ -54,23 +108,29 @@ class Page(Generic[T]):
     @classmethod
     def get_paginated_results(cls, query: Select, order_by: Field, list_rules: ListRules) -> Page[T]:
         model: BaseEntity = query.model
-        ordering = list_rules.order_by_field(order_by)
-
-        paginated_subquery: Select = (
-            model.select(model.id)
-            .where(query._where)
-            .order_by(ordering)
-            .paginate(list_rules.page, list_rules.count)
-            .alias("results")
+        ordering = list_rules.keyset_ordering(order_by, model.id)
+
+        filtered_subquery: Select = model.select(model.id).where(query._where)
+        paginated_subquery = list_rules.paginate(filtered_subquery.order_by(*ordering), order_by, model.id).alias(
+            "results"
         )
 
         results_query = query.clone()
         results_query._where = None
         results_query = results_query.join(
             paginated_subquery, join_type=JOIN.INNER, on=(model.id == paginated_subquery.c.id)
-        ).order_by(ordering)
+        ).order_by(*ordering)
 
-        return cls(results=list(results_query), total=paginated_subquery.count(clear_limit=True))
+        results = list(results_query)
+        return cls(
+            results=results,
+            total=filtered_subquery.count() if list_rules.include_total else None,
+            next_cursor=list_rules.next_cursor(
+                # Ids are held in hex by the cursors, whatever their storage format
+                results,
+                lambda r: (order_by.db_value(getattr(r, order_by.name)), r.id.hex),
+            ),
+        )
 
 
 @dataclass
@@ -84,6 +144,8 @@ class ListRules:
     count: int = DEFAULT_COUNT
     sort: SortOrder = SortOrder.ASC
     search: Optional[str] = None
+    cursor: Optional[Cursor] = None
+    include_total: bool = True
 
     @classmethod
     def from_params_without_search(cls, params: MultiDict) -> ListRules:
@@ -99,7 +161,49 @@ class ListRules:
             count=params.get("count", DEFAULT_COUNT, type=int),
             search=params.get("search", None, type=str),
             sort=(SortOrder.ASC if params.get("sort", "asc").lower() == "asc" else SortOrder.DESC),
+            cursor=decode_cursor(cursor) if (cursor := params.get("cursor")) else None,
+            include_total=params.get("include_total", "true").lower() != "false",
         )
 
-    def order_by_field(self, field: Field) -> Ordering:
+    def order_by_field(self, field: ColumnBase) -> Ordering:
         return field.asc() if self.sort == SortOrder.ASC else field.desc()
+
+    def keyset_ordering(self, sort_key: ColumnBase, id_key: ColumnBase) -> list[Ordering]:
+        """Order by the sort key and then by id, so that the position of each row can be held by a cursor."""
+        return [self.order_by_field(sort_key), self.order_by_field(id_key)]
+
+    def keyset_condition(self, sort_key: ColumnBase, id_key: ColumnBase) -> Optional[Expression]:
+        """
+        Condition matching the rows that come after the cursor, following the order given by `keyset_ordering`.
+
+        NULL sort keys come first in ascending order, and last in descending order.
+        """
+        if self.cursor is None:
+            return None
+        ascending = self.sort == SortOrder.ASC
+        after = operator.gt if ascending else operator.lt
+        last_id = Value(
+            id_key.db_value(self.cursor.id) if isinstance(id_key, Field) else self.cursor.id, converter=False
+        )
+        if self.cursor.value is None:
+            same_key_after = sort_key.is_null() & after(id_key, last_id)
+            return (same_key_after | sort_key.is_null(False)) if ascending else same_key_after
+
+        value = Value(self.cursor.value, converter=False)
+        condition = after(sort_key, value) | ((sort_key == value) & after(id_key, last_id))
+        return condition if ascending else (condition | sort_key.is_null())
+
+    def paginate(self, query: Select, sort_key: ColumnBase, id_key: ColumnBase) -> Select:
+        """Limit the query to the requested page, starting after the cursor when one is given."""
+        if (condition := self.keyset_condition(sort_key, id_key)) is not None:
+            return query.where(condition).limit(self.count)
+        return query.paginate(self.page, self.count)
+
+    def next_cursor(self, results: list[T], get_position: Callable[[T], tuple[Any, Any]]) -> Optional[str]:
+        """
+        Cursor for the page after the given results, or None when the page wasn't filled. `get_position` returns the
+        database values of the sort key and of the id of a result.
+        """
+        if not results or len(results) < self.count:
+            return None
+        return encode_cursor(*get_position(results[-1]))
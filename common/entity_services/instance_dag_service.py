@@ -1,6 +1,6 @@
 __all__ = ["InstanceDagService"]
 
-from collections import defaultdict, Counter
+from collections import defaultdict
 from itertools import chain
 from uuid import UUID
 
@@ -11,16 +11,17 @@ from common.entities import (
     DatasetOperation,
     DatasetOperationType,
     Instance,
-    InstanceAlert,
-    InstanceAlertsComponents,
     InstancesInstanceSets,
     InstanceSet,
+    InstanceSummary,
+    InstanceSummaryKind,
     Run,
     RunStatus,
     Schedule,
     TestOutcome,
 )
-from common.entity_services.instance_service import ADDITIONAL_ALERT_DESCRIPTION, InstanceService
+from common.entity_services.instance_service import summarize_alerts
+from common.entity_services.instance_summary_service import InstanceSummaryService
 from common.events.v2.test_outcomes import TestStatus
 
 RUN_STATUS_WEIGHT = {
@@ -134,91 +135,38 @@ class InstanceDagService:
         return component_statuses
 
     @staticmethod
-    def _get_runs_summary(instance: Instance) -> dict[UUID, list[dict]]:
-        runs_summary_query = InstanceService.runs_summary_query([instance.id])
-        runs_summary_query = (
-            runs_summary_query.select(*runs_summary_query.selected_columns, Run.pipeline)
-            .group_by(InstancesInstanceSets.instance, Run.pipeline, Run.status)
-            .tuples()
-        )
+    def _get_component_summaries(instance: Instance, kind: InstanceSummaryKind) -> dict[UUID, list[InstanceSummary]]:
+        summaries = defaultdict(list)
+        for summary in InstanceSummaryService.get_summaries([instance.id], kind):
+            summaries[summary.component_id].append(summary)
+        return summaries
 
-        runs_summary = defaultdict(list)
-        for _, status, count, component_id in runs_summary_query:
-            runs_summary[component_id].append({"status": status, "count": count})
-
-        return runs_summary
+    @staticmethod
+    def _get_runs_summary(instance: Instance) -> dict[UUID, list[dict]]:
+        return {
+            component_id: [{"status": s.status, "count": s.count} for s in summaries]
+            for component_id, summaries in InstanceDagService._get_component_summaries(
+                instance, InstanceSummaryKind.RUNS
+            ).items()
+        }
 
     @staticmethod
     def _get_tests_summary(instance: Instance) -> dict[UUID, list[dict]]:
-        tests_summary_query = InstanceService.tests_summary_query([instance.id])
-        tests_summary_query = (
-            tests_summary_query.select(*tests_summary_query.selected_columns, TestOutcome.component)
-            .group_by(InstancesInstanceSets.instance, TestOutcome.component, TestOutcome.status)
-            .tuples()
-        )
-
-        tests_summary = defaultdict(list)
-        for _, status, count, component_id in tests_summary_query:
-            tests_summary[component_id].append({"status": status, "count": count})
-
-        return tests_summary
+        return {
+            component_id: [{"status": s.status, "count": s.count} for s in summaries]
+            for component_id, summaries in InstanceDagService._get_component_summaries(
+                instance, InstanceSummaryKind.TESTS
+            ).items()
+        }
 
     @staticmethod
     def _get_alerts_summary(instance: Instance) -> dict[UUID, list[dict]]:
-        instance_alerts_query = InstanceService.instance_alerts_query([instance])
-        instance_alerts_query = instance_alerts_query.select(
-            *instance_alerts_query.selected_columns,
-            InstanceAlertsComponents.component.alias("component_id"),
-        ).join(InstanceAlertsComponents, on=(InstanceAlertsComponents.instance_alert == InstanceAlert.id))
-
-        run_alerts_query = InstanceService.run_alerts_query([instance])
-        run_alerts_query = run_alerts_query.select(
-            *run_alerts_query.selected_columns,
-            Run.pipeline.alias("component_id"),
-        )
-
-        alerts = instance_alerts_query.union_all(run_alerts_query)
-        agg_alerts = (
-            alerts.select_from(
-                alerts.c.component_id,
-                alerts.c.description,
-                alerts.c.level,
-                fn.COUNT(alerts.c.alert_id).alias("count"),
-                fn.ROW_NUMBER()
-                .over(partition_by=[alerts.c.component_id], order_by=[fn.COUNT(alerts.c.alert_id).desc()])
-                .alias("row_num"),
-            )
-            .group_by(alerts.c.component_id, alerts.c.description, alerts.c.level)
-            .order_by(fn.COUNT(alerts.c.alert_id).desc())
-        )
-        agg_data = list(agg_alerts)
-
-        # top 10 alerts by count for each instance
-        results = [
-            {"component_id": UUID(a.component_id), "level": a.level, "description": a.description, "count": a.count}
-            for a in agg_data
-            if a.row_num <= 10
-        ]
-        if len(agg_data) > 10:
-            additional_alerts_counter = Counter((UUID(a.component_id), a.level) for a in agg_data if a.row_num > 10)
-            results.extend(
-                [
-                    {
-                        "component_id": key[0],
-                        "level": key[1],
-                        "description": ADDITIONAL_ALERT_DESCRIPTION[key[1]],
-                        "count": val,
-                    }
-                    for key, val in additional_alerts_counter.items()
-                ]
-            )
-        alerts_summaries = defaultdict(list)
-        for res in results:
-            alerts_summaries[res["component_id"]].append(
-                {"level": res["level"], "description": res["description"], "count": res["count"]}
-            )
-
-        return alerts_summaries
+        return {
+            component_id: summarize_alerts(summaries)
+            for component_id, summaries in InstanceDagService._get_component_summaries(
+                instance, InstanceSummaryKind.COMPONENT_ALERTS
+            ).items()
+        }
 
     @staticmethod
     def _get_operations_summary(instance: Instance) -> dict[UUID, list[dict]]:
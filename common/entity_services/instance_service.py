@@ -11,16 +11,16 @@ from peewee import ModelSelect, Value, fn
 from common.entities import (
     AlertLevel,
     Instance,
-    InstanceAlert,
     InstanceSet,
     InstancesInstanceSets,
+    InstanceSummary,
+    InstanceSummaryKind,
     Journey,
     JourneyDagEdge,
     Pipeline,
     Run,
-    RunAlert,
-    TestOutcome,
 )
+from common.entity_services.instance_summary_service import InstanceSummaryService
 
 ADDITIONAL_ALERT_DESCRIPTION = {
     AlertLevel.ERROR.value: "Additional Errors (ct)",
@@ -28,6 +28,18 @@ ADDITIONAL_ALERT_DESCRIPTION = {
 }
 
 
+def summarize_alerts(alerts: Iterable[InstanceSummary]) -> list[dict]:
+    """List the 10 most frequent alerts, followed by the number of other alerts of each level."""
+    ranked = sorted(alerts, key=lambda a: (-a.count, a.description))
+    summary = [{"level": a.status, "description": a.description, "count": a.count} for a in ranked[:10]]
+    additional_alerts_counter = Counter(a.status for a in ranked[10:])
+    summary.extend(
+        {"level": level, "description": ADDITIONAL_ALERT_DESCRIPTION[level], "count": count}
+        for level, count in additional_alerts_counter.items()
+    )
+    return summary
+
+
 class InstanceService:
     @staticmethod
     def aggregate_runs_summary(instances: Iterable[Instance]) -> None:
@@ -40,13 +52,7 @@ class InstanceService:
 
     @staticmethod
     def runs_summary_query(ids: Iterable[UUID]) -> ModelSelect:
-        return (
-            Run.select(InstancesInstanceSets.instance, Run.status, fn.COUNT(Run.id).alias("count"))
-            .join(InstanceSet)
-            .join(InstancesInstanceSets)
-            .group_by(InstancesInstanceSets.instance, Run.status)
-            .where(InstancesInstanceSets.instance << ids)
-        )
+        return InstanceService._summary_query(ids, InstanceSummaryKind.RUNS)
 
     @staticmethod
     def aggregate_tests_summary(instances: Iterable[Instance]) -> None:
@@ -59,105 +65,24 @@ class InstanceService:
 
     @staticmethod
     def tests_summary_query(ids: Iterable[UUID]) -> ModelSelect:
-        return (
-            TestOutcome.select(
-                InstancesInstanceSets.instance, TestOutcome.status, fn.COUNT(TestOutcome.id).alias("count")
-            )
-            .join(InstanceSet)
-            .join(InstancesInstanceSets)
-            .group_by(InstancesInstanceSets.instance, TestOutcome.status)
-            .where(InstancesInstanceSets.instance << ids)
-            .tuples()
-        )
+        return InstanceService._summary_query(ids, InstanceSummaryKind.TESTS)
 
     @staticmethod
-    def aggregate_alerts_summary(instances: Iterable[Instance]) -> None:
-        instance_alerts = InstanceService.instance_alerts_query(instances)
-        run_alerts = InstanceService.run_alerts_query(instances)
-
-        # Query all instance alerts and run alerts of the specified instances
-        alerts = instance_alerts.union_all(run_alerts)
-        # Aggregate alerts by description and level for each instance
-        agg_alerts = alerts.select_from(
-            alerts.c.instance_id,
-            alerts.c.description,
-            alerts.c.level,
-            fn.COUNT(alerts.c.alert_id).alias("count"),
-            fn.ROW_NUMBER()
-            .over(partition_by=[alerts.c.instance_id], order_by=[fn.COUNT(alerts.c.alert_id).desc()])
-            .alias("row_num"),
-        ).group_by(alerts.c.instance_id, alerts.c.description, alerts.c.level)
-        agg_data = list(agg_alerts)
-        # top 10 alerts by count for each instance
-        results = [
-            {"instance_id": UUID(a.instance_id), "level": a.level, "description": a.description, "count": a.count}
-            for a in agg_data
-            if a.row_num <= 10
-        ]
-        if len(agg_data) > 10:
-            additional_alerts_counter = Counter((UUID(a.instance_id), a.level) for a in agg_data if a.row_num > 10)
-            results.extend(
-                [
-                    {
-                        "instance_id": key[0],
-                        "level": key[1],
-                        "description": ADDITIONAL_ALERT_DESCRIPTION[key[1]],
-                        "count": val,
-                    }
-                    for key, val in additional_alerts_counter.items()
-                ]
-            )
-        alerts_summaries = defaultdict(list)
-        for res in results:
-            alerts_summaries[res["instance_id"]].append(
-                {"level": res["level"], "description": res["description"], "count": res["count"]}
-            )
-        for instance in instances:
-            instance.alerts_summary = sorted(
-                alerts_summaries[instance.id],
-                key=lambda k: (
-                    1 if k["description"] not in ADDITIONAL_ALERT_DESCRIPTION.values() else 2,
-                    -k["count"],
-                    k["description"],
-                ),
-            )
+    def _summary_query(ids: Iterable[UUID], kind: InstanceSummaryKind) -> ModelSelect:
+        """Add up the counters of all the components of each instance."""
+        summaries = InstanceSummaryService.get_summaries(ids, kind)
+        return summaries.select(
+            InstanceSummary.instance, InstanceSummary.status, fn.SUM(InstanceSummary.count).alias("count")
+        ).group_by(InstanceSummary.instance, InstanceSummary.status)
 
     @staticmethod
-    def instance_alerts_query(instances: Iterable[Instance]) -> ModelSelect:
-        return (
-            InstanceAlert.select(
-                InstanceAlert.id.alias("alert_id"),
-                InstanceAlert.description.alias("description"),
-                InstanceAlert.level.alias("level"),
-                Instance.id.alias("instance_id"),
-                Journey.id,
-                Journey.project,
-            )
-            .join(Instance)
-            .join(Journey)
-            # Additional filter by journey id to help query performance
-            .where((Instance.id.in_(instances)) & (Journey.id.in_([i.journey.id for i in instances])))
-        )
+    def aggregate_alerts_summary(instances: Iterable[Instance]) -> None:
+        alerts = defaultdict(list)
+        for alert in InstanceSummaryService.get_summaries([i.id for i in instances], InstanceSummaryKind.ALERTS):
+            alerts[alert.instance_id].append(alert)
 
-    @staticmethod
-    def run_alerts_query(instances: Iterable[Instance]) -> ModelSelect:
-        return (
-            RunAlert.select(
-                RunAlert.id.alias("alert_id"),
-                RunAlert.description.alias("description"),
-                RunAlert.level.alias("level"),
-                Instance.id.alias("instance_id"),
-                Journey.id,
-                Journey.project,
-            )
-            .join(Run)
-            .join(InstanceSet)
-            .join(InstancesInstanceSets)
-            .join(Instance)
-            .join(Journey)
-            # Additional filter by journey id to help query performance
-            .where((Instance.id.in_(instances)) & (Journey.id.in_([i.journey.id for i in instances])))
-        )
+        for instance in instances:
+            instance.alerts_summary = summarize_alerts(alerts[instance.id])
 
     @staticmethod
     def get_instance_run_counts(
@@ -0,0 +1,279 @@
+__all__ = ["InstanceSummaryService", "SummaryKey"]
+
+import logging
+from collections import Counter
+from collections.abc import Iterable
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+from peewee import ModelSelect, SqliteDatabase, chunked, fn
+
+from common.constants import BATCH_SIZE
+from common.entities import (
+    DB,
+    AlertLevel,
+    Instance,
+    InstanceAlert,
+    InstanceAlertsComponents,
+    InstanceSet,
+    InstancesInstanceSets,
+    InstanceSummary,
+    InstanceSummaryKind,
+    Run,
+    RunAlert,
+    TestOutcome,
+)
+
+LOG = logging.getLogger(__name__)
+
+
+class SummaryKey(NamedTuple):
+    instance: UUID
+    kind: InstanceSummaryKind
+    component: Optional[UUID]
+    status: str
+    description: Optional[str] = None
+
+
+def _level_name(level: AlertLevel | str) -> str:
+    return level.name if isinstance(level, AlertLevel) else level
+
+
+def _instance_set_members(instance_set_id: Optional[UUID]) -> list[UUID]:
+    if instance_set_id is None:
+        return []
+    return [
+        i
+        for (i,) in InstancesInstanceSets.select(InstancesInstanceSets.instance)
+        .where(InstancesInstanceSets.instance_set == instance_set_id)
+        .tuples()
+    ]
+
+
+def _alert_keys(
+    instance_id: UUID, component_ids: Iterable[UUID], level: AlertLevel | str, description: str
+) -> list[SummaryKey]:
+    level_name = _level_name(level)
+    return [
+        SummaryKey(instance_id, InstanceSummaryKind.ALERTS, None, level_name, description),
+        *(
+            SummaryKey(instance_id, InstanceSummaryKind.COMPONENT_ALERTS, component_id, level_name, description)
+            for component_id in component_ids
+        ),
+    ]
+
+
+class InstanceSummaryService:
+    """
+    Maintains the `InstanceSummary` counters.
+
+    The counters are updated in the same transaction as the runs, test outcomes and alerts they count. Changes made
+    elsewhere, e.g. entities deleted by the API, are not reflected until the summaries are rebuilt.
+    """
+
+    @staticmethod
+    def increment(counts: Counter[SummaryKey]) -> None:
+        """Add the given amounts, which can be negative, to the counters. Missing counters are created."""
+        for key, amount in counts.items():
+            if amount == 0:
+                continue
+            conflict_kwargs: dict[str, object] = {"update": {InstanceSummary.count: InstanceSummary.count + amount}}
+            if isinstance(DB.obj, SqliteDatabase):  # Sqlite requires setting a conflict_target
+                conflict_kwargs["conflict_target"] = [InstanceSummary.instance, InstanceSummary.key]
+            InstanceSummary.insert(
+                instance=key.instance,
+                key=InstanceSummary.get_key(key.kind, key.component, key.status, key.description),
+                kind=key.kind,
+                component=key.component,
+                status=key.status,
+                description=key.description,
+                count=amount,
+            ).on_conflict(**conflict_kwargs).execute()
+
+    @staticmethod
+    def update_run(run: Run, *, prev_instance_set_id: Optional[UUID], prev_status: Optional[str]) -> None:
+        """
+        Move the run, and its alerts when its instance set changed, from the counters matching the previous instance
+        set and status to the counters matching the current ones.
+        """
+        if prev_instance_set_id == run.instance_set_id and prev_status == run.status:
+            return
+
+        prev_instances = _instance_set_members(prev_instance_set_id)
+        if run.instance_set_id == prev_instance_set_id:
+            instances = prev_instances
+        else:
+            instances = _instance_set_members(run.instance_set_id)
+
+        counts: Counter[SummaryKey] = Counter()
+        if prev_instances:
+            # The run was saved in an instance set before, so it had a status; the status column is NOT NULL
+            assert prev_status is not None
+            for instance_id in prev_instances:
+                counts[SummaryKey(instance_id, InstanceSummaryKind.RUNS, run.pipeline_id, prev_status)] -= 1
+        for instance_id in instances:
+            counts[SummaryKey(instance_id, InstanceSummaryKind.RUNS, run.pipeline_id, run.status)] += 1
+
+        if run.instance_set_id != prev_instance_set_id:
+            alerts = RunAlert.select(RunAlert.level, RunAlert.description).where(RunAlert.run == run.id).tuples()
+            for level, description in alerts:
+                for instance_id in prev_instances:
+                    counts.subtract(_alert_keys(instance_id, [run.pipeline_id], level, description))
+                for instance_id in instances:
+                    counts.update(_alert_keys(instance_id, [run.pipeline_id], level, description))
+
+        InstanceSummaryService.increment(counts)
+
+    @staticmethod
+    def add_test_outcomes(instance_ids: Iterable[UUID], component_id: UUID, statuses: Iterable[str]) -> None:
+        """Count new test outcomes of a component, given their statuses, for each of the instances."""
+        status_counts = Counter(statuses)
+        InstanceSummaryService.increment(
+            Counter(
+                {
+                    SummaryKey(instance_id, InstanceSummaryKind.TESTS, component_id, status): count
+                    for instance_id in instance_ids
+                    for status, count in status_counts.items()
+                }
+            )
+        )
+
+    @staticmethod
+    def add_run_alert(alert: RunAlert, run: Run) -> None:
+        counts: Counter[SummaryKey] = Counter()
+        for instance_id in _instance_set_members(run.instance_set_id):
+            counts.update(_alert_keys(instance_id, [run.pipeline_id], alert.level, alert.description))
+        InstanceSummaryService.increment(counts)
+
+    @staticmethod
+    def add_instance_alert(alert: InstanceAlert, component_ids: Iterable[UUID]) -> None:
+        InstanceSummaryService.increment(
+            Counter(_alert_keys(alert.instance_id, component_ids, alert.level, alert.description))
+        )
+
+    @staticmethod
+    def get_summaries(instance_ids: Iterable[UUID], kind: InstanceSummaryKind) -> ModelSelect:
+        return InstanceSummary.select().where(
+            InstanceSummary.instance << list(instance_ids),
+            InstanceSummary.kind == kind,
+            InstanceSummary.count > 0,
+        )
+
+    @staticmethod
+    def count_summaries(instance_ids: Iterable[UUID]) -> Counter[SummaryKey]:
+        """Compute the counters of the instances from the runs, test outcomes and alerts."""
+        instance_ids = list(instance_ids)
+        counts: Counter[SummaryKey] = Counter()
+
+        runs = (
+            Run.select(InstancesInstanceSets.instance, Run.pipeline, Run.status, fn.COUNT(Run.id))
+            .join(InstanceSet)
+            .join(InstancesInstanceSets)
+            .where(InstancesInstanceSets.instance << instance_ids)
+            .group_by(InstancesInstanceSets.instance, Run.pipeline, Run.status)
+            .tuples()
+        )
+        for instance_id, pipeline_id, status, count in runs:
+            counts[SummaryKey(instance_id, InstanceSummaryKind.RUNS, pipeline_id, status)] += count
+
+        tests = (
+            TestOutcome.select(
+                InstancesInstanceSets.instance, TestOutcome.component, TestOutcome.status, fn.COUNT(TestOutcome.id)
+            )
+            .join(InstanceSet)
+            .join(InstancesInstanceSets)
+            .where(InstancesInstanceSets.instance << instance_ids)
+            .group_by(InstancesInstanceSets.instance, TestOutcome.component, TestOutcome.status)
+            .tuples()
+        )
+        for instance_id, component_id, status, count in tests:
+            counts[SummaryKey(instance_id, InstanceSummaryKind.TESTS, component_id, status)] += count
+
+        run_alerts = (
+            RunAlert.select(
+                InstancesInstanceSets.instance,
+                Run.pipeline,
+                RunAlert.level,
+                RunAlert.description,
+                fn.COUNT(RunAlert.id),
+            )
+            .join(Run)
+            .join(InstanceSet)
+            .join(InstancesInstanceSets)
+            .where(InstancesInstanceSets.instance << instance_ids)
+            .group_by(InstancesInstanceSets.instance, Run.pipeline, RunAlert.level, RunAlert.description)
+            .tuples()
+        )
+        for instance_id, pipeline_id, level, description, count in run_alerts:
+            for key in _alert_keys(instance_id, [pipeline_id], level, description):
+                counts[key] += count
+
+        instance_alerts = (
+            InstanceAlert.select(
+                InstanceAlert.instance, InstanceAlert.level, InstanceAlert.description, fn.COUNT(InstanceAlert.id)
+            )
+            .where(InstanceAlert.instance << instance_ids)
+            .group_by(InstanceAlert.instance, InstanceAlert.level, InstanceAlert.description)
+            .tuples()
+        )
+        for instance_id, level, description, count in instance_alerts:
+            counts[SummaryKey(instance_id, InstanceSummaryKind.ALERTS, None, _level_name(level), description)] += count
+
+        instance_alert_components = (
+            InstanceAlert.select(
+                InstanceAlert.instance,
+                InstanceAlertsComponents.component,
+                InstanceAlert.level,
+                InstanceAlert.description,
+                fn.COUNT(InstanceAlert.id),
+            )
+            .join(InstanceAlertsComponents)
+            .where(InstanceAlert.instance << instance_ids)
+            .group_by(
+                InstanceAlert.instance,
+                InstanceAlertsComponents.component,
+                InstanceAlert.level,
+                InstanceAlert.description,
+            )
+            .tuples()
+        )
+        for instance_id, component_id, level, description, count in instance_alert_components:
+            key = SummaryKey(
+                instance_id, InstanceSummaryKind.COMPONENT_ALERTS, component_id, _level_name(level), description
+            )
+            counts[key] += count
+
+        return counts
+
+    @staticmethod
+    def rebuild(instance_ids: Optional[Iterable[UUID]] = None) -> int:
+        """
+        Recompute the counters of the given instances, or of all the instances, to repair any drift. Each batch of
+        instances is rebuilt in its own transaction. Returns the number of instances rebuilt.
+        """
+        if instance_ids is None:
+            instance_ids = (i for (i,) in Instance.select(Instance.id).order_by(Instance.id).tuples().iterator())
+
+        rebuilt = 0
+        for batch in chunked(instance_ids, BATCH_SIZE):
+            with DB.atomic():
+                counts = InstanceSummaryService.count_summaries(batch)
+                InstanceSummary.delete().where(InstanceSummary.instance << batch).execute()
+                InstanceSummary.bulk_create(
+                    [
+                        InstanceSummary(
+                            instance=key.instance,
+                            key=InstanceSummary.get_key(key.kind, key.component, key.status, key.description),
+                            kind=key.kind,
+                            component=key.component,
+                            status=key.status,
+                            description=key.description,
+                            count=count,
+                        )
+                        for key, count in counts.items()
+                    ],
+                    batch_size=BATCH_SIZE,
+                )
+            rebuilt += len(batch)
+            LOG.info("Rebuilt the summaries of %s instances", rebuilt)
+        return rebuilt
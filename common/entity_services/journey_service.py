@@ -1,16 +1,185 @@
-__all__ = ["JourneyService"]
+from __future__ import annotations
 
+__all__ = ["CompiledJourneyDag", "ComponentPatternIndex", "ComponentPatternMatcher", "JourneyService"]
+
+import hashlib
 import logging
-from fnmatch import fnmatch
+import re
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from fnmatch import translate
+from functools import reduce
+from graphlib import CycleError, TopologicalSorter
+from operator import or_
 from typing import Optional
 from uuid import UUID
 
+from peewee import Expression, Field
+
+from common.cache import TTLCache
 from common.entities import DB, Action, Company, Component, Journey, JourneyDagEdge, Organization, Project, Rule
 from common.entity_services.helpers import ComponentFilters, ListRules, Page
 from common.exceptions.service import MultipleActionsFound
 
 LOG = logging.getLogger(__name__)
 
+COMPILED_DAG_CACHE_SIZE: int = 1024
+"""Maximum number of compiled journey DAGs kept in the in-process cache."""
+
+COMPILED_DAG_CACHE_TTL_SECS: float = 600
+"""How long a compiled journey DAG is kept in the cache, even when its edges are unchanged."""
+
+PATTERN_INDEX_CACHE_SIZE: int = 1024
+"""Maximum number of project component pattern indexes kept in the in-process cache."""
+
+PATTERN_INDEX_CACHE_TTL_SECS: float = 600
+"""How long a project component pattern index is kept in the cache, even when the patterns are unchanged."""
+
+_WILDCARD_CHARS = re.compile(r"[*?[]")
+
+
+@dataclass(frozen=True)
+class CompiledJourneyDag:
+    """
+    Immutable view of a journey DAG which can be queried without accessing the database.
+
+    `version` identifies the set of edges the DAG was compiled from; see `JourneyService.get_compiled_dags`.
+    """
+
+    version: bytes
+    order: tuple[UUID, ...]
+    """Components in topological order, upstream components first."""
+    parents: Mapping[UUID, tuple[UUID, ...]]
+    """Direct upstream components of each component."""
+    upstream: Mapping[UUID, frozenset[UUID]]
+    """Transitive upstream components of each component."""
+
+    @classmethod
+    def compile(cls, version: bytes, edges: Iterable[tuple[Optional[UUID], UUID]]) -> CompiledJourneyDag:
+        """Compile the DAG from its `(left, right)` edges. Raises ValueError when the edges contain a cycle."""
+        graph: defaultdict[UUID, set[UUID]] = defaultdict(set)
+        for left, right in edges:
+            parents = graph[right]  # Nodes without parents are still part of the graph
+            if left is not None:
+                parents.add(left)
+        try:
+            order = tuple(TopologicalSorter(graph).static_order())
+        except CycleError as e:
+            raise ValueError("Journey DAG contains cycle errors") from e
+
+        upstream: dict[UUID, frozenset[UUID]] = {}
+        for node in order:
+            parents = graph.get(node, set())
+            upstream[node] = frozenset(parents).union(*(upstream[p] for p in parents))
+        return cls(
+            version=version,
+            order=order,
+            parents={node: tuple(parents) for node, parents in graph.items()},
+            upstream=upstream,
+        )
+
+    def upstream_of(self, component_id: UUID) -> frozenset[UUID]:
+        return self.upstream.get(component_id, frozenset())
+
+
+def _edges_digest(edge_ids: Iterable[UUID]) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    for edge_id in sorted(edge_ids):
+        digest.update(edge_id.bytes)
+    return digest.digest()
+
+
+COMPILED_DAGS: TTLCache[UUID, CompiledJourneyDag] = TTLCache(
+    max_size=COMPILED_DAG_CACHE_SIZE, ttl=COMPILED_DAG_CACHE_TTL_SECS
+)
+
+
+@dataclass(frozen=True)
+class ComponentPatternMatcher:
+    """
+    The include and exclude patterns of a journey, each list translated once into a single regular expression.
+
+    Matches the same component keys as `fnmatch` does with the individual patterns.
+    """
+
+    include: Optional[re.Pattern[str]]
+    exclude: Optional[re.Pattern[str]]
+    prefixes: tuple[str, ...]
+    """Literal prefix of each include pattern, i.e. the characters preceding its first wildcard."""
+
+    @classmethod
+    def compile(cls, include_patterns: Sequence[str], exclude_patterns: Sequence[str]) -> ComponentPatternMatcher:
+        def _combine(patterns: Sequence[str]) -> Optional[re.Pattern[str]]:
+            return re.compile("|".join(translate(p) for p in patterns)) if patterns else None
+
+        return cls(
+            include=_combine(include_patterns),
+            exclude=_combine(exclude_patterns),
+            prefixes=tuple(_WILDCARD_CHARS.split(p, maxsplit=1)[0] for p in include_patterns),
+        )
+
+    def matches(self, key: str) -> bool:
+        if self.include is None or not self.include.match(key):
+            return False
+        return self.exclude is None or not self.exclude.match(key)
+
+    def prefilter(self, key_field: Field) -> Optional[Expression]:
+        """
+        SQL condition selecting a superset of the keys matching the include patterns, using their literal prefixes.
+        Returns None when a pattern starts with a wildcard, as every key may then match.
+        """
+        if not self.prefixes or not all(self.prefixes):
+            return None
+        return reduce(or_, (key_field.startswith(prefix) for prefix in sorted(set(self.prefixes))))
+
+
+@dataclass(frozen=True)
+class ComponentPatternIndex:
+    """
+    The pattern matchers of all the journeys of a project, indexed by the literal prefixes of their include patterns
+    so that a component key is only matched against the journeys it can belong to.
+
+    `version` holds the patterns the index was compiled from; see `JourneyService.get_pattern_index`.
+    """
+
+    version: tuple[tuple[UUID, Optional[str], Optional[str]], ...]
+    matchers: Mapping[UUID, ComponentPatternMatcher]
+    by_prefix: Mapping[str, tuple[UUID, ...]]
+    prefix_lengths: tuple[int, ...]
+
+    @classmethod
+    def compile(cls, version: tuple[tuple[UUID, Optional[str], Optional[str]], ...]) -> ComponentPatternIndex:
+        """Compile the index from the `(journey id, include patterns, exclude patterns)` of the journeys."""
+        matchers: dict[UUID, ComponentPatternMatcher] = {}
+        by_prefix: defaultdict[str, set[UUID]] = defaultdict(set)
+        for journey_id, include, exclude in version:
+            if not (include_patterns := JourneyService.parse_patterns(include)):
+                continue
+            matcher = ComponentPatternMatcher.compile(include_patterns, JourneyService.parse_patterns(exclude))
+            matchers[journey_id] = matcher
+            for prefix in matcher.prefixes:
+                by_prefix[prefix].add(journey_id)
+        return cls(
+            version=version,
+            matchers=matchers,
+            by_prefix={prefix: tuple(journey_ids) for prefix, journey_ids in by_prefix.items()},
+            prefix_lengths=tuple(sorted({len(prefix) for prefix in by_prefix})),
+        )
+
+    def matching_journeys(self, key: str) -> list[UUID]:
+        candidates: set[UUID] = set()
+        for length in self.prefix_lengths:
+            if length > len(key):
+                break
+            candidates.update(self.by_prefix.get(key[:length], ()))
+        return [journey_id for journey_id in sorted(candidates) if self.matchers[journey_id].matches(key)]
+
+
+PATTERN_INDEXES: TTLCache[UUID, ComponentPatternIndex] = TTLCache(
+    max_size=PATTERN_INDEX_CACHE_SIZE, ttl=PATTERN_INDEX_CACHE_TTL_SECS
+)
+
 
 class JourneyService:
     @staticmethod
@@ -77,12 +246,11 @@ class JourneyService:
     ) -> list[Component]:
         if not include_patterns:
             return []
-        components: list[Component] = list(Component.select().where(Component.project == project_id))
-        return [
-            c
-            for c in components
-            if any(fnmatch(c.key, p) for p in include_patterns) and not any(fnmatch(c.key, p) for p in exclude_patterns)
-        ]
+        matcher = ComponentPatternMatcher.compile(include_patterns, exclude_patterns)
+        query = Component.select().where(Component.project == project_id)
+        if (prefilter := matcher.prefilter(Component.key)) is not None:
+            query = query.where(prefilter)
+        return [c for c in query if matcher.matches(c.key)]
 
     @staticmethod
     def apply_component_patterns(journey: Journey) -> None:
@@ -113,33 +281,66 @@ class JourneyService:
             for edge in restored_edges:
                 JourneyDagEdge(journey=journey, left=edge.left, right=edge.right).save(force_insert=True)
 
+    @staticmethod
+    def get_pattern_index(project_id: UUID) -> ComponentPatternIndex:
+        """
+        Return the component pattern index of the project, compiling it only when missing from the cache or outdated.
+
+        The version of the index is the patterns of the journeys, which are read in a single narrow query, so that
+        changing the patterns from any process is picked up immediately.
+        """
+        version = tuple(
+            Journey.select(Journey.id, Journey.component_include_patterns, Journey.component_exclude_patterns)
+            .where(Journey.project == project_id, Journey.component_include_patterns.is_null(False))
+            .order_by(Journey.id)
+            .tuples()
+        )
+        if (index := PATTERN_INDEXES.get(project_id)) is None or index.version != version:
+            index = ComponentPatternIndex.compile(version)
+            PATTERN_INDEXES.set(project_id, index)
+        return index
+
     @staticmethod
     def add_component_to_matching_journeys(component: Component) -> None:
-        journeys = list(
-            Journey.select().where(
-                Journey.project == component.project_id,
-                Journey.component_include_patterns.is_null(False),
-            )
+        index = JourneyService.get_pattern_index(component.project_id)
+        for journey_id in index.matching_journeys(component.key):
+            JourneyDagEdge(journey=journey_id, left=None, right=component).save(force_insert=True)
+
+    @staticmethod
+    def get_compiled_dags(journey_ids: Iterable[UUID]) -> dict[UUID, CompiledJourneyDag]:
+        """
+        Return the compiled DAG of each journey, compiling only the ones missing from the cache or outdated.
+
+        The version of a DAG is a digest of the sorted ids of its edges, which are read for all the journeys in a
+        single query served by the journey index. Edges are never modified, only added and deleted, so adding,
+        removing or replacing edges changes it, including when the edges are removed by deleting a component.
+        """
+        if not (journey_ids := set(journey_ids)):
+            return {}
+        edge_ids: dict[UUID, list[UUID]] = {journey_id: [] for journey_id in journey_ids}
+        edge_id_query = (
+            JourneyDagEdge.select(JourneyDagEdge.journey, JourneyDagEdge.id)
+            .where(JourneyDagEdge.journey.in_(journey_ids))
+            .tuples()
         )
-        for journey in journeys:
-            include_patterns = JourneyService.parse_patterns(journey.component_include_patterns)
-            exclude_patterns = JourneyService.parse_patterns(journey.component_exclude_patterns)
-            if not include_patterns:
-                continue
-            if any(fnmatch(component.key, p) for p in include_patterns) and not any(
-                fnmatch(component.key, p) for p in exclude_patterns
-            ):
-                JourneyDagEdge(journey=journey, left=None, right=component).save(force_insert=True)
+        for journey_id, edge_id in edge_id_query:
+            edge_ids[journey_id].append(edge_id)
+        versions = {journey_id: _edges_digest(ids) for journey_id, ids in edge_ids.items()}
+
+        dags: dict[UUID, CompiledJourneyDag] = {}
+        for journey_id, version in versions.items():
+            if (dag := COMPILED_DAGS.get(journey_id)) is None or dag.version != version:
+                edges = (
+                    JourneyDagEdge.select(JourneyDagEdge.left, JourneyDagEdge.right)
+                    .where(JourneyDagEdge.journey == journey_id)
+                    .tuples()
+                )
+                dag = CompiledJourneyDag.compile(version, edges)
+                COMPILED_DAGS.set(journey_id, dag)
+            dags[journey_id] = dag
+        return dags
 
     @staticmethod
-    def get_upstream_nodes(journey: Journey, component_id: UUID) -> set:
-        journey_dag = journey.journey_dag
-        upstream_nodes = set()
-        queue = [next((node for node in journey_dag if node.id == component_id), None)]
-        while queue:
-            if cur := queue.pop(0):
-                for edge in journey_dag[cur]:
-                    if edge.left is not None:
-                        upstream_nodes.add(edge.left_id)
-                        queue.append(edge.left)
-        return upstream_nodes
+    def get_upstream_nodes(journey: Journey, component_id: UUID) -> set[UUID]:
+        dag = JourneyService.get_compiled_dags((journey.id,))[journey.id]
+        return set(dag.upstream_of(component_id))
@@ -142,7 +142,7 @@ class ProjectService:
                 memberships.append(Pipeline.tool.in_(filters.tools))
 
         query = query.where(*memberships)
-        paginated_query = query.order_by(rules.order_by_field(start_dt)).paginate(rules.page, rules.count)
+        paginated_query = rules.paginate(query.order_by(*rules.keyset_ordering(start_dt, Run.id)), start_dt, Run.id)
         tasks_summary = RunTask.select(RunTask.run, RunTask.status, fn.COUNT(RunTask.id).alias("count")).group_by(
             RunTask.run, RunTask.status
         )
@@ -150,7 +150,13 @@ class ProjectService:
             TestOutcome.run, TestOutcome.status, fn.COUNT(TestOutcome.id).alias("count")
         ).group_by(TestOutcome.run, TestOutcome.status)
         result = paginated_query.prefetch(tasks_summary, tests_summary, prefetch_type=PREFETCH_TYPE.JOIN)
-        return Page[Run](results=result, total=query.count())
+        return Page[Run](
+            results=result,
+            total=query.count() if rules.include_total else None,
+            next_cursor=rules.next_cursor(
+                result, lambda r: (Run.start_time.db_value(r.start_dt), Run.id.db_value(r.id))
+            ),
+        )
 
     @staticmethod
     def get_instances_with_rules(
@@ -188,11 +194,9 @@ class ProjectService:
             .where(*memberships)
         )
 
-        results = (
-            query.order_by(rules.order_by_field(Instance.start_time))
-            .paginate(rules.page, rules.count)
-            .prefetch(Journey, InstanceRule, Component, Schedule, prefetch_type=PREFETCH_TYPE.JOIN)
-        )
+        results = rules.paginate(
+            query.order_by(*rules.keyset_ordering(Instance.start_time, Instance.id)), Instance.start_time, Instance.id
+        ).prefetch(Journey, InstanceRule, Component, Schedule, prefetch_type=PREFETCH_TYPE.JOIN)
 
         for instance in results:
             if (
@@ -208,7 +212,13 @@ class ProjectService:
         InstanceService.aggregate_runs_summary(results)
         InstanceService.aggregate_tests_summary(results)
         InstanceService.aggregate_alerts_summary(results)
-        return Page[Instance](results=results, total=query.count())
+        return Page[Instance](
+            results=results,
+            total=query.count() if rules.include_total else None,
+            next_cursor=rules.next_cursor(
+                results, lambda i: (Instance.start_time.db_value(i.start_time), Instance.id.db_value(i.id))
+            ),
+        )
 
     @staticmethod
     def get_journeys_with_rules(project_id: str, rules: ListRules, component_id: Optional[str] = None) -> Page[Journey]:
@@ -304,8 +314,9 @@ class ProjectService:
             alerts_union.c.created_on,
         )
 
-        ordering = rules.order_by_field(alerts_union.c.created_on)
-        paginated = list(alerts.order_by(ordering).paginate(rules.page, rules.count))
+        alert_id = fn.COALESCE(alerts_union.c.instance_id, alerts_union.c.run_id)
+        ordering = rules.keyset_ordering(alerts_union.c.created_on, alert_id)
+        paginated = list(rules.paginate(alerts.order_by(*ordering), alerts_union.c.created_on, alert_id))
         instance_alerts = (
             InstanceAlert.select(InstanceAlert).where(
                 InstanceAlert.id.in_([a.instance_id for a in paginated if a.instance_id])
@@ -317,10 +328,17 @@ class ProjectService:
 
         combined_alerts = run_alerts + instance_alerts
         combined_alerts.sort(
-            key=lambda a: a.created_on,
+            key=lambda a: (a.created_on, a.id.hex),
             reverse=True if rules.sort == SortOrder.DESC else False,
         )
-        return Page(results=UIAlertSchema().dump(combined_alerts, many=True), total=alerts.count())
+        return Page(
+            results=UIAlertSchema().dump(combined_alerts, many=True),
+            total=alerts.count() if rules.include_total else None,
+            next_cursor=rules.next_cursor(
+                combined_alerts,
+                lambda a: (a.__class__.created_on.db_value(a.created_on), a.__class__.id.db_value(a.id)),
+            ),
+        )
 
     @staticmethod
     def get_template_actions(project: Project, actions: list[ActionImpl]) -> dict[str, Action]:
@@ -18,13 +18,13 @@ from functools import partial
 from typing import Optional
 from uuid import UUID
 from uuid import UUID as std_UUID
-from uuid import uuid4
 
 from marshmallow import Schema
 from marshmallow.fields import UUID as m_UUID
 
 from common.decorators import cached_property
 from common.entities import ComponentType, Pipeline, Project, Run, RunTask, Task
+from common.uuid_utils import uuid7
 
 
 @dataclass(kw_only=True)
@@ -115,5 +115,5 @@ class JourneyMixin:
 
 @dataclass(kw_only=True)
 class EventBaseMixin:
-    event_id: UUID = field(default_factory=uuid4)
+    event_id: UUID = field(default_factory=uuid7)
     created_timestamp: datetime = field(default_factory=partial(datetime.now, tz=timezone.utc))
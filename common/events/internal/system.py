@@ -1,4 +1,4 @@
-__all__ = ["AgentStatusChangeEvent"]
+__all__ = ["AgentStatusChangeEvent", "ComponentChangeEvent", "RuleChangeEvent"]
 
 from datetime import datetime
 from dataclasses import dataclass
@@ -17,3 +17,22 @@ class AgentStatusChangeEvent(EventBaseMixin, ProjectMixin):
     current_status: AgentStatus
     latest_heartbeat: datetime
     latest_event_timestamp: datetime
+
+
+@dataclass(kw_only=True)
+class RuleChangeEvent(EventBaseMixin):
+    """Published when the rules of a journey are created, updated or deleted, for the rules engines to reload them."""
+
+    journey_id: UUID
+
+    @property
+    def partition_identifier(self) -> str:
+        """Implementing the common.kafka.topic.PayloadInterface protocol."""
+        return str(self.journey_id)
+
+
+@dataclass(kw_only=True)
+class ComponentChangeEvent(EventBaseMixin, ProjectMixin):
+    """Published when a component is updated or deleted, for the run managers to forget the cached component."""
+
+    component_id: UUID
@@ -6,7 +6,7 @@ import logging
 from dataclasses import InitVar, dataclass, field
 from datetime import datetime, timezone
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from common.decorators import cached_property
 from common.entities import (
@@ -32,6 +32,7 @@ from common.events.base import InstanceRef
 from common.events.event_handler import EventHandlerBase
 from common.events.v1.event_interface import EventInterface
 from common.events.v1.event_schemas import EventApiSchema
+from common.uuid_utils import uuid7
 
 LOG = logging.getLogger(__name__)
 
@@ -139,7 +140,7 @@ class Event(EventInterface):
         event_body["event_type"] = cls.__name__
         # We want to be able to trace an event through the system, and give an ID to the user. We'd thought
         # to use the elastic ID, but decided for a full through-put, a separate ID was more useful.
-        event_body["event_id"] = uuid4()
+        event_body["event_id"] = uuid7()
 
         result: Event = cls.from_dict(event_body)
         return result
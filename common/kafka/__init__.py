@@ -1,5 +1,6 @@
 from .consumer import *
 from .errors import *
+from .listener import *
 from .message import *
 from .producer import *
 from .settings import *
@@ -6,7 +6,7 @@ from types import FrameType
 from typing import Any, Optional
 from collections.abc import Iterator
 
-from confluent_kafka import Consumer, Message
+from confluent_kafka import Consumer, Message, TopicPartition
 
 from common.kafka.errors import (
     ConsumerCommitError,
@@ -127,6 +127,25 @@ class KafkaConsumer:
                 raise
         self.disconnect()
 
+    def batches(self, max_messages: int, timeout: float) -> Iterator[list[KafkaMessage]]:
+        """
+        Like iterating over the consumer, but yields lists of up to `max_messages` messages, waiting at most
+        `timeout` seconds for each list to fill up.
+        """
+        self.connect()
+        while not self.killer.should_exit:
+            try:
+                messages = self.consume(max_messages, timeout)
+
+                if not messages:
+                    LOG.debug("Waiting for messages...")
+                    continue
+                yield messages
+            except (ConsumerError, MessageError):
+                LOG.critical("Error receiving messages", exc_info=True)
+                raise
+        self.disconnect()
+
     def connect(self) -> None:
         if not self.consumer:
             self.consumer = Consumer(self.config)
@@ -145,23 +164,61 @@ class KafkaConsumer:
     def get_offsets(self) -> Any:
         return self.consumer.position(self.consumer.assignment())
 
-    def commit(self) -> Any:
-        """Commit until last consumed message"""
+    def commit(self, offsets: Optional[list[TopicPartition]] = None) -> Any:
+        """Commit until last consumed message, or up to the given offsets"""
         try:
+            if offsets:
+                return self.consumer.commit(offsets=offsets, asynchronous=False)
             return self.consumer.commit(asynchronous=False)
         except Exception as e:
             raise ConsumerCommitError from e
 
-    def poll(self) -> Optional[KafkaMessage]:
+    def store_offsets(self, offsets: list[TopicPartition]) -> None:
+        """
+        Store the offsets to be committed by the next automatic commit. Only useful when the consumer is configured
+        with `enable.auto.offset.store` disabled, otherwise the offsets are stored as the messages are consumed.
+        """
+        try:
+            self.consumer.store_offsets(offsets=offsets)
+        except Exception as e:
+            raise ConsumerCommitError from e
+
+    def pause(self, partitions: list[TopicPartition]) -> None:
+        """Stop fetching messages from the given partitions until they are resumed, while staying in the group."""
         try:
-            msg: Optional[Message] = self.consumer.poll(CONSUMER_POLL_PERIOD_SECS)
+            self.consumer.pause(partitions)
+        except Exception as e:
+            raise ConsumerError("Error pausing partitions") from e
+
+    def resume(self, partitions: list[TopicPartition]) -> None:
+        try:
+            self.consumer.resume(partitions)
+        except Exception as e:
+            raise ConsumerError("Error resuming partitions") from e
+
+    def poll(self, timeout: float = CONSUMER_POLL_PERIOD_SECS) -> Optional[KafkaMessage]:
+        try:
+            msg: Optional[Message] = self.consumer.poll(timeout)
         except DisconnectedConsumerError:
             raise
         except Exception as ex:
             raise ConsumerError("Error pooling for messages") from ex
         if msg is None:
             return None
-        elif msg.error():
+        return self._deserialize(msg)
+
+    def consume(self, max_messages: int, timeout: float) -> list[KafkaMessage]:
+        """Consume up to `max_messages` messages, blocking for at most `timeout` seconds"""
+        try:
+            msgs: list[Message] = self.consumer.consume(max_messages, timeout)
+        except DisconnectedConsumerError:
+            raise
+        except Exception as ex:
+            raise ConsumerError("Error consuming messages") from ex
+        return [message for msg in msgs if (message := self._deserialize(msg)) is not None]
+
+    def _deserialize(self, msg: Message) -> Optional[KafkaMessage]:
+        if msg.error():
             raise MessageError(msg.error())
         try:
             topic = self.topics[msg.topic()]
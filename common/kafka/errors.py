@@ -34,6 +34,10 @@ class ProducerConfigurationError(ProducerError):
     pass
 
 
+class ProducerQueueFullError(ProducerError):
+    """The local queue of messages waiting to be delivered is full; the caller should back off and retry later."""
+
+
 class ConsumerError(Exception):
     pass
 
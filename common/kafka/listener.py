@@ -0,0 +1,60 @@
+__all__ = ["ChangesListener"]
+
+import logging
+import threading
+from typing import Optional
+
+from common.kafka.consumer import KafkaConsumer
+from common.kafka.message import KafkaMessage
+
+LOG = logging.getLogger(__name__)
+
+ERROR_BACKOFF_SECS: float = 5
+"""How long to wait before consuming the changes again after an error."""
+
+
+class ChangesListener:
+    """
+    Consumes, in a background thread, the changes published for the in-process caches of a service to apply them.
+
+    Every process has to see every change, so each of them is expected to consume the topic in its own consumer group,
+    starting from the latest offset: the changes made before it started are already reflected by its caches. The caches
+    must still expire their entries, as changes can be missed.
+
+    The thread is tied to the consumer, and runs until `stop` is called or the process is asked to exit.
+    """
+
+    thread_name: str = "changes-listener"
+
+    def __init__(self, consumer: KafkaConsumer) -> None:
+        self.consumer = consumer
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def handle(self, message: KafkaMessage) -> None:
+        raise NotImplementedError
+
+    def _listen(self) -> None:
+        while not self._stopped.is_set() and not self.consumer.killer.should_exit:
+            try:
+                self.consumer.connect()
+                if message := self.consumer.poll():
+                    self.handle(message)
+            except Exception:
+                LOG.exception("Error consuming the changes in %s", self.thread_name)
+                self._stopped.wait(ERROR_BACKOFF_SECS)
+        try:
+            self.consumer.disconnect()
+        except Exception:
+            LOG.exception("Error disconnecting the consumer of %s", self.thread_name)
+
+    def start(self) -> None:
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._listen, name=self.thread_name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
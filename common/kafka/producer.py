@@ -9,7 +9,7 @@ from types import TracebackType
 from typing import Any, Optional
 from collections.abc import Callable, Generator
 
-from confluent_kafka import KafkaError, KafkaException, Message, Producer
+from confluent_kafka import KafkaError, KafkaException, Message, Producer, TopicPartition
 
 from common.kafka.consumer import KafkaTransactionalConsumer
 from common.kafka.errors import (
@@ -17,6 +17,7 @@ from common.kafka.errors import (
     MessageTooLargeError,
     ProducerConfigurationError,
     ProducerError,
+    ProducerQueueFullError,
     ProducerTransactionError,
     SerializationError,
 )
@@ -67,14 +68,18 @@ class KafkaProducer:
 
     Config reference docs: https://github.com/edenhill/librdkafka/blob/master/CONFIGURATION.md
 
+    A `delivery_callback` can be given to replace the default delivery report, which raises a ProducerError from
+    whatever poll() or flush() call happens to serve it. Long-lived producers shared between callers should provide
+    one that does not raise.
     """
 
-    def __init__(self, config: dict) -> None:
+    def __init__(self, config: dict, delivery_callback: Optional[Callable[[KafkaError, Message], None]] = None) -> None:
         if PRODUCER_MANDATORY_SETTINGS.keys() & config.keys():
             raise ProducerConfigurationError(
                 f"Local configuration cannot override any of {PRODUCER_MANDATORY_SETTINGS.keys()}"
             )
         self.producer = DisconnectedProducer()
+        self.delivery_callback = delivery_callback
         self.config = {
             **config,
             # Environment settings can override settings from the call site
@@ -96,9 +101,14 @@ class KafkaProducer:
         if not self.producer:
             self.producer = Producer(self.config)
 
-    def disconnect(self) -> None:
+    def disconnect(self, timeout: Optional[float] = None) -> None:
         if self.producer:
-            self.producer.flush()
+            if timeout is None:
+                self.producer.flush()
+            elif pending := self.producer.flush(timeout):
+                LOG.error(
+                    "%s message(s) were still pending delivery after %s seconds and were discarded", pending, timeout
+                )
             self.producer = DisconnectedProducer()
 
     def is_topic_available(self, topic: Topic, timeout: int = KAFKA_OP_TIMEOUT_SECS) -> bool:
@@ -112,7 +122,7 @@ class KafkaProducer:
                 raise ProducerError(f"Failed to produce message: {err}")
             LOG.debug("Message delivered to %s [%s]", message.topic(), message.partition())
 
-        callback = callback or delivery_report
+        callback = callback or self.delivery_callback or delivery_report
         try:
             message = topic.serialize(event)
         except Exception as ex:
@@ -124,6 +134,8 @@ class KafkaProducer:
             self.producer.poll(0)
         except DisconnectedProducerError:
             raise
+        except BufferError as ex:
+            raise ProducerQueueFullError("The local producer queue is full") from ex
         except KafkaException as ex:
             if ex.args[0].code() == KafkaError.MSG_SIZE_TOO_LARGE:
                 raise MessageTooLargeError("Payload is too large to fit into a single Kafka message") from ex
@@ -174,10 +186,14 @@ class KafkaTransactionalProducer(KafkaProducer):
     def abort_tx(self) -> None:
         self.producer.abort_transaction(PRODUCER_TX_OPS_TIMEOUT_SECS)
 
-    def commit_tx(self) -> None:
+    def commit_tx(self, offsets: Optional[list[TopicPartition]] = None) -> None:
+        """
+        Commit the transaction along with the consumer offsets. Unless explicit `offsets` are given, the position of
+        the consumer in all its assigned partitions is committed.
+        """
         if self.tx_consumer:
             self.producer.send_offsets_to_transaction(
-                self.tx_consumer.get_offsets(),
+                offsets or self.tx_consumer.get_offsets(),
                 self.tx_consumer.get_group_metadata(),
                 # Docs say this argument is in seconds, but it's actually milliseconds
                 PRODUCER_TX_OPS_TIMEOUT_SECS * 1000,
@@ -185,12 +201,14 @@ class KafkaTransactionalProducer(KafkaProducer):
         self.producer.commit_transaction(PRODUCER_TX_COMMIT_TIMEOUT_SECS)
 
     @contextmanager
-    def transaction(self) -> Generator[KafkaTransactionalProducer, None, None]:
+    def transaction(
+        self, offsets: Optional[list[TopicPartition]] = None
+    ) -> Generator[KafkaTransactionalProducer, None, None]:
         try:
             self.begin_tx()
             yield self
             self.producer.flush()
-            self.commit_tx()
+            self.commit_tx(offsets)
         except KafkaException as e:
             # Certain errors requires aborting the transaction. Retriable
             # errors are also aborted since the retry logic is performed by
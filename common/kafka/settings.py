@@ -14,6 +14,9 @@ PRODUCER_TX_OPS_TIMEOUT_SECS: float = 5
 PRODUCER_TX_COMMIT_TIMEOUT_SECS: int = 6
 """How long to wait for commit operation."""
 
+PRODUCER_SHUTDOWN_FLUSH_TIMEOUT_SECS: float = 10
+"""How long a long-lived producer waits for its pending messages to be delivered when the process exits."""
+
 PRODUCER_MANDATORY_SETTINGS = {
     "request.required.acks": "all",
 }
@@ -4,6 +4,8 @@ __all__ = [
     "TOPIC_UNIDENTIFIED_EVENTS",
     "TOPIC_SCHEDULED_EVENTS",
     "TOPIC_DEAD_LETTER_OFFICE",
+    "TOPIC_RULE_CHANGES",
+    "TOPIC_COMPONENT_CHANGES",
 ]
 
 
@@ -16,6 +18,10 @@ from confluent_kafka import Message
 from common import messagepack as msgpack
 from common.events.v1 import EventInterface, instantiate_event_from_data
 from common.kafka.message import KafkaMessage
+from conf import settings
+
+CONTENT_TYPE_HEADER = "Content-Type"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
 
 
 class PayloadInterface(Protocol):
@@ -85,7 +91,7 @@ class MsgPackTopic(Topic):
         return ProduceMessageArgs(
             value=msgpack.dumps(event),
             topic=self.name,
-            headers={"Content-Type": "application/msgpack"},
+            headers={CONTENT_TYPE_HEADER: MSGPACK_CONTENT_TYPE},
             key=event.partition_identifier,
         )
 
@@ -105,6 +111,11 @@ class MixedTopic(Topic):
     """
     This class mix JSON and msgpack serialization in the same topic.
 
+    The format of each message is told by its Content-Type header, so messages of either format are always read. The
+    v1 events are produced as JSON unless the `KAFKA_BINARY_V1_EVENTS` setting is enabled, which should only be done
+    once every consumer of the topic reads the header, so that a rolling upgrade does not lose any message. Events
+    produced as msgpack are trusted: they are not validated again by the event schemas when consumed.
+
     It is created as an interim solution as JSON serialization is graudally phased out. It should not be used more than
     what is necessary.
     """
@@ -112,7 +123,7 @@ class MixedTopic(Topic):
     binary: bool = True  # and False
 
     def serialize(self, event: EventInterface | PayloadInterface) -> ProduceMessageArgs:
-        if isinstance(event, EventInterface):
+        if isinstance(event, EventInterface) and not settings.KAFKA_BINARY_V1_EVENTS:
             return ProduceMessageArgs(
                 value=event.as_bytes(), topic=self.name, headers={}, key=event.partition_identifier
             )
@@ -120,19 +131,20 @@ class MixedTopic(Topic):
             return ProduceMessageArgs(
                 value=msgpack.dumps(event),
                 topic=self.name,
-                headers={"Content-Type": "application/msgpack"},
+                headers={CONTENT_TYPE_HEADER: MSGPACK_CONTENT_TYPE},
                 key=event.partition_identifier,
             )
 
     def deserialize(self, message: Message) -> KafkaMessage[EventInterface] | KafkaMessage[PayloadInterface]:
-        if not message.headers():
+        headers = _get_headers_as_dict(message.headers())
+        if headers.get(CONTENT_TYPE_HEADER) != MSGPACK_CONTENT_TYPE:
             msg_data = json.loads(message.value().decode("utf-8"))
             return KafkaMessage[EventInterface](
                 payload=instantiate_event_from_data(msg_data),
                 topic=message.topic(),
                 partition=message.partition(),
                 offset=message.offset(),
-                headers=_get_headers_as_dict(message.headers()),
+                headers=headers,
                 key=message.key(),
             )
         else:
@@ -141,7 +153,7 @@ class MixedTopic(Topic):
                 topic=message.topic(),
                 partition=message.partition(),
                 offset=message.offset(),
-                headers=_get_headers_as_dict(message.headers()),
+                headers=headers,
                 key=message.key(),
             )
 
@@ -149,7 +161,7 @@ class MixedTopic(Topic):
 TOPIC_IDENTIFIED_EVENTS = MixedTopic(name="IdentifiedEvents")
 """Kafka topic for identified events."""
 
-TOPIC_UNIDENTIFIED_EVENTS = JsonV1Topic(name="UnidentifiedEvents")
+TOPIC_UNIDENTIFIED_EVENTS = MixedTopic(name="UnidentifiedEvents")
 """Kafka topic for unidentified events."""
 
 TOPIC_SCHEDULED_EVENTS = MsgPackTopic(name="ScheduledEvents")
@@ -157,3 +169,9 @@ TOPIC_SCHEDULED_EVENTS = MsgPackTopic(name="ScheduledEvents")
 
 TOPIC_DEAD_LETTER_OFFICE = JsonV1Topic(name="DeadLetterOffice")
 """Kafka topic for any event that isn't recognizable by the system """
+
+TOPIC_RULE_CHANGES = MsgPackTopic(name="RuleChanges")
+"""Kafka topic notifying every rules engine of the journeys whose rules changed."""
+
+TOPIC_COMPONENT_CHANGES = MsgPackTopic(name="ComponentChanges")
+"""Kafka topic notifying every run manager of the components that were updated or deleted."""
@@ -5,6 +5,7 @@ from dataclasses import is_dataclass
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum, IntEnum
+from functools import lru_cache
 from importlib import import_module
 from io import BytesIO
 from pathlib import Path, PurePath, PurePosixPath, PureWindowsPath
@@ -18,6 +19,7 @@ from boltons.dictutils import FrozenDict
 from boltons.ioutils import SpooledBytesIO, SpooledStringIO
 from msgpack import ExtType
 
+from common.events.v1 import EVENT_TYPE_MAP, Event
 from common.events.v2 import BatchPipelineStatus, MessageLog, MetricLog, TestOutcomes
 
 path_order = [PurePath, PurePosixPath, PureWindowsPath, Path]
@@ -55,6 +57,9 @@ V2_EVENTS = FrozenDict(
 V2_EVENTS_REV_MAP = FrozenDict({v: k for k, v in V2_EVENTS.items()})
 """Registry of Event classes to Event ID's."""
 
+V1_EVENTS = FrozenDict(EVENT_TYPE_MAP)
+"""Registry of V1 Event type names to Event classes."""
+
 
 class TypeID(IntEnum):
     TUPLE = 1
@@ -74,12 +79,16 @@ class TypeID(IntEnum):
     FROZEN_SET = 15
     ENUM = 16
     V2_EVENT = 50
+    V1_EVENT = 51
 
 
+@lru_cache(maxsize=1024)
 def import_string(import_name: str) -> Any:
     """
     Attempt to import a module or module attribute from a dot-notation string path.
 
+    The result is cached, as the same classes are imported over and over to decode enums and dataclasses.
+
     Example::
 
         >>> ret = import_string("datetime.date")
@@ -125,7 +134,7 @@ def serialize_custom(value: object) -> object:
         case Decimal():
             return ExtType(TypeID.DECIMAL.value, str(value).encode("utf-8"))
         case UUID():
-            return ExtType(TypeID.UUID.value, value.int.to_bytes(128, "little"))
+            return ExtType(TypeID.UUID.value, value.int.to_bytes(16, "little"))
         case slice():
             return ExtType(TypeID.SLICE.value, dumps((value.start, value.stop, value.step)))
         case range():
@@ -151,6 +160,10 @@ def serialize_custom(value: object) -> object:
         case BatchPipelineStatus():
             data = {x: getattr(value, x) for x in value.__dataclass_fields__.keys()}
             return ExtType(TypeID.V2_EVENT, dumps((V2_EVENTS_REV_MAP[BatchPipelineStatus], data)))
+        case Event():
+            # The event is trusted as it is: unlike its JSON form, it is not validated again by its schema when loaded
+            data = {x: getattr(value, x) for x in value.__dataclass_fields__.keys()}
+            return ExtType(TypeID.V1_EVENT, dumps((value.__class__.__name__, data)))
         case Enum():
             return ExtType(
                 TypeID.ENUM, dumps((f"{value.__class__.__module__}.{value.__class__.__name__}", value.value))
@@ -245,6 +258,9 @@ def decode_ext(code: int, data: bytes) -> object:
             event_map = event_data[1]
             EventKlass = V2_EVENTS[event_id]
             return EventKlass(**event_map)
+        case TypeID.V1_EVENT:
+            event_type, event_map = cast(tuple[str, dict], loads(data))
+            return V1_EVENTS[event_type](**event_map)
         case TypeID.ENUM:
             enum_data = cast(tuple[str, object], loads(data))
             enum_module = enum_data[0]
@@ -55,6 +55,7 @@ def walk(module: Optional[ModuleType] = None) -> dict[str, Model]:
                 dir_obj is Model
                 or dir_obj is entities.BaseModel
                 or dir_obj is entities.BaseEntity
+                or dir_obj is entities.TimeOrderedEntity
                 or dir_obj is entities.ActivableEntityMixin
                 or dir_obj is entities.AuditEntityMixin
             ):
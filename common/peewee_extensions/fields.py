@@ -1,4 +1,11 @@
-__all__ = ["DomainField", "EnumStrField", "JSONStrListField", "UTCTimestampField", "ZoneInfoField"]
+__all__ = [
+    "DomainField",
+    "EnumStrField",
+    "JSONStrListField",
+    "TimeOrderedUUIDField",
+    "UTCTimestampField",
+    "ZoneInfoField",
+]
 
 import logging
 import re
@@ -7,16 +14,17 @@ from datetime import datetime, timezone
 from enum import Enum
 from json import dumps as json_dumps
 from json import loads as json_loads
-from typing import Any, Optional, Union, cast
 from re import Pattern
+from typing import Any, Optional, Union, cast
 from unicodedata import normalize
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from marshmallow import Schema
-from peewee import CharField, IntegerField, TextField, TimestampField
+from peewee import BinaryUUIDField, CharField, IntegerField, TextField, TimestampField
 from playhouse.mysql_ext import JSONField
 
 from common.decorators import cached_property
+from common.uuid_utils import uuid7
 
 LOG = logging.getLogger(__name__)
 
@@ -162,6 +170,22 @@ class ZoneInfoField(CharField):
         return value
 
 
+class TimeOrderedUUIDField(BinaryUUIDField):
+    """
+    A UUID field stored as 16 bytes, which defaults to time-ordered (version 7) UUIDs.
+
+    Being half the size of the hex representation, and increasing over time, it keeps the primary key index and all the
+    secondary indexes, which embed the primary key, compact. Values are read as `UUID` objects, so the entities and the
+    API schemas are unaware of the storage format.
+    """
+
+    field_type = "BINARY(16)"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("default", uuid7)
+        super().__init__(*args, **kwargs)
+
+
 class JSONStrListField(TextField):
     """
     A field for storing a list of strings in a JSON field.
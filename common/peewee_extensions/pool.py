@@ -0,0 +1,118 @@
+__all__ = ["PoolStats", "ReconnectingPooledMySQLDatabase"]
+
+import logging
+from time import monotonic
+from typing import Any, NamedTuple, Optional
+
+from playhouse.pool import MaxConnectionsExceeded, PooledMySQLDatabase
+from playhouse.shortcuts import ReconnectMixin
+
+LOG = logging.getLogger(__name__)
+
+
+class PoolStats(NamedTuple):
+    max_connections: int
+    in_use: int
+    idle: int
+    checkouts: int
+    """Number of connections handed out since the pool was created, whether new or reused."""
+    created: int
+    """Number of connections opened to the database server."""
+    dropped: int
+    """Number of idle connections found closed by the server when checked out."""
+    exhausted: int
+    """Number of checkouts that failed because all the connections remained in use for the whole wait timeout."""
+
+
+class ReconnectingPooledMySQLDatabase(ReconnectMixin, PooledMySQLDatabase):
+    """
+    Connection pool for MySQL, which reconnects when a query fails because the server closed the connection.
+
+    Returning a connection with `DB.close()` and checking it out again with `DB.connect()` is cheap, so it can be done
+    for every request or message. Unlike the playhouse pool, which pings the server on every checkout, only
+    connections that were idle for longer than `ping_after_idle` seconds are checked before being reused.
+
+    The `pool_stats` are logged when the pool is exhausted, and on the first checkout every `stats_log_interval`
+    seconds.
+    """
+
+    def __init__(
+        self,
+        database: Any,
+        *,
+        ping_after_idle: Optional[float] = 30,
+        stats_log_interval: Optional[float] = 300,
+        **kwargs: Any,
+    ) -> None:
+        self.ping_after_idle = ping_after_idle
+        self.stats_log_interval = stats_log_interval
+        self._stats_logged_at = monotonic()
+        self._released_at: dict[int, float] = {}
+        self._checkouts = 0
+        self._created = 0
+        self._dropped = 0
+        self._exhausted = 0
+        super().__init__(database, **kwargs)
+
+    @property
+    def pool_stats(self) -> PoolStats:
+        with self._pool_lock:
+            return PoolStats(
+                max_connections=self._max_connections,
+                in_use=len(self._in_use),
+                idle=len(self._connections),
+                checkouts=self._checkouts,
+                created=self._created,
+                dropped=self._dropped,
+                exhausted=self._exhausted,
+            )
+
+    def connect(self, reuse_if_open: bool = False) -> bool:
+        try:
+            connected = bool(super().connect(reuse_if_open))
+        except MaxConnectionsExceeded:
+            # Raised once the wait timeout expired; the pool retries the checkout until then
+            with self._pool_lock:
+                self._exhausted += 1
+            LOG.warning("Database connection pool exhausted", extra={"db_pool": self.pool_stats._asdict()})
+            raise
+        self._log_stats_periodically()
+        return connected
+
+    def _log_stats_periodically(self) -> None:
+        if self.stats_log_interval is None:
+            return
+        now = monotonic()
+        with self._pool_lock:
+            if now - self._stats_logged_at < self.stats_log_interval:
+                return
+            self._stats_logged_at = now
+        LOG.info("Database connection pool stats", extra={"db_pool": self.pool_stats._asdict()})
+
+    def _connect(self) -> Any:
+        with self._pool_lock:
+            conn = super()._connect()
+            self._checkouts += 1
+            if self._released_at.pop(self.conn_key(conn), None) is None:
+                self._created += 1
+            return conn
+
+    def _is_closed(self, conn: Any) -> bool:
+        key = self.conn_key(conn)
+        released_at = self._released_at.get(key)
+        if self.ping_after_idle is not None and released_at is not None:
+            if monotonic() - released_at <= self.ping_after_idle:
+                return False
+        if closed := bool(super()._is_closed(conn)):
+            self._released_at.pop(key, None)
+            self._dropped += 1
+        return closed
+
+    def _close(self, conn: Any, close_conn: bool = False) -> None:
+        with self._pool_lock:
+            key = self.conn_key(conn)
+            super()._close(conn, close_conn)
+            if not close_conn and any(idle is conn for *_, idle in self._connections):
+                self._released_at[key] = monotonic()
+            else:
+                self._released_at.pop(key, None)
@@ -0,0 +1,47 @@
+__all__ = ["TransactionalDatabaseProxy"]
+
+import logging
+from collections.abc import Callable
+
+from peewee import DatabaseProxy, _savepoint
+
+LOG = logging.getLogger(__name__)
+
+
+class _Savepoint(_savepoint):
+    def rollback(self) -> None:
+        super().rollback()
+        self.db._notify_rollback()
+
+
+class TransactionalDatabaseProxy(DatabaseProxy):
+    """
+    Database proxy which lets in-process caches know when a transaction, or a savepoint, is rolled back.
+
+    Entities read or written by a transaction that was rolled back may not exist anymore, so caches holding them should
+    register a callback with `on_rollback`. The callbacks are called by the thread that rolled back, after every
+    rollback made through `atomic`, `transaction` or `savepoint`.
+    """
+
+    def __init__(self) -> None:
+        # The proxy only allows setting its slots, forwarding everything else to the database
+        object.__setattr__(self, "_rollback_callbacks", [])
+        super().__init__()
+
+    def on_rollback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        self._rollback_callbacks.append(callback)
+        return callback
+
+    def _notify_rollback(self) -> None:
+        for callback in self._rollback_callbacks:
+            try:
+                callback()
+            except Exception:
+                LOG.exception("Error calling rollback callback %s", callback)
+
+    def rollback(self) -> None:
+        self.obj.rollback()
+        self._notify_rollback()
+
+    def savepoint(self) -> _Savepoint:
+        return _Savepoint(self)
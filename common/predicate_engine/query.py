@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-__all__ = ["ConnectorType", "rule_to_predicate", "get_rule_fields"]
+__all__ = ["ConnectorType", "compile_rule", "rule_to_predicate", "get_rule_fields"]
 
 import logging
+import re
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
 from copy import copy, deepcopy
 from datetime import datetime, timezone
 from enum import Enum
-from functools import partial, reduce
+from functools import cache, partial
 from typing import Any, Final, Optional, Union
 from collections.abc import Callable, Iterable
 
@@ -20,6 +21,18 @@ SENTINEL_NONE = object()  # Fake None singleton (to avoid confusion with None co
 NULL_OPERATOR: Final[QueryOperator] = get_operator("isnull")
 """The is_null predicate function."""
 
+REGEX_OPERATORS: Final[dict[QueryOperator, re.RegexFlag]] = {
+    get_operator("regex"): re.NOFLAG,
+    get_operator("iregex"): re.IGNORECASE,
+}
+"""The regex predicate functions, along with the flags they search with."""
+
+R_OPERATOR: Final[QueryOperator] = get_operator("r")
+"""The predicate function matching a nested rule."""
+
+DATABASE_NAMESPACE: Final[str] = "database"
+"""Leaves spanning this attribute query the database, so they are evaluated after the others by compiled rules."""
+
 
 def _ensure_utc(dt: datetime) -> datetime:
     """
@@ -39,22 +52,30 @@ def _ensure_utc(dt: datetime) -> datetime:
     return dt.astimezone(timezone.utc)
 
 
-def getattr_recursive(lookup_obj: Any, attr_name: str, *args: Any) -> Any:
-    """Recursively follow attribute spanning notation up the chain. 'foo__bar__baz'"""
+def _getattr(obj: Any, attr: str, *args: Any) -> Any:
+    if isinstance(obj, Mapping) and attr in obj:
+        try:
+            ret_val = obj.get(attr, SENTINEL_NONE)
+        except Exception:
+            return getattr(obj, attr, *args)  # Fall back to normal getattr
+        if ret_val is SENTINEL_NONE:
+            return getattr(obj, attr, *args)  # Fall back to normal getattr
+        else:
+            return ret_val
+    return getattr(obj, attr, *args)
 
-    def _getattr(obj: Any, attr: str) -> Any:
-        if isinstance(obj, Mapping) and attr in obj:
-            try:
-                ret_val = obj.get(attr, SENTINEL_NONE)
-            except Exception:
-                return getattr(obj, attr, *args)  # Fall back to normal getattr
-            if ret_val is SENTINEL_NONE:
-                return getattr(obj, attr, *args)  # Fall back to normal getattr
-            else:
-                return ret_val
-        return getattr(obj, attr, *args)
 
-    return reduce(_getattr, [lookup_obj] + attr_name.split("__"))
+@cache
+def _split_attr_name(attr_name: str) -> tuple[str, ...]:
+    return tuple(attr_name.split("__"))
+
+
+def getattr_recursive(lookup_obj: Any, attr_name: str, *args: Any) -> Any:
+    """Recursively follow attribute spanning notation up the chain. 'foo__bar__baz'"""
+    value = lookup_obj
+    for attr in _split_attr_name(attr_name):
+        value = _getattr(value, attr, *args)
+    return value
 
 
 class ConnectorType(Enum):
@@ -231,6 +252,52 @@ class ATLEAST(_Encapsulate):
         return i >= self.count
 
 
+def _compare(inst_value: Any, compare_value: Any, op_func: QueryOperator) -> bool:
+    """Compare the value of an instance attribute with the value of a rule leaf."""
+    if inst_value is SENTINEL_NONE:
+        # For __isnull=True, a missing attribute should be a successful match (it's VERY null)
+        if op_func is NULL_OPERATOR and compare_value is True:
+            return True
+        # Fail all other comparisons
+        return False
+
+    if isinstance(compare_value, _Encapsulate):
+        try:
+            return compare_value.matches(op_func=op_func, instance_value=inst_value)
+        except TypeError:
+            # See TypeError in the next try/except block
+            return False
+        except AttributeError:
+            # See AttributeError in the next try/except block
+            return False
+
+    try:
+        return bool(op_func(inst_value, compare_value))
+    except TypeError:
+        # If instance.attr_name is None, not all operators can handle that comparison and instead raise a
+        # TypeError. For those cases, we simply return False. If we happen to be attempting to compare two
+        # datetime objects, one of which is naive, AND if the operator is one which directly compares the two
+        # values, then coerce them UTC and retry the comparison.
+        if isinstance(inst_value, datetime) and isinstance(compare_value, datetime):
+            _inst_utc = _ensure_utc(inst_value)
+            _comp_utc = _ensure_utc(compare_value)
+            try:
+                if op_func(_inst_utc, _comp_utc):
+                    return True
+                else:
+                    return False
+            except Exception:
+                LOG.warning("Error comparing %s to %s", _inst_utc, _comp_utc, exc_info=True)
+                return False
+        else:
+            return False
+    except AttributeError:
+        # The comparision depended on attributes that one of the values to compare does not have. i.e. a None
+        # will not have a .lower() function and so case insensitive matches cannot be performed. Since such
+        # comparisons make no sense anyway, this is a failed match as well.
+        return False
+
+
 def rule_to_predicate(rtree: Union[R, tuple[str, object]]) -> Callable[[object], bool]:
     """Given a rules object (R), return a predicate function which determines whether an object matches the rule."""
     if isinstance(rtree, R):
@@ -249,49 +316,7 @@ def rule_to_predicate(rtree: Union[R, tuple[str, object]]) -> Callable[[object],
         child_obj: tuple[str, object] = rtree
 
         def op_compare(instance: Any, *, compare_value: Any, attr_name: str, op_func: QueryOperator) -> bool:
-            inst_value = getattr_recursive(instance, attr_name, SENTINEL_NONE)
-            if inst_value is SENTINEL_NONE:
-                # For __isnull=True, a missing attribute should be a successful match (it's VERY null)
-                if op_func is NULL_OPERATOR and compare_value is True:
-                    return True
-                # Fail all other comparisons
-                return False
-
-            if isinstance(compare_value, _Encapsulate):
-                try:
-                    return compare_value.matches(op_func=op_func, instance_value=inst_value)
-                except TypeError:
-                    # See TypeError in the next try/except block
-                    return False
-                except AttributeError:
-                    # See AttributeError in the next try/except block
-                    return False
-
-            try:
-                return bool(op_func(inst_value, compare_value))
-            except TypeError:
-                # If instance.attr_name is None, not all operators can handle that comparison and instead raise a
-                # TypeError. For those cases, we simply return False. If we happen to be attempting to compare two
-                # datetime objects, one of which is naive, AND if the operator is one which directly compares the two
-                # values, then coerce them UTC and retry the comparison.
-                if isinstance(inst_value, datetime) and isinstance(compare_value, datetime):
-                    _inst_utc = _ensure_utc(inst_value)
-                    _comp_utc = _ensure_utc(compare_value)
-                    try:
-                        if op_func(_inst_utc, _comp_utc):
-                            return True
-                        else:
-                            return False
-                    except Exception:
-                        LOG.warning("Error comparing %s to %s", _inst_utc, _comp_utc, exc_info=True)
-                        return False
-                else:
-                    return False
-            except AttributeError:
-                # The comparision depended on attributes that one of the values to compare does not have. i.e. a None
-                # will not have a .lower() function and so case insensitive matches cannot be performed. Since such
-                # comparisons make no sense anyway, this is a failed match as well.
-                return False
+            return _compare(getattr_recursive(instance, attr_name, SENTINEL_NONE), compare_value, op_func)
 
         # A left/right side comparison setup - left side is the attribute name and optionally, an operator string
         # while the right side is the value to compare against
@@ -430,3 +455,74 @@ def get_rule_fields(search_object: Union[R, tuple[str, Any]]) -> set[str]:
         child_fields = get_rule_fields(child_tuple)
         fields.update(child_fields)
     return {x for x in fields}
+
+
+def _rule_cost(rtree: Union[R, tuple[str, object]]) -> int:
+    """Rough cost of evaluating a rule node: 1 when it may query the database, 0 otherwise."""
+    if isinstance(rtree, R):
+        return max((_rule_cost(child) for child in rtree.children), default=0)
+    attr_name, _ = split_operators(rtree[0])
+    return 1 if _split_attr_name(attr_name)[0] == DATABASE_NAMESPACE else 0
+
+
+def _compile_operator(op_func: QueryOperator, compare_value: object) -> QueryOperator:
+    """Bind the parts of an operator that only depend on the value of the rule."""
+    match_value = compare_value.wrapped_value if isinstance(compare_value, _Encapsulate) else compare_value
+    if (flags := REGEX_OPERATORS.get(op_func)) is not None and isinstance(match_value, str):
+        search = re.compile(match_value, flags).search
+        return lambda x, _: bool(search(x))
+    if op_func is R_OPERATOR and isinstance(match_value, R):
+        nested = compile_rule(match_value)
+        return lambda x, _: nested(x)
+    return op_func
+
+
+def _compile_leaf(leaf: tuple[str, object]) -> Callable[[object], bool]:
+    op_key, compare_value = leaf
+    attr_name, op_func = get_operators(op_key)
+    path = _split_attr_name(attr_name)
+    op_func = _compile_operator(op_func, compare_value)
+
+    def predicate(instance: object) -> bool:
+        value = instance
+        for attr in path:
+            value = _getattr(value, attr, SENTINEL_NONE)
+        return _compare(value, compare_value, op_func)
+
+    predicate.__doc__ = f"Compiled comparison callable for rule: {leaf}"
+    return predicate
+
+
+def compile_rule(rtree: Union[R, tuple[str, object]]) -> Callable[[object], bool]:
+    """
+    Given a rules object (R), return an evaluator that determines whether an object matches the rule.
+
+    The evaluator behaves like the predicate built by `rule_to_predicate`, but the tree is only walked once: attribute
+    paths are split, operators looked up, regular expressions and nested rules compiled ahead of the evaluations. The
+    children of each node are also reordered so that the leaves reading the database are evaluated last, and can be
+    skipped when the others already decide the outcome. Compile a rule once and keep the evaluator for as long as
+    the rule is in use.
+    """
+    if not isinstance(rtree, R):
+        return _compile_leaf(rtree)
+
+    children = tuple(compile_rule(child) for child in sorted(rtree.children, key=_rule_cost))
+    negated = rtree.negated
+    if rtree.conn_type is ConnectorType.OR:
+
+        def evaluate(instance: object) -> bool:
+            for child in children:
+                if child(instance):
+                    return not negated
+            return negated
+
+    else:
+
+        def evaluate(instance: object) -> bool:
+            for child in children:
+                if not child(instance):
+                    return negated
+            return not negated
+
+    evaluate.__doc__ = f"Compiled callable for rule: {rtree}"
+    return evaluate
@@ -5,7 +5,7 @@ from common.events.v1 import ApiRunStatus, RunStatusEvent
 from conf import init_db
 from common.schemas.action_schemas import HttpMethod, WebhookActionArgsSchema
 from common.actions.webhook_action import WebhookAction
-from rules_engine.journey_rules import _get_rules
+from rules_engine.journey_rules import RULES_CACHE
 from testlib.fixtures.web_server import webhook_server  # noqa: F401
 
 
@@ -33,7 +33,7 @@ def action(company):
 
 @pytest.fixture
 def db_rule(journey, pipeline, action):
-    _get_rules.cache_clear()
+    RULES_CACHE.clear()
     rule = Rule.create(
         action=action.action_impl,
         component=pipeline,
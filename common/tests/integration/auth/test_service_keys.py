@@ -1,7 +1,11 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
 import pytest
 
 from common.auth.keys import service_key
-from common.entities import Company, Organization, Project, Service
+from common.auth.keys.lib import hash_value
+from common.entities import Company, Organization, Project, Service, ServiceAccountKey
 
 
 @pytest.fixture
@@ -18,3 +22,59 @@ def test_generate_and_validate_key(project):
     data = service_key.validate_key(new_key)
     assert data.valid is True
     assert data.allowed_services == [Service.EVENTS_API.name]
+
+
+@pytest.mark.integration
+def test_validate_key_cached(project):
+    new_key = service_key.generate_key(allowed_services=[Service.EVENTS_API.name], project=project)
+    with patch("common.auth.keys.service_key.hash_value", wraps=hash_value) as hash_mock:
+        validated = service_key.validate_key_cached(new_key.encoded_key)
+        assert validated.project == project
+        assert validated.key_data.allowed_services == [Service.EVENTS_API.name]
+        assert service_key.validate_key_cached(new_key.encoded_key) == validated
+    hash_mock.assert_called_once()
+
+
+@pytest.mark.integration
+def test_validate_key_cached_invalidated(project):
+    new_key = service_key.generate_key(allowed_services=[Service.EVENTS_API.name], project=project)
+    assert service_key.validate_key_cached(new_key.encoded_key) is not None
+
+    service_key.invalidate_key(new_key.key_entity.id)
+    with patch("common.auth.keys.service_key.hash_value", wraps=hash_value) as hash_mock:
+        assert service_key.validate_key_cached(new_key.encoded_key) is not None
+    hash_mock.assert_called_once()
+
+
+@pytest.mark.integration
+def test_validate_key_cached_deleted(project):
+    new_key = service_key.generate_key(allowed_services=[Service.EVENTS_API.name], project=project)
+    assert service_key.validate_key_cached(new_key.encoded_key) is not None
+
+    new_key.key_entity.delete_instance()
+    assert service_key.validate_key_cached(new_key.encoded_key) is None
+
+
+@pytest.mark.integration
+def test_validate_key_cached_project_deleted(project):
+    new_key = service_key.generate_key(allowed_services=[Service.EVENTS_API.name], project=project)
+    assert service_key.validate_key_cached(new_key.encoded_key) is not None
+
+    project.delete_instance()
+    assert service_key.validate_key_cached(new_key.encoded_key) is None
+
+
+@pytest.mark.integration
+def test_validate_key_cached_expired(project):
+    new_key = service_key.generate_key(allowed_services=[Service.EVENTS_API.name], project=project)
+    ServiceAccountKey.update(expiry=datetime.now(timezone.utc) - timedelta(seconds=1)).execute()
+    assert service_key.validate_key_cached(new_key.encoded_key) is None
+
+
+@pytest.mark.integration
+def test_validate_key_cached_expired_after_validation(project):
+    new_key = service_key.generate_key(allowed_services=[Service.EVENTS_API.name], project=project)
+    assert service_key.validate_key_cached(new_key.encoded_key) is not None
+
+    ServiceAccountKey.update(expiry=datetime.now(timezone.utc) - timedelta(seconds=1)).execute()
+    assert service_key.validate_key_cached(new_key.encoded_key) is None
@@ -1,8 +1,10 @@
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
-from common.entities import Instance
+from common.entities import DB, Instance, InstanceSet
+from common.entities.instance import INSTANCE_SET_CACHE
 
 
 @pytest.mark.integration
@@ -23,3 +25,59 @@ def test_instance_active_query(instance):
     instance.end_time = datetime.utcnow()
     instance.save()
     assert 1 == Instance.select().where(Instance.active == False).count()
+
+
+@pytest.fixture
+def instance_2(journey):
+    return Instance.create(journey=journey)
+
+
+@pytest.mark.integration
+def test_instance_set_get_or_create(instance, instance_2):
+    INSTANCE_SET_CACHE.clear()
+    instance_set = InstanceSet.get_or_create([instance.id, instance_2.id])
+
+    assert instance_set.digest == InstanceSet.get_digest([instance_2.id, instance.id])
+    assert {iis.instance_id for iis in instance_set.iis} == {instance.id, instance_2.id}
+
+    INSTANCE_SET_CACHE.clear()
+    assert InstanceSet.get_or_create([instance_2.id, instance.id]).id == instance_set.id
+    assert InstanceSet.get_or_create([instance.id]).id != instance_set.id
+    assert InstanceSet.select().count() == 2
+
+
+@pytest.mark.integration
+def test_instance_set_get_or_create_cached(instance):
+    INSTANCE_SET_CACHE.clear()
+    instance_set = InstanceSet.get_or_create([instance.id])
+
+    with patch.object(InstanceSet, "get") as get_mock:
+        assert InstanceSet.get_or_create([instance.id]) is instance_set
+    get_mock.assert_not_called()
+
+
+@pytest.mark.integration
+def test_instance_set_get_or_create_rolled_back(instance):
+    INSTANCE_SET_CACHE.clear()
+    with pytest.raises(ValueError), DB.atomic():
+        InstanceSet.get_or_create([instance.id])
+        raise ValueError
+
+    assert len(INSTANCE_SET_CACHE) == 0
+    assert InstanceSet.get_or_create([instance.id]).id == InstanceSet.get().id
+
+
+@pytest.mark.integration
+def test_instance_set_get_or_create_concurrently_created(instance):
+    INSTANCE_SET_CACHE.clear()
+    existing = InstanceSet.create(digest=InstanceSet.get_digest([instance.id]))
+
+    with patch.object(InstanceSet, "get", side_effect=InstanceSet.DoesNotExist):
+        assert InstanceSet.get_or_create([instance.id]).id == existing.id
+    assert InstanceSet.select().count() == 1
+
+
+@pytest.mark.integration
+def test_instance_set_get_or_create_empty():
+    with pytest.raises(ValueError):
+        InstanceSet.get_or_create([])
@@ -3,7 +3,7 @@ from datetime import datetime, timedelta
 import pytest
 
 from common.entities import Instance, InstanceSet, Run, RunStatus, TestOutcome
-from common.entity_services import InstanceService
+from common.entity_services import InstanceService, InstanceSummaryService
 from common.events.v1 import TestStatuses
 
 
@@ -23,6 +23,7 @@ def test_aggregate_runs_summary(journey, pipeline, patched_instance_set):
             start_time=datetime.utcnow(),
             end_time=datetime.utcnow() + timedelta(minutes=5),
         )
+    InstanceSummaryService.rebuild([instance_1.id, instance_2.id])
     InstanceService.aggregate_runs_summary([instance_1, instance_2])
     assert len(instance_1.runs_summary) == 2
     assert {"status": "FAILED", "count": 4} in instance_1.runs_summary
@@ -45,6 +46,7 @@ def test_aggregate_tests_summary(journey, pipeline, patched_instance_set):
             name="My test",
             status=TestStatuses.FAILED.name if i % 2 else TestStatuses.WARNING.name,
         )
+    InstanceSummaryService.rebuild([instance_1.id, instance_2.id])
     InstanceService.aggregate_tests_summary([instance_1, instance_2])
     assert len(instance_1.tests_summary) == 2
     assert {"status": "FAILED", "count": 4} in instance_1.tests_summary
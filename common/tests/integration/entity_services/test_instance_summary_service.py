@@ -0,0 +1,132 @@
+from collections import Counter
+
+import pytest
+
+from common.entities import (
+    AlertLevel,
+    Instance,
+    InstanceAlert,
+    InstanceAlertsComponents,
+    InstanceAlertType,
+    InstanceSet,
+    InstanceSummary,
+    InstanceSummaryKind,
+    Run,
+    RunAlert,
+    RunAlertType,
+    RunStatus,
+)
+from common.entity_services import InstanceSummaryService, SummaryKey
+from common.entity_services.instance_service import ADDITIONAL_ALERT_DESCRIPTION, summarize_alerts
+
+
+def _stored_counts() -> Counter[SummaryKey]:
+    return Counter(
+        {
+            SummaryKey(s.instance_id, s.kind, s.component_id, s.status, s.description): s.count
+            for s in InstanceSummary.select()
+            if s.count
+        }
+    )
+
+
+@pytest.fixture
+def instances(journey, patched_instance_set):
+    instance_1 = Instance.create(journey=journey)
+    instance_2 = Instance.create(journey=journey)
+    yield instance_1, instance_2
+
+
+@pytest.mark.integration
+def test_increment(instance, pipeline):
+    key = SummaryKey(instance.id, InstanceSummaryKind.RUNS, pipeline.id, RunStatus.RUNNING.name)
+
+    InstanceSummaryService.increment(Counter({key: 2}))
+    InstanceSummaryService.increment(Counter({key: 3}))
+    InstanceSummaryService.increment(Counter({key: -4}))
+
+    summary = InstanceSummary.get()
+    assert summary.count == 1
+    assert summary.kind == InstanceSummaryKind.RUNS
+    assert summary.component_id == pipeline.id
+    assert summary.status == RunStatus.RUNNING.name
+
+
+@pytest.mark.integration
+def test_update_run(instances, pipeline):
+    instance_1, instance_2 = instances
+    instance_set_1 = InstanceSet.get_or_create([instance_1.id])
+    instance_set_2 = InstanceSet.get_or_create([instance_1.id, instance_2.id])
+    run = Run.create(key="r1", pipeline=pipeline, status=RunStatus.RUNNING.name, instance_set=instance_set_1)
+    InstanceSummaryService.update_run(run, prev_instance_set_id=None, prev_status=None)
+    alert = RunAlert.create(run=run, level=AlertLevel.WARNING, type=RunAlertType.LATE_END, description="Late end of P1")
+    InstanceSummaryService.add_run_alert(alert, run)
+    assert _stored_counts() == InstanceSummaryService.count_summaries([instance_1.id, instance_2.id])
+
+    run.status = RunStatus.COMPLETED.name
+    run.instance_set = instance_set_2
+    run.save()
+    InstanceSummaryService.update_run(run, prev_instance_set_id=instance_set_1.id, prev_status=RunStatus.RUNNING.name)
+
+    counts = _stored_counts()
+    assert counts == InstanceSummaryService.count_summaries([instance_1.id, instance_2.id])
+    for instance in instances:
+        assert counts[SummaryKey(instance.id, InstanceSummaryKind.RUNS, pipeline.id, RunStatus.COMPLETED.name)] == 1
+        assert counts[SummaryKey(instance.id, InstanceSummaryKind.ALERTS, None, "WARNING", "Late end of P1")] == 1
+        assert (
+            counts[
+                SummaryKey(instance.id, InstanceSummaryKind.COMPONENT_ALERTS, pipeline.id, "WARNING", "Late end of P1")
+            ]
+            == 1
+        )
+    assert counts[SummaryKey(instance_1.id, InstanceSummaryKind.RUNS, pipeline.id, RunStatus.RUNNING.name)] == 0
+
+
+@pytest.mark.integration
+def test_add_instance_alert(instance, pipeline, pipeline_2):
+    alert = InstanceAlert.create(
+        instance=instance, level=AlertLevel.ERROR.name, type=InstanceAlertType.INCOMPLETE, description="Incomplete"
+    )
+    InstanceAlertsComponents.create(instance_alert=alert, component=pipeline)
+    InstanceAlertsComponents.create(instance_alert=alert, component=pipeline_2)
+
+    InstanceSummaryService.add_instance_alert(alert, [pipeline.id, pipeline_2.id])
+
+    counts = _stored_counts()
+    assert counts == InstanceSummaryService.count_summaries([instance.id])
+    assert counts[SummaryKey(instance.id, InstanceSummaryKind.ALERTS, None, "ERROR", "Incomplete")] == 1
+    assert sum(counts.values()) == 3
+
+
+@pytest.mark.integration
+def test_rebuild(instances, pipeline):
+    instance_1, instance_2 = instances
+    instance_set = InstanceSet.get_or_create([instance_1.id, instance_2.id])
+    Run.create(key="r1", pipeline=pipeline, status=RunStatus.FAILED.name, instance_set=instance_set)
+    stale_key = SummaryKey(instance_1.id, InstanceSummaryKind.RUNS, pipeline.id, RunStatus.RUNNING.name)
+    InstanceSummaryService.increment(Counter({stale_key: 5}))
+
+    assert InstanceSummaryService.rebuild([instance_1.id]) == 1
+    assert _stored_counts() == Counter(
+        {SummaryKey(instance_1.id, InstanceSummaryKind.RUNS, pipeline.id, RunStatus.FAILED.name): 1}
+    )
+
+    assert InstanceSummaryService.rebuild() == 2
+    assert _stored_counts() == InstanceSummaryService.count_summaries([instance_1.id, instance_2.id])
+    assert len(_stored_counts()) == 2
+
+
+@pytest.mark.unit
+def test_summarize_alerts():
+    alerts = [
+        InstanceSummary(status="ERROR" if i % 2 else "WARNING", description=f"Alert {i:02}", count=i + 1)
+        for i in range(14)
+    ]
+
+    summary = summarize_alerts(alerts)
+
+    assert [a["description"] for a in summary[:10]] == [f"Alert {i:02}" for i in range(13, 3, -1)]
+    assert summary[10:] == [
+        {"level": "ERROR", "description": ADDITIONAL_ALERT_DESCRIPTION["ERROR"], "count": 2},
+        {"level": "WARNING", "description": ADDITIONAL_ALERT_DESCRIPTION["WARNING"], "count": 2},
+    ]
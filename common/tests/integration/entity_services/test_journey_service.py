@@ -1,9 +1,11 @@
+from fnmatch import fnmatchcase
 from uuid import uuid4
 
 import pytest
+from peewee import fn
 
-from common.entities import Action, ActionImpl, Company, Journey, JourneyDagEdge, Rule
-from common.entity_services import JourneyService
+from common.entities import Action, ActionImpl, Company, Component, Journey, JourneyDagEdge, Rule
+from common.entity_services import CompiledJourneyDag, ComponentPatternIndex, ComponentPatternMatcher, JourneyService
 from common.entity_services.helpers import ComponentFilters, ListRules
 from common.exceptions.service import MultipleActionsFound
 
@@ -392,3 +394,132 @@ def test_get_upstream_nodes(
     for node in journey.journey_dag:
         resp = JourneyService.get_upstream_nodes(journey, node.id)
         assert resp == {components[idx].id for idx in expected[node.key]}
+
+
+@pytest.mark.unit
+def test_compiled_dag_upstream_closure():
+    a, b, c, d = (uuid4() for _ in range(4))
+    dag = CompiledJourneyDag.compile(b"", [(None, a), (a, b), (a, c), (b, d), (c, d)])
+
+    assert dag.order.index(a) < dag.order.index(b) < dag.order.index(d)
+    assert dag.upstream_of(a) == frozenset()
+    assert dag.upstream_of(b) == {a}
+    assert dag.upstream_of(d) == {a, b, c}
+    assert dag.upstream_of(uuid4()) == frozenset()
+
+
+@pytest.mark.unit
+def test_compiled_dag_cycle():
+    a, b = uuid4(), uuid4()
+    with pytest.raises(ValueError):
+        CompiledJourneyDag.compile(b"", [(a, b), (b, a)])
+
+
+@pytest.mark.integration
+def test_get_compiled_dags_recompiled_on_edge_change(project, pipeline, pipeline_2, pipeline_3, dag1_data):
+    journey = Journey.create(name="journey-compiled-test", project=project)
+    create_dag(journey, dag1_data)
+
+    dag = JourneyService.get_compiled_dags([journey.id])[journey.id]
+    assert JourneyService.get_compiled_dags([journey.id])[journey.id] is dag
+    assert dag.upstream_of(pipeline_3.id) == {pipeline.id, pipeline_2.id}
+
+    JourneyDagEdge.delete().where(JourneyDagEdge.journey == journey, JourneyDagEdge.right == pipeline_2).execute()
+    JourneyDagEdge.create(journey=journey, left=None, right=pipeline_2)
+
+    new_dag = JourneyService.get_compiled_dags([journey.id])[journey.id]
+    assert new_dag is not dag
+    assert new_dag.upstream_of(pipeline_3.id) == {pipeline_2.id}
+
+
+@pytest.mark.integration
+def test_get_compiled_dags_recompiled_on_edge_swap(project, pipeline, pipeline_2, pipeline_3, dag1_data):
+    journey = Journey.create(name="journey-compiled-swap-test", project=project)
+    create_dag(journey, dag1_data)
+    dag = JourneyService.get_compiled_dags([journey.id])[journey.id]
+    updated_on = JourneyDagEdge.select(fn.MAX(JourneyDagEdge.updated_on)).scalar()
+
+    # Same number of edges and same latest update time
+    JourneyDagEdge.delete().where(JourneyDagEdge.journey == journey, JourneyDagEdge.right == pipeline_3).execute()
+    JourneyDagEdge.create(journey=journey, left=pipeline, right=pipeline_3, updated_on=updated_on)
+
+    new_dag = JourneyService.get_compiled_dags([journey.id])[journey.id]
+    assert new_dag is not dag
+    assert new_dag.upstream_of(pipeline_3.id) == {pipeline.id}
+
+
+@pytest.mark.integration
+def test_get_compiled_dags_without_edges(project):
+    journey = Journey.create(name="journey-empty-test", project=project)
+    assert JourneyService.get_compiled_dags([journey.id])[journey.id].order == ()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("include", "exclude"),
+    (
+        (["*"], []),
+        (["P1"], []),
+        (["P*", "Q?"], ["P2"]),
+        (["[PQ]*"], ["*2"]),
+        (["[!P]*", "P[0-9]"], ["Q[!1]"]),
+        (["a.b*", "(x)+"], []),
+    ),
+)
+def test_component_pattern_matcher_same_as_fnmatch(include, exclude):
+    keys = ["P1", "P2", "P12", "Q1", "Q2", "Q12", "a.b", "aXb", "(x)+", "(x)", "p1", "", "P1\nP2"]
+    matcher = ComponentPatternMatcher.compile(include, exclude)
+    for key in keys:
+        expected = any(fnmatchcase(key, p) for p in include) and not any(fnmatchcase(key, p) for p in exclude)
+        assert matcher.matches(key) is expected, key
+
+
+@pytest.mark.unit
+def test_component_pattern_matcher_no_include():
+    assert ComponentPatternMatcher.compile([], ["*"]).matches("P1") is False
+    assert ComponentPatternMatcher.compile([], []).prefilter(Component.key) is None
+
+
+@pytest.mark.unit
+def test_component_pattern_matcher_prefixes():
+    assert ComponentPatternMatcher.compile(["P1", "P*", "ab?c", "x[yz]"], []).prefixes == ("P1", "P", "ab", "x")
+    assert ComponentPatternMatcher.compile(["P*"], []).prefilter(Component.key) is not None
+    assert ComponentPatternMatcher.compile(["P*", "*Q"], []).prefilter(Component.key) is None
+
+
+@pytest.mark.integration
+def test_get_components_matching_patterns_prefilter_escapes_like(test_db, project, pipeline, pipeline_2):
+    pipeline.key = "a_b%c"
+    pipeline.save()
+    pipeline_2.key = "aXbYc"
+    pipeline_2.save()
+    result = JourneyService.get_components_matching_patterns(str(project.id), ["a_b%*"], [])
+    assert [c.id for c in result] == [pipeline.id]
+
+
+@pytest.mark.unit
+def test_component_pattern_index_matching_journeys():
+    j1, j2, j3, j4 = sorted(uuid4() for _ in range(4))
+    index = ComponentPatternIndex.compile(
+        ((j1, "P*", "P2"), (j2, "*1", None), (j3, "Q1, P1", None), (j4, None, "*")),
+    )
+    assert index.matching_journeys("P1") == [j1, j2, j3]
+    assert index.matching_journeys("P2") == []
+    assert index.matching_journeys("Q1") == [j2, j3]
+    assert index.matching_journeys("") == []
+    assert j4 not in index.matchers
+
+
+@pytest.mark.integration
+def test_get_pattern_index_recompiled_on_pattern_change(test_db, journey, project, pipeline):
+    journey.component_include_patterns = "P*"
+    journey.save()
+    index = JourneyService.get_pattern_index(project.id)
+    assert JourneyService.get_pattern_index(project.id) is index
+    assert index.matching_journeys(pipeline.key) == [journey.id]
+
+    Journey.update(component_exclude_patterns="P1").where(Journey.id == journey.id).execute()
+
+    new_index = JourneyService.get_pattern_index(project.id)
+    assert new_index is not index
+    assert new_index.matching_journeys(pipeline.key) == []
@@ -3,6 +3,7 @@ from typing import Optional
 from uuid import uuid4
 
 import pytest
+from werkzeug.datastructures import MultiDict
 
 from common.actions.webhook_action import WebhookAction
 from common.entities import (
@@ -25,7 +26,7 @@ from common.entities import (
     TestOutcome,
     ActionImpl,
 )
-from common.entity_services import ProjectService
+from common.entity_services import InstanceSummaryService, ProjectService
 from common.entity_services.helpers import (
     ComponentFilters,
     Filters,
@@ -227,6 +228,28 @@ def test_get_runs_with_rules_paginated(runs, pipeline):
         assert r.key == str(key)
 
 
+@pytest.mark.integration
+@pytest.mark.parametrize("sort", (SortOrder.ASC, SortOrder.DESC))
+def test_get_runs_with_rules_cursor(sort, runs, pipeline):
+    expected = ProjectService.get_runs_with_rules(
+        str(pipeline.project.id), [str(pipeline.id)], ListRules(sort=sort), RunFilters()
+    ).results
+
+    keys = []
+    rules = ListRules(sort=sort, count=4, include_total=False)
+    while True:
+        page = ProjectService.get_runs_with_rules(str(pipeline.project.id), [str(pipeline.id)], rules, RunFilters())
+        assert page.total is None
+        keys.extend(r.key for r in page.results)
+        if page.next_cursor is None:
+            break
+        rules = ListRules.from_params(
+            MultiDict([("cursor", page.next_cursor), ("count", "4"), ("sort", sort.name), ("include_total", "false")])
+        )
+
+    assert keys == [r.key for r in expected]
+
+
 @pytest.mark.integration
 def test_get_runs_with_rules_time_filtering_start(runs, pipeline, current_time):
     rules = ListRules(sort=SortOrder.DESC)
@@ -350,6 +373,7 @@ def test_get_runs_with_rules_search(runs, pipeline):
 
 @pytest.mark.integration
 def test_get_instances_with_rules_has_alerts(instances, journey):
+    InstanceSummaryService.rebuild()
     p = ProjectService.get_instances_with_rules(
         ListRules(),
         Filters(),
@@ -422,6 +446,24 @@ def test_get_instances_with_rules_paginated(instances, journey, current_time):
     assert instance2.start_time == current_time - timedelta(hours=3)
 
 
+@pytest.mark.integration
+def test_get_instances_with_rules_cursor(instances, journey, current_time):
+    first = ProjectService.get_instances_with_rules(ListRules(count=4), Filters(), [str(journey.project.id)])
+    assert first.total == NUMBER_OF_RUNS
+    assert first.next_cursor is not None
+
+    second = ProjectService.get_instances_with_rules(
+        ListRules.from_params(MultiDict([("cursor", first.next_cursor), ("count", "4")])),
+        Filters(),
+        [str(journey.project.id)],
+    )
+    assert second.next_cursor is None
+    assert [i.start_time for i in second.results] == [
+        current_time - timedelta(hours=2),
+        current_time - timedelta(hours=1),
+    ]
+
+
 @pytest.mark.integration
 def test_get_instances_with_rules_time_filtering_start(instances, journey, current_time):
     rules = ListRules(sort=SortOrder.DESC)
@@ -782,3 +824,19 @@ def test_get_alert_actions_empty(test_db, project):
     actions = ProjectService.get_alert_actions(project)
 
     assert actions == []
+
+
+@pytest.mark.integration
+def test_get_test_outcome_project_cursor(test_db, project, runs):
+    all_outcomes = ProjectService.get_test_outcomes_with_rules(
+        project, ListRules(count=100), TestOutcomeItemFilters()
+    ).results
+
+    first = ProjectService.get_test_outcomes_with_rules(project, ListRules(count=10), TestOutcomeItemFilters())
+    second = ProjectService.get_test_outcomes_with_rules(
+        project,
+        ListRules.from_params(MultiDict([("cursor", first.next_cursor), ("count", "10")])),
+        TestOutcomeItemFilters(),
+    )
+    assert first.total == second.total == len(all_outcomes)
+    assert [t.id for t in first.results + second.results] == [t.id for t in all_outcomes[:20]]
@@ -1,3 +1,4 @@
+import smtplib
 from unittest.mock import Mock, PropertyMock, patch
 from uuid import uuid4
 
@@ -6,6 +7,7 @@ from peewee import DoesNotExist
 
 from common.datetime_utils import datetime_formatted
 from common.entities import AuthProvider
+from common.actions.action import ActionResult
 from common.actions.send_email_action import SendEmailAction
 
 from testlib.peewee import patch_select
@@ -260,3 +262,22 @@ def test_journey_and_task_names_missing(action, mocked_test_outcomes_dataset_eve
         }
         actual_data_points = action._get_data_points(mocked_test_outcomes_dataset_event, rule_mock, uuid4())
         assert actual_data_points == expected_data_points
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "exception, retryable",
+    (
+        (smtplib.SMTPServerDisconnected(), True),
+        (smtplib.SMTPConnectError(421, "Try again later"), True),
+        (smtplib.SMTPResponseException(451, "Local error"), True),
+        (smtplib.SMTPAuthenticationError(535, "Bad credentials"), False),
+        (ValueError(), False),
+    ),
+)
+def test_send_email_is_retryable(action, exception, retryable):
+    action_executor = SendEmailAction(
+        action, {"recipients": ["a@example.com"], "template": "x", "smtp_config": {"endpoint": "smtp.example.com"}}
+    )
+    assert action_executor.destination == "smtp.example.com"
+    assert action_executor.is_retryable(ActionResult(False, None, exception)) is retryable
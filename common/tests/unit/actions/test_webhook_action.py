@@ -2,11 +2,13 @@ from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 
 import pytest
+from requests import exceptions as requests_exceptions
 
+from common.actions.action import ActionResult
 from common.entities import Action
 from common.events.v1 import ApiRunStatus, RunStatusEvent, TestOutcomesEvent, TestStatuses
 from common.schemas.action_schemas import WebhookActionArgsSchema
-from common.actions.webhook_action import WebhookAction
+from common.actions.webhook_action import TemplateString, WebhookAction, format_data, get_references
 from testlib.fixtures.entities import *
 
 
@@ -128,3 +130,76 @@ def test_webhook_action_default_fields(session, test_outcomes_data, rule):
         headers=None,
         json=None,
     )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "exception, retryable",
+    (
+        (requests_exceptions.ConnectionError(), True),
+        (requests_exceptions.Timeout(), True),
+        (requests_exceptions.HTTPError(response=Mock(status_code=503)), True),
+        (requests_exceptions.HTTPError(response=Mock(status_code=429)), True),
+        (requests_exceptions.HTTPError(response=Mock(status_code=404)), False),
+        (ValueError(), False),
+    ),
+)
+def test_webhook_action_is_retryable(exception, retryable):
+    action = WebhookAction(None, {"url": "https://example.com/hook/{pipeline_key}", "method": "POST"})
+    assert action.destination == "example.com"
+    assert action.is_retryable(ActionResult(False, None, exception)) is retryable
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "template",
+    (
+        "plain text",
+        "{run.status} and {run.status!r:>12} {{escaped}}",
+        "{event.values[1]}-{project.name:.3}",
+        "{run.status:{project.name}}",
+    ),
+)
+def test_template_string_render(template):
+    class Namespace:
+        status = "FAILED"
+        name = "Project"
+        values = [1, 2]
+
+    data_points = {"run": Namespace(), "project": Namespace(), "event": Namespace()}
+
+    try:
+        expected = template.format(**data_points)
+    except ValueError as e:
+        with pytest.raises(type(e)):
+            TemplateString(template).render(data_points)
+    else:
+        assert TemplateString(template).render(data_points) == expected
+
+
+@pytest.mark.unit
+def test_template_string_invalid():
+    assert TemplateString("broken {").parts is None
+    assert format_data("broken {", {}) == "broken {"
+    assert format_data("missing {run.status}", {}) == "missing {run.status}"
+
+
+@pytest.mark.unit
+def test_get_references():
+    data = ["{run.status}", {"a": "{project.name} {event.test_outcomes[0].status}", "b": 1}, None, "{{run.key}}"]
+
+    assert get_references(data) == {"run.status", "project.name", "event.test_outcomes"}
+
+
+@pytest.mark.unit
+def test_webhook_action_references():
+    action = WebhookAction(
+        None,
+        {
+            "url": "https://example.com/{pipeline.key}",
+            "method": "POST",
+            "headers": [{"key": "X-Run", "value": "{run.status}"}],
+            "payload": {"project": "{project.name}"},
+        },
+    )
+    assert action.references == {"pipeline.key", "run.status", "project.name"}
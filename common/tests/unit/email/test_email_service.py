@@ -1,27 +1,112 @@
+import smtplib
 from unittest.mock import Mock, patch
 from uuid import UUID
 
 import pytest
+
+from common.email.email_renderer import get_compiled_template
 from common.email.email_service import EmailService
+from common.email.smtp_pool import SMTP_POOL, SMTPConnectionPool, SMTPServer
+
+SERVER = SMTPServer(host="smtp.example.com", port=465, username="user", password="pass")
 
 
 @pytest.fixture
-def smtp_client_mock():
+def smtp_mock():
     with patch("smtplib.SMTP_SSL") as smtp_mock:
-        client_mock = Mock()
-        smtp_mock.return_value.__enter__.return_value = client_mock
-        yield client_mock
+        smtp_mock.side_effect = lambda *args, **kwargs: Mock()
+        yield smtp_mock
+    SMTP_POOL.close()
 
 
-@pytest.mark.unit
-def test_send_email_smtp(smtp_client_mock):
-    uuid = UUID("4333cd05-72f4-4839-8185-f0227f7f4750")
-    response = EmailService.send_email(
+@pytest.fixture
+def smtp_client_mock(smtp_mock):
+    client_mock = Mock()
+    smtp_mock.side_effect = None
+    smtp_mock.return_value = client_mock
+    yield client_mock
+
+
+def send_email():
+    return EmailService.send_email(
         smtp_config={},
         from_address="a@abc.com",
         recipients=["b@abc.com"],
         template_name="message_log",
-        template_context_vars={"a": 1, "b": uuid},
+        template_context_vars={"a": 1, "b": UUID("4333cd05-72f4-4839-8185-f0227f7f4750")},
     )
+
+
+@pytest.mark.unit
+def test_send_email_smtp(smtp_client_mock):
+    send_email()
     smtp_client_mock.login.assert_called_once()
     smtp_client_mock.sendmail.assert_called_once()
+
+
+@pytest.mark.unit
+def test_send_email_reuses_connection(smtp_mock, smtp_client_mock):
+    send_email()
+    send_email()
+    smtp_mock.assert_called_once()
+    smtp_client_mock.login.assert_called_once()
+    assert smtp_client_mock.sendmail.call_count == 2
+
+
+@pytest.mark.unit
+def test_send_email_reconnects_when_disconnected(smtp_mock, smtp_client_mock):
+    send_email()
+    smtp_client_mock.sendmail.side_effect = [smtplib.SMTPServerDisconnected, {}]
+    send_email()
+    assert smtp_mock.call_count == 2
+    assert smtp_client_mock.sendmail.call_count == 3
+
+
+@pytest.mark.unit
+def test_send_email_compiles_template_once(smtp_client_mock):
+    get_compiled_template.cache_clear()
+    with patch("common.email.email_renderer.Compiler") as compiler_mock:
+        compiler_mock.return_value.compile.return_value = Mock(return_value="content")
+        send_email()
+        send_email()
+    compiler_mock.return_value.compile.assert_called_once()
+    get_compiled_template.cache_clear()
+
+
+@pytest.mark.unit
+def test_pool_discards_connection_on_error(smtp_mock):
+    pool = SMTPConnectionPool()
+    with pytest.raises(ValueError):
+        with pool.connection(SERVER) as client:
+            raise ValueError
+    client.quit.assert_called_once()
+    with pool.connection(SERVER) as new_client:
+        pass
+    assert new_client is not client
+
+
+@pytest.mark.unit
+def test_pool_checks_idle_connections(smtp_mock):
+    pool = SMTPConnectionPool(check_after_idle_secs=0)
+    with pool.connection(SERVER) as client:
+        pass
+    client.noop.return_value = (421, b"Timeout")
+    with pool.connection(SERVER) as new_client:
+        pass
+    assert new_client is not client
+    client.noop.assert_called_once()
+    client.quit.assert_called_once()
+
+
+@pytest.mark.unit
+def test_pool_keeps_connections_per_server(smtp_mock):
+    pool = SMTPConnectionPool(max_idle=1)
+    with pool.connection(SERVER) as client_1, pool.connection(SERVER) as client_2:
+        pass
+    # Only one idle connection is kept
+    client_1.quit.assert_called_once()
+    client_2.quit.assert_not_called()
+    with pool.connection(SERVER._replace(username="other")) as other_client:
+        pass
+    assert other_client not in (client_1, client_2)
+    other_client.login.assert_called_once_with("other", SERVER.password)
@@ -1,9 +1,19 @@
 from unittest.mock import ANY, Mock, MagicMock
 
 import pytest
+from marshmallow import ValidationError
 from werkzeug.datastructures import MultiDict
 
-from common.entity_services.helpers import DEFAULT_COUNT, DEFAULT_PAGE, ListRules, Page, SortOrder
+from common.entity_services.helpers import (
+    DEFAULT_COUNT,
+    DEFAULT_PAGE,
+    Cursor,
+    ListRules,
+    Page,
+    SortOrder,
+    decode_cursor,
+    encode_cursor,
+)
 
 
 @pytest.fixture()
@@ -97,14 +107,14 @@ def test_page_get_paginated_results(mocked_field, mocked_entity_class, mocked_qu
     mocked_field.asc.assert_called_once()
 
     mocked_subquery.where.assert_called_once_with(mocked_query._where)
-    mocked_subquery.order_by.assert_called_once_with(rules.order_by_field(mocked_field))
+    mocked_subquery.order_by.assert_called_once_with(*rules.keyset_ordering(mocked_field, mocked_query.model.id))
     mocked_subquery.paginate.assert_called_once_with(rules.page, rules.count)
     mocked_subquery.alias.assert_called_once()
-    mocked_subquery.count.assert_called_once_with(clear_limit=True)
+    mocked_subquery.count.assert_called_once_with()
 
     assert mocked_results_query._where is None
     mocked_results_query.join.assert_called_once_with(mocked_subquery, join_type=ANY, on=ANY)
-    mocked_results_query.order_by.assert_called_once_with(rules.order_by_field(mocked_field))
+    mocked_results_query.order_by.assert_called_once_with(*rules.keyset_ordering(mocked_field, mocked_query.model.id))
 
     assert type(result) == Page
 
@@ -126,3 +136,62 @@ def test_page_iter(mocked_field, mocked_entity_class, mocked_query_with_data):
     count = len(list(mocked_query_with_data.clone.return_value))
     r = [r for r in result]
     assert len(r) == count
+
+
+@pytest.mark.unit
+def test_page_get_paginated_results_without_total(mocked_field, mocked_entity_class, mocked_query):
+    mocked_subquery = mocked_query.model.select.return_value
+    rules = ListRules.from_params(MultiDict([("include_total", "false")]))
+
+    result = Page[mocked_entity_class].get_paginated_results(mocked_query, mocked_field, rules)
+
+    mocked_subquery.count.assert_not_called()
+    assert result.total is None
+
+
+@pytest.mark.unit
+def test_page_get_paginated_results_with_cursor(mocked_field, mocked_entity_class, mocked_query):
+    mocked_subquery = mocked_query.model.select.return_value
+    mocked_subquery.limit.return_value = mocked_subquery
+    rules = ListRules.from_params(MultiDict([("cursor", encode_cursor(10, "abc")), ("count", "5")]))
+
+    Page[mocked_entity_class].get_paginated_results(mocked_query, mocked_field, rules)
+
+    assert mocked_subquery.where.call_count == 2
+    mocked_subquery.limit.assert_called_once_with(5)
+    mocked_subquery.paginate.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("value", (1234, "2024-01-01", None, 1.5))
+def test_cursor_round_trip(value):
+    assert decode_cursor(encode_cursor(value, "0a1b")) == Cursor(value, "0a1b")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("token", ("not-base64!", "bm90IGpzb24=", "WzEsMiwzXQ==", "W1sxXSwxXQ=="))
+def test_decode_cursor_invalid(token):
+    with pytest.raises(ValidationError):
+        decode_cursor(token)
+
+
+@pytest.mark.unit
+def test_from_params_cursor():
+    rules = ListRules.from_params(MultiDict([("cursor", encode_cursor(5, 7))]))
+    assert rules.cursor == Cursor(5, 7)
+    assert rules.include_total is True
+
+
+@pytest.mark.unit
+def test_keyset_condition_without_cursor(mocked_field):
+    assert ListRules().keyset_condition(mocked_field, mocked_field) is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "results, expected",
+    (([], None), ([1], None), ([1, 2], encode_cursor(2, 2))),
+    ids=("empty", "partial", "full"),
+)
+def test_next_cursor(results, expected):
+    assert ListRules(count=2).next_cursor(results, lambda r: (r, r)) == expected
@@ -0,0 +1,76 @@
+from unittest.mock import MagicMock, patch
+
+import flask
+import pytest
+
+from common.api.flask_ext.kafka_producer import SharedKafkaProducer
+
+
+@pytest.fixture
+def kafka_producer_class():
+    with patch("common.api.flask_ext.kafka_producer.KafkaProducer") as producer_class:
+        producer_class.side_effect = lambda *args, **kwargs: MagicMock()
+        yield producer_class
+
+
+@pytest.fixture
+def app():
+    test_app = flask.Flask("test_flask_app")
+    test_app.config["KAFKA_PRODUCER_SETTINGS"] = {"linger.ms": 10}
+    with patch("common.api.flask_ext.kafka_producer.atexit"):
+        yield test_app
+
+
+@pytest.mark.unit
+def test_producer_shared_between_requests(app, kafka_producer_class):
+    SharedKafkaProducer(app)
+    with app.test_request_context():
+        producer = SharedKafkaProducer.get_producer()
+    with app.test_request_context():
+        assert SharedKafkaProducer.get_producer() is producer
+
+    kafka_producer_class.assert_called_once_with(
+        {"linger.ms": 10}, delivery_callback=SharedKafkaProducer.delivery_report
+    )
+    producer.connect.assert_called_once()
+
+
+@pytest.mark.unit
+def test_producer_recreated_after_fork(app, kafka_producer_class):
+    ext = SharedKafkaProducer(app)
+    with patch("common.api.flask_ext.kafka_producer.os.getpid", return_value=1):
+        parent_producer = ext.producer
+    with patch("common.api.flask_ext.kafka_producer.os.getpid", return_value=2):
+        child_producer = ext.producer
+
+    assert child_producer is not parent_producer
+    assert kafka_producer_class.call_count == 2
+    parent_producer.disconnect.assert_not_called()
+
+
+@pytest.mark.unit
+def test_shutdown_flushes_producer(app, kafka_producer_class):
+    ext = SharedKafkaProducer(app)
+    producer = ext.producer
+    ext.shutdown()
+
+    producer.disconnect.assert_called_once()
+    assert ext.producer is not producer
+
+
+@pytest.mark.unit
+def test_shutdown_skips_inherited_producer(app, kafka_producer_class):
+    ext = SharedKafkaProducer(app)
+    with patch("common.api.flask_ext.kafka_producer.os.getpid", return_value=1):
+        producer = ext.producer
+    with patch("common.api.flask_ext.kafka_producer.os.getpid", return_value=2):
+        ext.shutdown()
+
+    producer.disconnect.assert_not_called()
+
+
+@pytest.mark.unit
+def test_delivery_report_does_not_raise():
+    message = MagicMock()
+    SharedKafkaProducer.delivery_report(MagicMock(), message)
+    SharedKafkaProducer.delivery_report(None, message)
@@ -1,11 +1,12 @@
 import signal
+from itertools import cycle
 
 import pytest
 from confluent_kafka import TopicPartition
 
 from common.kafka import KafkaConsumer, KafkaTransactionalConsumer
 from common.kafka.consumer import DisconnectedConsumer, GracefulKiller
-from common.kafka.errors import ConsumerCommitError, DeserializationError, DisconnectedConsumerError
+from common.kafka.errors import ConsumerCommitError, ConsumerError, DeserializationError, DisconnectedConsumerError
 from common.kafka.topic import JsonV1Topic, MsgPackTopic
 
 CONFIG = {"bootstrap.servers": "127.0.0.1:1337"}
@@ -186,3 +187,69 @@ def test_graceful_killer_sigterm():
     assert not killer.should_exit
     signal.raise_signal(signal.SIGTERM)
     assert killer.should_exit
+
+
+@pytest.mark.unit
+def test_consumer_consume(json_topic, mocked_confluent_kafka_consumer, mocked_kafka_message, metric_log_event):
+    mocked_confluent_kafka_consumer.return_value.consume.return_value = [mocked_kafka_message, mocked_kafka_message]
+    consumer = KafkaConsumer(CONFIG, [json_topic])
+    consumer.connect()
+    messages = consumer.consume(10, 0.5)
+    mocked_confluent_kafka_consumer.return_value.consume.assert_called_once_with(10, 0.5)
+    assert len(messages) == 2
+    assert all(isinstance(msg.payload, metric_log_event.__class__) for msg in messages)
+
+
+@pytest.mark.unit
+def test_consumer_consume_deserialization_error_skipped(
+    json_topic, mocked_confluent_kafka_consumer, mocked_kafka_message_bad_data
+):
+    mocked_confluent_kafka_consumer.return_value.consume.return_value = [mocked_kafka_message_bad_data]
+    consumer = KafkaConsumer(CONFIG, [json_topic])
+    consumer.connect()
+    assert consumer.consume(10, 0.5) == []
+
+
+@pytest.mark.unit
+def test_consumer_consume_error(json_topic, mocked_confluent_kafka_consumer):
+    mocked_confluent_kafka_consumer.return_value.consume.side_effect = Exception()
+    consumer = KafkaConsumer(CONFIG, [json_topic])
+    consumer.connect()
+    with pytest.raises(ConsumerError):
+        consumer.consume(10, 0.5)
+
+
+@pytest.mark.unit
+def test_consumer_batches(json_topic, mocked_confluent_kafka_consumer, mocked_kafka_message):
+    mocked_confluent_kafka_consumer.return_value.consume.side_effect = cycle([[], [mocked_kafka_message] * 3])
+    i = 0
+    for messages in KafkaConsumer(CONFIG, [json_topic]).batches(3, 0.5):
+        i += 1
+        assert len(messages) == 3
+        if i == 2:
+            signal.raise_signal(signal.SIGINT)
+        elif i == 3:
+            raise AssertionError("kill signal failed to kill the loop")
+    assert i == 2
+
+
+@pytest.mark.unit
+def test_consumer_commit_offsets(json_topic, mocked_confluent_kafka_consumer):
+    offsets = [TopicPartition(json_topic.name, 0, 5)]
+    consumer = KafkaConsumer(CONFIG, [json_topic])
+    consumer.connect()
+    consumer.commit(offsets)
+    mocked_confluent_kafka_consumer.return_value.commit.assert_called_once_with(offsets=offsets, asynchronous=False)
+
+
+@pytest.mark.unit
+def test_consumer_store_offsets(json_topic, mocked_confluent_kafka_consumer):
+    offsets = [TopicPartition(json_topic.name, 0, 5)]
+    consumer = KafkaConsumer(CONFIG, [json_topic])
+    consumer.connect()
+    consumer.store_offsets(offsets)
+    mocked_confluent_kafka_consumer.return_value.store_offsets.assert_called_once_with(offsets=offsets)
+
+    mocked_confluent_kafka_consumer.return_value.store_offsets.side_effect = Exception()
+    with pytest.raises(ConsumerCommitError):
+        consumer.store_offsets(offsets)
@@ -1,13 +1,14 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
-from confluent_kafka import KafkaError, KafkaException
+from confluent_kafka import KafkaError, KafkaException, TopicPartition
 
 from common.kafka import (
     KafkaProducer,
     KafkaTransactionalConsumer,
     KafkaTransactionalProducer,
     ProducerError,
+    ProducerQueueFullError,
     ProducerTransactionError,
 )
 from common.kafka.errors import DisconnectedProducerError, MessageTooLargeError
@@ -263,3 +264,43 @@ def test_producer_raises_msg_too_large_error(mocked_confluent_kafka_producer, js
         mocked_confluent_kafka_producer.return_value.produce.side_effect = ex
         with pytest.raises(MessageTooLargeError):
             producer.produce(json_topic, metric_log_event)
+
+
+@pytest.mark.unit
+def test_producer_raises_queue_full_error(mocked_confluent_kafka_producer, json_topic, metric_log_event):
+    with KafkaProducer(CONFIG) as producer:
+        mocked_confluent_kafka_producer.return_value.produce.side_effect = BufferError()
+        with pytest.raises(ProducerQueueFullError):
+            producer.produce(json_topic, metric_log_event)
+
+
+@pytest.mark.unit
+def test_producer_default_delivery_callback(mocked_confluent_kafka_producer, json_topic, metric_log_event):
+    callback = MagicMock()
+    with KafkaProducer(CONFIG, delivery_callback=callback) as producer:
+        producer.produce(json_topic, metric_log_event)
+        assert mocked_confluent_kafka_producer.return_value.produce.call_args[1]["callback"] is callback
+
+
+@pytest.mark.unit
+def test_producer_disconnect_timeout(mocked_confluent_kafka_producer):
+    mocked_confluent_kafka_producer.return_value.flush.return_value = 3
+    producer = KafkaProducer(CONFIG)
+    producer.connect()
+    producer.disconnect(timeout=2.5)
+    mocked_confluent_kafka_producer.return_value.flush.assert_called_once_with(2.5)
+    assert not producer.producer
+
+
+@pytest.mark.unit
+def test_transactional_producer_commit_explicit_offsets(
+    mocked_confluent_kafka_producer, mocked_confluent_kafka_consumer, json_topic
+):
+    offsets = [TopicPartition(json_topic.name, 3, 42)]
+    consumer = KafkaTransactionalConsumer(CONFIG, [json_topic])
+    consumer.connect()
+    with KafkaTransactionalProducer(CONFIG, tx_consumer=consumer) as producer:
+        with producer.transaction(offsets):
+            pass
+    assert mocked_confluent_kafka_producer.return_value.send_offsets_to_transaction.call_args[0][0] == offsets
+    mocked_confluent_kafka_consumer.return_value.position.assert_not_called()
@@ -1,9 +1,10 @@
 from dataclasses import dataclass
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
-from common.kafka.topic import MixedTopic, PayloadInterface
+from common.kafka.topic import TOPIC_IDENTIFIED_EVENTS, TOPIC_UNIDENTIFIED_EVENTS, MixedTopic, PayloadInterface
+from conf import settings
 from testlib.fixtures.v1_events import *
 
 
@@ -49,3 +50,35 @@ def test_mixed_topic_serialize_others_events(a_dataclass, mocked_kafka_message):
     mocked_kafka_message.headers = Mock(return_value=[(k, v.encode("utf-8")) for k, v in msg_args.headers.items()])
     msg = topic.deserialize(mocked_kafka_message)
     assert msg.payload == a_dataclass
+
+
+@pytest.mark.integration
+def test_mixed_topic_serialize_binary_v1_events(message_log_event, mocked_kafka_message):
+    topic = MixedTopic(name="reflect")
+
+    with patch.object(settings, "KAFKA_BINARY_V1_EVENTS", True):
+        msg_args = topic.serialize(message_log_event)
+    assert msg_args.headers == {"Content-Type": "application/msgpack"}
+    assert msg_args.key == message_log_event.partition_identifier
+
+    mocked_kafka_message.value = Mock(return_value=msg_args.value)
+    mocked_kafka_message.headers = Mock(return_value=[(k, v.encode("utf-8")) for k, v in msg_args.headers.items()])
+    msg = topic.deserialize(mocked_kafka_message)
+    assert msg.payload == message_log_event
+
+
+@pytest.mark.integration
+def test_mixed_topic_negotiates_content_type(message_log_event, mocked_kafka_message):
+    topic = MixedTopic(name="reflect")
+
+    mocked_kafka_message.value = Mock(return_value=message_log_event.as_bytes())
+    mocked_kafka_message.headers = Mock(return_value=[("traceparent", b"00-abc-def-01")])
+    msg = topic.deserialize(mocked_kafka_message)
+    assert msg.payload == message_log_event
+    assert msg.headers == {"traceparent": "00-abc-def-01"}
+
+
+@pytest.mark.unit
+def test_events_topics_negotiate_content_type():
+    assert isinstance(TOPIC_UNIDENTIFIED_EVENTS, MixedTopic)
+    assert isinstance(TOPIC_IDENTIFIED_EVENTS, MixedTopic)
@@ -1,8 +1,10 @@
 from datetime import datetime, timezone
 from enum import Enum, IntEnum
+from uuid import UUID, uuid4
 from zoneinfo import ZoneInfo
 
 import pytest
+from peewee import Model
 
 from common.peewee_extensions.fields import (
     DomainField,
@@ -10,6 +12,7 @@ from common.peewee_extensions.fields import (
     EnumStrField,
     JSONDictListField,
     JSONStrListField,
+    TimeOrderedUUIDField,
     UTCTimestampField,
     ZoneInfoField,
 )
@@ -241,6 +244,41 @@ def test_zoneinfo_field_value():
     assert py_value == zi_value
 
 
+class TimeOrderedUUIDExample(Model):
+    id = TimeOrderedUUIDField(primary_key=True)
+
+
+@pytest.mark.unit
+def test_time_ordered_uuid_field_default():
+    assert TimeOrderedUUIDExample().id.version == 7
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value",
+    (
+        UUID("0190a3d4-6e2b-7c11-8a5e-3f6d2b1c9e07"),
+        "0190a3d46e2b7c118a5e3f6d2b1c9e07",
+        UUID("0190a3d4-6e2b-7c11-8a5e-3f6d2b1c9e07").bytes,
+    ),
+)
+def test_time_ordered_uuid_field_db_value(value):
+    f_inst = TimeOrderedUUIDExample.id
+    db_value = f_inst.db_value(value)
+
+    assert bytes(db_value) == bytes.fromhex("0190a3d46e2b7c118a5e3f6d2b1c9e07")
+    assert f_inst.python_value(db_value) == UUID("0190a3d4-6e2b-7c11-8a5e-3f6d2b1c9e07")
+
+
+@pytest.mark.unit
+def test_time_ordered_uuid_field_db_value_invalid():
+    f_inst = TimeOrderedUUIDExample.id
+    with pytest.raises(ValueError):
+        f_inst.db_value("not-a-uuid")
+    assert f_inst.db_value(None) is None
+    assert f_inst.python_value(f_inst.db_value(value := uuid4())) == value
+
+
 @pytest.mark.unit
 def test_json_str_list_field_python_value_valid():
     """JSONStrListField.python_value yields an list of strings for valid input."""
@@ -0,0 +1,111 @@
+import logging
+from unittest.mock import Mock, patch
+
+import pytest
+from peewee import MySQLDatabase
+from playhouse.pool import MaxConnectionsExceeded
+
+from common.peewee_extensions.pool import PoolStats, ReconnectingPooledMySQLDatabase
+
+
+@pytest.fixture
+def server_connect():
+    with patch.object(MySQLDatabase, "_connect", side_effect=lambda: Mock()) as connect:
+        yield connect
+
+
+@pytest.fixture
+def clock():
+    with patch("common.peewee_extensions.pool.monotonic", return_value=100.0) as monotonic:
+        yield monotonic
+
+
+@pytest.fixture
+def db(server_connect, clock):
+    database = ReconnectingPooledMySQLDatabase("test", max_connections=2, ping_after_idle=30)
+    database.server_version = (8, 0, 0)
+    yield database
+
+
+@pytest.mark.unit
+def test_pool_reuses_connection_without_ping(db, server_connect):
+    db.connect()
+    conn = db.connection()
+    db.close()
+    db.connect()
+
+    assert db.connection() is conn
+    conn.ping.assert_not_called()
+    server_connect.assert_called_once()
+    assert db.pool_stats == PoolStats(
+        max_connections=2, in_use=1, idle=0, checkouts=2, created=1, dropped=0, exhausted=0
+    )
+
+
+@pytest.mark.unit
+def test_pool_pings_idle_connection(db, server_connect, clock):
+    db.connect()
+    conn = db.connection()
+    db.close()
+
+    clock.return_value += 31
+    db.connect()
+
+    assert db.connection() is conn
+    conn.ping.assert_called_once_with()
+    server_connect.assert_called_once()
+
+
+@pytest.mark.unit
+def test_pool_drops_closed_connection(db, server_connect, clock):
+    db.connect()
+    conn = db.connection()
+    conn.ping.side_effect = Exception("MySQL server has gone away")
+    db.close()
+
+    clock.return_value += 31
+    db.connect()
+
+    assert db.connection() is not conn
+    assert server_connect.call_count == 2
+    assert db.pool_stats.dropped == 1
+    assert db.pool_stats.created == 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("wait_timeout", (None, 0.25))
+def test_pool_exhausted(db, wait_timeout):
+    db._wait_timeout = wait_timeout
+    db._connect()
+    db._connect()
+    with pytest.raises(MaxConnectionsExceeded):
+        db.connect()
+
+    assert db.pool_stats.in_use == 2
+    # Counted once, however many times the checkout was retried while waiting
+    assert db.pool_stats.exhausted == 1
+
+
+@pytest.mark.unit
+def test_pool_logs_stats_periodically(db, clock, caplog):
+    with caplog.at_level(logging.INFO, logger="common.peewee_extensions.pool"):
+        db.connect()
+        db.close()
+        clock.return_value += 301
+        db.connect()
+        db.close()
+        db.connect()
+
+    assert [r.db_pool for r in caplog.records] == [
+        PoolStats(max_connections=2, in_use=1, idle=0, checkouts=2, created=1, dropped=0, exhausted=0)._asdict()
+    ]
+
+
+@pytest.mark.unit
+def test_pool_forgets_closed_connections(db):
+    db.connect()
+    db.close()
+    db.close_idle()
+
+    assert db._released_at == {}
+    assert db.pool_stats.idle == 0
@@ -0,0 +1,56 @@
+from unittest.mock import Mock
+
+import pytest
+from peewee import SqliteDatabase
+
+from common.peewee_extensions.proxy import TransactionalDatabaseProxy
+
+
+@pytest.fixture
+def proxy():
+    proxy = TransactionalDatabaseProxy()
+    proxy.initialize(SqliteDatabase(":memory:"))
+    yield proxy
+    proxy.close()
+
+
+@pytest.fixture
+def callback(proxy):
+    return proxy.on_rollback(Mock())
+
+
+@pytest.mark.unit
+def test_rollback_callback_on_transaction_rollback(proxy, callback):
+    with pytest.raises(ValueError), proxy.atomic():
+        raise ValueError
+
+    callback.assert_called_once_with()
+
+
+@pytest.mark.unit
+def test_rollback_callback_on_savepoint_rollback(proxy, callback):
+    with proxy.atomic():
+        with pytest.raises(ValueError), proxy.atomic():
+            raise ValueError
+        callback.assert_called_once_with()
+
+    callback.assert_called_once_with()
+
+
+@pytest.mark.unit
+def test_rollback_callback_not_called_on_commit(proxy, callback):
+    with proxy.atomic():
+        with proxy.atomic():
+            proxy.execute_sql("SELECT 1")
+
+    callback.assert_not_called()
+
+
+@pytest.mark.unit
+def test_rollback_callback_error(proxy, callback):
+    failing = proxy.on_rollback(Mock(side_effect=Exception))
+    with pytest.raises(ValueError), proxy.atomic():
+        raise ValueError
+
+    failing.assert_called_once_with()
+    callback.assert_called_once_with()
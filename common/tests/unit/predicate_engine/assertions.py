@@ -1,6 +1,6 @@
 from typing import Any, Optional
 
-from common.predicate_engine.query import ALL, ANY, R
+from common.predicate_engine.query import ALL, ANY, R, compile_rule
 
 
 def assertRuleEqual(a, b, default_op="exact"):
@@ -42,10 +42,19 @@ def assertRuleEqual(a, b, default_op="exact"):
         raise AssertionError(f"Rules differ: \n\t{str_a}\n\t!=\n\t{str_b}")
 
 
+def _matches(a: R, b: Any) -> bool:
+    """Evaluate the rule both interpreted and compiled, asserting that the results agree."""
+    result = a.matches(b)
+    compiled_result = compile_rule(a)(b)
+    if compiled_result is not result:
+        raise AssertionError(f"Compiled R object `{a}` returned {compiled_result} for value `{b}`, expected {result}.")
+    return result
+
+
 def assertRuleMatches(a: R, b: Any, msg: Optional[str] = None):
     """Assert that an R object matches a given value."""
     try:
-        result = a.matches(b)
+        result = _matches(a, b)
     except Exception as e:
         raise AssertionError(msg or f"R object `{a}` failed to match value `{b}`.") from e
     else:
@@ -55,7 +64,7 @@ def assertRuleMatches(a: R, b: Any, msg: Optional[str] = None):
     # Anytime a rule matches, it's inverse should NOT match
     neg_a = ~a
     try:
-        result = neg_a.matches(b)
+        result = _matches(neg_a, b)
     except Exception:
         pass
     else:
@@ -67,7 +76,7 @@ def assertRuleMatches(a: R, b: Any, msg: Optional[str] = None):
 
 def assertRuleNotMatches(a: R, b: Any, msg: Optional[str] = None):
     try:
-        result = a.matches(b)
+        result = _matches(a, b)
     except Exception:
         pass
     else:
@@ -77,7 +86,7 @@ def assertRuleNotMatches(a: R, b: Any, msg: Optional[str] = None):
     # Anytime a rule does not match, it's inverse SHOULD match
     neg_a = ~a
     try:
-        result = neg_a.matches(b)
+        result = _matches(neg_a, b)
     except Exception as e:
         raise AssertionError(msg or f"R object `{neg_a}` (negation of rule `{a}`) failed to match value `{b}`.") from e
     else:
@@ -8,7 +8,16 @@ from unicodedata import category
 import pytest
 
 from common.predicate_engine._operators import OPERAND_MAP, split_operators
-from common.predicate_engine.query import ALL, ANY, ATLEAST, EXACT_N, R, get_rule_fields, getattr_recursive
+from common.predicate_engine.query import (
+    ALL,
+    ANY,
+    ATLEAST,
+    EXACT_N,
+    R,
+    compile_rule,
+    get_rule_fields,
+    getattr_recursive,
+)
 
 from .assertions import assertRuleEqual, assertRuleMatches, assertRuleNotMatches
 
@@ -1282,3 +1291,49 @@ def test_matching_r_value():
     assertRuleNotMatches(R(val_array__r=ALL(R(a__exact=ANY("missing", attr_name="a")))), fake_obj)
     assertRuleNotMatches(R(val_array__r=EXACT_N(R(a__exact=ANY("y", attr_name="a")), n=2)), fake_obj)
     assertRuleNotMatches(R(val_array__r=ATLEAST(R(a__exact=ANY("x", attr_name="a")), n=3)), fake_obj)
+
+
+class Database:
+    """Stands in for the database namespace of the rules data, counting the lookups."""
+
+    def __init__(self):
+        self.lookups = 0
+
+    @property
+    def runs(self):
+        self.lookups += 1
+        return ["COMPLETED", "COMPLETED"]
+
+
+@pytest.mark.unit
+def test_compiled_rule_evaluates_database_last():
+    database = Database()
+    data = {"event": SimpleObj("FAILED", 1), "database": database}
+    rule = R(database__runs__exact=ALL("COMPLETED")) & R(event__a__exact="COMPLETED")
+
+    assert compile_rule(rule)(data) is False
+    assert database.lookups == 0
+    assert rule.matches(data) is False
+    assert database.lookups == 1
+
+    assert compile_rule(rule | R(event__a__exact="FAILED"))(data) is True
+    assert database.lookups == 1
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "rule, expected",
+    (
+        (R(a__regex=r"^fl.*m$"), True),
+        (R(a__iregex=r"^FLEEM$"), True),
+        (R(a__regex=r"^FLEEM$"), False),
+        (R(b__regex=r"anything"), False),
+        (~R(a__regex=r"^x"), True),
+        (R(val_array__exact=ANY(r"^fo", attr_name="a")) | R(a__exact="no"), False),
+    ),
+)
+def test_compiled_rule_regex(rule, expected):
+    fake_obj = FakeObject("fleem", None, val_array=(SimpleObj("foo", 0),))
+
+    assert compile_rule(rule)(fake_obj) is expected
+    assert rule.matches(fake_obj) is expected
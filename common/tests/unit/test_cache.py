@@ -0,0 +1,94 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from common.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.mark.unit
+def test_ttl_cache_get_set(clock):
+    cache = TTLCache(max_size=10, ttl=5, clock=clock)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert "a" in cache
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+@pytest.mark.unit
+def test_ttl_cache_expiry(clock):
+    cache = TTLCache(max_size=10, ttl=5, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=1)
+    clock.now = 1
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    clock.now = 5
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_ttl_cache_custom_ttl_capped(clock):
+    cache = TTLCache(max_size=10, ttl=5, clock=clock)
+    cache.set("a", 1, ttl=100)
+    clock.now = 6
+    assert cache.get("a") is None
+
+
+@pytest.mark.unit
+def test_ttl_cache_lru_eviction(clock):
+    cache = TTLCache(max_size=2, ttl=5, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert "a" in cache
+    assert "c" in cache
+    assert cache.stats.evictions == 1
+    assert cache.stats.size == 2
+
+
+@pytest.mark.unit
+def test_ttl_cache_get_or_set(clock):
+    cache = TTLCache(max_size=2, ttl=5, clock=clock)
+    factory = MagicMock(return_value=1)
+    assert cache.get_or_set("a", factory) == 1
+    assert cache.get_or_set("a", factory) == 1
+    factory.assert_called_once()
+
+
+@pytest.mark.unit
+def test_ttl_cache_invalidate(clock):
+    cache = TTLCache(max_size=10, ttl=5, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    cache.invalidate("a")
+    assert "a" not in cache
+    assert cache.invalidate_where(lambda k, v: v > 2) == 1
+    assert "c" not in cache
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("max_size, ttl", ((0, 1), (1, 0)))
+def test_ttl_cache_invalid_args(max_size, ttl):
+    with pytest.raises(ValueError):
+        TTLCache(max_size=max_size, ttl=ttl)
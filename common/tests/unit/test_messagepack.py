@@ -6,8 +6,10 @@ from decimal import Decimal
 from io import BytesIO
 from pathlib import Path, PurePath, PurePosixPath, PureWindowsPath
 from types import MappingProxyType
+from unittest.mock import patch
 from uuid import NAMESPACE_URL, uuid1, uuid3, uuid4, uuid5
 
+import msgpack
 import pytest
 
 from common.decorators import cached_property
@@ -17,8 +19,10 @@ from common.events.v2.batch_pipeline_status import BatchPipelineStatus
 from common.events.v2.component_data import BatchPipelineData
 from common.events.v2.message_log import MessageLog
 from common.events.v2.metric_log import MetricLog
+from common.events.v1 import Event
 from common.events.v2.test_outcomes import TestGenComponentData, TestOutcomeItem, TestOutcomes, TestStatus
-from common.messagepack import dump, dumps, load, loads
+from common.messagepack import TypeID, dump, dumps, load, loads
+from testlib.fixtures.v1_events import *
 from testlib.fixtures.v2_events import message_log_event_v2, metric_log_event_v2  # noqa: F401
 
 
@@ -204,6 +208,15 @@ def test_dump_load_uuid5():
     assert data == out_value
 
 
+@pytest.mark.unit
+def test_dump_load_uuid_legacy():
+    """Messagepack can load UUID values encoded on 128 bytes, as they used to be."""
+    data = uuid4()
+    legacy = msgpack.packb(msgpack.ExtType(TypeID.UUID.value, data.int.to_bytes(128, "little")))
+    assert loads(legacy) == data
+    assert len(dumps(data)) < len(legacy)
+
+
 @pytest.mark.unit
 def test_dump_load_tuples():
     """Messagepack can dump/load tuples of values."""
@@ -414,3 +427,25 @@ def test_flo_dump_load():
 
     actual = load(flo)
     assert expected == actual
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "event_fixture",
+    (
+        "message_log_event",
+        "metric_log_event",
+        "RUNNING_run_status_event",
+        "test_outcomes_event",
+        "test_outcomes_testgen_event",
+        "dataset_operation_event",
+    ),
+)
+def test_msgpack_v1_event(event_fixture, request):
+    """Can serialize/deserialize v1 Event dataclasses, without going through their schemas."""
+    event = request.getfixturevalue(event_fixture)
+    with patch.object(type(event), "from_dict", side_effect=AssertionError("Schema used")):
+        out_value = loads(dumps(event))
+    assert out_value == event
+    assert type(out_value) is type(event)
+    assert isinstance(out_value, Event)
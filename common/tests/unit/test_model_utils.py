@@ -26,5 +26,9 @@ def test_walk_models_default():
     assert unexpected_key not in model_map, f"Model map contained unexpected key: {unexpected_key}"
 
     # Make sure that BaseEntity and RbacEntity are not present in the keylist
-    for omitted_key in ("common.entities.base_entity.RbacEntity", "common.entities.base_entity.BaseEntity"):
+    for omitted_key in (
+        "common.entities.base_entity.RbacEntity",
+        "common.entities.base_entity.BaseEntity",
+        "common.entities.base_entity.TimeOrderedEntity",
+    ):
         assert omitted_key not in model_map, f"Model map contained unexpected key: {omitted_key}"
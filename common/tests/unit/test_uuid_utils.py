@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from common.uuid_utils import uuid7, uuid7_timestamp
+
+
+@pytest.mark.unit
+def test_uuid7_layout():
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+    assert abs(uuid7_timestamp(value) - datetime.now(tz=timezone.utc)) < timedelta(seconds=5)
+
+
+@pytest.mark.unit
+def test_uuid7_increasing():
+    values = [uuid7() for _ in range(10_000)]
+    assert values == sorted(values)
+    assert [v.hex for v in values] == sorted(v.hex for v in values)
+    assert [v.bytes for v in values] == sorted(v.bytes for v in values)
+    assert len(set(values)) == len(values)
+
+
+@pytest.mark.unit
+def test_uuid7_increasing_within_same_millisecond():
+    with patch("common.uuid_utils.time.time_ns", return_value=1_700_000_000_000_000_000):
+        values = [uuid7() for _ in range(5_000)]
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+
+@pytest.mark.unit
+def test_uuid7_timestamp_invalid_version():
+    with pytest.raises(ValueError):
+        uuid7_timestamp(uuid4())
@@ -91,24 +91,29 @@ settings = ConfigClass()
 
 
 def init_db() -> None:
-    """Initialize the database engine and establish a connection."""
+    """
+    Initialize the database engine and establish a connection.
+
+    The engine is only created on the first call; later calls just check out a connection, which is cheap when the
+    configured engine is a connection pool.
+    """
     # Importing locally to avoid circular imports
     from common.entities import ALL_MODELS, DB
 
-    dbconfig = settings.DATABASE.copy()  # Don't modify config value
+    if DB.obj is None:
+        dbconfig = settings.DATABASE.copy()  # Don't modify config value
 
-    # Get required name & engine parameters
-    try:
-        EngineKlass = dbconfig.pop("engine")
-    except KeyError as e:
-        raise ValueError("Missing required `engine` key in DATABASE configuration") from e
-    try:
-        name = dbconfig.pop("name")
-    except KeyError as e:
-        raise ValueError("Missing required `name` key in DATABASE configuration") from e
+        # Get required name & engine parameters
+        try:
+            EngineKlass = dbconfig.pop("engine")
+        except KeyError as e:
+            raise ValueError("Missing required `engine` key in DATABASE configuration") from e
+        try:
+            name = dbconfig.pop("name")
+        except KeyError as e:
+            raise ValueError("Missing required `name` key in DATABASE configuration") from e
 
-    if DB.obj is None:
         DB.initialize(EngineKlass(name, **dbconfig))
     DB.connect(reuse_if_open=True)
-    if EngineKlass is SqliteDatabase:
+    if isinstance(DB.obj, SqliteDatabase):
         DB.create_tables(ALL_MODELS)  # Create the DB tables
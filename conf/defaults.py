@@ -1,9 +1,48 @@
 RULE_REFRESH_SECONDS: int = 30
 """Number of seconds to cache rules in rules engine"""
 
+RULES_ENGINE_RULE_CACHE_MAX_RULES: int = 10_000
+"""Maximum number of compiled rules cached by the rules engine, evicting the least recently used journeys first."""
+
+RULES_ENGINE_WORKERS: int = 1
+"""Number of threads evaluating rules concurrently, keyed by project. The default of 1 evaluates all events serially."""
+
+RULES_ENGINE_WORKER_QUEUE_SIZE: int = 100
+"""Maximum number of events waiting to be evaluated by each rules engine worker."""
+
+RULES_ENGINE_ACTION_WORKERS: int = 16
+"""Number of threads executing rule actions. Use 0 to execute the actions inline, during the rule evaluation."""
+
+RULES_ENGINE_ACTION_QUEUE_SIZE: int = 1000
+"""Maximum number of pending rule actions before the rule evaluation waits for them to complete."""
+
+RULES_ENGINE_ACTION_MAX_PER_DESTINATION: int = 4
+"""Maximum number of rule actions running concurrently against the same webhook host or SMTP server."""
+
+RULES_ENGINE_ACTION_MAX_ATTEMPTS: int = 5
+"""Number of times a rule action failing with a transient error is attempted before giving up."""
+
+RULES_ENGINE_ACTION_RETRY_BACKOFF_SECONDS: float = 1
+"""Delay before the first retry of a rule action. It doubles on each subsequent retry."""
+
+RULES_ENGINE_ACTION_RETRY_MAX_BACKOFF_SECONDS: float = 60
+"""Upper bound of the delay between retries of a rule action."""
+
+RULES_ENGINE_ACTION_SHUTDOWN_TIMEOUT_SECONDS: float = 30
+"""How long the rules engine waits for pending actions to complete when exiting."""
+
+KAFKA_BINARY_V1_EVENTS: bool = False
+"""Produce the v1 events as msgpack instead of JSON. Enable once every service reads the format from the headers."""
+
 MIGRATIONS_SRC_PATH = "/dk/lib/migrations"
 """Yoyo migrations source folder."""
 
+RUN_MANAGER_BATCH_SIZE: int = 1
+"""Maximum number of events the run manager handles in a single transaction. Batching is disabled when set to 1."""
+
+RUN_MANAGER_BATCH_TIMEOUT_SECONDS: float = 0.1
+"""How long the run manager waits for a batch of events to fill up before handling it."""
+
 AGENT_STATUS_CHECK_DEFAULT_INTERVAL_SECONDS: int = 300
 """Default polling internal for Agent status changes."""
 
@@ -12,3 +51,12 @@ AGENT_STATUS_CHECK_UNHEALTHY_FACTOR: float = 2
 
 AGENT_STATUS_CHECK_OFFLINE_FACTOR: float = 4
 """Multiplier factor to consider an Agent offline, based on the checking interval."""
+
+AGENT_STATUS_CHECK_SWEEP_INTERVAL_SECONDS: int = 30
+"""Longest interval at which the scheduler checks the status of the agents of all the projects."""
+
+AGENT_STATUS_CHECK_MIN_SWEEP_INTERVAL_SECONDS: int = 5
+"""Shortest interval at which the scheduler checks the status of the agents of all the projects."""
+
+AGENT_STATUS_CHECK_SWEEP_FACTOR: float = 0.1
+"""Fraction of the shortest project check interval the agents are checked at, within the sweep interval bounds."""
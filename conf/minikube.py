@@ -1,11 +1,6 @@
 import os
 
-from playhouse.pool import PooledMySQLDatabase
-from playhouse.shortcuts import ReconnectMixin
-
-
-class ReconnectingPooledMySQLDatabase(ReconnectMixin, PooledMySQLDatabase):
-    pass
+from common.peewee_extensions.pool import ReconnectingPooledMySQLDatabase
 
 
 CORS_DOMAINS: list[str] = os.environ.get("CORS_DOMAINS", "*").split(",")
@@ -19,6 +14,8 @@ DATABASE: dict[str, object] = {
     "port": int(os.environ.get("MYSQL_SERVICE_PORT", 3306)),
     "max_connections": 32,
     "stale_timeout": 300,
+    "timeout": 10,
+    "ping_after_idle": 30,
 }
 """Settings for connecting to the development database instance."""
 
@@ -0,0 +1,40 @@
+"""
+Add the digest column to the instance_set table and backfill it
+
+The digest is the SHA-256 of the sorted, comma separated, hex ids of the member instances. When duplicated sets exist,
+only the oldest one gets the digest.
+"""
+
+from yoyo import step
+
+__depends__ = {"20260318_01_pQ7mR-add-journey-component-pattern-columns"}
+__transactional__ = False
+
+steps = [
+    step(
+        "ALTER TABLE `instance_set` ADD COLUMN `digest` varchar(64) NULL",
+        "ALTER TABLE `instance_set` DROP COLUMN `digest`",
+    ),
+    step("SET SESSION group_concat_max_len = 1048576"),
+    step(
+        """
+        UPDATE `instance_set` AS `s`
+        INNER JOIN (
+            SELECT `d`.`digest`, MIN(`d`.`instance_set_id`) AS `instance_set_id`
+            FROM (
+                SELECT
+                    `instance_set_id`,
+                    SHA2(GROUP_CONCAT(`instance_id` ORDER BY `instance_id` SEPARATOR ','), 256) AS `digest`
+                FROM `instances_instancesets`
+                GROUP BY `instance_set_id`
+            ) AS `d`
+            GROUP BY `d`.`digest`
+        ) AS `k` ON `s`.`id` = `k`.`instance_set_id`
+        SET `s`.`digest` = `k`.`digest`
+        """
+    ),
+    step(
+        "CREATE UNIQUE INDEX `instanceset_digest` ON `instance_set` (`digest`)",
+        "DROP INDEX `instanceset_digest` ON `instance_set`",
+    ),
+]
@@ -0,0 +1,33 @@
+"""
+Store the evententity ids as 16 bytes instead of their 32 characters hex representation
+
+New events get time-ordered ids, which keep the primary key index compact. The existing ids are converted as they are.
+"""
+
+from yoyo import step
+
+__depends__ = {"20261018_01_Hq3vT-add-instance-set-digest-column"}
+__transactional__ = False
+
+steps = [
+    step(
+        "ALTER TABLE `evententity` ADD COLUMN `id_bin` BINARY(16) NULL",
+        "ALTER TABLE `evententity` DROP COLUMN `id_bin`",
+    ),
+    step(
+        "ALTER TABLE `evententity` DROP PRIMARY KEY, MODIFY `id` VARCHAR(40) NULL",
+        "ALTER TABLE `evententity` MODIFY `id` VARCHAR(40) NOT NULL, ADD PRIMARY KEY (`id`)",
+    ),
+    step(
+        "UPDATE `evententity` SET `id_bin` = UNHEX(`id`)",
+        "UPDATE `evententity` SET `id` = LOWER(HEX(`id_bin`))",
+    ),
+    step(
+        "ALTER TABLE `evententity` DROP COLUMN `id`",
+        "ALTER TABLE `evententity` ADD COLUMN `id` VARCHAR(40) NULL FIRST",
+    ),
+    step(
+        "ALTER TABLE `evententity` CHANGE COLUMN `id_bin` `id` BINARY(16) NOT NULL FIRST, ADD PRIMARY KEY (`id`)",
+        "ALTER TABLE `evententity` DROP PRIMARY KEY, CHANGE COLUMN `id` `id_bin` BINARY(16) NULL",
+    ),
+]
@@ -0,0 +1,91 @@
+"""
+Add the instance_summary table and fill it from the existing runs, test outcomes and alerts
+
+The key column is the SHA-256 of the kind, component id, status and description, separated by new lines, as computed by
+InstanceSummary.get_key. The counters can be recomputed at any time with `cli rebuild-summaries`.
+"""
+
+from yoyo import step
+
+__depends__ = {"20261018_02_Lw8sK-store-event-ids-as-binary"}
+__transactional__ = False
+
+steps = [
+    step(
+        """
+        CREATE TABLE `instance_summary` (
+          `instance_id` VARCHAR(40) NOT NULL,
+          `key` VARCHAR(64) NOT NULL,
+          `kind` VARCHAR(20) NOT NULL,
+          `component_id` VARCHAR(40),
+          `status` VARCHAR(50) NOT NULL,
+          `description` VARCHAR(255),
+          `count` INTEGER NOT NULL,
+          PRIMARY KEY (`instance_id`, `key`),
+          FOREIGN KEY (`instance_id`) REFERENCES `instance` (`id`) ON DELETE CASCADE,
+          FOREIGN KEY (`component_id`) REFERENCES `component` (`id`) ON DELETE CASCADE
+        )
+        """,
+        "DROP TABLE `instance_summary`",
+    ),
+    step(
+        "CREATE INDEX `instancesummary_instance_id` ON `instance_summary` (`instance_id`)",
+        "DROP INDEX `instancesummary_instance_id` ON `instance_summary`",
+    ),
+    step(
+        "CREATE INDEX `instancesummary_component_id` ON `instance_summary` (`component_id`)",
+        "DROP INDEX `instancesummary_component_id` ON `instance_summary`",
+    ),
+    step(
+        """
+        INSERT INTO `instance_summary` (`instance_id`, `key`, `kind`, `component_id`, `status`, `description`, `count`)
+        SELECT
+            `s`.`instance_id`,
+            SHA2(
+                CONCAT_WS(
+                    '\\n', `s`.`kind`, COALESCE(`s`.`component_id`, ''), `s`.`status`, COALESCE(`s`.`description`, '')
+                ),
+                256
+            ),
+            `s`.`kind`,
+            `s`.`component_id`,
+            `s`.`status`,
+            `s`.`description`,
+            SUM(`s`.`count`)
+        FROM (
+            SELECT `iis`.`instance_id`, 'RUNS' AS `kind`, `r`.`pipeline_id` AS `component_id`, `r`.`status`,
+                NULL AS `description`, COUNT(*) AS `count`
+            FROM `run` AS `r`
+            INNER JOIN `instances_instancesets` AS `iis` ON `iis`.`instance_set_id` = `r`.`instance_set_id`
+            GROUP BY `iis`.`instance_id`, `r`.`pipeline_id`, `r`.`status`
+            UNION ALL
+            SELECT `iis`.`instance_id`, 'TESTS', `t`.`component_id`, `t`.`status`, NULL, COUNT(*)
+            FROM `test_outcome` AS `t`
+            INNER JOIN `instances_instancesets` AS `iis` ON `iis`.`instance_set_id` = `t`.`instance_set_id`
+            GROUP BY `iis`.`instance_id`, `t`.`component_id`, `t`.`status`
+            UNION ALL
+            SELECT `iis`.`instance_id`, 'ALERTS', NULL, `a`.`level`, `a`.`description`, COUNT(*)
+            FROM `run_alerts` AS `a`
+            INNER JOIN `run` AS `r` ON `r`.`id` = `a`.`run_id`
+            INNER JOIN `instances_instancesets` AS `iis` ON `iis`.`instance_set_id` = `r`.`instance_set_id`
+            GROUP BY `iis`.`instance_id`, `a`.`level`, `a`.`description`
+            UNION ALL
+            SELECT `iis`.`instance_id`, 'COMPONENT_ALERTS', `r`.`pipeline_id`, `a`.`level`, `a`.`description`, COUNT(*)
+            FROM `run_alerts` AS `a`
+            INNER JOIN `run` AS `r` ON `r`.`id` = `a`.`run_id`
+            INNER JOIN `instances_instancesets` AS `iis` ON `iis`.`instance_set_id` = `r`.`instance_set_id`
+            GROUP BY `iis`.`instance_id`, `r`.`pipeline_id`, `a`.`level`, `a`.`description`
+            UNION ALL
+            SELECT `a`.`instance_id`, 'ALERTS', NULL, `a`.`level`, `a`.`description`, COUNT(*)
+            FROM `instance_alerts` AS `a`
+            GROUP BY `a`.`instance_id`, `a`.`level`, `a`.`description`
+            UNION ALL
+            SELECT `a`.`instance_id`, 'COMPONENT_ALERTS', `c`.`component_id`, `a`.`level`, `a`.`description`, COUNT(*)
+            FROM `instance_alerts` AS `a`
+            INNER JOIN `instance_alerts_components` AS `c` ON `c`.`instance_alert_id` = `a`.`id`
+            GROUP BY `a`.`instance_id`, `c`.`component_id`, `a`.`level`, `a`.`description`
+        ) AS `s`
+        GROUP BY `s`.`instance_id`, `s`.`kind`, `s`.`component_id`, `s`.`status`, `s`.`description`
+        """
+    ),
+]
@@ -26,3 +26,18 @@ SERVICE_NAME: str = Service.EVENTS_API.name
 
 MAX_REQUEST_BODY_SIZE: int = 100 * 1024  # 100KB
 """Event HTTP request max body size in bytes."""
+
+MAX_BATCH_REQUEST_BODY_SIZE: int = 5 * 1024 * 1024  # 5MB
+"""Batch event HTTP request max body size in bytes."""
+
+MAX_BATCH_EVENTS: int = 500
+"""Maximum number of events in a single batch request."""
+
+KAFKA_PRODUCER_SETTINGS: dict[str, object] = {
+    "queue.buffering.max.messages": 10000,
+    "linger.ms": 5,
+}
+"""Settings of the Kafka producer shared by all requests of a worker process. Bounds the local queue of events."""
+
+PRODUCER_QUEUE_FULL_RETRY_AFTER: int = 5
+"""Seconds clients are asked to wait before retrying when an event is rejected because the producer queue is full."""
@@ -0,0 +1,121 @@
+__all__ = ["BatchEventView", "NDJSON_MIMETYPE"]
+
+import json
+import logging
+from collections.abc import Iterator
+from http import HTTPStatus
+from typing import Any, Union
+
+from flask import Response, current_app, make_response, request
+from marshmallow import ValidationError
+from werkzeug.exceptions import BadRequest, RequestEntityTooLarge
+
+from common.api.base_view import PERM_PROJECT, BaseView
+from common.api.flask_ext.kafka_producer import SharedKafkaProducer
+from common.events.base import EventBaseMixin
+from common.events.v1 import Event
+from common.kafka import (
+    TOPIC_UNIDENTIFIED_EVENTS,
+    KafkaProducer,
+    MessageError,
+    MessageTooLargeError,
+    ProducerError,
+    ProducerQueueFullError,
+)
+
+LOG = logging.getLogger(__name__)
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+class BatchEventView(BaseView):
+    """
+    Base view for posting many events, possibly of different types, in a single request.
+
+    The request body is either a JSON array or, when the content-type is `application/x-ndjson`, one JSON object per
+    line. Each item holds an `event_type` and an `event_payload`, which is validated exactly like the body of the
+    matching single event endpoint. Every valid event is produced, even when other items of the batch are not, and the
+    response holds one result per item in the same order as the request.
+
+    Subclasses implement `build_event` for their API version.
+    """
+
+    PERMISSION_REQUIREMENTS = (PERM_PROJECT,)
+
+    def build_event(self, event_type: Any, event_payload: Any) -> Union[Event, EventBaseMixin]:
+        """Validate an item of the batch and build its event. Raises ValidationError for invalid items."""
+        raise NotImplementedError
+
+    def _iter_ndjson(self) -> Iterator[Any]:
+        max_line_size: int = current_app.config["MAX_REQUEST_BODY_SIZE"]
+        line_number = 0
+        # Reading one byte past the limit tells a line that is too large apart from one that exactly fits
+        while line := request.stream.readline(max_line_size + 1):
+            line_number += 1
+            if len(line.rstrip(b"\r\n")) > max_line_size:
+                raise RequestEntityTooLarge(f"Line {line_number} is larger than {max_line_size} bytes")
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as je:
+                raise BadRequest(f"Line {line_number} is not a valid JSON object") from je
+
+    def parse_items(self) -> list[Any]:
+        max_events: int = current_app.config["MAX_BATCH_EVENTS"]
+        items: list[Any] = []
+        if request.mimetype == NDJSON_MIMETYPE:
+            for item in self._iter_ndjson():
+                items.append(item)
+                if len(items) > max_events:
+                    break
+        else:
+            items = self.request_body  # type: ignore[assignment]
+            if not isinstance(items, list):
+                raise BadRequest("Invalid request: expected a list of events")
+        if len(items) > max_events:
+            raise RequestEntityTooLarge(f"A batch cannot contain more than {max_events} events")
+        return items
+
+    def _produce_item(self, producer: KafkaProducer, item: Any) -> dict[str, Any]:
+        if not isinstance(item, dict):
+            return {
+                "status": HTTPStatus.BAD_REQUEST,
+                "error": "Expected an object with `event_type` and `event_payload`",
+            }
+        try:
+            event = self.build_event(item.get("event_type"), item.get("event_payload"))
+        except ValidationError as ve:
+            return {"status": HTTPStatus.BAD_REQUEST, "error": "Invalid event", "details": ve.messages}
+
+        try:
+            producer.produce(TOPIC_UNIDENTIFIED_EVENTS, event)
+        except ProducerQueueFullError:
+            return {"status": HTTPStatus.SERVICE_UNAVAILABLE, "error": "Event could not be queued, retry later"}
+        except MessageTooLargeError:
+            return {"status": HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "error": "The event payload is too large"}
+        except (MessageError, ProducerError):
+            LOG.exception("Error producing batched event")
+            return {"status": HTTPStatus.INTERNAL_SERVER_ERROR, "error": "Event could not be processed"}
+        return {"status": HTTPStatus.ACCEPTED, "event_id": str(event.event_id)}
+
+    def post(self) -> Response:
+        max_body_size: int = current_app.config["MAX_BATCH_REQUEST_BODY_SIZE"]
+        if (request.content_length or 0) > max_body_size:
+            raise RequestEntityTooLarge("Request Entity Too Large")
+        # Chunked uploads have no content length; the limit makes reading past it raise RequestEntityTooLarge
+        request.max_content_length = max_body_size
+
+        items = self.parse_items()
+        producer = SharedKafkaProducer.get_producer()
+        results = [self._produce_item(producer, item) for item in items]
+
+        statuses = {result["status"] for result in results}
+        response = make_response(
+            {"results": results},
+            HTTPStatus.ACCEPTED if statuses <= {HTTPStatus.ACCEPTED} else HTTPStatus.MULTI_STATUS,
+        )
+        if HTTPStatus.SERVICE_UNAVAILABLE in statuses:
+            LOG.warning("Kafka producer queue is full; rejected events from a batch")
+            response.headers["Retry-After"] = str(current_app.config["PRODUCER_QUEUE_FULL_RETRY_AFTER"])
+        return response
@@ -1,3 +1,4 @@
+from .batch import *
 from .dataset_operation import *
 from .message_log import *
 from .metric_log import *
@@ -0,0 +1,119 @@
+__all__ = ["EventBatch"]
+
+from functools import cached_property
+from typing import Any
+
+from flask import Response, g
+from marshmallow import ValidationError
+
+from common.events.enums import EventSources
+from common.events.v1 import Event
+
+from ..batch_view import BatchEventView
+from .dataset_operation import DatasetOperation
+from .event_view import EventView, get_event_source
+from .message_log import MessageLog
+from .metric_log import MetricLog
+from .run_status import RunStatus
+from .test_outcomes import TestOutcomes
+
+EVENT_VIEWS: dict[str, type[EventView]] = {
+    "dataset-operation": DatasetOperation,
+    "message-log": MessageLog,
+    "metric-log": MetricLog,
+    "run-status": RunStatus,
+    "test-outcomes": TestOutcomes,
+}
+"""Valid `event_type` values for batch items, named after the endpoint of each event type."""
+
+
+class EventBatch(BatchEventView):
+    """Posts multiple events in a single request."""
+
+    @cached_property
+    def event_source(self) -> EventSources:
+        return get_event_source()
+
+    def build_event(self, event_type: Any, event_payload: Any) -> Event:
+        try:
+            view = EVENT_VIEWS[event_type]
+        except (KeyError, TypeError) as e:
+            raise ValidationError({"event_type": [f"Must be one of: {', '.join(EVENT_VIEWS)}."]}) from e
+        if not isinstance(event_payload, dict):
+            raise ValidationError({"event_payload": ["Must be an object."]})
+
+        event: Event = view.event_type.as_event_from_request(event_payload)
+        event.source = self.event_source.value
+        event.project_id = g.project.id
+        return event
+
+    def post(self) -> Response:
+        """
+        Batch Event CREATE
+        ---
+        tags: ["Events"]
+        summary: Batch of Events
+        operationId: PostEventBatch
+        description: Posts multiple events, of any type, in a single request.
+
+                     The body is a list of objects, each with an `event_type` (the name of the endpoint of the
+                     event type, e.g. `metric-log`) and an `event_payload` (the body the endpoint expects). The
+                     body can also be sent as newline delimited JSON using the `application/x-ndjson`
+                     content-type. Each event is validated individually and the response holds the result of
+                     each event, in the order they were sent.
+        security:
+            - SAKey: []
+        parameters:
+           - in: header
+             name: EVENT-SOURCE
+             description: Set the source of the events. If unset, the Event Ingestion API will assume the source of
+                          the Events is API. Warning - This parameter is not intended for use by end users.
+             schema:
+                type: string
+                default: API
+                enum:
+                    - USER
+                    - SCHEDULER
+                    - API
+                    - RULES_ENGINE
+             required: false
+        requestBody:
+            description: The events to be posted.
+            required: true
+            content:
+                application/json:
+                    schema:
+                        type: array
+                        items:
+                            type: object
+                            properties:
+                                event_type:
+                                    type: string
+                                    enum: [dataset-operation, message-log, metric-log, run-status, test-outcomes]
+                                event_payload:
+                                    type: object
+                application/x-ndjson:
+                    schema:
+                        type: string
+        responses:
+            202:
+                description: All the events were accepted.
+            207:
+                description: Some events were not accepted. Check the status of each result.
+            400:
+                description: The request body is not a list of events.
+                content:
+                    application/json:
+                        schema: HTTPErrorSchema
+            413:
+                description: The request body or the number of events is too large.
+                content:
+                    application/json:
+                        schema: HTTPErrorSchema
+            500:
+                description: Unverified error. Consult the response body for more details.
+                content:
+                    application/json:
+                        schema: HTTPErrorSchema
+        """
+        return super().post()
@@ -5,16 +5,33 @@ from typing import Optional
 
 from flask import Response, current_app, g, make_response, request
 from marshmallow import ValidationError
-from werkzeug.exceptions import BadRequest, RequestEntityTooLarge
+from werkzeug.exceptions import BadRequest, RequestEntityTooLarge, ServiceUnavailable
 
 from common.api.base_view import PERM_PROJECT, BaseView
+from common.api.flask_ext.kafka_producer import SharedKafkaProducer
 from common.events.enums import EventSources
 from common.events.v1 import Event
-from common.kafka import TOPIC_UNIDENTIFIED_EVENTS, KafkaProducer, MessageError, MessageTooLargeError, ProducerError
+from common.kafka import (
+    TOPIC_UNIDENTIFIED_EVENTS,
+    MessageError,
+    MessageTooLargeError,
+    ProducerError,
+    ProducerQueueFullError,
+)
 
 LOG = logging.getLogger(__name__)
 
 
+def get_event_source() -> EventSources:
+    """Parse the EVENT-SOURCE request header, defaulting to API."""
+    try:
+        return EventSources(request.headers.get("EVENT-SOURCE", EventSources.API.name).upper())
+    except ValueError as ve:
+        raise BadRequest(
+            f"Invalid EVENT-SOURCE. Valid EVENT-SOURCE: {', '.join(e.value for e in EventSources)}."
+        ) from ve
+
+
 class EventView(BaseView):
     """
     Base view for an Event.
@@ -54,19 +71,15 @@ class EventView(BaseView):
             event: Event = self.event_type.as_event_from_request(self.request_body)
         except ValidationError as ve:
             raise BadRequest(f"Invalid request: {str(ve)}") from ve
-        try:
-            source = EventSources(request.headers.get("EVENT-SOURCE", EventSources.API.name).upper())
-            event.source = source.value
-        except ValueError as ve:
-            raise BadRequest(
-                f"Invalid EVENT-SOURCE. Valid EVENT-SOURCE: {', '.join(e.value for e in EventSources)}."
-            ) from ve
+        event.source = get_event_source().value
 
         # g.project should be set by the ServiceAccountAuth extension or other authentication methods.
         event.project_id = g.project.id
         try:
-            with KafkaProducer({}) as producer:
-                producer.produce(TOPIC_UNIDENTIFIED_EVENTS, event)
+            SharedKafkaProducer.get_producer().produce(TOPIC_UNIDENTIFIED_EVENTS, event)
+        except ProducerQueueFullError as queue_err:
+            LOG.warning("Kafka producer queue is full; rejecting '%s' event", request.path)
+            raise ServiceUnavailable(retry_after=current_app.config["PRODUCER_QUEUE_FULL_RETRY_AFTER"]) from queue_err
         except MessageTooLargeError as msg_err:
             LOG.warning(
                 "Attempt to send a large '%s' event",
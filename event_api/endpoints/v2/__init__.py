@@ -1,3 +1,4 @@
+from .batch import *
 from .batch_pipeline_status import *
 from .dataset_operation import *
 from .event_view import *
@@ -0,0 +1,94 @@
+__all__ = ["EventBatchView"]
+
+from typing import Any
+
+from flask import Response, g
+from marshmallow import ValidationError
+
+from common.entities import ApiEventType
+from common.events.v2 import EventV2
+
+from ..batch_view import BatchEventView
+from .batch_pipeline_status import BatchPipelineStatusView
+from .dataset_operation import DatasetOperationView
+from .event_view import BaseEventView
+from .message_log import MessageLogView
+from .metric_log import MetricLogView
+from .test_outcomes import TestOutcomesView
+
+EVENT_VIEWS: dict[str, type[BaseEventView]] = {
+    ApiEventType.BATCH_PIPELINE_STATUS.value: BatchPipelineStatusView,
+    ApiEventType.DATASET_OPERATION.value: DatasetOperationView,
+    ApiEventType.MESSAGE_LOG.value: MessageLogView,
+    ApiEventType.METRIC_LOG.value: MetricLogView,
+    ApiEventType.TEST_OUTCOMES.value: TestOutcomesView,
+}
+
+
+class EventBatchView(BatchEventView):
+    def build_event(self, event_type: Any, event_payload: Any) -> EventV2:
+        try:
+            view = EVENT_VIEWS[event_type]
+        except (KeyError, TypeError) as e:
+            raise ValidationError({"event_type": [f"Must be one of: {', '.join(EVENT_VIEWS)}."]}) from e
+        if not isinstance(event_payload, dict):
+            raise ValidationError({"event_payload": ["Must be an object."]})
+
+        return view.event_type(event_payload=view.payload_schema.load(event_payload), project_id=g.project.id)
+
+    def post(self) -> Response:
+        """
+        Post a batch of events.
+        ---
+        tags: ["Events"]
+        summary: Batch of Events
+        operationId: PostEventBatch
+        description: Posts multiple events, of any type, in a single request.
+
+                     The body is a list of objects, each with an `event_type` and an `event_payload` (the body the
+                     endpoint of that event type expects). The body can also be sent as newline delimited JSON
+                     using the `application/x-ndjson` content-type. Each event is validated individually and the
+                     response holds the result of each event, in the order they were sent.
+        security:
+            - SAKey: []
+        requestBody:
+            description: The events to be posted.
+            required: true
+            content:
+                application/json:
+                    schema:
+                        type: array
+                        items:
+                            type: object
+                            properties:
+                                event_type:
+                                    type: string
+                                    enum: [BATCH_PIPELINE_STATUS, DATASET_OPERATION, MESSAGE_LOG, METRIC_LOG,
+                                           TEST_OUTCOMES]
+                                event_payload:
+                                    type: object
+                application/x-ndjson:
+                    schema:
+                        type: string
+        responses:
+            202:
+                description: All the events were accepted.
+            207:
+                description: Some events were not accepted. Check the status of each result.
+            400:
+                description: The request body is not a list of events.
+                content:
+                    application/json:
+                        schema: HTTPErrorSchema
+            413:
+                description: The request body or the number of events is too large.
+                content:
+                    application/json:
+                        schema: HTTPErrorSchema
+            500:
+                description: Unverified error. Consult the response body for more details.
+                content:
+                    application/json:
+                        schema: HTTPErrorSchema
+        """
+        return super().post()
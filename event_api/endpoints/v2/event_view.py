@@ -1,13 +1,14 @@
 import logging
 from http import HTTPStatus
 
-from flask import Response, g, make_response
+from flask import Response, current_app, g, make_response
 from marshmallow import Schema, ValidationError
-from werkzeug.exceptions import BadRequest, InternalServerError
+from werkzeug.exceptions import BadRequest, InternalServerError, ServiceUnavailable
 
 from common.api.base_view import PERM_PROJECT, BaseView
+from common.api.flask_ext.kafka_producer import SharedKafkaProducer
 from common.events.v2 import EventResponseSchema, EventV2
-from common.kafka import TOPIC_UNIDENTIFIED_EVENTS, KafkaProducer, MessageError, ProducerError
+from common.kafka import TOPIC_UNIDENTIFIED_EVENTS, MessageError, ProducerError, ProducerQueueFullError
 
 LOG = logging.getLogger(__name__)
 
@@ -29,8 +30,10 @@ class BaseEventView(BaseView):
         )
 
         try:
-            with KafkaProducer({}) as producer:
-                producer.produce(TOPIC_UNIDENTIFIED_EVENTS, event)
+            SharedKafkaProducer.get_producer().produce(TOPIC_UNIDENTIFIED_EVENTS, event)
+        except ProducerQueueFullError as e:
+            LOG.warning("Kafka producer queue is full; rejecting event")
+            raise ServiceUnavailable(retry_after=current_app.config["PRODUCER_QUEUE_FULL_RETRY_AFTER"]) from e
         except (MessageError, ProducerError) as e:
             LOG.exception(str(e))
             raise InternalServerError() from e
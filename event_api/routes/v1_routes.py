@@ -4,7 +4,7 @@ from collections.abc import Callable
 
 from flask import Blueprint, Flask
 
-from event_api.endpoints.v1 import DatasetOperation, MessageLog, MetricLog, RunStatus, TestOutcomes
+from event_api.endpoints.v1 import DatasetOperation, EventBatch, MessageLog, MetricLog, RunStatus, TestOutcomes
 
 """
 Blueprints:  https://flask.palletsprojects.com/en/2.0.x/blueprints/
@@ -19,18 +19,21 @@ def build_event_routes(bp: Blueprint) -> list[Callable]:
     metric_log_view = MetricLog.as_view("metric-log")
     status_view = RunStatus.as_view("run-status")
     test_outcomes_view = TestOutcomes.as_view("test-outcomes")
+    batch_view = EventBatch.as_view("events-batch")
 
     bp.add_url_rule("/dataset-operation", view_func=dataset_operation_view, methods=["POST"])
     bp.add_url_rule("/message-log", view_func=message_log_view, methods=["POST"])
     bp.add_url_rule("/metric-log", view_func=metric_log_view, methods=["POST"])
     bp.add_url_rule("/run-status", view_func=status_view, methods=["POST"])
     bp.add_url_rule("/test-outcomes", view_func=test_outcomes_view, methods=["POST"])
+    bp.add_url_rule("/events/batch", view_func=batch_view, methods=["POST"])
     return [
         dataset_operation_view,
         message_log_view,
         metric_log_view,
         status_view,
         test_outcomes_view,
+        batch_view,
     ]
 
 
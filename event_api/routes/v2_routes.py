@@ -7,6 +7,7 @@ from flask import Blueprint, Flask
 from event_api.endpoints.v2 import (
     BatchPipelineStatusView,
     DatasetOperationView,
+    EventBatchView,
     MessageLogView,
     MetricLogView,
     TestOutcomesView,
@@ -25,14 +26,16 @@ def build_event_routes(bp: Blueprint) -> list[Callable]:
     metric_log_view = MetricLogView.as_view("metric-log")
     status_view = BatchPipelineStatusView.as_view("run-status")
     test_outcomes_view = TestOutcomesView.as_view("test-outcomes")
+    batch_view = EventBatchView.as_view("events-batch")
 
     bp.add_url_rule("/batch-pipeline-status", view_func=status_view, methods=["POST"])
     bp.add_url_rule("/dataset-operation", view_func=dataset_operation_view, methods=["POST"])
     bp.add_url_rule("/message-log", view_func=message_log_view, methods=["POST"])
     bp.add_url_rule("/metric-log", view_func=metric_log_view, methods=["POST"])
     bp.add_url_rule("/test-outcomes", view_func=test_outcomes_view, methods=["POST"])
+    bp.add_url_rule("/events/batch", view_func=batch_view, methods=["POST"])
 
-    return [dataset_operation_view, status_view, message_log_view, metric_log_view, test_outcomes_view]
+    return [dataset_operation_view, status_view, message_log_view, metric_log_view, test_outcomes_view, batch_view]
 
 
 def build_v2_routes(app: Flask, prefix: str) -> list[Callable]:
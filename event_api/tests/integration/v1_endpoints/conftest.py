@@ -12,6 +12,7 @@ from common.api.flask_ext.authentication import ServiceAccountAuth
 from common.api.flask_ext.config import Config
 from common.api.flask_ext.database_connection import DatabaseConnection
 from common.api.flask_ext.exception_handling import ExceptionHandling
+from common.api.flask_ext.kafka_producer import SharedKafkaProducer
 from common.auth.keys.service_key import generate_key
 from common.entities import DB, Company, Organization, Project
 from common.events.v1 import ApiRunStatus, MessageEventLogLevel, TestgenIntegrationVersions, TestStatuses
@@ -148,10 +149,11 @@ def flask_app(kafka_producer):
     Config(app, config_module="event_api.config")
     build_v1_routes(app, prefix="events")
     ExceptionHandling(app)
+    SharedKafkaProducer(app)
     DatabaseConnection(app)
     ServiceAccountAuth(app)
 
-    with patch("event_api.endpoints.v1.event_view.KafkaProducer", return_value=kafka_producer):
+    with patch("common.api.flask_ext.kafka_producer.KafkaProducer", return_value=kafka_producer):
         yield app
     shutil.rmtree(app.instance_path, ignore_errors=True)
 
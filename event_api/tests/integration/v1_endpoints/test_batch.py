@@ -0,0 +1,125 @@
+import io
+import json
+from http import HTTPStatus
+from unittest.mock import patch
+
+import pytest
+
+from common.events.enums import EventSources
+from common.events.v1 import MessageEventLogLevel, MessageLogEvent, MetricLogEvent
+from common.kafka import TOPIC_UNIDENTIFIED_EVENTS, MessageTooLargeError
+
+
+@pytest.fixture
+def batch(metriclog_schema):
+    # The schema fixtures share the same base dictionary, so the message log payload is built from a copy
+    messagelog = {k: v for k, v in metriclog_schema.items() if k not in ("metric_key", "metric_value")}
+    messagelog.update({"log_level": MessageEventLogLevel.INFO.name, "message": "Test Message Please Ignore"})
+    return [
+        {"event_type": "metric-log", "event_payload": dict(metriclog_schema)},
+        {"event_type": "message-log", "event_payload": messagelog},
+    ]
+
+
+@pytest.mark.integration
+def test_batch_endpoint(client, database_ctx, kafka_producer, headers, batch):
+    response = client.post("/events/v1/events/batch", json=batch, headers=headers)
+    assert response.status_code == HTTPStatus.ACCEPTED, response.json
+
+    results = response.json["results"]
+    assert [r["status"] for r in results] == [HTTPStatus.ACCEPTED, HTTPStatus.ACCEPTED]
+    assert kafka_producer.produce.call_count == 2
+    events = [call.args[1] for call in kafka_producer.produce.call_args_list]
+    assert all(call.args[0] == TOPIC_UNIDENTIFIED_EVENTS for call in kafka_producer.produce.call_args_list)
+    assert isinstance(events[0], MetricLogEvent)
+    assert isinstance(events[1], MessageLogEvent)
+    assert [str(e.event_id) for e in events] == [r["event_id"] for r in results]
+    assert all(e.project_id == database_ctx.project.id for e in events)
+    assert all(e.source == EventSources.API.name for e in events)
+
+
+@pytest.mark.integration
+def test_batch_endpoint_ndjson(client, database_ctx, kafka_producer, headers, batch):
+    body = "\n".join(json.dumps(item) for item in batch) + "\n"
+    response = client.post(
+        "/events/v1/events/batch", data=body, headers={**headers, "Content-Type": "application/x-ndjson"}
+    )
+    assert response.status_code == HTTPStatus.ACCEPTED, response.json
+    assert len(response.json["results"]) == 2
+    assert kafka_producer.produce.call_count == 2
+
+
+@pytest.mark.integration
+def test_batch_endpoint_partial_failure(client, database_ctx, kafka_producer, headers, batch):
+    del batch[0]["event_payload"]["metric_key"]
+    batch.append({"event_type": "unknown", "event_payload": {}})
+    batch.append("not an object")
+
+    response = client.post("/events/v1/events/batch", json=batch, headers=headers)
+    assert response.status_code == HTTPStatus.MULTI_STATUS, response.json
+
+    results = response.json["results"]
+    assert [r["status"] for r in results] == [
+        HTTPStatus.BAD_REQUEST,
+        HTTPStatus.ACCEPTED,
+        HTTPStatus.BAD_REQUEST,
+        HTTPStatus.BAD_REQUEST,
+    ]
+    assert "metric_key" in results[0]["details"]
+    assert "event_type" in results[2]["details"]
+    kafka_producer.produce.assert_called_once()
+
+
+@pytest.mark.integration
+def test_batch_endpoint_message_too_large(client, database_ctx, kafka_producer, headers, batch):
+    kafka_producer.produce.side_effect = [MessageTooLargeError(), None]
+
+    response = client.post("/events/v1/events/batch", json=batch, headers=headers)
+    assert response.status_code == HTTPStatus.MULTI_STATUS, response.json
+    assert [r["status"] for r in response.json["results"]] == [
+        HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+        HTTPStatus.ACCEPTED,
+    ]
+
+
+@pytest.mark.integration
+def test_batch_endpoint_not_a_list(client, database_ctx, kafka_producer, headers, metriclog_schema):
+    response = client.post("/events/v1/events/batch", json=metriclog_schema, headers=headers)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    kafka_producer.produce.assert_not_called()
+
+
+@pytest.mark.integration
+def test_batch_endpoint_too_many_events(flask_app, client, database_ctx, kafka_producer, headers, batch):
+    with patch.dict(flask_app.config, {"MAX_BATCH_EVENTS": 1}):
+        response = client.post("/events/v1/events/batch", json=batch, headers=headers)
+    assert response.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    kafka_producer.produce.assert_not_called()
+
+
+@pytest.mark.integration
+def test_batch_endpoint_chunked_body_too_large(flask_app, client, database_ctx, kafka_producer, headers, batch):
+    body = "\n".join(json.dumps(item) for item in batch) + "\n"
+    with patch.dict(flask_app.config, {"MAX_BATCH_REQUEST_BODY_SIZE": len(body) - 1}):
+        response = client.post(
+            "/events/v1/events/batch",
+            input_stream=io.BytesIO(body.encode()),
+            headers={**headers, "Content-Type": "application/x-ndjson", "Transfer-Encoding": "chunked"},
+            # Set by the WSGI servers which terminate chunked streams on their own
+            environ_overrides={"wsgi.input_terminated": True},
+        )
+    assert response.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    kafka_producer.produce.assert_not_called()
+
+
+@pytest.mark.integration
+def test_batch_endpoint_ndjson_line_too_large(flask_app, client, database_ctx, kafka_producer, headers, batch):
+    lines = [json.dumps(item) for item in batch]
+    with patch.dict(flask_app.config, {"MAX_REQUEST_BODY_SIZE": min(len(line) for line in lines)}):
+        response = client.post(
+            "/events/v1/events/batch",
+            data="\n".join(lines) + "\n",
+            headers={**headers, "Content-Type": "application/x-ndjson"},
+        )
+    assert response.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    kafka_producer.produce.assert_not_called()
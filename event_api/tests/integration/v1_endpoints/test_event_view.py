@@ -3,7 +3,7 @@ from unittest.mock import patch
 
 import pytest
 
-from common.kafka import MessageTooLargeError
+from common.kafka import MessageTooLargeError, ProducerQueueFullError
 
 
 @pytest.mark.integration
@@ -21,3 +21,13 @@ def test_request_body_too_large(flask_app, client, database_ctx, kafka_producer,
         response = client.post("/events/v1/metric-log", json=metriclog_schema, headers=headers)
 
     assert response.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+
+
+@pytest.mark.integration
+def test_kafka_producer_queue_full(client, database_ctx, kafka_producer, headers, metriclog_schema):
+    kafka_producer.produce.side_effect = ProducerQueueFullError()
+
+    response = client.post("/events/v1/metric-log", json=metriclog_schema, headers=headers)
+
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "5"
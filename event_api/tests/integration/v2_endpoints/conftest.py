@@ -10,6 +10,7 @@ from common.api.flask_ext.authentication import ServiceAccountAuth
 from common.api.flask_ext.config import Config
 from common.api.flask_ext.database_connection import DatabaseConnection
 from common.api.flask_ext.exception_handling import ExceptionHandling
+from common.api.flask_ext.kafka_producer import SharedKafkaProducer
 from common.auth.keys.service_key import generate_key
 from common.entities import DB, Company, Organization, Project
 from conf import init_db
@@ -76,6 +77,7 @@ def flask_app(kafka_producer):
     Config(app, config_module="event_api.config")
     build_v2_routes(app, prefix="events")
     ExceptionHandling(app)
+    SharedKafkaProducer(app)
     DatabaseConnection(app)
     ServiceAccountAuth(app)
 
@@ -85,7 +87,7 @@ def flask_app(kafka_producer):
 
 @pytest.fixture(autouse=True)
 def kafka_class_mock(kafka_producer):
-    with patch("event_api.endpoints.v2.event_view.KafkaProducer", return_value=kafka_producer):
+    with patch("common.api.flask_ext.kafka_producer.KafkaProducer", return_value=kafka_producer):
         yield
 
 
@@ -0,0 +1,76 @@
+import json
+from http import HTTPStatus
+
+import pytest
+
+from common.events.v2 import MessageLogUserEvent, MetricLogUserEvent
+from common.kafka import TOPIC_UNIDENTIFIED_EVENTS, ProducerQueueFullError
+
+
+@pytest.fixture
+def batch(component):
+    return [
+        {
+            "event_type": "METRIC_LOG",
+            "event_payload": {"component": component, "metric_entries": [{"key": "row_count", "value": "100"}]},
+        },
+        {
+            "event_type": "MESSAGE_LOG",
+            "event_payload": {"component": component, "log_entries": [{"level": "INFO", "message": "hello"}]},
+        },
+    ]
+
+
+@pytest.mark.integration
+def test_batch_ok(client, project, kafka_producer, headers, batch):
+    response = client.post("/events/v2/events/batch", json=batch, headers=headers)
+    assert response.status_code == HTTPStatus.ACCEPTED, response.json
+
+    results = response.json["results"]
+    assert [r["status"] for r in results] == [HTTPStatus.ACCEPTED, HTTPStatus.ACCEPTED]
+    calls = kafka_producer.produce.call_args_list
+    assert [c.args[0] for c in calls] == [TOPIC_UNIDENTIFIED_EVENTS, TOPIC_UNIDENTIFIED_EVENTS]
+    assert isinstance(calls[0].args[1], MetricLogUserEvent)
+    assert isinstance(calls[1].args[1], MessageLogUserEvent)
+    assert [str(c.args[1].event_id) for c in calls] == [r["event_id"] for r in results]
+    assert all(c.args[1].project_id == project.id for c in calls)
+
+
+@pytest.mark.integration
+def test_batch_ndjson(client, project, kafka_producer, headers, batch):
+    body = "\n".join(json.dumps(item) for item in batch)
+    response = client.post(
+        "/events/v2/events/batch", data=body, headers={**headers, "Content-Type": "application/x-ndjson"}
+    )
+    assert response.status_code == HTTPStatus.ACCEPTED, response.json
+    assert kafka_producer.produce.call_count == 2
+
+
+@pytest.mark.integration
+def test_batch_ndjson_invalid_line(client, project, kafka_producer, headers, batch):
+    body = json.dumps(batch[0]) + "\n{not json"
+    response = client.post(
+        "/events/v2/events/batch", data=body, headers={**headers, "Content-Type": "application/x-ndjson"}
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    kafka_producer.produce.assert_not_called()
+
+
+@pytest.mark.integration
+def test_batch_invalid_item(client, project, kafka_producer, headers, batch):
+    batch[1]["event_payload"]["component"] = None
+    response = client.post("/events/v2/events/batch", json=batch, headers=headers)
+    assert response.status_code == HTTPStatus.MULTI_STATUS, response.json
+    results = response.json["results"]
+    assert [r["status"] for r in results] == [HTTPStatus.ACCEPTED, HTTPStatus.BAD_REQUEST]
+    assert "component" in results[1]["details"]
+    kafka_producer.produce.assert_called_once()
+
+
+@pytest.mark.integration
+def test_batch_queue_full(client, project, kafka_producer, headers, batch):
+    kafka_producer.produce.side_effect = [None, ProducerQueueFullError()]
+    response = client.post("/events/v2/events/batch", json=batch, headers=headers)
+    assert response.status_code == HTTPStatus.MULTI_STATUS, response.json
+    assert [r["status"] for r in response.json["results"]] == [HTTPStatus.ACCEPTED, HTTPStatus.SERVICE_UNAVAILABLE]
+    assert response.headers["Retry-After"] == "5"
@@ -8,6 +8,7 @@ from common.api.flask_ext.cors import CORS
 from common.api.flask_ext.database_connection import DatabaseConnection
 from common.api.flask_ext.exception_handling import ExceptionHandling
 from common.api.flask_ext.health import Health
+from common.api.flask_ext.kafka_producer import SharedKafkaProducer
 from common.api.flask_ext.logging import Logging
 from common.api.flask_ext.timing import Timing
 from common.api.flask_ext.url_converters import URLConverters
@@ -26,6 +27,7 @@ ExceptionHandling(app)
 Timing(app)
 ServiceAccountAuth(app)
 JWTAuth(app)
+SharedKafkaProducer(app)
 Health(app, prefix=app.config["API_PREFIX"], readiness_callback=readiness_probe)
 
 
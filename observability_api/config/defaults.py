@@ -38,3 +38,6 @@ SERVICE_NAME: str = Service.OBSERVABILITY_API.name
 
 DEFAULT_JWT_EXPIRATION_SECONDS: float = timedelta(hours=24).total_seconds()
 """Default expiration period for the JWT tokens."""
+
+KAFKA_PRODUCER_SETTINGS: dict[str, object] = {"linger.ms": 5}
+"""Settings of the Kafka producer shared by all requests of a worker process, which publishes the rule changes."""
@@ -11,7 +11,10 @@ from marshmallow_peewee import ModelSchema
 from common.api.base_view import Permission
 from common.entities import BaseEntity, Project
 from common.entity_services import JourneyService
+from common.events.internal import ComponentChangeEvent
+from common.kafka import TOPIC_COMPONENT_CHANGES
 from observability_api.endpoints.entity_view import BaseEntityView
+from observability_api.helpers.changes import publish_change
 from observability_api.schemas.component_schemas import ComponentPatchSchema
 
 LOG = logging.getLogger(__name__)
@@ -32,6 +35,9 @@ class ComponentByIdAbstractView(BaseEntityView):
         component = self.get_entity_or_fail(self.entity, self.entity.id == component_id)
         self.parse_body(schema=ComponentPatchSchema(component))
         self.save_entity_or_fail(component)
+        publish_change(
+            TOPIC_COMPONENT_CHANGES, ComponentChangeEvent(project_id=component.project_id, component_id=component.id)
+        )
         return make_response(self.schema().dump(self.entity.get_by_id(component_id)))
 
     @classmethod
@@ -115,6 +115,22 @@ class ProjectAlerts(BaseEntityView):
               type: string
               format: date
             required: false
+          - in: query
+            name: cursor
+            schema:
+              type: string
+            required: false
+            description: Optional. The next_cursor value returned with the previous page. When given, the results
+                         following the cursor are returned and the page parameter is ignored. Unlike page numbers,
+                         listing with a cursor takes the same time no matter how deep the page is.
+          - in: query
+            name: include_total
+            schema:
+              type: boolean
+              default: true
+            required: false
+            description: Optional. Set to false to skip counting the total number of results, which is returned as
+                         null. Counting is the slowest part of listing large result sets.
         responses:
           200:
             description: Request successful - alerts returned.
@@ -143,4 +159,4 @@ class ProjectAlerts(BaseEntityView):
         if "sort" not in request.args:
             rules.sort = SortOrder.DESC
         page = ProjectService.get_alerts_with_rules(str(project_id), rules, AlertFilters.from_params(request.args))
-        return make_response({"entities": page.results, "total": page.total})
+        return make_response({"entities": page.results, "total": page.total, "next_cursor": page.next_cursor})
@@ -12,7 +12,10 @@ from common.api.request_parsing import no_body_allowed
 from common.entities import Component, Journey, Project
 from common.entity_services import JourneyService, ProjectService
 from common.entity_services.helpers import ComponentFilters, ListRules, Page
+from common.events.internal import ComponentChangeEvent
+from common.kafka import TOPIC_COMPONENT_CHANGES
 from observability_api.endpoints.entity_view import BaseEntityView
+from observability_api.helpers.changes import publish_change
 from observability_api.schemas import ComponentSchema
 
 LOG = logging.getLogger(__name__)
@@ -197,9 +200,15 @@ class ComponentById(BaseEntityView):
 
         """
         try:
-            self.get_entity_or_fail(Component, Component.id == component_id).delete_instance()
+            component = self.get_entity_or_fail(Component, Component.id == component_id)
         except NotFound:
             pass
+        else:
+            project_id = component.project_id
+            component.delete_instance()
+            publish_change(
+                TOPIC_COMPONENT_CHANGES, ComponentChangeEvent(project_id=project_id, component_id=component_id)
+            )
         return make_response("", HTTPStatus.NO_CONTENT)
 
 
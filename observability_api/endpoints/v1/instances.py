@@ -133,6 +133,22 @@ class Instances(BaseEntityView, SearchableView):
             required: false
             description: Optional. A case-insensitive search query. If specified, only instances with payload key value
                          that is a partial or full match to the query will be listed.
+          - in: query
+            name: cursor
+            schema:
+              type: string
+            required: false
+            description: Optional. The next_cursor value returned with the previous page. When given, the results
+                         following the cursor are returned and the page parameter is ignored. Unlike page numbers,
+                         listing with a cursor takes the same time no matter how deep the page is.
+          - in: query
+            name: include_total
+            schema:
+              type: boolean
+              default: true
+            required: false
+            description: Optional. Set to false to skip counting the total number of results, which is returned as
+                         null. Counting is the slowest part of listing large result sets.
         responses:
           200:
             description: Request successful - Instance list returned.
@@ -147,6 +163,11 @@ class Instances(BaseEntityView, SearchableView):
                         $ref: '#/components/schemas/InstanceDetailedSchema'
                     total:
                       type: integer
+                      nullable: true
+                    next_cursor:
+                      type: string
+                      nullable: true
+                      description: Cursor to list the next page, null when there are no more results.
           404:
             description: Project not found.
             content:
@@ -165,7 +186,13 @@ class Instances(BaseEntityView, SearchableView):
             Filters.from_dict(self.FILTERS_SCHEMA().load(self.args)),
             [str(project_id)],
         )
-        return make_response({"entities": InstanceDetailedSchema().dump(page.results, many=True), "total": page.total})
+        return make_response(
+            {
+                "entities": InstanceDetailedSchema().dump(page.results, many=True),
+                "total": page.total,
+                "next_cursor": page.next_cursor,
+            }
+        )
 
 
 class CompanyInstances(BaseEntityView):
@@ -291,6 +318,22 @@ class CompanyInstances(BaseEntityView):
             required: false
             description: Optional. A case-insensitive search query. If specified, only instances with payload key value
                          that is a partial or full match to the query will be listed.
+          - in: query
+            name: cursor
+            schema:
+              type: string
+            required: false
+            description: Optional. The next_cursor value returned with the previous page. When given, the results
+                         following the cursor are returned and the page parameter is ignored. Unlike page numbers,
+                         listing with a cursor takes the same time no matter how deep the page is.
+          - in: query
+            name: include_total
+            schema:
+              type: boolean
+              default: true
+            required: false
+            description: Optional. Set to false to skip counting the total number of results, which is returned as
+                         null. Counting is the slowest part of listing large result sets.
         responses:
           200:
             description: Request successful - Instance list returned.
@@ -305,6 +348,11 @@ class CompanyInstances(BaseEntityView):
                         $ref: '#/components/schemas/InstanceDetailedSchema'
                     total:
                       type: integer
+                      nullable: true
+                    next_cursor:
+                      type: string
+                      nullable: true
+                      description: Cursor to list the next page, null when there are no more results.
           500:
             description: Unverified error. Consult the response body for more details.
             content:
@@ -322,7 +370,13 @@ class CompanyInstances(BaseEntityView):
             project_ids,
             company_id,
         )
-        return make_response({"entities": InstanceDetailedSchema().dump(page.results, many=True), "total": page.total})
+        return make_response(
+            {
+                "entities": InstanceDetailedSchema().dump(page.results, many=True),
+                "total": page.total,
+                "next_cursor": page.next_cursor,
+            }
+        )
 
 
 class InstanceById(BaseEntityView):
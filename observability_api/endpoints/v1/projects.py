@@ -269,6 +269,22 @@ class ProjectEvents(BaseEntityView):
                   - MESSAGE_LOG
                   - METRIC_LOG
                   - TEST_OUTCOMES
+          - in: query
+            name: cursor
+            schema:
+              type: string
+            required: false
+            description: Optional. The next_cursor value returned with the previous page. When given, the results
+                         following the cursor are returned and the page parameter is ignored. Unlike page numbers,
+                         listing with a cursor takes the same time no matter how deep the page is.
+          - in: query
+            name: include_total
+            schema:
+              type: boolean
+              default: true
+            required: false
+            description: Optional. Set to false to skip counting the total number of results, which is returned as
+                         null. Counting is the slowest part of listing large result sets.
         responses:
           200:
             description: Request successful - project event details returned.
@@ -283,6 +299,11 @@ class ProjectEvents(BaseEntityView):
                         $ref: '#/components/schemas/EventResponseSchema'
                     total:
                       type: integer
+                      nullable: true
+                    next_cursor:
+                      type: string
+                      nullable: true
+                      description: Cursor to list the next page, null when there are no more results.
           400:
             description: Request bodies are not supported by this endpoint.
             content:
@@ -304,4 +325,10 @@ class ProjectEvents(BaseEntityView):
         page: Page[EventEntity] = EventService.get_events_with_rules(
             rules=ListRules.from_params(request.args), filters=event_filters
         )
-        return make_response({"entities": EventResponseSchema().dump(page.results, many=True), "total": page.total})
+        return make_response(
+            {
+                "entities": EventResponseSchema().dump(page.results, many=True),
+                "total": page.total,
+                "next_cursor": page.next_cursor,
+            }
+        )
@@ -16,11 +16,14 @@ from common.api.request_parsing import no_body_allowed
 from common.entities import DB, Component, Journey, Rule
 from common.entity_services import JourneyService
 from common.entity_services.helpers import ListRules, Page
+from common.events.internal import RuleChangeEvent
 from common.exceptions.service import MultipleActionsFound
+from common.kafka import TOPIC_RULE_CHANGES
 from common.predicate_engine.compilers import compile_schema
 from common.predicate_engine.exceptions import InvalidRuleData
 from common.predicate_engine.schemas.simple_v1 import RuleDataSchema
 from observability_api.endpoints.entity_view import BaseEntityView
+from observability_api.helpers.changes import publish_change
 from observability_api.schemas import RulePatchSchema, RuleSchema
 
 LOG = logging.getLogger(__name__)
@@ -49,6 +52,11 @@ def _validate_rule_predicate(rule: Rule) -> None:
         raise BadRequest("Invalid rule pattern.") from ird
 
 
+def _publish_rule_change(journey_id: UUID) -> None:
+    """Let the rules engines know that the rules of the journey changed, so that they reload them."""
+    publish_change(TOPIC_RULE_CHANGES, RuleChangeEvent(journey_id=journey_id))
+
+
 class Rules(BaseEntityView):
     PERMISSION_REQUIREMENTS: tuple[Permission, ...] = ()
 
@@ -205,6 +213,7 @@ class Rules(BaseEntityView):
             except IntegrityError as ie:
                 LOG.exception("Rule CREATE failed.")
                 raise Conflict("Failed to create Rule; one already exists with that information.") from ie
+        _publish_rule_change(rule.journey_id)
         return make_response(RuleSchema().dump(rule), HTTPStatus.CREATED)
 
 
@@ -332,6 +341,7 @@ class RuleById(BaseEntityView):
             LOG.exception("Rule PATCH failed.")
             raise Conflict("Failed to patch Rule.") from e
 
+        _publish_rule_change(rule.journey_id)
         return make_response(RuleSchema().dump(rule))
 
     @no_body_allowed
@@ -364,7 +374,10 @@ class RuleById(BaseEntityView):
                 schema: HTTPErrorSchema
         """
         try:
-            self.get_entity_or_fail(Rule, Rule.id == rule_id).delete_instance()
+            rule = self.get_entity_or_fail(Rule, Rule.id == rule_id)
         except NotFound:
             pass
+        else:
+            rule.delete_instance()
+            _publish_rule_change(rule.journey_id)
         return make_response("", HTTPStatus.NO_CONTENT)
@@ -154,6 +154,22 @@ class Runs(BaseEntityView):
             required: false
             description: Optional. A case-insensitive search query. If specified, runs with keys or
                          names that have a partial or full match to the query will be listed.
+          - in: query
+            name: cursor
+            schema:
+              type: string
+            required: false
+            description: Optional. The next_cursor value returned with the previous page. When given, the results
+                         following the cursor are returned and the page parameter is ignored. Unlike page numbers,
+                         listing with a cursor takes the same time no matter how deep the page is.
+          - in: query
+            name: include_total
+            schema:
+              type: boolean
+              default: true
+            required: false
+            description: Optional. Set to false to skip counting the total number of results, which is returned as
+                         null. Counting is the slowest part of listing large result sets.
         responses:
           200:
             description: Request successful - Run list returned.
@@ -168,6 +184,11 @@ class Runs(BaseEntityView):
                         $ref: '#/components/schemas/RunSchema'
                     total:
                       type: integer
+                      nullable: true
+                    next_cursor:
+                      type: string
+                      nullable: true
+                      description: Cursor to list the next page, null when there are no more results.
           404:
             description: Project not found.
             content:
@@ -189,7 +210,7 @@ class Runs(BaseEntityView):
             RunFilters.from_params(request.args),
         )
         runs = RunSchema().dump(page.results, many=True)
-        return make_response({"entities": runs, "total": page.total})
+        return make_response({"entities": runs, "total": page.total, "next_cursor": page.next_cursor})
 
 
 class RunById(BaseEntityView):
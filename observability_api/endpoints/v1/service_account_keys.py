@@ -10,7 +10,7 @@ from werkzeug.exceptions import Conflict
 
 from common.api.base_view import PERM_USER
 from common.api.request_parsing import no_body_allowed
-from common.auth.keys.service_key import generate_key
+from common.auth.keys.service_key import generate_key, invalidate_key
 from common.entities import DB, Project, ServiceAccountKey
 from common.entity_services import ServiceAccountKeyService
 from common.entity_services.helpers import ListRules, Page
@@ -199,4 +199,5 @@ class ServiceAccountKeyById(BaseEntityView):
         sa_key = self.get_entity_or_fail(ServiceAccountKey, ServiceAccountKey.id == key_id)
         with DB.atomic():
             sa_key.delete_instance()
+        invalidate_key(sa_key.id)
         return make_response("", HTTPStatus.NO_CONTENT)
@@ -138,6 +138,22 @@ class ProjectTests(BaseEntityView):
             schema:
               type: string
               format: uuid
+          - in: query
+            name: cursor
+            schema:
+              type: string
+            required: false
+            description: Optional. The next_cursor value returned with the previous page. When given, the results
+                         following the cursor are returned and the page parameter is ignored. Unlike page numbers,
+                         listing with a cursor takes the same time no matter how deep the page is.
+          - in: query
+            name: include_total
+            schema:
+              type: boolean
+              default: true
+            required: false
+            description: Optional. Set to false to skip counting the total number of results, which is returned as
+                         null. Counting is the slowest part of listing large result sets.
         responses:
           200:
             description: Request successful - List of test outcomes returned.
@@ -152,6 +168,11 @@ class ProjectTests(BaseEntityView):
                         $ref: '#/components/schemas/TestOutcomeItemSchema'
                     total:
                       type: integer
+                      nullable: true
+                    next_cursor:
+                      type: string
+                      nullable: true
+                      description: Cursor to list the next page, null when there are no more results.
           404:
             description: Project not found.
             content:
@@ -170,7 +191,13 @@ class ProjectTests(BaseEntityView):
             ListRules.from_params(request.args),
             TestOutcomeItemFilters.from_params(request.args),
         )
-        return make_response({"entities": TestOutcomeItemSchema().dump(page.results, many=True), "total": page.total})
+        return make_response(
+            {
+                "entities": TestOutcomeItemSchema().dump(page.results, many=True),
+                "total": page.total,
+                "next_cursor": page.next_cursor,
+            }
+        )
 
 
 class TestOutcomeById(BaseEntityView):
@@ -0,0 +1,25 @@
+__all__ = ["publish_change"]
+
+import logging
+
+from flask import current_app
+
+from common.api.flask_ext.kafka_producer import EXTENSION_NAME as KAFKA_PRODUCER_EXTENSION
+from common.api.flask_ext.kafka_producer import SharedKafkaProducer
+from common.events.base import EventBaseMixin
+from common.kafka.topic import MsgPackTopic
+
+LOG = logging.getLogger(__name__)
+
+
+def publish_change(topic: MsgPackTopic, event: EventBaseMixin) -> None:
+    """
+    Let the services caching the changed entities know about the change, so that they reload them. Failing to do so
+    only delays the change until the services' caches expire, so errors are logged rather than raised.
+    """
+    if KAFKA_PRODUCER_EXTENSION not in current_app.extensions:
+        return
+    try:
+        SharedKafkaProducer.get_producer().produce(topic, event)
+    except Exception:
+        LOG.exception("Error publishing %s to %s", event, topic.name)
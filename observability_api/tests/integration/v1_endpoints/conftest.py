@@ -3,6 +3,7 @@ import shutil
 import uuid
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from unittest.mock import MagicMock, patch
 
 import pytest
 from flask import Flask, g
@@ -10,6 +11,7 @@ from flask import Flask, g
 from common.api.flask_ext.authentication import JWTAuth
 from common.api.flask_ext.config import Config
 from common.api.flask_ext.exception_handling import ExceptionHandling
+from common.api.flask_ext.kafka_producer import SharedKafkaProducer
 from common.api.flask_ext.url_converters import URLConverters
 from common.entities import (
     DB,
@@ -49,6 +51,14 @@ def test_db():
     DB.close()
 
 
+@pytest.fixture
+def kafka_producer(flask_app):
+    kafka_producer = MagicMock()
+    SharedKafkaProducer(flask_app)
+    with patch("common.api.flask_ext.kafka_producer.KafkaProducer", return_value=kafka_producer):
+        yield kafka_producer
+
+
 @pytest.fixture
 def company_2():
     return Company.create(name="C2")
@@ -5,6 +5,8 @@ import pytest
 from werkzeug.datastructures import MultiDict
 
 from common.entities import BaseEntity, Component, ComponentType, JourneyDagEdge
+from common.events.internal import ComponentChangeEvent
+from common.kafka import TOPIC_COMPONENT_CHANGES
 from common.schemas.fields import strip_upper_underscore
 
 subcomponent_test_params = pytest.mark.parametrize(
@@ -265,6 +267,22 @@ def test_delete_component_ok(client, pipeline, g_user):
     assert len(Component.select()) == 0
 
 
+def assert_component_change_published(kafka_producer, component):
+    kafka_producer.produce.assert_called_once()
+    topic, event = kafka_producer.produce.call_args.args
+    assert topic == TOPIC_COMPONENT_CHANGES
+    assert isinstance(event, ComponentChangeEvent)
+    assert event.component_id == component.id
+    assert event.project_id == component.project_id
+
+
+@pytest.mark.integration
+def test_delete_component_publishes_change(client, pipeline, g_user, kafka_producer):
+    response = client.delete(f"/observability/v1/components/{pipeline.id}")
+    assert response.status_code == HTTPStatus.NO_CONTENT, response.json
+    assert_component_change_published(kafka_producer, pipeline)
+
+
 @pytest.mark.integration
 def test_delete_component_not_found(client, pipeline, g_user):
     uuid = uuid4()
@@ -569,6 +587,18 @@ def test_patch_subcomponent_clear_fields(route, subcomponent: type[BaseEntity],
     assert resp_data["labels"] == new_data["labels"]
 
 
+@pytest.mark.integration
+@subcomponent_test_params
+def test_patch_subcomponent_publishes_change(route, subcomponent: type[BaseEntity], client, g_user, kafka_producer):
+    response = client.patch(
+        f"/observability/v1/{route}/{subcomponent.id}",
+        headers={"Content-Type": "application/json"},
+        json={"name": "some new name"},
+    )
+    assert response.status_code == HTTPStatus.OK, response.json
+    assert_component_change_published(kafka_producer, subcomponent)
+
+
 @pytest.mark.integration
 @subcomponent_test_params
 def test_patch_subcomponent_not_found(route, subcomponent, client, pipeline, g_user):
@@ -31,6 +31,7 @@ from common.entities import (
     TestOutcome,
 )
 from common.entities.instance import InstanceStartType
+from common.entity_services import InstanceSummaryService
 from common.entity_services.helpers import SortOrder
 from common.entity_services.instance_service import ADDITIONAL_ALERT_DESCRIPTION
 from common.events.enums import EventSources
@@ -305,6 +306,7 @@ def instance_runs_different_statuses(instance_instance_set, runs_different_statu
 def test_list_instances_plain(
     client, journey, instances, instance_alerts, pipeline, pipeline_2, g_user, payload_instance
 ):
+    InstanceSummaryService.rebuild()
     response = client.get(f"/observability/v1/projects/{journey.project.id}/instances")
     assert response.status_code == HTTPStatus.OK, response.json
 
@@ -395,6 +397,7 @@ def test_list_instances_plain_forbidden(client, journey, g_user_2):
 @pytest.mark.integration
 def test_list_instances_with_runs(client, journey, instance, instance_runs, run_alerts, g_user):
     # request with pagination to ensure prefetches are not limited nor limiting the results
+    InstanceSummaryService.rebuild()
     response = client.get(f"/observability/v1/projects/{journey.project.id}/instances?count=2")
     assert response.status_code == HTTPStatus.OK, response.json
 
@@ -414,6 +417,7 @@ def test_list_instances_with_runs(client, journey, instance, instance_runs, run_
 
 @pytest.mark.integration
 def test_list_instances_with_tests(client, journey, instance, instance_runs, test_outcomes, g_user):
+    InstanceSummaryService.rebuild()
     response = client.get(f"/observability/v1/projects/{journey.project.id}/instances")
     assert response.status_code == HTTPStatus.OK, response.json
 
@@ -434,6 +438,7 @@ def test_list_instances_with_multiple_instances(client, journey, instance, insta
     journey2 = Journey.create(name="J2", project=journey.project.id)
     instance2 = Instance.create(journey=journey2.id)
 
+    InstanceSummaryService.rebuild()
     response = client.get(f"/observability/v1/projects/{journey.project.id}/instances")
     assert response.status_code == HTTPStatus.OK, response.json
     assert response.json["total"] == 2
@@ -588,6 +593,7 @@ def test_list_instances_forbidden(client, project):
 def test_get_instance(
     client, g_user, instance, run_alerts, instance_alert, instance_alerts_components, pipeline, pipeline_2
 ):
+    InstanceSummaryService.rebuild()
     response = client.get(f"/observability/v1/instances/{instance.id}")
     assert response.status_code == HTTPStatus.OK, response.json
     resp = response.json
@@ -615,6 +621,7 @@ def test_get_instance_forbidden(client, g_user_2, instance, run_alerts):
 
 @pytest.mark.integration
 def test_get_instance_many_runs(client, g_user, instance, instance_runs, test_outcomes):
+    InstanceSummaryService.rebuild()
     response = client.get(f"/observability/v1/instances/{instance.id}")
     assert response.status_code == HTTPStatus.OK, response.json
     resp = response.json
@@ -635,6 +642,7 @@ def test_get_instance_different_runs_status(client, g_user, instance, instance_r
     TestOutcome.create(
         component=run.pipeline, name="Foo", status=TestStatuses.WARNING.name, run=run, instance_set=run.instance_set_id
     )
+    InstanceSummaryService.rebuild()
     response = client.get(f"/observability/v1/instances/{instance.id}")
     assert response.status_code == HTTPStatus.OK, response.json
     assert response.json == {
@@ -703,6 +711,7 @@ def test_list_company_instances(num_instances, instance_alert_ct, run_alert_ct,
         instance_alert_ct=instance_alert_ct,
         run_alert_ct=run_alert_ct,
     )
+    InstanceSummaryService.rebuild()
     response = client.get("/observability/v1/instances", query_string=MultiDict([("project_id", context.project.id)]))
     assert response.status_code == HTTPStatus.OK, response.json
     data = response.json
@@ -730,6 +739,7 @@ def test_list_company_instances_alerts_summary_payload(client, g_user, organizat
     )
     RunAlert.update({RunAlert.description: "warning text"}).where(RunAlert.level == AlertLevel.WARNING).execute()
     RunAlert.update({RunAlert.description: "error text"}).where(RunAlert.level == AlertLevel.ERROR).execute()
+    InstanceSummaryService.rebuild()
     response = client.get("/observability/v1/instances", query_string=MultiDict([("project_id", context.project.id)]))
     assert response.status_code == HTTPStatus.OK, response.json
     assert len(response.json["entities"]) == len(context.instances)
@@ -890,6 +900,7 @@ def test_get_instance_dag(client, g_user, organization):
     )
     instance = context.instances[0]
 
+    InstanceSummaryService.rebuild()
     response = client.get(f"/observability/v1/instances/{instance.id}/dag")
 
     assert response.status_code == HTTPStatus.OK, response.json
@@ -160,6 +160,12 @@ def test_list_project_events_other_filters(client, g_user, event_entity, project
     assert response.json["total"] == 1
 
 
+@pytest.mark.integration
+def test_list_project_events_invalid_event_id(client, g_user, event_entity, project):
+    response = client.get(f"/observability/v1/projects/{project.id}/events?event_id=not-a-uuid")
+    assert response.status_code == HTTPStatus.BAD_REQUEST, response.json
+
+
 @pytest.mark.integration
 def test_list_project_events_not_found(client, g_user):
     response = client.get(f"/observability/v1/projects/{uuid.uuid4()}/events")
@@ -4,7 +4,9 @@ from uuid import uuid4
 import pytest
 
 from common.entities import Action, AlertLevel, Journey, Pipeline, Rule, RunState
+from common.events.internal import RuleChangeEvent
 from common.events.v1 import TestStatuses
+from common.kafka import TOPIC_RULE_CHANGES
 
 
 @pytest.fixture
@@ -27,6 +29,14 @@ def task_status_warning_pattern():
     }
 
 
+def assert_rule_change_published(kafka_producer, journey_id):
+    kafka_producer.produce.assert_called_once()
+    topic, event = kafka_producer.produce.call_args.args
+    assert topic == TOPIC_RULE_CHANGES
+    assert isinstance(event, RuleChangeEvent)
+    assert event.journey_id == journey_id
+
+
 @pytest.fixture
 def journey1(project):
     return Journey.create(name="J1", description="Test Journey Description 1", project=project)
@@ -724,3 +734,43 @@ def test_admin_user_patch_webhook_rule_ok(client, g_user_2_admin, journey1, pipe
     response = client.patch(f"/observability/v1/rules/{rule.id}", headers={"Content-Type": "application/json"}, json={})
     assert response.status_code == HTTPStatus.OK, response.json
     assert g_user_2_admin.user.primary_company.id != rule.journey.project.organization.company.id
+
+
+@pytest.mark.integration
+def test_post_rule_publishes_change(client, g_user, kafka_producer, journey1, email_action, email_action_args):
+    post_data = {
+        "rule_schema": "simple_v1",
+        "rule_data": {"when": "all", "conditions": [{"task_status": {"matches": "FAILED"}}]},
+        "action": email_action.action_impl,
+        "action_args": email_action_args,
+    }
+    response = client.post(f"/observability/v1/journeys/{journey1.id}/rules", json=post_data)
+    assert response.status_code == HTTPStatus.CREATED, response.json
+    assert_rule_change_published(kafka_producer, journey1.id)
+
+
+@pytest.mark.integration
+def test_patch_rule_publishes_change(client, g_user, kafka_producer, journey1, rules):
+    new_data = {"rule_data": {"when": "any", "conditions": [{"task_status": {"matches": "FAILED"}}]}}
+    response = client.patch(f"/observability/v1/rules/{rules[journey1][0].id}", json=new_data)
+    assert response.status_code == HTTPStatus.OK, response.json
+    assert_rule_change_published(kafka_producer, journey1.id)
+
+
+@pytest.mark.integration
+def test_delete_rule_publishes_change(client, g_user, kafka_producer, journey1, rules):
+    response = client.delete(f"/observability/v1/rules/{rules[journey1][0].id}")
+    assert response.status_code == HTTPStatus.NO_CONTENT, response.json
+    assert_rule_change_published(kafka_producer, journey1.id)
+
+    response = client.delete(f"/observability/v1/rules/{uuid4()}")
+    assert response.status_code == HTTPStatus.NO_CONTENT, response.json
+    kafka_producer.produce.assert_called_once()
+
+
+@pytest.mark.integration
+def test_rule_change_publish_error(client, g_user, kafka_producer, journey1, rules):
+    kafka_producer.produce.side_effect = Exception("Kafka is down")
+    response = client.delete(f"/observability/v1/rules/{rules[journey1][0].id}")
+    assert response.status_code == HTTPStatus.NO_CONTENT, response.json
+    assert Rule.select().where(Rule.id == rules[journey1][0].id).count() == 0
@@ -1,12 +1,16 @@
 import logging
 from logging.config import dictConfig
 from typing import Union
+from uuid import uuid4
 
 from common import argparse
-from common.kafka import TOPIC_IDENTIFIED_EVENTS, KafkaConsumer
+from common.kafka import TOPIC_IDENTIFIED_EVENTS, TOPIC_RULE_CHANGES, KafkaConsumer
 from common.kubernetes import readiness_probe
 from common.logging import JsonFormatter
+from conf import settings
+from rules_engine.action_dispatcher import start_dispatcher, stop_dispatcher
 from rules_engine.engine import RulesEngine
+from rules_engine.rule_changes import RuleChangesListener
 
 
 def init_logging(*, handler: str = "json") -> None:
@@ -46,20 +50,57 @@ kafka_consumer_config: dict[str, Union[str, bool]] = {
     "allow.auto.create.topics": True,
 }
 
+rule_changes_consumer_config: dict[str, Union[str, bool]] = {
+    "auto.offset.reset": "latest",
+    "enable.auto.commit": False,
+    "allow.auto.create.topics": True,
+}
+"""Each rules engine consumes the rule changes in its own consumer group, see `ChangesListener`."""
+
+RULE_CHANGES_SHUTDOWN_TIMEOUT_SECONDS: float = 5
+"""How long to wait for the rule changes listener to disconnect when exiting."""
+
 
 def main() -> None:
     init_logging()
     argparse.add_arg_handler(readiness_probe.get_args_handler(60))
     argparse.handle_args()
     LOG.info("Starting Rules Engine...")
-    event_consumer = KafkaConsumer(kafka_consumer_config, [TOPIC_IDENTIFIED_EVENTS])
-    rules_engine = RulesEngine(event_consumer=event_consumer)
+    consumer_config = kafka_consumer_config.copy()
+    if settings.RULES_ENGINE_WORKERS > 1 or settings.RULES_ENGINE_ACTION_WORKERS > 0:
+        # Offsets are stored once the messages are fully processed, including the actions they dispatched
+        consumer_config["enable.auto.offset.store"] = False
+    event_consumer = KafkaConsumer(consumer_config, [TOPIC_IDENTIFIED_EVENTS])
+    rules_engine = RulesEngine(
+        event_consumer=event_consumer,
+        workers=settings.RULES_ENGINE_WORKERS,
+        worker_queue_size=settings.RULES_ENGINE_WORKER_QUEUE_SIZE,
+    )
+
+    if settings.RULES_ENGINE_ACTION_WORKERS > 0:
+        start_dispatcher(
+            workers=settings.RULES_ENGINE_ACTION_WORKERS,
+            max_per_destination=settings.RULES_ENGINE_ACTION_MAX_PER_DESTINATION,
+            max_attempts=settings.RULES_ENGINE_ACTION_MAX_ATTEMPTS,
+            backoff=settings.RULES_ENGINE_ACTION_RETRY_BACKOFF_SECONDS,
+            max_backoff=settings.RULES_ENGINE_ACTION_RETRY_MAX_BACKOFF_SECONDS,
+            max_queue_size=settings.RULES_ENGINE_ACTION_QUEUE_SIZE,
+        )
+
+    rule_changes_listener = RuleChangesListener(
+        KafkaConsumer(
+            {**rule_changes_consumer_config, "group.id": f"rules-engine-rule-changes-{uuid4()}"}, [TOPIC_RULE_CHANGES]
+        )
+    )
+    rule_changes_listener.start()
 
     try:
         rules_engine.process_events()
     except Exception:
         LOG.exception("Unexpected error occurred, exiting...")
     finally:
+        rule_changes_listener.stop(RULE_CHANGES_SHUTDOWN_TIMEOUT_SECONDS)
+        stop_dispatcher(settings.RULES_ENGINE_ACTION_SHUTDOWN_TIMEOUT_SECONDS)
         event_consumer.disconnect()
 
     LOG.info("Exiting...")
@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+__all__ = [
+    "ActionDispatcher",
+    "DispatcherStats",
+    "dispatch_action",
+    "dispatcher_running",
+    "start_dispatcher",
+    "stop_dispatcher",
+    "track_actions",
+]
+
+import heapq
+import itertools
+import logging
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, is_dataclass
+from time import monotonic
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+from peewee import PeeweeException
+
+from common.actions.action import ActionResult, BaseAction
+from common.entities import DB, Rule
+from conf import init_db
+from rules_engine.typing import EVENT_TYPE
+
+LOG = logging.getLogger(__name__)
+
+DESTINATION_BUSY_DELAY_SECS: float = 0.1
+"""How long to wait before attempting again an action whose destination has no free slot."""
+
+
+class DispatcherStats(NamedTuple):
+    queued: int
+    """Actions waiting to be executed, either for the first time or for a retry."""
+    in_flight: int
+    succeeded: int
+    retried: int
+    dead_lettered: int
+    avg_latency: float
+    """Average time, in seconds, between dispatching an action and its final outcome."""
+    max_latency: float
+
+
+@dataclass(kw_only=True)
+class _ActionJob:
+    action: BaseAction
+    event: EVENT_TYPE
+    rule: Rule
+    journey_id: Optional[UUID]
+    dispatched_at: float
+    attempts: int = 0
+    on_complete: Optional[Callable[[], None]] = None
+
+
+class ActionDispatcher:
+    """
+    Executes rule actions in a pool of threads, so that the rule evaluation is not held up by slow external systems.
+
+    - At most `max_per_destination` actions run concurrently against the same destination (e.g. a webhook host or an
+      SMTP server). Actions over that limit are rescheduled instead of holding up a worker.
+    - Failed actions that the action considers retryable are attempted up to `max_attempts` times, with an exponential
+      backoff starting at `backoff` seconds and capped at `max_backoff` seconds.
+    - Actions that failed for good, including those failing unexpectedly, are logged as dead letters, along with the
+      event and rule needed to replay them.
+    - Dispatching blocks while `max_queue_size` actions are pending, throttling the rule evaluation.
+    - The `on_complete` callback given to `dispatch` is called once the action succeeded or was dead-lettered.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        max_per_destination: int,
+        max_attempts: int,
+        backoff: float,
+        max_backoff: float,
+        max_queue_size: int,
+    ) -> None:
+        self.max_per_destination = max_per_destination
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="action-worker")
+        self._capacity = threading.BoundedSemaphore(max_queue_size)
+        self._condition = threading.Condition()
+        self._schedule: list[tuple[float, int, _ActionJob]] = []
+        self._sequence = itertools.count()
+        self._destinations: defaultdict[str, int] = defaultdict(int)
+        self._stopping = False
+        self._pending = 0
+        self._in_flight = 0
+        self._succeeded = 0
+        self._retried = 0
+        self._dead_lettered = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+        self._scheduler = threading.Thread(target=self._run_scheduler, name="action-scheduler", daemon=True)
+        self._scheduler.start()
+
+    @property
+    def stats(self) -> DispatcherStats:
+        with self._condition:
+            completed = self._succeeded + self._dead_lettered
+            return DispatcherStats(
+                queued=self._pending - self._in_flight,
+                in_flight=self._in_flight,
+                succeeded=self._succeeded,
+                retried=self._retried,
+                dead_lettered=self._dead_lettered,
+                avg_latency=self._total_latency / completed if completed else 0.0,
+                max_latency=self._max_latency,
+            )
+
+    def dispatch(
+        self,
+        action: BaseAction,
+        event: EVENT_TYPE,
+        rule: Rule,
+        journey_id: Optional[UUID],
+        on_complete: Optional[Callable[[], None]] = None,
+    ) -> None:
+        if self._stopping:
+            raise RuntimeError("The action dispatcher is shutting down")
+        if not self._capacity.acquire(blocking=False):
+            LOG.warning("Action queue is full, waiting for pending actions to complete")
+            self._capacity.acquire()
+        with self._condition:
+            self._pending += 1
+        job = _ActionJob(
+            action=action,
+            event=event,
+            rule=rule,
+            journey_id=journey_id,
+            dispatched_at=monotonic(),
+            on_complete=on_complete,
+        )
+        self._schedule_job(job, 0)
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Stop accepting actions and wait for the pending ones, including their retries, to complete."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._scheduler.join(timeout)
+        if self._scheduler.is_alive():
+            # The offsets of their events were not stored, so the events are evaluated again after a restart
+            LOG.error("%s action(s) were still pending when the dispatcher was shut down", self._pending)
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            self._executor.shutdown(wait=True)
+        LOG.info("Action dispatcher stopped: %s", self.stats._asdict())
+
+    def _schedule_job(self, job: _ActionJob, delay: float) -> None:
+        with self._condition:
+            heapq.heappush(self._schedule, (monotonic() + delay, next(self._sequence), job))
+            self._condition.notify_all()
+
+    def _run_scheduler(self) -> None:
+        with self._condition:
+            while not (self._stopping and self._pending == 0):
+                if not self._schedule:
+                    self._condition.wait()
+                    continue
+                due, _, job = self._schedule[0]
+                if (delay := due - monotonic()) > 0:
+                    self._condition.wait(delay)
+                    continue
+                heapq.heappop(self._schedule)
+                self._executor.submit(self._execute, job)
+
+    def _acquire_destination(self, destination: str) -> bool:
+        with self._condition:
+            if self._destinations[destination] >= self.max_per_destination:
+                return False
+            self._destinations[destination] += 1
+            self._in_flight += 1
+            return True
+
+    def _release_destination(self, destination: str) -> None:
+        with self._condition:
+            self._destinations[destination] -= 1
+            self._in_flight -= 1
+
+    def _execute(self, job: _ActionJob) -> None:
+        destination: Optional[str] = None
+        try:
+            destination = job.action.destination
+            if not self._acquire_destination(destination):
+                self._schedule_job(job, DESTINATION_BUSY_DELAY_SECS)
+                return
+            job.attempts += 1
+            try:
+                init_db()
+                result = job.action.run(job.event, job.rule, job.journey_id)
+            except Exception as e:
+                LOG.exception("Unexpected error executing action %s", job.action.__class__.__name__)
+                result = ActionResult(False, None, e)
+            finally:
+                try:
+                    DB.close()
+                except (PeeweeException, Exception):
+                    pass  # It probably wasn't open
+                self._release_destination(destination)
+            retry = not result.result and job.attempts < self.max_attempts and job.action.is_retryable(result)
+        except Exception as e:
+            # Whatever fails here, the job must complete so that its pending and capacity slots are released
+            LOG.exception("Unexpected error dispatching action %s", job.action.__class__.__name__)
+            result = ActionResult(False, None, e)
+            retry = False
+
+        if result.result:
+            self._complete(job, succeeded=True)
+        elif retry:
+            delay = min(self.backoff * 2 ** (job.attempts - 1), self.max_backoff)
+            LOG.warning(
+                "Action %s to %s failed on attempt %s, retrying in %.1f seconds",
+                job.action.__class__.__name__,
+                destination,
+                job.attempts,
+                delay,
+            )
+            with self._condition:
+                self._retried += 1
+            self._schedule_job(job, delay)
+        else:
+            LOG.error(
+                "Action %s to %s failed after %s attempt(s), giving up",
+                job.action.__class__.__name__,
+                destination,
+                job.attempts,
+                extra={
+                    "dead_letter": {
+                        "action": job.action.__class__.__name__,
+                        "destination": destination,
+                        "attempts": job.attempts,
+                        "error": repr(result.exception),
+                        "rule_id": str(job.rule.id) if job.rule.id else None,
+                        "journey_id": str(job.journey_id) if job.journey_id else None,
+                        "event": asdict(job.event) if is_dataclass(job.event) else repr(job.event),
+                    }
+                },
+            )
+            self._complete(job, succeeded=False)
+
+    def _complete(self, job: _ActionJob, *, succeeded: bool) -> None:
+        latency = monotonic() - job.dispatched_at
+        with self._condition:
+            if succeeded:
+                self._succeeded += 1
+            else:
+                self._dead_lettered += 1
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
+            self._pending -= 1
+            queue_depth = self._pending - self._in_flight
+            self._condition.notify_all()
+        self._capacity.release()
+        LOG.info(
+            "Action %s completed in %.2f seconds",
+            job.action.__class__.__name__,
+            latency,
+            extra={"action_latency": latency, "action_queue_depth": queue_depth},
+        )
+        if job.on_complete is not None:
+            try:
+                job.on_complete()
+            except Exception:
+                LOG.exception("Error completing action %s", job.action.__class__.__name__)
+
+
+class _ActionGroup:
+    """Calls `on_done` once it is closed and all the actions dispatched within it completed."""
+
+    def __init__(self, on_done: Callable[[], None]) -> None:
+        self.on_done = on_done
+        self._pending = 1  # Held by the group itself until it is closed
+        self._lock = threading.Lock()
+
+    def add(self) -> None:
+        with self._lock:
+            self._pending += 1
+
+    def done(self) -> None:
+        with self._lock:
+            self._pending -= 1
+            finished = self._pending == 0
+        if finished:
+            self.on_done()
+
+
+_CURRENT_GROUP = threading.local()
+
+
+_DISPATCHER: Optional[ActionDispatcher] = None
+
+
+def start_dispatcher(
+    *,
+    workers: int,
+    max_per_destination: int,
+    max_attempts: int,
+    backoff: float,
+    max_backoff: float,
+    max_queue_size: int,
+) -> ActionDispatcher:
+    """Start the dispatcher used by `dispatch_action`. See `ActionDispatcher` for the arguments."""
+    global _DISPATCHER
+    if _DISPATCHER is not None:
+        raise RuntimeError("The action dispatcher is already running")
+    _DISPATCHER = ActionDispatcher(
+        workers=workers,
+        max_per_destination=max_per_destination,
+        max_attempts=max_attempts,
+        backoff=backoff,
+        max_backoff=max_backoff,
+        max_queue_size=max_queue_size,
+    )
+    return _DISPATCHER
+
+
+def stop_dispatcher(timeout: Optional[float] = None) -> None:
+    global _DISPATCHER
+    if _DISPATCHER is not None:
+        _DISPATCHER.shutdown(timeout)
+        _DISPATCHER = None
+
+
+def dispatcher_running() -> bool:
+    return _DISPATCHER is not None
+
+
+@contextmanager
+def track_actions(on_done: Callable[[], None]) -> Iterator[None]:
+    """
+    Call `on_done` once the block succeeded and all the actions it dispatched from the current thread completed, which
+    may happen later from an action worker. `on_done` is never called when the block raises.
+    """
+    group = _ActionGroup(on_done)
+    _CURRENT_GROUP.group = group
+    try:
+        yield
+    finally:
+        _CURRENT_GROUP.group = None
+    group.done()
+
+
+def dispatch_action(action: BaseAction, event: EVENT_TYPE, rule: Rule, journey_id: Optional[UUID]) -> None:
+    """Hand the action over to the running dispatcher, or execute it right away when no dispatcher was started."""
+    if _DISPATCHER is None:
+        action.execute(event, rule, journey_id)
+        return
+    if (group := getattr(_CURRENT_GROUP, "group", None)) is None:
+        _DISPATCHER.dispatch(action, event, rule, journey_id)
+        return
+    group.add()
+    try:
+        _DISPATCHER.dispatch(action, event, rule, journey_id, on_complete=group.done)
+    except Exception:
+        group.done()
+        raise
@@ -2,65 +2,125 @@ import logging
 from dataclasses import asdict
 from time import time
 
+from confluent_kafka import TopicPartition
 from peewee import InterfaceError, OperationalError, PeeweeException
 
 from common.entities import DB
 from common.events.internal import InstanceAlert, RunAlert
 from common.events.v1 import Event
-from common.kafka import ConsumerError, KafkaConsumer, MessageError
+from common.kafka import ConsumerCommitError, ConsumerError, KafkaConsumer, KafkaMessage, MessageError
+from common.kafka.settings import CONSUMER_POLL_PERIOD_SECS
 from common.kubernetes import readiness_check_wrapper
 from conf import init_db
 
+from .action_dispatcher import dispatcher_running, track_actions
 from .lib import process_instance_alert, process_run_alert, process_v1_event, process_project_alert
 from .typing import PROJECT_EVENT
+from .worker_pool import PAUSED_POLL_TIMEOUT_SECS, PartitionedWorkerPool
 
 LOG = logging.getLogger(__name__)
 
 
 class RulesEngine:
-    def __init__(self, *, event_consumer: KafkaConsumer) -> None:
+    def __init__(self, *, event_consumer: KafkaConsumer, workers: int = 1, worker_queue_size: int = 100) -> None:
         self.event_consumer = event_consumer
+        self.workers = workers
+        self.worker_queue_size = worker_queue_size
         self.last_refresh = time()
 
+    def evaluate_message(self, message: KafkaMessage) -> bool:
+        """
+        Evaluate the rules for the message's event. Returns False when the evaluation failed and the message should be
+        skipped. Database connection errors are raised so that the message is consumed again.
+        """
+        try:
+            init_db()
+            event = message.payload
+            match event:
+                case InstanceAlert():
+                    process_instance_alert(event)
+                case RunAlert():
+                    process_run_alert(event)
+                case Event():
+                    process_v1_event(event)
+                case PROJECT_EVENT():
+                    process_project_alert(event)
+                case _:
+                    LOG.info("Message payload %s is not a type supported by the rules engine.", type(event))
+        except (InterfaceError, OperationalError) as e:
+            # OperationalError has been seen during migrations such as adding table indexes. Catching
+            # and reraising the exception to re-consume the event. InterfaceError is related to the
+            # connection and should benefit from re-consuming too.
+            LOG.error("Database error occured: %s", e)
+            raise
+        except Exception:
+            LOG.exception("Error evaluating event", extra={"kafka_message": asdict(message)})
+            return False
+        finally:
+            try:
+                DB.close()
+            # for how these exceptions were inferred; see peewee.py:3185
+            except InterfaceError:
+                LOG.warning("Attempted to close an uninitialized (or deferred) database connection.")
+            except OperationalError:
+                LOG.warning("Attempted to close a database connection while a transaction is open.")
+            except (PeeweeException, Exception):
+                LOG.exception("Unknown exception occurred while attempting to close the database.")
+        return True
+
+    def _store_offset(self, offset: TopicPartition) -> None:
+        try:
+            self.event_consumer.store_offsets([offset])
+        except ConsumerCommitError:
+            # Most likely the partition was revoked; its messages will be consumed again by the new assignee
+            LOG.warning("Unable to store offset %s for partition %s:%s", offset.offset, offset.topic, offset.partition)
+
+    def _pause(self, partition: TopicPartition) -> None:
+        self.event_consumer.pause([partition])
+
+    def _resume(self, partition: TopicPartition) -> None:
+        try:
+            self.event_consumer.resume([partition])
+        except ConsumerError:
+            # Most likely the partition was revoked; it is not paused when assigned again
+            LOG.warning("Unable to resume partition %s:%s", partition.topic, partition.partition)
+
+    def _process_events_concurrently(self) -> None:
+        """
+        Dispatch the messages to a pool of workers, keyed by project, so that the events of different projects are
+        evaluated concurrently. Offsets are stored for the automatic commit as they are fully processed, including the
+        actions they dispatched, which requires the consumer to be configured with `enable.auto.offset.store` disabled.
+
+        The partitions of busy workers are paused rather than waiting for them, so that the consumer keeps polling
+        within `max.poll.interval.ms` however long the evaluations take.
+        """
+        with PartitionedWorkerPool(
+            self.evaluate_message,
+            self._store_offset,
+            workers=self.workers,
+            queue_size=self.worker_queue_size,
+            on_pause=self._pause,
+            on_resume=self._resume,
+            completion_scope=track_actions,
+        ) as pool:
+            while not self.event_consumer.killer.should_exit:
+                pool.resume_ready()
+                timeout = PAUSED_POLL_TIMEOUT_SECS if pool.paused else CONSUMER_POLL_PERIOD_SECS
+                if message := self.event_consumer.poll(timeout):
+                    pool.submit(message)
+        pool.raise_for_error()
+
     def process_events(self) -> None:
         with readiness_check_wrapper():
             self.event_consumer.connect()
             init_db()
         try:
-            for message in self.event_consumer:
-                try:
-                    init_db()
-                    event = message.payload
-                    match event:
-                        case InstanceAlert():
-                            process_instance_alert(event)
-                        case RunAlert():
-                            process_run_alert(event)
-                        case Event():
-                            process_v1_event(event)
-                        case PROJECT_EVENT():
-                            process_project_alert(event)
-                        case _:
-                            LOG.info("Message payload %s is not a type supported by the rules engine.", type(event))
-                except (InterfaceError, OperationalError) as e:
-                    # OperationalError has been seen during migrations such as adding table indexes. Catching
-                    # and reraising the exception to re-consume the event. InterfaceError is related to the
-                    # connection and should benefit from re-consuming too.
-                    LOG.error("Database error occured: %s", e)
-                    raise
-                except Exception:
-                    LOG.exception("Error evaluating event", extra={"kafka_message": asdict(message)})
-                    self.event_consumer.commit()
-                    continue
-                finally:
-                    try:
-                        DB.close()
-                    # for how these exceptions were inferred; see peewee.py:3185
-                    except InterfaceError:
-                        LOG.warning("Attempted to close an uninitialized (or deferred) database connection.")
-                    except OperationalError:
-                        LOG.warning("Attempted to close a database connection while a transaction is open.")
-                    except (PeeweeException, Exception):
-                        LOG.exception("Unknown exception occurred while attempting to close the database.")
+            # The actions run by the dispatcher complete after their event is evaluated, and its offset is stored then
+            if self.workers > 1 or dispatcher_running():
+                self._process_events_concurrently()
+            else:
+                for message in self.event_consumer:
+                    if not self.evaluate_message(message):
+                        self.event_consumer.commit()
         except (ConsumerError, MessageError):
             LOG.exception("Error evaluating rules, stopping...")
@@ -1,34 +1,104 @@
 from __future__ import annotations
 
-__all__ = ["get_rules", "JourneyRule"]
+__all__ = ["get_rules", "JourneyRule", "JourneyRuleIndex", "JourneyRulesCache", "RULES_CACHE"]
 
 import logging
-import time
-from functools import lru_cache
-from typing import Any, Optional
-from collections.abc import Callable
+import threading
+from collections import OrderedDict, defaultdict
+from time import monotonic
+from typing import Any, Optional, cast
+from collections.abc import Callable, Iterable
 from uuid import UUID
 
+from peewee import fn
+
 from common.actions.action import ActionResult
 from common.actions.action_factory import action_factory
 from common.entities import Rule as RuleEntity
+from common.entities import RunState
 from common.entity_services import JourneyService
-from common.events.internal import RunAlert
-from common.events.v1 import Event
+from common.events.internal import InstanceAlert, RunAlert
+from common.events.v1 import Event, MessageLogEvent, MetricLogEvent, RunStatusEvent, TestOutcomesEvent
 from common.predicate_engine.compilers import compile_schema
-from common.predicate_engine.query import R
+from common.predicate_engine.query import R, compile_rule
 from common.predicate_engine.schemas.simple_v1 import RuleDataSchema
 from conf import settings
+from rules_engine.action_dispatcher import dispatch_action
 from rules_engine.typing import EVENT_TYPE
 from rules_engine.rule_data import RuleData
 
 LOG = logging.getLogger(__name__)
 
+CONDITION_EVENT_TYPES: dict[str, tuple[type, ...]] = {
+    "message_log": (MessageLogEvent,),
+    "metric_log": (MetricLogEvent,),
+    "task_status": (RunStatusEvent,),
+    "test_status": (TestOutcomesEvent,),
+}
+"""The event classes that the simple_v1 conditions can match, when they do not depend on the condition values."""
+
+RUN_STATUS_RUN_STATES = frozenset(
+    (RunState.RUNNING, RunState.COMPLETED, RunState.COMPLETED_WITH_WARNINGS, RunState.FAILED)
+)
+"""The run states matched against run status events; the others are matched against run alerts."""
+
+
+def get_event_types(rule_schema: str, rule_data: dict) -> Optional[tuple[type, ...]]:
+    """
+    Return the event classes that a rule can match, given its schema and parsed rule data, or None when the rule may
+    match any event.
+    """
+    if rule_schema != "simple_v1":
+        return None
+    event_types: list[type] = []
+    for condition in rule_data.get("conditions") or ():
+        for name, value in condition.items():
+            if name in CONDITION_EVENT_TYPES:
+                event_types.extend(CONDITION_EVENT_TYPES[name])
+            elif name == "run_state":
+                event_types.append(RunStatusEvent if value.get("matches") in RUN_STATUS_RUN_STATES else RunAlert)
+            elif name == "instance_alert":
+                # Run alerts have levels too, so only the alert types tell them apart
+                event_types.extend((InstanceAlert,) if value.get("type_matches") else (InstanceAlert, RunAlert))
+            else:
+                return None
+    return tuple(dict.fromkeys(event_types)) or None
+
+
+def get_runs_window(rule_schema: str, rule_data: dict) -> tuple[int, bool]:
+    """
+    Return how many of the most recent runs a rule reads from the database, given its schema and parsed rule data,
+    and whether it reads their alerts.
+    """
+    if rule_schema != "simple_v1":
+        return 0, False
+    limit, alerts = 0, False
+    for condition in rule_data.get("conditions") or ():
+        if (value := condition.get("run_state")) is None:
+            continue
+        if value.get("trigger_successive") is False:
+            count = value.get("count", 1) + 1
+        elif (count := value.get("count", 1)) <= 1:
+            continue
+        limit = max(limit, count)
+        alerts = alerts or value.get("matches") not in RUN_STATUS_RUN_STATES
+    return limit, alerts
+
 
 class JourneyRule:
     """A rule definition. Takes an R object for rules evaluation and a list of callables to trigger for matches."""
 
-    __slots__ = ("journey_id", "r_obj", "rule_entity", "component_id", "triggers")
+    __slots__ = (
+        "journey_id",
+        "r_obj",
+        "predicate",
+        "rule_entity",
+        "component_id",
+        "event_types",
+        "runs_limit",
+        "prefetch_run_alerts",
+        "triggers",
+    )
 
     def __init__(
         self,
@@ -37,12 +107,22 @@ class JourneyRule:
         *triggers: Callable,
         journey_id: Optional[UUID] = None,
         component_id: Optional[UUID] = None,
+        event_types: Optional[tuple[type, ...]] = None,
+        runs_limit: int = 0,
+        prefetch_run_alerts: bool = False,
     ) -> None:
         self.r_obj: R = r_obj
+        self.predicate: Callable[[object], bool] = compile_rule(r_obj)
         self.rule_entity = rule_entity
         self.triggers: tuple[Callable[[EVENT_TYPE, Optional[RuleEntity], Optional[UUID]], ActionResult], ...] = triggers
         self.journey_id: Optional[UUID] = journey_id
         self.component_id: Optional[UUID] = component_id
+        self.event_types: Optional[tuple[type, ...]] = event_types
+        """The event classes that the rule can match; None when it may match any event."""
+        self.runs_limit: int = runs_limit
+        """How many of the most recent runs the rule reads from the database."""
+        self.prefetch_run_alerts: bool = prefetch_run_alerts
+        """Whether the rule reads the alerts of those runs."""
 
     @staticmethod
     def _get_component_id(event: EVENT_TYPE) -> Optional[UUID]:
@@ -55,7 +135,7 @@ class JourneyRule:
             case _:
                 return None
 
-    def evaluate(self, event: EVENT_TYPE) -> None:
+    def evaluate(self, event: EVENT_TYPE, rule_data: Optional[RuleData] = None) -> None:
         LOG.info("Evaluating event: %s", event)
         if (component_id := self._get_component_id(event)) is not None:
             if self.component_id is not None and component_id != self.component_id:
@@ -66,7 +146,9 @@ class JourneyRule:
                 )
                 return None
 
-        if self.r_obj.matches(RuleData(event)):
+        if rule_data is None:
+            rule_data = RuleData(event, runs_limit=self.runs_limit, prefetch_run_alerts=self.prefetch_run_alerts)
+        if self.predicate(rule_data):
             LOG.info("RESULT: True: `%s` matches event: `%s`", self.r_obj, event)
             for trigger in self.triggers:
                 LOG.debug("Running trigger `%s` for event `%s`", trigger, event)
@@ -81,43 +163,221 @@ class JourneyRule:
         return f"{self.__module__}.{self.__class__.__name__}: {self.r_obj}"
 
 
+class JourneyRuleIndex(list[JourneyRule]):
+    """
+    The rules of a set of journeys, indexed by the event classes they can match and by their component.
+
+    `for_event` returns, in their original order, only the rules that may match an event: the ones for the event's
+    class (or any of its base classes) or for any event, and for the event's component or for any component.
+    """
+
+    def __init__(self, rules: Iterable[JourneyRule] = ()) -> None:
+        super().__init__(rules)
+        self._index: defaultdict[Optional[type], defaultdict[Optional[UUID], list[tuple[int, JourneyRule]]]] = (
+            defaultdict(lambda: defaultdict(list))
+        )
+        for position, rule in enumerate(self):
+            for event_type in rule.event_types or (None,):
+                self._index[event_type][rule.component_id].append((position, rule))
+
+    def for_event(self, event: EVENT_TYPE) -> list[JourneyRule]:
+        component_id = JourneyRule._get_component_id(event)
+        candidates: dict[int, JourneyRule] = {}
+        for event_type in (*type(event).__mro__, None):
+            if (by_component := self._index.get(event_type)) is None:
+                continue
+            if component_id is None:
+                # Rules bound to a component apply to the events without one
+                for rules in by_component.values():
+                    candidates.update(rules)
+            else:
+                candidates.update(by_component.get(component_id, ()))
+                candidates.update(by_component.get(None, ()))
+        return [candidates[position] for position in sorted(candidates)]
+
+
 def _execute_action(event: EVENT_TYPE, rule_entity: RuleEntity, journey_id: Optional[UUID]) -> Any:
     action_entity = JourneyService.get_action_by_implementation(rule_entity.journey_id, rule_entity.action)
     action = action_factory(rule_entity.action, rule_entity.action_args, action_entity)
-    action.execute(event, rule_entity, journey_id)
+    dispatch_action(action, event, rule_entity, journey_id)
+
+
+RulesStamp = tuple[int, Any]
+"""The number of rules of a journey and their latest update time, which change whenever the rules change."""
 
+EMPTY_STAMP: RulesStamp = (0, None)
 
-@lru_cache(maxsize=50)
-def _get_rules(journey_ids: frozenset[UUID], _ttl: int) -> list[JourneyRule]:
-    # Makes linter not implode
-    del _ttl
 
-    rules: list[JourneyRule] = []
+def _get_rules_stamps(journey_ids: Iterable[UUID]) -> dict[UUID, RulesStamp]:
+    query = (
+        RuleEntity.select(RuleEntity.journey, fn.COUNT(RuleEntity.id), fn.MAX(RuleEntity.updated_on))
+        .where(RuleEntity.journey.in_(list(journey_ids)))
+        .group_by(RuleEntity.journey)
+        .tuples()
+    )
+    return {journey_id: (count, updated_on) for journey_id, count, updated_on in query}
 
-    rule_entities = RuleEntity.select(RuleEntity).where(RuleEntity.journey.in_(journey_ids))
+
+def _load_rules(journey_ids: Iterable[UUID]) -> defaultdict[UUID, list[JourneyRule]]:
+    rules: defaultdict[UUID, list[JourneyRule]] = defaultdict(list)
+
+    rule_entities = RuleEntity.select(RuleEntity).where(RuleEntity.journey.in_(list(journey_ids)))
     for rule_entity in rule_entities:
         try:
             parsed_rule_data = RuleDataSchema().load(rule_entity.rule_data)
             rule_obj = compile_schema(rule_entity.rule_schema, parsed_rule_data)
+            runs_limit, prefetch_run_alerts = get_runs_window(rule_entity.rule_schema, parsed_rule_data)
             r = JourneyRule(
                 rule_obj,
                 rule_entity,
                 _execute_action,
                 journey_id=rule_entity.journey_id,
                 component_id=rule_entity.component_id,
+                event_types=get_event_types(rule_entity.rule_schema, parsed_rule_data),
+                runs_limit=runs_limit,
+                prefetch_run_alerts=prefetch_run_alerts,
             )
-            rules.append(r)
+            rules[rule_entity.journey_id].append(r)
         except Exception:
             # TODO: Don't catch all exceptions since the users won't have great visibility over what's wrong
             LOG.exception("Exception setting up rule evaluator for rule %s", rule_entity.id)
     return rules
 
 
-def get_rules(*journey_ids: UUID) -> list[JourneyRule]:
+class _JourneyRules:
+    __slots__ = ("rules", "stamp", "checked_at")
+
+    def __init__(self, rules: list[JourneyRule], stamp: RulesStamp, checked_at: float) -> None:
+        self.rules = rules
+        self.stamp = stamp
+        self.checked_at = checked_at
+
+    @property
+    def weight(self) -> int:
+        return max(len(self.rules), 1)
+
+
+class JourneyRulesCache:
+    """
+    The compiled rules, cached per journey.
+
+    The rules of a journey are versioned by their number and latest update time. Once `refresh_interval` seconds have
+    passed since they were last checked, the version is compared with the database's and the rules are only loaded
+    and compiled again when it changed. Each journey is checked on its own schedule, so the entries do not all expire
+    at once. Changes are usually applied sooner than that: the rules engines are notified of them and `invalidate`
+    the journeys that changed.
+
+    The cache holds at most `max_rules` rules, evicting the least recently used journeys first. The index of the rules
+    of a set of journeys is kept until any of these journeys changes.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_rules: Optional[int] = None,
+        refresh_interval: Optional[float] = None,
+        max_indexes: int = 1000,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._max_rules = max_rules
+        self._refresh_interval = refresh_interval
+        self.max_indexes = max_indexes
+        self._clock = clock
+        self._entries: OrderedDict[UUID, _JourneyRules] = OrderedDict()
+        self._indexes: OrderedDict[frozenset[UUID], tuple[tuple[_JourneyRules, ...], JourneyRuleIndex]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_rules(self) -> int:
+        return self._max_rules if self._max_rules is not None else int(settings.RULES_ENGINE_RULE_CACHE_MAX_RULES)
+
+    @property
+    def refresh_interval(self) -> float:
+        return self._refresh_interval if self._refresh_interval is not None else float(settings.RULE_REFRESH_SECONDS)
+
+    @property
+    def size(self) -> int:
+        """The number of rules cached."""
+        return self._size
+
+    def get(self, journey_ids: Iterable[UUID]) -> JourneyRuleIndex:
+        journey_ids = frozenset(journey_ids)
+        now = self._clock()
+        with self._lock:
+            entries = {journey_id: self._entries.get(journey_id) for journey_id in journey_ids}
+            for journey_id, entry in entries.items():
+                if entry is not None:
+                    self._entries.move_to_end(journey_id)
+
+        stale: dict[UUID, RulesStamp] = {}
+        if expired := [j for j, e in entries.items() if e is not None and now - e.checked_at >= self.refresh_interval]:
+            stamps = _get_rules_stamps(expired)
+            for journey_id in expired:
+                entry = cast(_JourneyRules, entries[journey_id])
+                if (stamp := stamps.get(journey_id, EMPTY_STAMP)) == entry.stamp:
+                    entry.checked_at = now
+                else:
+                    stale[journey_id] = stamp
+        if missing := [journey_id for journey_id, entry in entries.items() if entry is None]:
+            stale.update({journey_id: EMPTY_STAMP for journey_id in missing})
+            # Read the versions before the rules, so that a change made in between is caught by the next check
+            stale.update(_get_rules_stamps(missing))
+        if stale:
+            LOG.info("Loading the rules of %s journey(s)", len(stale))
+            rules = _load_rules(stale)
+            loaded = {journey_id: _JourneyRules(rules[journey_id], stamp, now) for journey_id, stamp in stale.items()}
+            with self._lock:
+                for journey_id, entry in loaded.items():
+                    self._store(journey_id, entry)
+            entries.update(loaded)
+
+        journey_entries = tuple(cast(_JourneyRules, entries[journey_id]) for journey_id in sorted(journey_ids))
+        with self._lock:
+            cached = self._indexes.get(journey_ids)
+            if cached is not None and all(a is b for a, b in zip(cached[0], journey_entries, strict=True)):
+                self._indexes.move_to_end(journey_ids)
+                return cached[1]
+        index = JourneyRuleIndex(rule for entry in journey_entries for rule in entry.rules)
+        with self._lock:
+            self._indexes[journey_ids] = (journey_entries, index)
+            self._indexes.move_to_end(journey_ids)
+            while len(self._indexes) > self.max_indexes:
+                self._indexes.popitem(last=False)
+        return index
+
+    def _store(self, journey_id: UUID, entry: _JourneyRules) -> None:
+        if (previous := self._entries.pop(journey_id, None)) is not None:
+            self._size -= previous.weight
+        self._entries[journey_id] = entry
+        self._size += entry.weight
+        while self._size > self.max_rules and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= evicted.weight
+
+    def invalidate(self, *journey_ids: UUID) -> None:
+        """Drop the rules of the given journeys, to be loaded again when next needed."""
+        with self._lock:
+            for journey_id in journey_ids:
+                if (entry := self._entries.pop(journey_id, None)) is not None:
+                    self._size -= entry.weight
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._indexes.clear()
+            self._size = 0
+
+
+RULES_CACHE = JourneyRulesCache()
+"""The compiled rules of the journeys, shared by the rules engine workers."""
+
+
+def get_rules(*journey_ids: UUID) -> JourneyRuleIndex:
     """
-    Return a list of Rule objects. Uses _get_rules for LRU cache.
+    Return a list of Rule objects. Uses RULES_CACHE to cache the compiled rules of each journey.
 
-    This finds and returns all rules that exist for a given set of Journeys
+    This finds and returns all rules that exist for a given set of Journeys, indexed to select the rules that may match
+    a given event.
     """
-    _ttl = round(time.time() / settings.RULE_REFRESH_SECONDS)
-    return _get_rules(frozenset(journey_ids), _ttl)
+    return RULES_CACHE.get(journey_ids)
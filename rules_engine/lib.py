@@ -6,20 +6,32 @@ from common.events.internal import InstanceAlert, RunAlert
 from common.events.v1 import Event
 from rules_engine.project_rules import get_project_rules
 from rules_engine.typing import EVENT_TYPE, Rule, PROJECT_EVENT
-from rules_engine.journey_rules import get_rules
+from rules_engine.journey_rules import JourneyRule, get_rules
+from rules_engine.rule_data import RuleData
 
 LOG = logging.getLogger(__name__)
 
 
 def evaluate_rules(event: EVENT_TYPE, *rules: Rule) -> None:
-    """Evaluate all the rules for a given event."""
+    """
+    Evaluate all the rules for a given event.
+
+    The rules share the data they are evaluated against, so that the runs read from the database are fetched once for
+    the event, as many as the most demanding rule needs.
+    """
     total = len(rules)
     LOG.info("Found %s rule(s) to evaluate", total)
     padding = len(str(total))  # Used in progress indicator
 
+    journey_rules = [rule for rule in rules if isinstance(rule, JourneyRule)]
+    rule_data = RuleData(
+        event,
+        runs_limit=max((rule.runs_limit for rule in journey_rules), default=0),
+        prefetch_run_alerts=any(rule.prefetch_run_alerts for rule in journey_rules),
+    )
     for idx, rule in enumerate(rules, start=1):
         LOG.info("[#m<%s/%s>] Evaluating: %s", str(idx).zfill(padding), total, rule)
-        rule.evaluate(event)
+        rule.evaluate(event, rule_data)
 
 
 def process_v1_event(event: Event) -> None:
@@ -29,7 +41,7 @@ def process_v1_event(event: Event) -> None:
         return
 
     rules = get_rules(*(r.journey for r in event.instances))
-    evaluate_rules(event, *rules)
+    evaluate_rules(event, *rules.for_event(event))
 
 
 def process_instance_alert(event: InstanceAlert) -> None:
@@ -39,7 +51,7 @@ def process_instance_alert(event: InstanceAlert) -> None:
         LOG.warning("InstanceAlert has no `journey_id`; no rules to evaluate.")
     else:
         rules = get_rules(journey_id)
-        evaluate_rules(event, *rules)
+        evaluate_rules(event, *rules.for_event(event))
 
 
 def process_run_alert(event: RunAlert) -> None:
@@ -56,7 +68,7 @@ def process_run_alert(event: RunAlert) -> None:
             .distinct()
         )
         rules = get_rules(*[j.id for j in journeys])
-        evaluate_rules(event, *rules)
+        evaluate_rules(event, *rules.for_event(event))
 
 
 def process_project_alert(event: PROJECT_EVENT) -> None:
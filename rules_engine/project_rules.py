@@ -1,7 +1,7 @@
 __all__ = ("ProjectRule", "get_project_rules")
 
 import logging
-from typing import cast
+from typing import Optional, cast
 from collections.abc import Callable
 from uuid import UUID
 
@@ -9,6 +9,8 @@ from peewee import fn
 
 from common.entities import Project, Rule as RuleEntity
 from common.entity_services import ProjectService
+from rules_engine.action_dispatcher import dispatch_action
+from rules_engine.rule_data import RuleData
 from rules_engine.typing import PROJECT_EVENT, EVENT_TYPE
 
 LOG = logging.getLogger(__name__)
@@ -18,7 +20,7 @@ class ProjectRule:
     def __init__(self, callable: Callable[[PROJECT_EVENT], None]):
         self.callable = callable
 
-    def evaluate(self, event: EVENT_TYPE) -> None:
+    def evaluate(self, event: EVENT_TYPE, rule_data: Optional[RuleData] = None) -> None:
         LOG.info("Result: TRUE")
         self.callable(cast(PROJECT_EVENT, event))
 
@@ -45,7 +47,7 @@ def get_project_rules(project_id: UUID) -> list[ProjectRule]:
         if actions:
             for action in actions:
                 LOG.info("Executing action %s from project '%s'", action, project.id)
-                action.execute(event, RuleEntity(), None)
+                dispatch_action(action, event, RuleEntity(), None)
         else:
             LOG.info("No actions found for project '%s', skipping", project.id)
 
@@ -0,0 +1,31 @@
+__all__ = ["RuleChangesListener"]
+
+import logging
+
+from common.events.internal import RuleChangeEvent
+from common.kafka import ChangesListener, KafkaConsumer, KafkaMessage
+from rules_engine.journey_rules import RULES_CACHE, JourneyRulesCache
+
+LOG = logging.getLogger(__name__)
+
+
+class RuleChangesListener(ChangesListener):
+    """
+    Drops the cached rules of the journeys whose rules changed, as they are published by the API.
+
+    Missed changes are still applied once the journey's rules are checked again, see `JourneyRulesCache`.
+    """
+
+    thread_name = "rule-changes-listener"
+
+    def __init__(self, consumer: KafkaConsumer, cache: JourneyRulesCache = RULES_CACHE) -> None:
+        super().__init__(consumer)
+        self.cache = cache
+
+    def handle(self, message: KafkaMessage) -> None:
+        match message.payload:
+            case RuleChangeEvent(journey_id=journey_id):
+                LOG.info("Rules of journey '%s' changed", journey_id)
+                self.cache.invalidate(journey_id)
+            case payload:
+                LOG.warning("Ignoring unexpected rule change payload of type %s", type(payload))
@@ -1,25 +1,95 @@
-__all__ = ["RuleData"]
+__all__ = ["RuleData", "RecentRuns"]
 
-from typing import Optional
+from collections.abc import Iterator
+from typing import Any, Optional
 from uuid import UUID
 
-from peewee import SelectQuery, fn
+from peewee import PREFETCH_TYPE, SelectQuery, fn
 
+from common.decorators import cached_property
 from common.entities import Run
+from common.entities import RunAlert as RunAlertEntity
 from common.events.internal import RunAlert
 from common.events.v1 import Event
 from rules_engine.typing import EVENT_TYPE
 
 
+class _RunsCache:
+    """The runs fetched by a query, along with how many were asked for and whether their alerts were prefetched."""
+
+    def __init__(self, query: SelectQuery, *, limit_hint: int, prefetch_alerts: bool) -> None:
+        self.query = query
+        self.limit_hint = limit_hint
+        self.prefetch_alerts = prefetch_alerts
+        self.runs: Optional[list[Run]] = None
+        self.limit: Optional[int] = None
+        self.with_alerts = False
+
+    def _covers(self, count: Optional[int], alerts: bool) -> bool:
+        if self.runs is None or (alerts and not self.with_alerts):
+            return False
+        if self.limit is None or len(self.runs) < self.limit:
+            return True  # Every run was fetched
+        return count is not None and count <= self.limit
+
+    def get(self, count: Optional[int], alerts: bool) -> list[Run]:
+        if not self._covers(count, alerts):
+            limit = None if count is None else max(count, self.limit_hint, self.limit or 0)
+            alerts = alerts or self.prefetch_alerts or self.with_alerts
+            query = self.query if limit is None else self.query.limit(limit)
+            if alerts:
+                self.runs = list(query.prefetch(RunAlertEntity, prefetch_type=PREFETCH_TYPE.JOIN))
+            else:
+                self.runs = list(query)
+            self.limit, self.with_alerts = limit, alerts
+        runs = self.runs or []
+        return runs if count is None else runs[:count]
+
+
+class RecentRuns:
+    """
+    The runs of a pipeline, most recent first, fetched once per event no matter how many rules read them.
+
+    It stands in for the query of the runs in the rules' transform functions: `limit` and `prefetch` (of the run
+    alerts) select a window of the runs fetched in memory. The first fetch reads as many runs as the largest window
+    that the rules are expected to need, and the runs are only fetched again when a rule needs more than that.
+    """
+
+    def __init__(self, cache: _RunsCache, count: Optional[int] = None) -> None:
+        self._cache = cache
+        self._count = count
+
+    def limit(self, count: int) -> "RecentRuns":
+        return RecentRuns(self._cache, count if self._count is None else min(count, self._count))
+
+    def prefetch(self, *queries: Any, **kwargs: Any) -> list[Run]:
+        if queries == (RunAlertEntity,):
+            return self._cache.get(self._count, alerts=True)
+        query = self._cache.query if self._count is None else self._cache.query.limit(self._count)
+        return list(query.prefetch(*queries, **kwargs))
+
+    def count(self) -> int:
+        return len(self._cache.get(self._count, alerts=False))
+
+    def __iter__(self) -> Iterator[Run]:
+        return iter(self._cache.get(self._count, alerts=False))
+
+
 class DatabaseData:
     """
     A class to provide database data to the rules engine
+
+    The runs are fetched once, and shared by all the rules evaluated with this instance. `runs_limit` and
+    `prefetch_run_alerts` tell how many runs the rules are expected to read and whether they look at the run alerts,
+    so that a single query fetches them all.
     """
 
     event: EVENT_TYPE
 
-    def __init__(self, event: EVENT_TYPE) -> None:
+    def __init__(self, event: EVENT_TYPE, *, runs_limit: int = 0, prefetch_run_alerts: bool = False) -> None:
         self.event = event
+        self.runs_limit = runs_limit
+        self.prefetch_run_alerts = prefetch_run_alerts
 
     def _get_batch_pipeline_id(self) -> Optional[UUID]:
         match self.event:
@@ -30,8 +100,10 @@ class DatabaseData:
             case _:
                 raise AttributeError("Unsupported event type")
 
-    @property
-    def runs(self) -> SelectQuery:
+    def _recent_runs(self, query: SelectQuery) -> RecentRuns:
+        return RecentRuns(_RunsCache(query, limit_hint=self.runs_limit, prefetch_alerts=self.prefetch_run_alerts))
+
+    def _runs_query(self) -> SelectQuery:
         """Returns query of runs matching event's pipeline orderd in descending start time"""
         if (pipeline_id := self._get_batch_pipeline_id()) is None:
             raise AttributeError("No pipeline id set in event")
@@ -42,11 +114,16 @@ class DatabaseData:
         )
         return query
 
-    @property
-    def runs_filter_name(self) -> SelectQuery:
+    @cached_property
+    def runs(self) -> RecentRuns:
+        """Runs matching event's pipeline orderd in descending start time"""
+        return self._recent_runs(self._runs_query())
+
+    @cached_property
+    def runs_filter_name(self) -> RecentRuns:
         """Same as `runs` but filtered on run_name"""
         run_name_query = Run.select(Run.name).where(Run.id == getattr(self.event, "run_id"))
-        return self.runs.where(Run.name.in_(run_name_query))
+        return self._recent_runs(self._runs_query().where(Run.name.in_(run_name_query)))
 
 
 class RuleData:
@@ -64,6 +141,6 @@ class RuleData:
     event: EVENT_TYPE
     database: DatabaseData
 
-    def __init__(self, event: EVENT_TYPE) -> None:
+    def __init__(self, event: EVENT_TYPE, *, runs_limit: int = 0, prefetch_run_alerts: bool = False) -> None:
         self.event = event
-        self.database = DatabaseData(event)
+        self.database = DatabaseData(event, runs_limit=runs_limit, prefetch_run_alerts=prefetch_run_alerts)
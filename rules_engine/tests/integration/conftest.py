@@ -19,7 +19,7 @@ from common.events.enums import EventSources
 from common.events.v1 import ApiRunStatus, RunStatusEvent, TestOutcomesEvent, TestStatuses
 from common.kafka import TOPIC_IDENTIFIED_EVENTS, KafkaMessage
 from common.actions.action_factory import ACTION_CLASS_MAP
-from rules_engine.journey_rules import _get_rules
+from rules_engine.journey_rules import RULES_CACHE
 from testlib.fixtures.entities import *
 from testlib.fixtures.v2_events import *
 
@@ -79,7 +79,7 @@ def action(company):
 
 @pytest.fixture
 def db_rule(journey, pipeline, action):
-    _get_rules.cache_clear()
+    RULES_CACHE.clear()
     rule = Rule.create(
         action=action.action_impl,
         component=pipeline,
@@ -97,7 +97,7 @@ def db_rule(journey, pipeline, action):
 
 @pytest.fixture
 def instance_alert_rule(journey, pipeline, action):
-    _get_rules.cache_clear()
+    RULES_CACHE.clear()
     rule = Rule.create(
         action=action.action_impl,
         component=pipeline,
@@ -120,7 +120,7 @@ def instance_alert_rule(journey, pipeline, action):
 
 @pytest.fixture
 def run_state_rule(journey, pipeline, action, dag_simple):
-    _get_rules.cache_clear()
+    RULES_CACHE.clear()
     rule = Rule.create(
         action=action.action_impl,
         component=pipeline,
@@ -1,8 +1,10 @@
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
+from peewee import PREFETCH_TYPE
 
-from common.entities import Run, RunStatus
+from common.entities import DB, Run, RunAlert, RunStatus
 from rules_engine.rule_data import DatabaseData
 from testlib.fixtures.entities import *
 from testlib.fixtures.v1_events import *
@@ -50,3 +52,24 @@ def test_databasedata_runs_filter_name_sorting(pipeline, RUNNING_run_status_even
     assert DatabaseData(RUNNING_run_status_event).runs_filter_name.count() == 2
     for i, run in enumerate(DatabaseData(RUNNING_run_status_event).runs_filter_name):
         assert run.id == runs[i].id
+
+
+@pytest.mark.integration
+def test_databasedata_runs_fetched_once(pipeline, RUNNING_run_status_event):
+    RUNNING_run_status_event.pipeline_id = pipeline.id
+    runs = [Run.create(status=RunStatus.COMPLETED, key=str(i), pipeline=pipeline) for i in range(4)]
+    runs.reverse()
+    data = DatabaseData(RUNNING_run_status_event, runs_limit=3, prefetch_run_alerts=True)
+
+    with patch.object(DB.obj, "execute_sql", wraps=DB.obj.execute_sql) as execute_sql:
+        assert [r.id for r in data.runs.limit(2)] == [r.id for r in runs[:2]]
+        assert [r.id for r in data.runs.limit(3).prefetch(RunAlert, prefetch_type=PREFETCH_TYPE.JOIN)] == [
+            r.id for r in runs[:3]
+        ]
+        assert data.runs.limit(3).count() == 3
+        # The runs and their alerts are fetched together, sized for the largest window
+        assert execute_sql.call_count == 2
+
+        assert [r.id for r in data.runs.limit(10)] == [r.id for r in runs]
+        assert data.runs.count() == 4
+        assert execute_sql.call_count == 4
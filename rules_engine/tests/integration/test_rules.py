@@ -1,12 +1,12 @@
 import uuid
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
 from common.entities import Rule as RuleEntity
 from common.entities import RunStatus
 from common.events.v1 import TestStatuses
-from rules_engine.journey_rules import get_rules
+from rules_engine.journey_rules import JourneyRulesCache, get_rules
 
 
 @pytest.fixture
@@ -77,3 +77,25 @@ def test_non_batch_pipeline_component_get_rules(component_fixture, request, jour
     rules = get_rules(rule_entity.journey.id)
     assert 1 == len(rules)
     assert rules[0].component_id == component.id
+
+
+@pytest.mark.integration
+def test_get_rules_reloads_changed_journey(journey, pipeline, action):
+    rule_data = {"when": "all", "conditions": [{"task_status": {"matches": RunStatus.RUNNING.name}}]}
+    rule_entity = RuleEntity.create(
+        action=action.action_impl, component=pipeline, journey=journey, rule_schema="simple_v1", rule_data=rule_data
+    )
+    clock = Mock(return_value=0)
+    cache = JourneyRulesCache(max_rules=10, refresh_interval=30, clock=clock)
+    assert [r.rule_entity.id for r in cache.get([journey.id])] == [rule_entity.id]
+
+    other_rule = RuleEntity.create(
+        action=action.action_impl, component=pipeline, journey=journey, rule_schema="simple_v1", rule_data=rule_data
+    )
+    assert len(cache.get([journey.id])) == 1
+    clock.return_value = 30
+    assert {r.rule_entity.id for r in cache.get([journey.id])} == {rule_entity.id, other_rule.id}
+
+    rule_entity.delete_instance()
+    cache.invalidate(journey.id)
+    assert [r.rule_entity.id for r in cache.get([journey.id])] == [other_rule.id]
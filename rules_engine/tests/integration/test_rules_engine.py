@@ -11,7 +11,7 @@ from common.events.v1.test_outcomes_event import TestOutcomeItem
 from common.predicate_engine.query import ANY, R
 from rules_engine import lib
 from rules_engine.engine import RulesEngine
-from rules_engine.journey_rules import JourneyRule, get_rules
+from rules_engine.journey_rules import JourneyRule, JourneyRuleIndex, get_rules
 
 logging.basicConfig(level=logging.DEBUG)
 
@@ -33,7 +33,7 @@ def test_rules_engine_matching_task(kafka_consumer, db_rule, run_status_event, j
     # This should be an affirmative match
     predicate = R(event__task__key__exact="T1")
     # Register the rule manually
-    get_rules_mock.return_value = [JourneyRule(predicate, db_rule, action, journey_id=journey.id)]
+    get_rules_mock.return_value = JourneyRuleIndex([JourneyRule(predicate, db_rule, action, journey_id=journey.id)])
 
     rules_engine.process_events()
     # If the action as triggered then the match was successful
@@ -51,7 +51,7 @@ def test_rules_engine_non_matching_pipeline(
     # This should not match
     predicate = R(event__task__key__exact="T2")
     # Register the rule manually
-    get_rules_mock.return_value = [JourneyRule(predicate, db_rule, action, journey_id=journey.id)]
+    get_rules_mock.return_value = JourneyRuleIndex([JourneyRule(predicate, db_rule, action, journey_id=journey.id)])
 
     rules_engine.process_events()
     # If the action as triggered then the match was successful - this shouldn't happen
@@ -69,7 +69,7 @@ def test_rules_engine_matching_status(kafka_consumer, db_rule, run_status_event,
     # This should be an affirmative match
     predicate = R(event__status__exact=RunStatus.RUNNING.name)
     # Register the rule manually
-    get_rules_mock.return_value = [JourneyRule(predicate, db_rule, action, journey_id=journey.id)]
+    get_rules_mock.return_value = JourneyRuleIndex([JourneyRule(predicate, db_rule, action, journey_id=journey.id)])
 
     rules_engine.process_events()
     # If the action as triggered then the match was successful
@@ -101,9 +101,11 @@ def test_rules_engine_matching_single_test_outcome(
     action = MagicMock(return_value=None)
 
     predicate = R(event__test_outcomes__exact=ANY(TestStatuses.PASSED.name, attr_name="status"))
-    get_rules_mock.return_value = [
-        JourneyRule(predicate, db_rule, action, journey_id=journey.id, component_id=component.id),
-    ]
+    get_rules_mock.return_value = JourneyRuleIndex(
+        [
+            JourneyRule(predicate, db_rule, action, journey_id=journey.id, component_id=component.id),
+        ]
+    )
 
     rules_engine.process_events()
     # No action triggers when there is not any matching rule
@@ -139,7 +141,7 @@ def test_rules_engine_multiple_test_outcomes_action_trigger_once(
     action = MagicMock(return_value=None)
 
     predicate = R(event__test_outcomes__exact=ANY(TestStatuses.PASSED.name, attr_name="status"))
-    get_rules_mock.return_value = [JourneyRule(predicate, db_rule, action, journey_id=journey.id)]
+    get_rules_mock.return_value = JourneyRuleIndex([JourneyRule(predicate, db_rule, action, journey_id=journey.id)])
 
     kafka_consumer.__iter__.return_value = iter((test_outcome_event,))
     rules_engine.process_events()
@@ -159,7 +161,7 @@ def test_rules_engine_non_matching_status(kafka_consumer, run_status_event, db_r
     # This match should not succeed
     predicate = R(event__status__exact="nope")
     # Register the rule manually
-    get_rules_mock.return_value = [JourneyRule(predicate, db_rule, action, journey_id=journey.id)]
+    get_rules_mock.return_value = JourneyRuleIndex([JourneyRule(predicate, db_rule, action, journey_id=journey.id)])
 
     rules_engine.process_events()
     # If the action as triggered then the match was successful
@@ -171,7 +173,7 @@ def test_register_rules_from_db(db_rule, fake_action_class, journey_dag):
     # Should only be 1 rule entry in the db right now
     assert 1 == RuleEntity.select().count()
 
-    rules = [x for x in get_rules(journey_dag[0].journey)]
+    rules = [x for x in get_rules(journey_dag[0].journey_id)]
     assert 1 == len(rules)
 
 
@@ -200,7 +202,7 @@ def test_rules_engine_process_multiple_component_types_simultaneously(
     action = MagicMock(return_value=None)
 
     predicate = R(event__test_outcomes__exact=ANY(TestStatuses.PASSED.name, attr_name="status"))
-    get_rules_mock.return_value = [JourneyRule(predicate, db_rule, action, journey_id=journey.id)]
+    get_rules_mock.return_value = JourneyRuleIndex([JourneyRule(predicate, db_rule, action, journey_id=journey.id)])
 
     kafka_consumer.__iter__.return_value = iter(
         (batch_pipeline_test_outcome_event_message, dataset_test_outcome_event_message)
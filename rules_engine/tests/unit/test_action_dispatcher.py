@@ -0,0 +1,181 @@
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from common.actions.action import ActionResult, BaseAction
+from rules_engine import action_dispatcher
+from rules_engine.action_dispatcher import ActionDispatcher, dispatch_action
+
+
+class FakeAction(BaseAction):
+    def __init__(self, results, destination="example.com", retryable=True, gate=None):
+        super().__init__(None, {})
+        self.results = list(results)
+        self.calls = 0
+        self._destination = destination
+        self.retryable = retryable
+        self.gate = gate
+
+    @property
+    def destination(self):
+        return self._destination
+
+    def is_retryable(self, action_result):
+        return self.retryable
+
+    def _run(self, event, rule, journey_id):
+        self.calls += 1
+        if self.gate:
+            self.gate.wait(timeout=5)
+        return self.results.pop(0)
+
+
+SUCCESS = ActionResult(True, {}, None)
+FAILURE = ActionResult(False, None, ConnectionError())
+
+
+@pytest.fixture(autouse=True)
+def db_mocks():
+    with patch("rules_engine.action_dispatcher.init_db"), patch("rules_engine.action_dispatcher.DB"):
+        yield
+
+
+@pytest.fixture
+def dispatcher():
+    dispatcher = ActionDispatcher(
+        workers=4, max_per_destination=1, max_attempts=3, backoff=0.01, max_backoff=0.02, max_queue_size=10
+    )
+    yield dispatcher
+    dispatcher.shutdown(5)
+
+
+@pytest.mark.unit
+def test_dispatcher_executes_action(dispatcher):
+    action = FakeAction([SUCCESS])
+    dispatcher.dispatch(action, Mock(), Mock(), None)
+    dispatcher.shutdown(5)
+
+    assert action.calls == 1
+    stats = dispatcher.stats
+    assert (stats.succeeded, stats.retried, stats.dead_lettered, stats.queued) == (1, 0, 0, 0)
+
+
+@pytest.mark.unit
+def test_dispatcher_retries_transient_failures(dispatcher):
+    action = FakeAction([FAILURE, FAILURE, SUCCESS])
+    dispatcher.dispatch(action, Mock(), Mock(), None)
+    dispatcher.shutdown(5)
+
+    assert action.calls == 3
+    assert (dispatcher.stats.succeeded, dispatcher.stats.retried) == (1, 2)
+
+
+@pytest.mark.unit
+def test_dispatcher_dead_letter_after_max_attempts(dispatcher, caplog):
+    action = FakeAction([FAILURE] * 3)
+    dispatcher.dispatch(action, Mock(), Mock(), None)
+    dispatcher.shutdown(5)
+
+    assert action.calls == 3
+    assert dispatcher.stats.dead_lettered == 1
+    assert any(hasattr(record, "dead_letter") for record in caplog.records)
+
+
+@pytest.mark.unit
+def test_dispatcher_does_not_retry_permanent_failures(dispatcher):
+    action = FakeAction([FAILURE], retryable=False)
+    dispatcher.dispatch(action, Mock(), Mock(), None)
+    dispatcher.shutdown(5)
+
+    assert action.calls == 1
+    assert dispatcher.stats.dead_lettered == 1
+
+
+@pytest.mark.unit
+def test_dispatcher_limits_concurrency_per_destination(dispatcher):
+    gate = threading.Event()
+    slow_actions = [FakeAction([SUCCESS], destination="slow.com", gate=gate) for _ in range(2)]
+    fast_action = FakeAction([SUCCESS], destination="fast.com")
+    for action in (*slow_actions, fast_action):
+        dispatcher.dispatch(action, Mock(), Mock(), None)
+
+    for _ in range(500):
+        if fast_action.calls and dispatcher.stats.succeeded == 1:
+            break
+        threading.Event().wait(0.01)
+    # The fast destination is not held up, and only one action runs against the slow destination
+    assert fast_action.calls == 1
+    assert sum(action.calls for action in slow_actions) == 1
+
+    gate.set()
+    dispatcher.shutdown(5)
+    assert all(action.calls == 1 for action in slow_actions)
+    assert dispatcher.stats.succeeded == 3
+
+
+@pytest.mark.unit
+def test_dispatch_action_inline_without_dispatcher():
+    action = FakeAction([SUCCESS])
+    assert action_dispatcher._DISPATCHER is None
+    dispatch_action(action, Mock(), Mock(), None)
+    assert action.calls == 1
+
+
+class BrokenDestinationAction(FakeAction):
+    @property
+    def destination(self):
+        raise ValueError("SMTP is not configured")
+
+
+@pytest.mark.unit
+def test_dispatcher_dead_letter_on_destination_error(dispatcher):
+    action = BrokenDestinationAction([SUCCESS])
+    on_complete = Mock()
+    dispatcher.dispatch(action, Mock(), Mock(), None, on_complete=on_complete)
+    dispatcher.shutdown(5)
+
+    assert action.calls == 0
+    stats = dispatcher.stats
+    assert (stats.dead_lettered, stats.queued, stats.in_flight) == (1, 0, 0)
+    on_complete.assert_called_once_with()
+
+
+@pytest.mark.unit
+def test_dispatcher_calls_on_complete(dispatcher):
+    on_complete = Mock()
+    dispatcher.dispatch(FakeAction([SUCCESS]), Mock(), Mock(), None, on_complete=on_complete)
+    dispatcher.dispatch(FakeAction([FAILURE], retryable=False), Mock(), Mock(), None, on_complete=on_complete)
+    dispatcher.shutdown(5)
+
+    assert on_complete.call_count == 2
+
+
+@pytest.mark.unit
+def test_track_actions_waits_for_dispatched_actions():
+    gate = threading.Event()
+    on_done = Mock()
+    action_dispatcher.start_dispatcher(
+        workers=2, max_per_destination=1, max_attempts=1, backoff=0.01, max_backoff=0.02, max_queue_size=10
+    )
+    try:
+        with action_dispatcher.track_actions(on_done):
+            dispatch_action(FakeAction([SUCCESS], gate=gate), Mock(), Mock(), None)
+        on_done.assert_not_called()
+        gate.set()
+    finally:
+        action_dispatcher.stop_dispatcher(5)
+    on_done.assert_called_once_with()
+
+
+@pytest.mark.unit
+def test_track_actions_not_done_on_error():
+    on_done = Mock()
+    with pytest.raises(ValueError):
+        with action_dispatcher.track_actions(on_done):
+            raise ValueError()
+    on_done.assert_not_called()
+
+    with action_dispatcher.track_actions(on_done):
+        pass
+    on_done.assert_called_once_with()
@@ -1,8 +1,10 @@
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 import pytest
 
 from common.datetime_utils import datetime_formatted
+from common.entities import Project, Run
 from common.entities.component import ComponentType
 from common.entities.rule import RunState
 from common.events.v1 import ApiRunStatus, MessageEventLogLevel, MessageLogEvent, MetricLogEvent, RunStatusEvent
@@ -97,6 +99,41 @@ def test_project_data_points(run_status_event, project, rule):
     assert dps.project.name == project.name
 
 
+@pytest.mark.unit
+def test_prefetch_project_and_company(run_status_event, project, auth_provider, rule):
+    run_status_event.project_id = project.id
+    dps = DataPoints(run_status_event, rule)
+    dps.prefetch({"project.name", "company.ui_url", "run.key"})
+
+    with (
+        patch.object(Project, "get_by_id", side_effect=AssertionError),
+        patch("common.actions.data_points.AuthProvider.select", side_effect=AssertionError),
+    ):
+        assert dps.project.name == project.name
+        assert dps.company.ui_url == auth_provider.domain
+
+
+@pytest.mark.unit
+def test_prefetch_run(run_status_event, run, pipeline, rule):
+    run_status_event.run_id = run.id
+    dps = DataPoints(run_status_event, rule)
+    dps.prefetch({"run.status", "pipeline.name"})
+
+    with patch.object(Run, "get_by_id", side_effect=AssertionError):
+        assert dps.run.status == run.status
+    assert run_status_event.pipeline.id == pipeline.id
+
+
+@pytest.mark.unit
+def test_prefetch_missing_rows(run_status_event, rule):
+    dps = DataPoints(run_status_event, rule)
+    dps.prefetch({"project.name", "run.status", "run_task.status"})
+
+    assert "project" not in run_status_event.__dict__
+    with pytest.raises(AttributeError):
+        dps.project.name
+
+
 @pytest.mark.unit
 def test_pipeline_data_points(run_status_event, pipeline, rule):
     run_status_event.pipeline_id = pipeline.id
@@ -1,6 +1,7 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from confluent_kafka import TopicPartition
 from peewee import InterfaceError, OperationalError
 
 from common.kafka.message import KafkaMessage
@@ -46,3 +47,62 @@ def test_rules_engine_operational_db_failure(kafka_consumer, init_db_mock, excep
     with pytest.raises(exception):
         RulesEngine(event_consumer=kafka_consumer).process_events()
     kafka_consumer.commit.assert_not_called()
+
+
+@pytest.fixture
+def killer():
+    killer = MagicMock()
+    killer.should_exit = False
+    return killer
+
+
+@pytest.mark.unit
+def test_rules_engine_workers(kafka_message, db_mock, init_db_mock, killer):
+    consumer = MagicMock()
+    consumer.killer = killer
+
+    def poll(timeout):
+        killer.should_exit = True
+        return kafka_message
+
+    consumer.poll.side_effect = poll
+    RulesEngine(event_consumer=consumer, workers=2).process_events()
+    consumer.store_offsets.assert_called_once_with(
+        [TopicPartition(kafka_message.topic, kafka_message.partition, kafka_message.offset + 1)]
+    )
+    consumer.commit.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("exception", (OperationalError, InterfaceError))
+def test_rules_engine_workers_operational_db_failure(kafka_message, db_mock, init_db_mock, killer, exception):
+    init_db_mock.side_effect = [None, exception]
+    consumer = MagicMock()
+    consumer.killer = killer
+
+    def poll(timeout):
+        killer.should_exit = True
+        return kafka_message
+
+    consumer.poll.side_effect = poll
+    with pytest.raises(exception):
+        RulesEngine(event_consumer=consumer, workers=2).process_events()
+    consumer.store_offsets.assert_not_called()
+
+
+@pytest.mark.unit
+def test_rules_engine_dispatcher_stores_offsets(kafka_message, db_mock, init_db_mock, killer):
+    consumer = MagicMock()
+    consumer.killer = killer
+
+    def poll(timeout):
+        killer.should_exit = True
+        return kafka_message
+
+    consumer.poll.side_effect = poll
+    with patch("rules_engine.engine.dispatcher_running", return_value=True):
+        RulesEngine(event_consumer=consumer).process_events()
+    consumer.store_offsets.assert_called_once_with(
+        [TopicPartition(kafka_message.topic, kafka_message.partition, kafka_message.offset + 1)]
+    )
+    consumer.__iter__.assert_not_called()
@@ -0,0 +1,198 @@
+from collections import defaultdict
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from common.entities import RunState
+from common.events.internal import InstanceAlert, RunAlert
+from common.events.v1 import ApiRunStatus, MessageLogEvent, RunStatusEvent, TestOutcomesEvent
+from common.predicate_engine.query import R
+from rules_engine.journey_rules import (
+    EMPTY_STAMP,
+    JourneyRule,
+    JourneyRuleIndex,
+    JourneyRulesCache,
+    get_event_types,
+    get_runs_window,
+)
+from testlib.fixtures.entities import PIPELINE_ID
+
+
+@pytest.fixture
+def run_status_event():
+    event = RunStatusEvent.as_event_from_request(
+        {"status": ApiRunStatus.FAILED.name, "pipeline_key": "P1", "run_key": "R1"}
+    )
+    event.pipeline_id = PIPELINE_ID
+    return event
+
+
+def _rule(event_types=None, component_id=None):
+    return JourneyRule(R(), Mock(), event_types=event_types, component_id=component_id)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "conditions, expected",
+    (
+        ([{"message_log": {"level": ["ERROR"]}}], (MessageLogEvent,)),
+        ([{"test_status": {"matches": "FAILED"}}], (TestOutcomesEvent,)),
+        ([{"task_status": {"matches": "FAILED"}}, {"task_status": {"matches": "RUNNING"}}], (RunStatusEvent,)),
+        ([{"run_state": {"matches": RunState.FAILED}}], (RunStatusEvent,)),
+        ([{"run_state": {"matches": RunState.LATE_END}}], (RunAlert,)),
+        ([{"instance_alert": {"level_matches": [], "type_matches": ["INCOMPLETE"]}}], (InstanceAlert,)),
+        ([{"instance_alert": {"level_matches": ["ERROR"], "type_matches": []}}], (InstanceAlert, RunAlert)),
+        ([{"unknown": {}}], None),
+    ),
+)
+def test_get_event_types(conditions, expected):
+    assert get_event_types("simple_v1", {"when": "any", "conditions": conditions}) == expected
+
+
+@pytest.mark.unit
+def test_get_event_types_other_schema():
+    assert get_event_types("other", {"conditions": [{"message_log": {}}]}) is None
+
+
+@pytest.mark.unit
+def test_rule_index_event_type(run_status_event, run_alert, instance_alert):
+    any_event = _rule()
+    run_status = _rule((RunStatusEvent,))
+    message_log = _rule((MessageLogEvent,))
+    alerts = _rule((InstanceAlert, RunAlert))
+    index = JourneyRuleIndex([alerts, any_event, run_status, message_log])
+
+    assert len(index) == 4
+    assert index.for_event(run_status_event) == [any_event, run_status]
+    assert index.for_event(run_alert) == [alerts, any_event]
+    assert index.for_event(instance_alert) == [alerts, any_event]
+
+
+@pytest.mark.unit
+def test_rule_index_component(run_status_event, instance_alert):
+    any_component = _rule((RunStatusEvent,))
+    same_component = _rule((RunStatusEvent,), component_id=PIPELINE_ID)
+    other_component = _rule(component_id=uuid4())
+    index = JourneyRuleIndex([other_component, same_component, any_component])
+
+    assert index.for_event(run_status_event) == [same_component, any_component]
+    # Events without a component are evaluated against the rules of any component
+    assert index.for_event(instance_alert) == [other_component]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "conditions, expected",
+    (
+        ([{"message_log": {"level": ["ERROR"]}}], (0, False)),
+        ([{"run_state": {"matches": RunState.FAILED, "count": 1, "trigger_successive": True}}], (0, False)),
+        ([{"run_state": {"matches": RunState.FAILED, "count": 3, "trigger_successive": True}}], (3, False)),
+        ([{"run_state": {"matches": RunState.FAILED, "count": 1, "trigger_successive": False}}], (2, False)),
+        (
+            [
+                {"run_state": {"matches": RunState.FAILED, "count": 2, "trigger_successive": True}},
+                {"run_state": {"matches": RunState.LATE_END, "count": 4, "trigger_successive": False}},
+            ],
+            (5, True),
+        ),
+    ),
+)
+def test_get_runs_window(conditions, expected):
+    assert get_runs_window("simple_v1", {"when": "any", "conditions": conditions}) == expected
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def rules_db():
+    rules = {}
+    stamps = {}
+    with (
+        patch(
+            "rules_engine.journey_rules._get_rules_stamps",
+            side_effect=lambda ids: {j: stamps[j] for j in ids if j in stamps},
+        ) as get_stamps,
+        patch(
+            "rules_engine.journey_rules._load_rules",
+            side_effect=lambda ids: defaultdict(list, {j: list(rules[j]) for j in ids if j in rules}),
+        ) as load_rules,
+    ):
+        yield SimpleNamespace(rules=rules, stamps=stamps, get_stamps=get_stamps, load_rules=load_rules)
+
+
+@pytest.mark.unit
+def test_rules_cache_reuses_rules(rules_db):
+    journey_1, journey_2 = uuid4(), uuid4()
+    rules_db.rules[journey_1] = [_rule(), _rule()]
+    rules_db.stamps[journey_1] = (2, "t1")
+    cache = JourneyRulesCache(max_rules=10, refresh_interval=30, clock=FakeClock())
+
+    index = cache.get([journey_1, journey_2])
+    assert index == rules_db.rules[journey_1]
+    assert cache.get([journey_2, journey_1]) is index
+    assert rules_db.load_rules.call_count == 1
+    # Journeys without rules count as one
+    assert cache.size == 3
+
+
+@pytest.mark.unit
+def test_rules_cache_refresh_unchanged(rules_db):
+    journey = uuid4()
+    rules_db.rules[journey] = [_rule()]
+    rules_db.stamps[journey] = (1, "t1")
+    clock = FakeClock()
+    cache = JourneyRulesCache(max_rules=10, refresh_interval=30, clock=clock)
+
+    index = cache.get([journey])
+    clock.now = 30
+    assert cache.get([journey]) is index
+    assert rules_db.get_stamps.call_count == 2
+    assert rules_db.load_rules.call_count == 1
+
+    rules_db.rules[journey] = [_rule(), _rule()]
+    rules_db.stamps[journey] = (2, "t2")
+    clock.now = 45
+    assert cache.get([journey]) is index
+    clock.now = 60
+    assert cache.get([journey]) == rules_db.rules[journey]
+    assert rules_db.load_rules.call_count == 2
+
+
+@pytest.mark.unit
+def test_rules_cache_invalidate(rules_db):
+    journey_1, journey_2 = uuid4(), uuid4()
+    rules_db.rules.update({journey_1: [_rule()], journey_2: [_rule()]})
+    cache = JourneyRulesCache(max_rules=10, refresh_interval=30, clock=FakeClock())
+    cache.get([journey_1, journey_2])
+
+    rules_db.rules[journey_1] = []
+    cache.invalidate(journey_1)
+    assert cache.get([journey_1, journey_2]) == rules_db.rules[journey_2]
+    rules_db.load_rules.assert_called_with({journey_1: EMPTY_STAMP})
+
+
+@pytest.mark.unit
+def test_rules_cache_evicts_least_recently_used(rules_db):
+    journeys = [uuid4() for _ in range(3)]
+    rules_db.rules.update({journey: [_rule(), _rule()] for journey in journeys})
+    cache = JourneyRulesCache(max_rules=5, refresh_interval=30, clock=FakeClock())
+
+    cache.get([journeys[0]])
+    cache.get([journeys[1]])
+    cache.get([journeys[0]])
+    cache.get([journeys[2]])
+    assert cache.size == 4
+    assert rules_db.load_rules.call_count == 3
+
+    cache.get([journeys[0]])
+    assert rules_db.load_rules.call_count == 3
+    cache.get([journeys[1]])
+    assert rules_db.load_rules.call_count == 4
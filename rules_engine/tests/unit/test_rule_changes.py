@@ -0,0 +1,41 @@
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from common.events.internal import RuleChangeEvent
+from common.kafka import TOPIC_RULE_CHANGES, KafkaMessage
+from rules_engine.rule_changes import RuleChangesListener
+
+
+@pytest.mark.unit
+def test_rule_changes_invalidate_journey():
+    cache = Mock()
+    listener = RuleChangesListener(Mock(), cache)
+    journey_id = uuid4()
+
+    listener.handle(
+        KafkaMessage(
+            payload=RuleChangeEvent(journey_id=journey_id),
+            topic=TOPIC_RULE_CHANGES.name,
+            partition=0,
+            offset=0,
+            headers={},
+        )
+    )
+
+    cache.invalidate.assert_called_once_with(journey_id)
+
+
+@pytest.mark.unit
+def test_rule_changes_ignore_other_payloads():
+    cache = Mock()
+    listener = RuleChangesListener(Mock(), cache)
+
+    listener.handle(
+        KafkaMessage(
+            payload={"journey_id": str(uuid4())}, topic=TOPIC_RULE_CHANGES.name, partition=0, offset=0, headers={}
+        )
+    )
+
+    cache.invalidate.assert_not_called()
@@ -0,0 +1,159 @@
+import threading
+import time
+from contextlib import contextmanager
+from unittest.mock import Mock
+
+import pytest
+from confluent_kafka import TopicPartition
+
+from common.kafka.message import KafkaMessage
+from rules_engine.worker_pool import OffsetTracker, PartitionedWorkerPool
+
+
+def message(offset, key="project-a", partition=0):
+    return KafkaMessage(payload=offset, topic="topic", partition=partition, offset=offset, headers={}, key=key)
+
+
+@pytest.mark.unit
+def test_offset_tracker_advances_to_lowest_pending():
+    tracker = OffsetTracker()
+    for offset in (3, 4, 5):
+        tracker.add(message(offset))
+
+    assert tracker.complete(message(4)) is None
+    assert tracker.complete(message(3)) == TopicPartition("topic", 0, 5)
+    assert tracker.complete(message(5)) == TopicPartition("topic", 0, 6)
+
+
+@pytest.mark.unit
+def test_offset_tracker_partitions_are_independent():
+    tracker = OffsetTracker()
+    tracker.add(message(1, partition=0))
+    tracker.add(message(1, partition=1))
+
+    assert tracker.complete(message(1, partition=1)) == TopicPartition("topic", 1, 2)
+    assert tracker.complete(message(1, partition=0)) == TopicPartition("topic", 0, 2)
+
+
+@pytest.mark.unit
+def test_worker_pool_preserves_order_per_key():
+    processed = {"project-a": [], "project-b": []}
+    lock = threading.Lock()
+
+    def handler(msg):
+        with lock:
+            processed[msg.key].append(msg.offset)
+
+    on_offset = Mock()
+    with PartitionedWorkerPool(handler, on_offset, workers=4, queue_size=2) as pool:
+        for offset in range(20):
+            pool.submit(message(offset, key="project-a" if offset % 2 else "project-b"))
+
+    assert processed["project-a"] == list(range(1, 20, 2))
+    assert processed["project-b"] == list(range(0, 20, 2))
+    assert on_offset.call_args_list[-1][0][0] == TopicPartition("topic", 0, 20)
+
+
+@pytest.mark.unit
+def test_worker_pool_slow_key_does_not_block_others():
+    release = threading.Event()
+    fast_done = threading.Event()
+    processed = []
+
+    def handler(msg):
+        if msg.key == "slow":
+            release.wait(timeout=5)
+        processed.append(msg.offset)
+        if msg.offset == 2:
+            fast_done.set()
+
+    on_offset = Mock()
+    with PartitionedWorkerPool(handler, on_offset, workers=2, queue_size=10) as pool:
+        slow, fast = "slow", next(k for k in (f"k{i}" for i in range(100)) if hash(k) % 2 != hash("slow") % 2)
+        pool.submit(message(0, key=slow))
+        pool.submit(message(1, key=fast))
+        pool.submit(message(2, key=fast))
+        assert fast_done.wait(timeout=5)
+        assert processed == [1, 2]
+        # The slow message holds back the committed offset
+        on_offset.assert_not_called()
+        release.set()
+
+    on_offset.assert_called_once_with(TopicPartition("topic", 0, 3))
+
+
+@pytest.mark.unit
+def test_worker_pool_handler_error():
+    handler = Mock(side_effect=[None, ValueError])
+    on_offset = Mock()
+    pool = PartitionedWorkerPool(handler, on_offset, workers=1, queue_size=10)
+    with pool:
+        pool.submit(message(0))
+        pool.submit(message(1))
+        pool.threads[0].join()
+        with pytest.raises(ValueError):
+            pool.submit(message(2))
+
+    on_offset.assert_called_once_with(TopicPartition("topic", 0, 1))
+    assert handler.call_count == 2
+
+
+@pytest.mark.unit
+def test_worker_pool_pauses_busy_partition():
+    started = threading.Event()
+    release = threading.Event()
+    processed = []
+
+    def handler(msg):
+        started.set()
+        release.wait(timeout=5)
+        processed.append(msg.offset)
+
+    on_pause = Mock()
+    on_resume = Mock()
+    with PartitionedWorkerPool(
+        handler, Mock(), workers=1, queue_size=1, on_pause=on_pause, on_resume=on_resume
+    ) as pool:
+        pool.submit(message(0))
+        assert started.wait(timeout=5)
+        pool.submit(message(1))
+        pool.submit(message(2))
+        pool.submit(message(3))
+
+        on_pause.assert_called_once_with(TopicPartition("topic", 0))
+        assert pool.paused
+        pool.resume_ready()
+        on_resume.assert_not_called()
+
+        release.set()
+        for _ in range(50):
+            pool.resume_ready()
+            if not pool.paused:
+                break
+            time.sleep(0.1)
+        assert not pool.paused
+        on_resume.assert_called_once_with(TopicPartition("topic", 0))
+
+    assert processed == [0, 1, 2, 3]
+    on_pause.assert_called_once()
+
+
+@pytest.mark.unit
+def test_worker_pool_completion_scope_defers_offsets():
+    deferred = []
+
+    @contextmanager
+    def completion_scope(on_done):
+        yield
+        deferred.append(on_done)
+
+    on_offset = Mock()
+    with PartitionedWorkerPool(Mock(), on_offset, workers=1, queue_size=10, completion_scope=completion_scope) as pool:
+        pool.submit(message(0))
+        pool.submit(message(1))
+    on_offset.assert_not_called()
+
+    deferred[1]()
+    on_offset.assert_not_called()
+    deferred[0]()
+    on_offset.assert_called_once_with(TopicPartition("topic", 0, 2))
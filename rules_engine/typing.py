@@ -1,10 +1,13 @@
 __all__ = ("EVENT_TYPE", "ALERT_EVENT", "PROJECT_EVENT", "Rule")
 
-from typing import Union, Protocol
+from typing import TYPE_CHECKING, Optional, Union, Protocol
 
 from common.events.internal import InstanceAlert, RunAlert, AgentStatusChangeEvent
 from common.events.v1 import Event
 
+if TYPE_CHECKING:
+    from rules_engine.rule_data import RuleData
+
 EVENT_TYPE = Union[Event, RunAlert, InstanceAlert, AgentStatusChangeEvent]
 """All types of events supported by Rule evaluation."""
 
@@ -18,4 +21,4 @@ PROJECT_EVENT = AgentStatusChangeEvent
 class Rule(Protocol):
     """The minimal interface a rule has to implement."""
 
-    def evaluate(self, event: EVENT_TYPE) -> None: ...
+    def evaluate(self, event: EVENT_TYPE, rule_data: Optional["RuleData"] = None) -> None: ...
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+__all__ = ["OffsetTracker", "PartitionedWorkerPool"]
+
+import heapq
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from queue import Full, Queue
+from typing import Optional
+
+from confluent_kafka import TopicPartition
+
+from common.kafka import KafkaMessage
+
+LOG = logging.getLogger(__name__)
+
+QUEUE_PUT_TIMEOUT_SECS: float = 1
+"""How long to wait for room in a busy worker queue before checking for worker failures again."""
+
+PAUSED_POLL_TIMEOUT_SECS: float = 0.1
+"""How long to wait for messages while partitions are paused, before checking whether they can be resumed."""
+
+
+@contextmanager
+def _complete_on_return(on_done: Callable[[], None]) -> Iterator[None]:
+    yield
+    on_done()
+
+
+@dataclass
+class _PartitionOffsets:
+    pending: list[int] = field(default_factory=list)
+    done: set[int] = field(default_factory=set)
+
+
+class OffsetTracker:
+    """
+    Keeps track of the messages being processed out of order, so that only offsets below which all messages were
+    processed are committed.
+
+    The offset to commit for a partition only advances once the lowest in-flight message of that partition is done.
+    """
+
+    def __init__(self) -> None:
+        self._partitions: dict[tuple[str, int], _PartitionOffsets] = {}
+        self._lock = threading.Lock()
+
+    def add(self, message: KafkaMessage) -> None:
+        with self._lock:
+            offsets = self._partitions.setdefault((message.topic, message.partition), _PartitionOffsets())
+            heapq.heappush(offsets.pending, message.offset)
+
+    def complete(self, message: KafkaMessage) -> Optional[TopicPartition]:
+        """Mark the message as processed. Returns the offset to commit when it advanced, None otherwise."""
+        with self._lock:
+            offsets = self._partitions[(message.topic, message.partition)]
+            offsets.done.add(message.offset)
+            next_offset = None
+            while offsets.pending and offsets.pending[0] in offsets.done:
+                offset = heapq.heappop(offsets.pending)
+                offsets.done.discard(offset)
+                next_offset = offset + 1
+        if next_offset is None:
+            return None
+        return TopicPartition(message.topic, message.partition, next_offset)
+
+
+class PartitionedWorkerPool:
+    """
+    Processes Kafka messages concurrently in a fixed number of worker threads.
+
+    Messages are routed to a worker by their Kafka key, which is the project id for identified events. All the
+    messages of a project are therefore processed in order by the same worker while different projects are processed
+    concurrently. Each worker has a bounded queue. Submitting never blocks, so that the consumer keeps polling and
+    stays in its group: when the target worker is busy, the message is held and `on_pause` is called with its
+    partition, so that no more messages are fetched from it. The messages of a paused partition are held in order
+    until `resume_ready` finds room for all of them, then `on_resume` is called with the partition.
+
+    Once a message is processed, `on_offset` is called with the offset up to which every message of its partition was
+    processed, so it can be committed. The value returned by the handler is ignored. The handler runs within
+    `completion_scope`, which is given the callback marking the message as processed; the default scope calls it as
+    soon as the handler returns, but a scope may defer it until the work started by the handler is done. When the
+    handler raises, the worker stops and the error is re-raised by the next `submit` or `raise_for_error` call. The
+    failed message and the ones after it are never marked as processed.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[KafkaMessage], object],
+        on_offset: Callable[[TopicPartition], None],
+        *,
+        workers: int,
+        queue_size: int,
+        on_pause: Callable[[TopicPartition], None] = lambda _: None,
+        on_resume: Callable[[TopicPartition], None] = lambda _: None,
+        completion_scope: Callable[[Callable[[], None]], AbstractContextManager[None]] = _complete_on_return,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("The worker pool needs at least one worker")
+        self.handler = handler
+        self.on_offset = on_offset
+        self.on_pause = on_pause
+        self.on_resume = on_resume
+        self.completion_scope = completion_scope
+        self.offsets = OffsetTracker()
+        self.held: dict[tuple[str, int], deque[KafkaMessage]] = {}
+        self.queues: list[Queue[Optional[KafkaMessage]]] = [Queue(maxsize=queue_size) for _ in range(workers)]
+        self.threads = [
+            threading.Thread(target=self._work, args=(queue,), name=f"rules-engine-worker-{idx}", daemon=True)
+            for idx, queue in enumerate(self.queues)
+        ]
+        self.error: Optional[BaseException] = None
+
+    def __enter__(self) -> PartitionedWorkerPool:
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.shutdown()
+
+    def _work(self, queue: Queue[Optional[KafkaMessage]]) -> None:
+        while (message := queue.get()) is not None:
+            try:
+                with self.completion_scope(partial(self._complete, message)):
+                    self.handler(message)
+            except BaseException as e:
+                LOG.error("Worker %s stopped after failing to process a message", threading.current_thread().name)
+                self.error = e
+                return
+
+    def _complete(self, message: KafkaMessage) -> None:
+        if (offset := self.offsets.complete(message)) is not None:
+            self.on_offset(offset)
+
+    def start(self) -> None:
+        for thread in self.threads:
+            thread.start()
+
+    def raise_for_error(self) -> None:
+        if self.error is not None:
+            raise self.error
+
+    @property
+    def paused(self) -> bool:
+        """Whether messages are held for busy workers, which `resume_ready` should be called for."""
+        return bool(self.held)
+
+    def _worker_index(self, message: KafkaMessage) -> int:
+        return hash(message.key if message.key is not None else message.partition) % len(self.queues)
+
+    def _put(self, message: KafkaMessage) -> bool:
+        try:
+            self.queues[self._worker_index(message)].put_nowait(message)
+        except Full:
+            return False
+        return True
+
+    def submit(self, message: KafkaMessage) -> None:
+        self.raise_for_error()
+        self.offsets.add(message)
+        partition = (message.topic, message.partition)
+        if (held := self.held.get(partition)) is not None:
+            # Messages fetched before the partition was paused must not overtake the held ones
+            held.append(message)
+        elif not self._put(message):
+            LOG.debug("Worker for partition %s:%s is busy, pausing it", *partition)
+            self.held[partition] = deque((message,))
+            self.on_pause(TopicPartition(*partition))
+
+    def resume_ready(self) -> None:
+        """Hand the held messages over to the workers which have room again, resuming the emptied partitions."""
+        self.raise_for_error()
+        for partition, held in list(self.held.items()):
+            while held and self._put(held[0]):
+                held.popleft()
+            if not held:
+                del self.held[partition]
+                self.on_resume(TopicPartition(*partition))
+
+    def shutdown(self) -> None:
+        """Wait for the workers to process all the submitted messages, including the held ones, and stop them."""
+        for held in self.held.values():
+            for message in held:
+                idx = self._worker_index(message)
+                while self.threads[idx].is_alive():
+                    try:
+                        self.queues[idx].put(message, timeout=QUEUE_PUT_TIMEOUT_SECS)
+                        break
+                    except Full:
+                        continue
+        self.held.clear()
+        for queue, thread in zip(self.queues, self.threads, strict=True):
+            while thread.is_alive():
+                try:
+                    queue.put(None, timeout=QUEUE_PUT_TIMEOUT_SECS)
+                    break
+                except Full:
+                    continue
+        for thread in self.threads:
+            if thread.is_alive():
+                thread.join()
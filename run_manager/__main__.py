@@ -1,15 +1,21 @@
 import logging
 from logging.config import dictConfig
+from typing import Union
+from uuid import uuid4
 
 from common import argparse
 from common.kafka import (
+    TOPIC_COMPONENT_CHANGES,
     TOPIC_SCHEDULED_EVENTS,
     TOPIC_UNIDENTIFIED_EVENTS,
+    KafkaConsumer,
     KafkaTransactionalConsumer,
     KafkaTransactionalProducer,
 )
 from common.kubernetes import readiness_probe
 from common.logging import JsonFormatter
+from conf import settings
+from run_manager.component_changes import ComponentChangesListener
 from run_manager.run_manager import RunManager
 
 LOG_CONFIG: dict[str, object] = {
@@ -49,6 +55,16 @@ kafka_consumer_config = {
     "allow.auto.create.topics": True,
 }
 
+component_changes_consumer_config: dict[str, Union[str, bool]] = {
+    "auto.offset.reset": "latest",
+    "enable.auto.commit": False,
+    "allow.auto.create.topics": True,
+}
+"""Each run manager consumes the component changes in its own consumer group, see `ChangesListener`."""
+
+COMPONENT_CHANGES_SHUTDOWN_TIMEOUT_SECONDS: float = 5
+"""How long to wait for the component changes listener to disconnect when exiting."""
+
 
 def main() -> None:
     argparse.add_arg_handler(readiness_probe.get_args_handler(60))
@@ -59,12 +75,26 @@ def main() -> None:
         [TOPIC_UNIDENTIFIED_EVENTS, TOPIC_SCHEDULED_EVENTS],
     )
     event_producer = KafkaTransactionalProducer(config={}, tx_consumer=event_consumer)
-    manager = RunManager(event_consumer, event_producer)
+    manager = RunManager(
+        event_consumer,
+        event_producer,
+        batch_size=settings.RUN_MANAGER_BATCH_SIZE,
+        batch_timeout=settings.RUN_MANAGER_BATCH_TIMEOUT_SECONDS,
+    )
+    component_changes_listener = ComponentChangesListener(
+        KafkaConsumer(
+            {**component_changes_consumer_config, "group.id": f"run-manager-component-changes-{uuid4()}"},
+            [TOPIC_COMPONENT_CHANGES],
+        )
+    )
+    component_changes_listener.start()
+
     try:
         manager.process_events()
     except Exception:
         LOG.exception("Unexpected error occurred, exiting...")
     finally:
+        component_changes_listener.stop(COMPONENT_CHANGES_SHUTDOWN_TIMEOUT_SECONDS)
         event_consumer.disconnect()
         event_producer.disconnect()
     LOG.info("Exiting...")
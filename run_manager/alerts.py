@@ -20,6 +20,7 @@ from common.entities import (
     RunAlertType,
 )
 from common.entities.alert import InstanceAlertsComponents
+from common.entity_services.instance_summary_service import InstanceSummaryService
 from common.events.internal import InstanceAlert as InstanceAlertEvent
 from common.events.internal import RunAlert as RunAlertEvent
 from common.user_strings.alert_descriptions import INSTANCE_ALERT_DESCRIPTIONS, RUN_ALERT_DESCRIPTIONS
@@ -58,6 +59,7 @@ def create_run_alert(alert_type: RunAlertType, run: Run, pipeline: Pipeline) ->
         if start_dt := run.expected_start_time:
             alert.expected_start_time = start_dt
     alert.save(force_insert=True)
+    InstanceSummaryService.add_run_alert(alert, run)
     instances = (
         Instance.select(Instance.id).join(InstancesInstanceSets).join(InstanceSet).join(Run).where(Run.id == run.id)
     )
@@ -96,11 +98,11 @@ def create_instance_alert(
         type=alert_type.name,
         description=alert_description,
     )
-    alert_components = alert_components or []
-    alert_components = [
-        InstanceAlertsComponents(instance_alert=alert.id, component=component) for component in alert_components
+    alert_component_rows = [
+        InstanceAlertsComponents(instance_alert=alert.id, component=component) for component in alert_components or []
     ]
-    InstanceAlertsComponents.bulk_create(alert_components, batch_size=BATCH_SIZE)
+    InstanceAlertsComponents.bulk_create(alert_component_rows, batch_size=BATCH_SIZE)
+    InstanceSummaryService.add_instance_alert(alert, [ac.component_id for ac in alert_component_rows])
 
     if alert_level == AlertLevel.WARNING and not instance.has_warnings:
         Instance.update({Instance.has_warnings: True}).where(Instance.id == instance.id).execute()
@@ -0,0 +1,31 @@
+__all__ = ["ComponentChangesListener"]
+
+import logging
+
+from common.cache import TTLCache
+from common.entities import Component
+from common.events.internal import ComponentChangeEvent
+from common.kafka import ChangesListener, KafkaConsumer, KafkaMessage
+from run_manager.event_handlers.component_identifier import COMPONENT_CACHE
+
+LOG = logging.getLogger(__name__)
+
+
+class ComponentChangesListener(ChangesListener):
+    """Drops the components updated or deleted through the API from the component cache, as they are published."""
+
+    thread_name = "component-changes-listener"
+
+    def __init__(
+        self, consumer: KafkaConsumer, cache: TTLCache[tuple[str, str, str], Component] = COMPONENT_CACHE
+    ) -> None:
+        super().__init__(consumer)
+        self.cache = cache
+
+    def handle(self, message: KafkaMessage) -> None:
+        match message.payload:
+            case ComponentChangeEvent(component_id=component_id):
+                count = self.cache.invalidate_where(lambda _, component: bool(component.id == component_id))
+                LOG.info("Component '%s' changed, %s cached entries dropped", component_id, count)
+            case payload:
+                LOG.warning("Ignoring unexpected component change payload of type %s", type(payload))
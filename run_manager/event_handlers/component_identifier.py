@@ -1,10 +1,11 @@
-__all__ = ["ComponentIdentifier"]
+__all__ = ["COMPONENT_CACHE", "ComponentIdentifier"]
 
 import logging
 from typing import Optional, cast
 
 from peewee import DoesNotExist
 
+from common.cache import TTLCache
 from common.entities import Component, ComponentType, Dataset, Pipeline, Project, Server, StreamingPipeline
 from common.entity_services import JourneyService
 from common.events import EventHandlerBase
@@ -25,35 +26,78 @@ ALL_COMPONENTS = (Pipeline, Dataset, Server, StreamingPipeline)
 COMPONENT_TYPES = {class_.component_type: class_ for class_ in ALL_COMPONENTS}
 """Map event component type to db model"""
 
+COMPONENT_CACHE_SIZE: int = 10_000
+"""Maximum number of components kept in the in-process component cache."""
+
+COMPONENT_CACHE_TTL_SECS: float = 300
+"""
+How long a cached component is used without being read again from the database.
+
+The components updated or deleted through the API are dropped from the cache as their changes are published, see
+`ComponentChangesListener`. This bounds how long a missed change goes unnoticed by the run manager.
+"""
+
+COMPONENT_CACHE: TTLCache[tuple[str, str, str], Component] = TTLCache(
+    max_size=COMPONENT_CACHE_SIZE, ttl=COMPONENT_CACHE_TTL_SECS
+)
+"""
+Components identified by the project id, component type and key of the events.
+
+The entries can only be trusted as long as the transaction in which they were read or written is committed; the cache
+must be cleared whenever a transaction is rolled back.
+"""
+
+
+def _cache_key(event: Event) -> tuple[str, str, str]:
+    return (str(event.project_id), event.component_type.name, event.component_key)
+
+
+def _differs(event: Event, component: Component) -> bool:
+    return bool(
+        (event.component_name and event.component_name != component.name)
+        or (event.component_tool and event.component_tool != component.tool)
+    )
+
 
 def _get_component(event: Event) -> Optional[Component]:
     # v1 event can only have one (component type)_id
     if component_id := event.component_id:
         try:
-            component: Component = event.component_model.get_by_id(component_id)
-            return component
+            component_by_id: Component = event.component_model.get_by_id(component_id)
+            return component_by_id
         except DoesNotExist:
             LOG.warning(f"No {event.component_type} exist with id: {component_id}")
             raise
-    try:
-        project = Project.get_by_id(event.project_id)
-    except DoesNotExist:
-        LOG.warning("No project exist with project id: %s", event.project_id)
-        raise
-    try:
-        component_key = event.component_key
-        component = event.component_model.get(
-            event.component_model.key == component_key, event.component_model.project == project.id
-        )
-    except DoesNotExist:
-        return None
-
-    LOG.info("Retrieved existing component with id '%s'", component.id)
+    cache_key = _cache_key(event)
+    component: Optional[Component] = COMPONENT_CACHE.get(cache_key)
+    if component is not None and _differs(event, component):
+        # The event is about to update the component, which must not be done on a stale copy
+        COMPONENT_CACHE.invalidate(cache_key)
+        component = None
+    if component is None:
+        try:
+            project = Project.get_by_id(event.project_id)
+        except DoesNotExist:
+            LOG.warning("No project exist with project id: %s", event.project_id)
+            raise
+        try:
+            component = event.component_model.get(
+                event.component_model.key == event.component_key, event.component_model.project == project.id
+            )
+        except DoesNotExist:
+            return None
+        LOG.info("Retrieved existing component with id '%s'", component.id)
+        COMPONENT_CACHE.set(cache_key, component)
+
+    changed = False
     if (new_component_name := event.component_name) and new_component_name != component.name:
         component.name = new_component_name
+        changed = True
     if (new_component_tool := event.component_tool) and new_component_tool != component.tool:
         component.tool = new_component_tool
-    component.save()
+        changed = True
+    if changed:
+        component.save()
     return component
 
 
@@ -63,6 +107,7 @@ def _create_component(event: Event) -> Optional[Component]:
     )
     LOG.info(f"Created new {event.component_type} component with id `{component.id}`")
     JourneyService.add_component_to_matching_journeys(component)
+    COMPONENT_CACHE.set(_cache_key(event), component)
     return component
 
 
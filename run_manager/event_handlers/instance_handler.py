@@ -18,7 +18,7 @@ from common.entities import (
     RunStatus,
 )
 from common.entities.instance import InstanceStartType
-from common.entity_services import InstanceService
+from common.entity_services import InstanceService, InstanceSummaryService
 from common.events import EventHandlerBase
 from common.events.base import InstanceRef, InstanceType
 from common.events.v1 import (
@@ -80,9 +80,13 @@ class InstanceHandler(EventHandlerBase):
     def set_instance_set(self) -> None:
         if self.context.instances:
             self.context.instance_set = InstanceSet.get_or_create([ir.instance for ir in self.context.instances])
-            if self.context.run and self.context.run.instance_set_id != self.context.instance_set.id:
-                self.context.run.instance_set = self.context.instance_set
-                self.context.run.save()
+            if (run := self.context.run) and run.instance_set_id != self.context.instance_set.id:
+                prev_instance_set_id = run.instance_set_id
+                run.instance_set = self.context.instance_set
+                run.save()
+                InstanceSummaryService.update_run(
+                    run, prev_instance_set_id=prev_instance_set_id, prev_status=run.status
+                )
 
     def set_instances(self, event: Event) -> None:
         if self.context.created_run:
@@ -49,9 +49,10 @@ class OutOfSequenceInstanceHandler(EventHandlerBase):
             instances = iq.prefetch(
                 InstanceAlert.select().where(InstanceAlert.type == InstanceAlertType.OUT_OF_SEQUENCE)
             )
+            dags = JourneyService.get_compiled_dags(instance.journey_id for instance in instances)
             update_alerts = []
             for instance in instances:
-                if upstream_nodes := JourneyService.get_upstream_nodes(instance.journey, self.context.component.id):
+                if upstream_nodes := dags[instance.journey_id].upstream_of(self.context.component.id):
                     finished_runs = InstanceService.get_instance_run_counts(
                         instance,
                         end_before=self.context.run.start_time,
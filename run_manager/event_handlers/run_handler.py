@@ -2,11 +2,13 @@ __all__ = ["RunHandler"]
 
 import logging
 from typing import Optional, cast
+from uuid import UUID
 
 from peewee import DoesNotExist
 
 from common.datetime_utils import timestamp_to_datetime
 from common.entities import ComponentType, Pipeline, Run, RunStatus
+from common.entity_services import InstanceSummaryService
 from common.events import EventHandlerBase
 from common.events.internal import RunAlert
 from common.events.v1 import Event, MessageLogEvent, MetricLogEvent, RunStatusEvent, TestOutcomesEvent
@@ -45,6 +47,7 @@ class RunHandler(EventHandlerBase):
                 if RunStatus.has_run_started(event.status):
                     self.context.started_run = True
             self.context.run = run
+            prev_instance_set_id, prev_status = run.instance_set_id, run.status
 
             # If the RunStatusEvent contains expected_start_time metadata AND the expected_start_time is not yet set,
             # apply the expected_start_time to the Run instance.
@@ -71,10 +74,7 @@ class RunHandler(EventHandlerBase):
                 else:
                     update_state(run, event)
 
-                # If a new run was created it has not yet been inserted to the db, force insert it here
-                run.save(force_insert=self.context.created_run)
-            else:
-                run.save(force_insert=self.context.created_run)
+            self._save_run(run, prev_instance_set_id, prev_status)
         return True
 
     def handle_test_outcomes(self, event: TestOutcomesEvent) -> bool:
@@ -90,18 +90,23 @@ class RunHandler(EventHandlerBase):
             self.context.run = run
 
             if (run := self.context.run) is not None:
+                prev_instance_set_id, prev_status = run.instance_set_id, run.status
                 if run.status == RunStatus.PENDING.name:
                     _start_pending_run(event, run)
                     self.context.started_run = True
                 self._set_run_name(event)
-                # If a new run was created it has not yet been inserted to the db, force insert it here
-                run.save(force_insert=self.context.created_run)
+                self._save_run(run, prev_instance_set_id, prev_status)
             else:
                 raise ValueError(
                     f"{event.__class__.__name__} {event.event_id} failed to get a create a new run "
                     f"for batch-pipeline {self.context.pipeline.id}"
                 )
 
+    def _save_run(self, run: Run, prev_instance_set_id: Optional[UUID], prev_status: Optional[str]) -> None:
+        # If a new run was created it has not yet been inserted to the db, force insert it here
+        run.save(force_insert=self.context.created_run)
+        InstanceSummaryService.update_run(run, prev_instance_set_id=prev_instance_set_id, prev_status=prev_status)
+
     def _get_run(self, event: Event, pipeline: Pipeline) -> Optional[Run]:
         """
         Get an existing run instance
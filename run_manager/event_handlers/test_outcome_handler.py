@@ -5,6 +5,7 @@ from typing import cast
 from uuid import UUID
 
 from common.entities import ComponentType, Instance, InstanceAlert, InstanceAlertsComponents, InstanceAlertType, Journey
+from common.entity_services.instance_summary_service import InstanceSummaryService
 from common.entity_services.test_outcome_service import TestOutcomeService
 from common.events import EventHandlerBase
 from common.events.internal import InstanceAlert as InstanceAlertEvent
@@ -87,5 +88,9 @@ class TestOutcomeHandler(EventHandlerBase):
             run_id=run_id,
             task_id=task_id,
         )
+        if self.context.instance_set:
+            InstanceSummaryService.add_test_outcomes(
+                self.context.instance_ids, self.context.component.id, (t.status for t in event.test_outcomes)
+            )
         self.create_instance_alerts(event)
         return True
@@ -3,12 +3,14 @@ import time
 from collections import namedtuple
 from dataclasses import asdict
 from itertools import chain
-from typing import Union
+from typing import Optional, Union
 from collections.abc import Callable
 
+from confluent_kafka import TopicPartition
 from peewee import DatabaseError, InterfaceError, OperationalError
 
 from common.entities import DB
+from common.entities.instance import INSTANCE_SET_CACHE
 from common.events import to_v2
 from common.events.internal import ScheduledEvent, ScheduledInstance
 from common.events.v1 import Event
@@ -18,6 +20,7 @@ from common.kafka import (
     TOPIC_SCHEDULED_EVENTS,
     TOPIC_UNIDENTIFIED_EVENTS,
     ConsumerError,
+    KafkaMessage,
     KafkaTransactionalConsumer,
     KafkaTransactionalProducer,
     MessageError,
@@ -36,7 +39,7 @@ from run_manager.event_handlers import (
     TestOutcomeHandler,
     handle_schedule_event,
 )
-from run_manager.event_handlers.component_identifier import ComponentIdentifier
+from run_manager.event_handlers.component_identifier import COMPONENT_CACHE, ComponentIdentifier
 from run_manager.event_handlers.out_of_sequence_instance_handler import OutOfSequenceInstanceHandler
 from run_manager.event_handlers.run_unexpected_status_change_handler import RunUnexpectedStatusChangeHandler
 from run_manager.event_handlers.scheduled_instance_handler import handle_scheduled_instance_event
@@ -46,14 +49,28 @@ LOG = logging.getLogger(__name__)
 EventHandlingResult = namedtuple("EventHandlingResult", ("success", "alerts"))
 
 
+def _clear_caches() -> None:
+    """Forget the cached entities, which may have been read or written by a transaction that was rolled back."""
+    COMPONENT_CACHE.clear()
+    INSTANCE_SET_CACHE.clear()
+
+
 class RunManager:
     def __init__(
         self,
         event_consumer: KafkaTransactionalConsumer,
         event_producer: KafkaTransactionalProducer,
+        batch_size: int = 1,
+        batch_timeout: float = 0.1,
     ) -> None:
         self.event_consumer = event_consumer
         self.event_producer = event_producer
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.managers: dict[str, Callable] = {
+            TOPIC_UNIDENTIFIED_EVENTS.name: self._manage_user_event,
+            TOPIC_SCHEDULED_EVENTS.name: self._manage_schedule_event,
+        }
 
     def _handle_event(self, event: Event) -> EventHandlingResult:
         context = RunManagerContext()
@@ -127,6 +144,72 @@ class RunManager:
         for alert in alerts:
             self.event_producer.produce(TOPIC_IDENTIFIED_EVENTS, alert)
 
+    def _process_message(self, message: KafkaMessage, offsets: Optional[list[TopicPartition]] = None) -> None:
+        try:
+            # The connection is checked out of the pool for each
+            # consumed message and given back afterwards, so that
+            # stale connections are replaced. Connections are only
+            # pinged when they have been idle for a while.
+            init_db()
+            with self.event_producer.transaction(offsets), DB.atomic():
+                # This large DB transaction is trying to match the
+                # Kafka transaction. If the DB transaction fails the
+                # Kafka transaction will not be committed. It is still
+                # possible that the Kafka transaction fails after the
+                # DB transaction was committed though.
+                self.managers[message.topic](message.payload)
+        except ProducerTransactionError:
+            # if the error came from the transactional producer, let the process restart
+            # this error's base ProducerError is caught and logged below
+            _clear_caches()
+            raise
+        except (InterfaceError, OperationalError) as e:
+            # OperationalError has been seen during migrations such as adding table indexes. Catching
+            # and reraising the exception to re-consume the event. InterfaceError is related to the
+            # connection and should benefit from re-consuming too.
+            LOG.error("Database error occured: %s", e)
+            _clear_caches()
+            raise
+        except Exception:
+            LOG.exception(
+                "Error processing an event, continuing...",
+                extra={"kafka_message": asdict(message)},
+            )
+            _clear_caches()
+            self.event_consumer.commit(offsets)
+        finally:
+            try:
+                DB.close()
+            except Exception:
+                pass  # It probably wasn't open
+
+    def _process_batch(self, messages: list[KafkaMessage]) -> None:
+        """
+        Process all the messages in a single DB transaction and a single Kafka transaction.
+
+        When the batch fails for any reason other than a connection or transaction error, both transactions are rolled
+        back and the messages are processed again one by one, each committing its own offset, so that the offending
+        message is skipped without losing the others.
+        """
+        try:
+            init_db()
+            with self.event_producer.transaction(), DB.atomic():
+                for message in messages:
+                    self.managers[message.topic](message.payload)
+        except (ProducerTransactionError, InterfaceError, OperationalError):
+            _clear_caches()
+            raise
+        except Exception:
+            LOG.warning("Error processing a batch of %s events, processing them one by one", len(messages))
+            _clear_caches()
+            for message in messages:
+                self._process_message(message, [TopicPartition(message.topic, message.partition, message.offset + 1)])
+        finally:
+            try:
+                DB.close()
+            except Exception:
+                pass  # It probably wasn't open
+
     def process_events(self) -> None:
         with readiness_check_wrapper():
             init_db()
@@ -137,47 +220,11 @@ class RunManager:
                 raise NotReadyException(f"Kafka topic not ready: {TOPIC_IDENTIFIED_EVENTS.name}")
         try:
             with self.event_producer:
-                managers: dict[str, Callable] = {
-                    TOPIC_UNIDENTIFIED_EVENTS.name: self._manage_user_event,
-                    TOPIC_SCHEDULED_EVENTS.name: self._manage_schedule_event,
-                }
-                for message in self.event_consumer:
-                    try:
-                        # As long as we don't terminate on errors we need to
-                        # establish the database connection on each consumed
-                        # message to counter stale database connections. When
-                        # we terminate on errors the solution could be to
-                        # reconnect at restart which should yield the least
-                        # overhead as checking for stale connection requires
-                        # pinging the server.
-                        init_db()
-                        with self.event_producer.transaction(), DB.atomic():
-                            # This large DB transaction is trying to match the
-                            # Kafka transaction. If the DB transaction fails the
-                            # Kafka transaction will not be committed. It is still
-                            # possible that the Kafka transaction fails after the
-                            # DB transaction was committed though.
-                            managers[message.topic](message.payload)
-                    except ProducerTransactionError:
-                        # if the error came from the transactional producer, let the process restart
-                        # this error's base ProducerError is caught and logged below
-                        raise
-                    except (InterfaceError, OperationalError) as e:
-                        # OperationalError has been seen during migrations such as adding table indexes. Catching
-                        # and reraising the exception to re-consume the event. InterfaceError is related to the
-                        # connection and should benefit from re-consuming too.
-                        LOG.error("Database error occured: %s", e)
-                        raise
-                    except Exception:
-                        LOG.exception(
-                            "Error processing an event, continuing...",
-                            extra={"kafka_message": asdict(message)},
-                        )
-                        self.event_consumer.commit()
-                    finally:
-                        try:
-                            DB.close()
-                        except Exception:
-                            pass  # It probably wasn't open
+                if self.batch_size > 1:
+                    for messages in self.event_consumer.batches(self.batch_size, self.batch_timeout):
+                        self._process_batch(messages)
+                else:
+                    for message in self.event_consumer:
+                        self._process_message(message)
         except (ConsumerError, MessageError, ProducerError, DatabaseError, InterfaceError):
             LOG.exception("Error processing events, stopping...")
@@ -37,6 +37,7 @@ from common.events.v1 import (
 )
 from common.kafka import TOPIC_SCHEDULED_EVENTS, TOPIC_UNIDENTIFIED_EVENTS, KafkaMessage
 from conf import init_db
+from run_manager.event_handlers.component_identifier import COMPONENT_CACHE
 from testlib.fixtures.entities import patched_instance_set, pending_run  # noqa: F401
 from testlib.fixtures.v1_events import *
 
@@ -55,6 +56,14 @@ def compare_event_data(unidentified_event, identified_event, pipeline, run, task
         assert unidentified_event.payload.run_task_id == run_task.id
 
 
+@pytest.fixture(autouse=True)
+def clear_component_cache():
+    # Cached components refer to rows of the database of a previous test
+    COMPONENT_CACHE.clear()
+    yield
+    COMPONENT_CACHE.clear()
+
+
 @pytest.fixture
 def timestamp_now():
     return datetime.now(tz=timezone.utc)
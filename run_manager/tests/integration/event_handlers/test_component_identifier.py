@@ -1,8 +1,10 @@
+from unittest.mock import patch
+
 import pytest
 
-from common.entities import Component, JourneyDagEdge, Pipeline
+from common.entities import Component, JourneyDagEdge, Pipeline, Project
 from run_manager.context import RunManagerContext
-from run_manager.event_handlers.component_identifier import ComponentIdentifier
+from run_manager.event_handlers.component_identifier import COMPONENT_CACHE, ComponentIdentifier
 from testlib.fixtures.v1_events import *
 
 
@@ -59,3 +61,56 @@ def test_component_identifier_create_adds_to_matching_journey(run_status_event,
 
     assert Component.select().count() == 1
     assert JourneyDagEdge.select().where(JourneyDagEdge.journey == journey).count() == 1
+
+
+@pytest.mark.integration
+def test_component_identifier_cached_component(run_status_event, pipeline):
+    run_status_event.accept(ComponentIdentifier(RunManagerContext()))
+
+    context = RunManagerContext()
+    with (
+        patch.object(Project, "get_by_id") as get_project,
+        patch.object(Pipeline, "get") as get_pipeline,
+        patch.object(Pipeline, "save") as save_pipeline,
+    ):
+        run_status_event.accept(ComponentIdentifier(context))
+
+    assert context.component.id == pipeline.id
+    get_project.assert_not_called()
+    get_pipeline.assert_not_called()
+    save_pipeline.assert_not_called()
+
+
+@pytest.mark.integration
+def test_component_identifier_cached_component_updated(run_status_event, pipeline):
+    run_status_event.accept(ComponentIdentifier(RunManagerContext()))
+    run_status_event.pipeline_name = "new name"
+
+    run_status_event.accept(ComponentIdentifier(RunManagerContext()))
+
+    assert Pipeline.get().name == "new name"
+
+
+@pytest.mark.integration
+def test_component_identifier_created_component_cached(run_status_event):
+    run_status_event.accept(ComponentIdentifier(RunManagerContext()))
+
+    assert len(COMPONENT_CACHE) == 1
+    context = RunManagerContext()
+    with patch.object(Pipeline, "get") as get_pipeline:
+        run_status_event.accept(ComponentIdentifier(context))
+
+    get_pipeline.assert_not_called()
+    assert context.component.id == Pipeline.get().id
+
+
+@pytest.mark.integration
+def test_component_identifier_cached_component_differs(run_status_event, pipeline):
+    run_status_event.accept(ComponentIdentifier(RunManagerContext()))
+    Pipeline.update(description="updated description").where(Pipeline.id == pipeline.id).execute()
+    run_status_event.pipeline_name = "new name"
+
+    run_status_event.accept(ComponentIdentifier(RunManagerContext()))
+
+    assert Pipeline.get().name == "new name"
+    assert Pipeline.get().description == "updated description"
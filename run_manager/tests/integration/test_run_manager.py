@@ -1,4 +1,5 @@
 import copy
+from collections import Counter
 from uuid import uuid4
 
 import pytest
@@ -10,6 +11,8 @@ from common.entities import (
     InstanceAlert,
     InstanceAlertType,
     InstanceSet,
+    InstanceSummary,
+    InstanceSummaryKind,
     Pipeline,
     Run,
     RunAlert,
@@ -18,6 +21,7 @@ from common.entities import (
     RunTask,
 )
 from common.entities.instance import InstanceStatus
+from common.entity_services import InstanceSummaryService, SummaryKey
 from common.events.v1 import ApiRunStatus
 from common.kafka import TOPIC_DEAD_LETTER_OFFICE, TOPIC_IDENTIFIED_EVENTS
 from run_manager.context import RunManagerContext
@@ -501,3 +505,38 @@ def test_run_manager_out_of_sequence_alert_different_event_types(
     assert Pipeline.select().count() == 1
     assert Run.select().count() == 1
     assert InstanceAlert.select().where(InstanceAlert.type == InstanceAlertType.OUT_OF_SEQUENCE.name).count() == 0
+
+
+@pytest.mark.integration
+def test_run_manager_instance_summaries(
+    kafka_consumer, kafka_producer, run_status_message, test_outcomes_message, pipeline_edge
+):
+    status_started = run_status_message
+    status_started.payload.event_id = uuid4()
+    status_warning = copy.deepcopy(run_status_message)
+    status_warning.payload.event_id = uuid4()
+    status_warning.payload.status = ApiRunStatus.COMPLETED_WITH_WARNINGS.name
+    status_error = copy.deepcopy(run_status_message)
+    status_error.payload.event_id = uuid4()
+    status_error.payload.status = ApiRunStatus.FAILED.name
+    test_outcomes_message.payload.event_id = uuid4()
+    kafka_consumer.__iter__.return_value = iter((status_started, test_outcomes_message, status_warning, status_error))
+    run_manager = RunManager(kafka_consumer, kafka_producer)
+    run_manager.process_events()
+
+    instance_ids = [i.id for i in Instance.select()]
+    summaries = Counter(
+        {
+            SummaryKey(s.instance_id, s.kind, s.component_id, s.status, s.description): s.count
+            for s in InstanceSummary.select()
+            if s.count
+        }
+    )
+    kinds = {key.kind for key in summaries}
+    assert kinds == {
+        InstanceSummaryKind.RUNS,
+        InstanceSummaryKind.TESTS,
+        InstanceSummaryKind.ALERTS,
+        InstanceSummaryKind.COMPONENT_ALERTS,
+    }
+    assert summaries == InstanceSummaryService.count_summaries(instance_ids)
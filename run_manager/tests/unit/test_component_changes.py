@@ -0,0 +1,49 @@
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from common.cache import TTLCache
+from common.events.internal import ComponentChangeEvent
+from common.kafka import TOPIC_COMPONENT_CHANGES, KafkaMessage
+from run_manager.component_changes import ComponentChangesListener
+
+
+@pytest.mark.unit
+def test_component_changes_invalidate_component():
+    component_id = uuid4()
+    cache = TTLCache(max_size=10, ttl=60)
+    cache.set(("p", "BATCH_PIPELINE", "a"), Mock(id=component_id))
+    cache.set(("p", "BATCH_PIPELINE", "b"), Mock(id=uuid4()))
+    listener = ComponentChangesListener(Mock(), cache)
+
+    listener.handle(
+        KafkaMessage(
+            payload=ComponentChangeEvent(project_id=uuid4(), component_id=component_id),
+            topic=TOPIC_COMPONENT_CHANGES.name,
+            partition=0,
+            offset=0,
+            headers={},
+        )
+    )
+
+    assert cache.get(("p", "BATCH_PIPELINE", "a")) is None
+    assert cache.get(("p", "BATCH_PIPELINE", "b")) is not None
+
+
+@pytest.mark.unit
+def test_component_changes_ignore_other_payloads():
+    cache = Mock()
+    listener = ComponentChangesListener(Mock(), cache)
+
+    listener.handle(
+        KafkaMessage(
+            payload={"component_id": str(uuid4())},
+            topic=TOPIC_COMPONENT_CHANGES.name,
+            partition=0,
+            offset=0,
+            headers={},
+        )
+    )
+
+    cache.invalidate_where.assert_not_called()
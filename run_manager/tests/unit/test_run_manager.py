@@ -1,9 +1,12 @@
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock, call
 
 import pytest
+from confluent_kafka import TopicPartition
 from peewee import InterfaceError, OperationalError
 
-from common.kafka import DeserializationError, ProducerTransactionError
+from common.kafka import TOPIC_UNIDENTIFIED_EVENTS, DeserializationError, KafkaMessage, ProducerTransactionError
+from common.entities.instance import INSTANCE_SET_CACHE
+from run_manager.event_handlers.component_identifier import COMPONENT_CACHE
 from run_manager.run_manager import RunManager
 
 
@@ -45,3 +48,71 @@ def test_run_manager_kafka_transaction_exception(
     kafka_producer.transaction = Mock(side_effect=ProducerTransactionError)
     rm = RunManager(kafka_consumer, kafka_producer)
     rm.process_events()  # Exception caught and return normally
+
+
+@pytest.fixture
+def batch_consumer(kafka_consumer, kafka_message):
+    second_message = KafkaMessage(
+        payload=kafka_message.payload, topic=kafka_message.topic, partition=2, offset=2, headers={}
+    )
+    kafka_consumer.batches.return_value = iter(([kafka_message, second_message],))
+    return kafka_consumer
+
+
+@pytest.fixture
+def patch_db_atomic(patch_db):
+    patch_db.atomic = MagicMock()
+    return patch_db
+
+
+@pytest.mark.unit
+def test_run_manager_batch_single_transaction(kafka_producer, batch_consumer, patch_db_atomic):
+    rm = RunManager(batch_consumer, kafka_producer, batch_size=10)
+    manage_user_event = Mock()
+    rm.managers[TOPIC_UNIDENTIFIED_EVENTS.name] = manage_user_event
+    rm.process_events()
+
+    assert manage_user_event.call_count == 2
+    kafka_producer.transaction.assert_called_once_with()
+    patch_db_atomic.atomic.assert_called_once()
+    batch_consumer.batches.assert_called_once_with(10, rm.batch_timeout)
+
+
+@pytest.mark.unit
+def test_run_manager_batch_isolates_failed_message(kafka_producer, batch_consumer, patch_db_atomic):
+    rm = RunManager(batch_consumer, kafka_producer, batch_size=10)
+    # Fails on the first message of the batch and when retrying it on its own
+    manage_user_event = Mock(side_effect=[None, ValueError, ValueError, None])
+    rm.managers[TOPIC_UNIDENTIFIED_EVENTS.name] = manage_user_event
+    rm.process_events()
+
+    assert manage_user_event.call_count == 4
+    assert kafka_producer.transaction.call_args_list == [
+        call(),
+        call([TopicPartition(TOPIC_UNIDENTIFIED_EVENTS.name, 2, 2)]),
+        call([TopicPartition(TOPIC_UNIDENTIFIED_EVENTS.name, 2, 3)]),
+    ]
+    # Only the failed message is skipped
+    batch_consumer.commit.assert_called_once_with([TopicPartition(TOPIC_UNIDENTIFIED_EVENTS.name, 2, 2)])
+
+
+@pytest.mark.unit
+def test_run_manager_batch_failure_clears_caches(kafka_producer, batch_consumer, patch_db_atomic):
+    COMPONENT_CACHE.set(("project", "BATCH_PIPELINE", "key"), Mock())
+    INSTANCE_SET_CACHE.set("digest", Mock())
+    rm = RunManager(batch_consumer, kafka_producer, batch_size=10)
+    rm.managers[TOPIC_UNIDENTIFIED_EVENTS.name] = Mock(side_effect=[None, ValueError, None, None])
+    rm.process_events()
+
+    assert len(COMPONENT_CACHE) == 0
+    assert len(INSTANCE_SET_CACHE) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("exception", (OperationalError, InterfaceError))
+def test_run_manager_batch_peewee_exception(kafka_producer, batch_consumer, patch_db, exception):
+    patch_db.atomic = Mock(side_effect=exception)
+    rm = RunManager(batch_consumer, kafka_producer, batch_size=10)
+    rm.process_events()  # Exception caught and return normally
+    kafka_producer.transaction.assert_called_once_with()  # Not retried one by one
+    batch_consumer.commit.assert_not_called()
@@ -1,9 +1,16 @@
 import logging
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
+from functools import reduce
+from operator import or_
+from typing import Optional
 
 from apscheduler.triggers.interval import IntervalTrigger
+from peewee import chunked, fn
 
-from common.entities import Project, Agent
+from common.constants import BATCH_SIZE
+from common.entities import DB, Project, Agent
 from common.entities.agent import AgentStatus
 from common.events.internal.system import AgentStatusChangeEvent
 from common.kafka import TOPIC_IDENTIFIED_EVENTS
@@ -13,8 +20,10 @@ from scheduler.schedule_source import ScheduleSource
 LOG = logging.getLogger(__name__)
 
 
-def _get_agent_status(check_interval_seconds: int, latest_heartbeat: datetime) -> AgentStatus:
-    lateness = (datetime.now(tz=timezone.utc) - latest_heartbeat).total_seconds()
+def _get_agent_status(
+    check_interval_seconds: int, latest_heartbeat: datetime, now: Optional[datetime] = None
+) -> AgentStatus:
+    lateness = ((now or datetime.now(tz=timezone.utc)) - latest_heartbeat).total_seconds()
     if lateness > check_interval_seconds * settings.AGENT_STATUS_CHECK_OFFLINE_FACTOR:
         return AgentStatus.OFFLINE
     elif lateness > check_interval_seconds * settings.AGENT_STATUS_CHECK_UNHEALTHY_FACTOR:
@@ -23,60 +32,139 @@ def _get_agent_status(check_interval_seconds: int, latest_heartbeat: datetime) -
         return AgentStatus.ONLINE
 
 
-def _update_agent_status(agent: Agent, status: AgentStatus) -> bool:
-    """'Atomically' update a given agent instance status without changing the instance itself."""
-    count = (
-        Agent.update(status=status)
-        .where(
-            Agent.id == agent.id,
-            # Adding the latest_heartbeat timestamp to the 'where' clause to prevent the race condition where we
-            # have just received a heartbeat for an agent that is about to having its status degraded.
-            Agent.latest_heartbeat == agent.latest_heartbeat,
+def _get_status_threshold(check_interval_seconds: int, status: AgentStatus, now: datetime) -> datetime:
+    """The latest heartbeat an agent may have to be given the status, as evaluated by `_get_agent_status`."""
+    factor = {
+        AgentStatus.OFFLINE: settings.AGENT_STATUS_CHECK_OFFLINE_FACTOR,
+        AgentStatus.UNHEALTHY: settings.AGENT_STATUS_CHECK_UNHEALTHY_FACTOR,
+    }.get(status, 0)
+    return now - timedelta(seconds=check_interval_seconds * factor)
+
+
+def _update_agents_status(
+    agents: list[Agent], check_interval_seconds: int, status: AgentStatus, now: datetime
+) -> list[Agent]:
+    """
+    'Atomically' update the status of the given agents, which share the same check interval, without changing the
+    instances themselves. Returns the agents that were updated.
+    """
+    # Limiting the update to the agents whose latest heartbeat still warrants the new status prevents the race
+    # condition where we have just received a heartbeat for an agent that is about to having its status degraded.
+    threshold = _get_status_threshold(check_interval_seconds, status, now)
+    updated: list[Agent] = []
+    for batch in chunked(agents, BATCH_SIZE):
+        batch_ids = [agent.id for agent in batch]
+        count = (
+            Agent.update(status=status).where(Agent.id.in_(batch_ids), Agent.latest_heartbeat <= threshold).execute()
         )
-        .execute()
+        if count == len(batch):
+            updated.extend(batch)
+        elif count:
+            updated_ids = {
+                agent_id
+                for (agent_id,) in Agent.select(Agent.id)
+                .where(Agent.id.in_(batch_ids), Agent.status == status, Agent.latest_heartbeat <= threshold)
+                .tuples()
+            }
+            updated.extend(agent for agent in batch if agent.id in updated_ids)
+    return updated
+
+
+def _get_sweep_interval(min_check_interval_seconds: Optional[int]) -> int:
+    """
+    The interval at which to check the agents, a fraction of the shortest check interval of the projects, so that the
+    agents of every project are checked often enough relative to their check interval.
+    """
+    if min_check_interval_seconds is None:
+        return int(settings.AGENT_STATUS_CHECK_SWEEP_INTERVAL_SECONDS)
+    interval = int(min_check_interval_seconds * settings.AGENT_STATUS_CHECK_SWEEP_FACTOR)
+    return min(
+        max(interval, int(settings.AGENT_STATUS_CHECK_MIN_SWEEP_INTERVAL_SECONDS)),
+        int(settings.AGENT_STATUS_CHECK_SWEEP_INTERVAL_SECONDS),
     )
-    return bool(count == 1)
 
 
+@dataclass(frozen=True)
 class AgentCheckSchedule:
-    def __init__(self, project: Project):
-        self.project = project
+    """The single schedule of the agent status sweep, which checks the agents of all the projects."""
+
+    interval: int
+    """Seconds between sweeps, see `_get_sweep_interval`."""
 
     @property
     def id(self) -> str:
-        # We add the check interval to the unique identifier to force the schedule to be replaced when the interval
+        # We add the sweep interval to the unique identifier to force the schedule to be replaced when the interval
         # changes
-        return f"{self.project.id}-{self.project.agent_check_interval}"
+        return f"agent-sweep-{self.interval}"
 
 
 class AgentCheckScheduleSource(ScheduleSource[AgentCheckSchedule]):
+    """
+    Periodically updates the status of the agents whose latest heartbeat is late, according to the agent check interval
+    of their project.
+
+    Instead of a job per project, a single job sweeps the agents of all the projects: the late agents are selected in a
+    single query, bucketed by the check intervals in use, and their status is updated with one statement per check
+    interval and new status. The sweep interval follows the shortest check interval in use, and the job is replaced
+    when it changes.
+    """
+
     source_name = "agent_status"
     kafka_topic = TOPIC_IDENTIFIED_EVENTS
 
     def _get_schedules(self) -> list[AgentCheckSchedule]:
-        return [AgentCheckSchedule(p) for p in Project.select()]
+        min_check_interval = Project.select(fn.MIN(Project.agent_check_interval)).scalar()
+        return [AgentCheckSchedule(_get_sweep_interval(min_check_interval))]
 
     def _create_and_add_job(self, schedule: AgentCheckSchedule) -> None:
-        self.add_job(
-            self._check_agents_are_online,
-            schedule.id,
-            IntervalTrigger(seconds=schedule.project.agent_check_interval),
-            {"project": schedule.project},
+        self.add_job(self._check_agents_are_online, schedule.id, IntervalTrigger(seconds=schedule.interval), {})
+
+    def _check_agents_are_online(self) -> None:
+        now = datetime.now(tz=timezone.utc)
+        check_intervals = [i for (i,) in Project.select(Project.agent_check_interval).distinct().tuples()]
+        if not check_intervals:
+            return
+
+        late_agents = (
+            Agent.select(Agent, Project.id, Project.agent_check_interval)
+            .join(Project)
+            .where(
+                # Offline agents can only get back online with a heartbeat
+                Agent.status != AgentStatus.OFFLINE,
+                reduce(
+                    or_,
+                    (
+                        (Project.agent_check_interval == interval)
+                        & (Agent.latest_heartbeat < now - timedelta(seconds=interval))
+                        for interval in check_intervals
+                    ),
+                ),
+            )
         )
-
-    def _check_agents_are_online(self, project: Project) -> None:
-        check_threshold = datetime.now(tz=timezone.utc) - timedelta(seconds=project.agent_check_interval)
-        for agent in Agent.select().where(
-            Agent.project == project.id,
-            Agent.latest_heartbeat < check_threshold,
-        ):
-            new_status = _get_agent_status(project.agent_check_interval, agent.latest_heartbeat)
+        changes: defaultdict[tuple[int, AgentStatus], list[Agent]] = defaultdict(list)
+        for agent in late_agents:
+            check_interval = agent.project.agent_check_interval
+            new_status = _get_agent_status(check_interval, agent.latest_heartbeat, now)
             if agent.status == new_status:
                 LOG.debug("Agent '%s' status did not change: %s", agent.id, agent.status)
             else:
                 LOG.info("Agent '%s' status changed from %s to %s", agent.id, agent.status, new_status)
-                if _update_agent_status(agent, new_status) and new_status == AgentStatus.OFFLINE:
-                    self._send_agent_status_change_event(agent, new_status)
+                changes[(check_interval, new_status)].append(agent)
+
+        updated_count = 0
+        offline_agents: list[Agent] = []
+        with DB.atomic():
+            for (check_interval, new_status), agents in changes.items():
+                updated = _update_agents_status(agents, check_interval, new_status, now)
+                updated_count += len(updated)
+                if new_status == AgentStatus.OFFLINE:
+                    offline_agents.extend(updated)
+
+        # The events are produced once the statuses are committed, and are delivered in batches by the producer
+        for agent in offline_agents:
+            self._send_agent_status_change_event(agent, AgentStatus.OFFLINE)
+        if changes:
+            LOG.info("Updated the status of %s agents, %s of them went offline", updated_count, len(offline_agents))
 
     def _send_agent_status_change_event(self, agent: Agent, new_status: AgentStatus) -> None:
         event = AgentStatusChangeEvent(
@@ -1,11 +1,13 @@
 import logging
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 
 from apscheduler.triggers.cron import CronTrigger
+from peewee import chunked
 
 from common.apscheduler_extensions import DelayedTrigger, fix_weekdays
+from common.constants import BATCH_SIZE
 from common.entities import Schedule, ScheduleExpectation
 from common.events.enums import ScheduleType
 from common.events.internal import ScheduledEvent
@@ -22,6 +24,16 @@ class ComponentScheduleSource(ScheduleSource[Schedule]):
     def _get_schedules(self) -> list[Schedule]:
         return list(Schedule.select())
 
+    def _get_schedule_stamps(self) -> dict[str, Any]:
+        query = Schedule.select(Schedule.id, Schedule.updated_on)
+        return {str(schedule_id): updated_on for schedule_id, updated_on in query.tuples()}
+
+    def _get_schedules_by_id(self, schedule_ids: set[str]) -> list[Schedule]:
+        schedules: list[Schedule] = []
+        for batch in chunked(schedule_ids, BATCH_SIZE):
+            schedules.extend(Schedule.select().where(Schedule.id.in_(batch)))
+        return schedules
+
     def _produce_event(
         self,
         run_time: datetime,
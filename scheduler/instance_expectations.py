@@ -1,9 +1,12 @@
 import logging
 from datetime import datetime
+from typing import Any
 
 from apscheduler.triggers.cron import CronTrigger
+from peewee import chunked
 
 from common.apscheduler_extensions import fix_weekdays
+from common.constants import BATCH_SIZE
 from common.entities import InstanceRule, InstanceRuleAction
 from common.events.internal.scheduled_instance import ScheduledInstance
 from common.kafka import TOPIC_SCHEDULED_EVENTS
@@ -19,6 +22,20 @@ class InstanceScheduleSource(ScheduleSource[InstanceRule]):
     def _get_schedules(self) -> list[InstanceRule]:
         return list(InstanceRule.select().where(InstanceRule.expression.is_null(False)))
 
+    def _get_schedule_stamps(self) -> dict[str, Any]:
+        query = InstanceRule.select(InstanceRule.id, InstanceRule.updated_on).where(
+            InstanceRule.expression.is_null(False)
+        )
+        return {str(rule_id): updated_on for rule_id, updated_on in query.tuples()}
+
+    def _get_schedules_by_id(self, schedule_ids: set[str]) -> list[InstanceRule]:
+        rules: list[InstanceRule] = []
+        for batch in chunked(schedule_ids, BATCH_SIZE):
+            rules.extend(
+                InstanceRule.select().where(InstanceRule.id.in_(batch), InstanceRule.expression.is_null(False))
+            )
+        return rules
+
     def _produce_event(
         self,
         run_time: datetime,
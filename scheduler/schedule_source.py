@@ -1,13 +1,15 @@
-__all__ = ["ScheduleSource", "RunTimeExecutor"]
+__all__ = ["ScheduleSource", "RunTimeExecutor", "SyncStats"]
 
 import logging
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Optional, Protocol, Generic, TypeVar
+from time import monotonic
+from typing import Any, Generic, NamedTuple, Optional, Protocol, TypeVar
 from collections.abc import Callable
 
 from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.job import Job
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.schedulers.base import BaseScheduler
 from apscheduler.triggers.base import BaseTrigger
@@ -33,6 +35,18 @@ class RunTimeExecutor(ThreadPoolExecutor):
         return super().submit_job(job, run_times)
 
 
+class SyncStats(NamedTuple):
+    schedules: int
+    """Number of schedules in the jobstore after the sync."""
+    jobs: int
+    added: int
+    replaced: int
+    """Number of schedules whose jobs were recreated because the schedule changed."""
+    removed: int
+    duration: float
+    """Time, in seconds, taken by the sync."""
+
+
 class Schedule(Protocol):
     @property
     def id(self) -> str: ...
@@ -52,6 +66,9 @@ class ScheduleSource(Generic[ST]):
     ):
         self.scheduler = scheduler
         self.event_producer = event_producer
+        self.sync_stats: Optional[SyncStats] = None
+        self._synced_stamps: dict[str, Any] = {}
+        self._jobs_by_sched_id: defaultdict[str, set[str]] = defaultdict(set)
         self.scheduler.add_jobstore(MemoryJobStore(), self.jobstore_name)
         self.scheduler.add_executor(RunTimeExecutor(), self.executor_name)
         self.scheduler.add_job(self.update, trigger=IntervalTrigger(seconds=update_interval))
@@ -66,7 +83,7 @@ class ScheduleSource(Generic[ST]):
         return self.source_name
 
     def add_job(self, func: Callable, job_id: str, trigger: BaseTrigger, kwargs: Optional[dict[str, Any]]) -> Job:
-        return self.scheduler.add_job(
+        job = self.scheduler.add_job(
             func,
             id=job_id,
             trigger=trigger,
@@ -74,37 +91,67 @@ class ScheduleSource(Generic[ST]):
             jobstore=self.jobstore_name,
             executor=self.executor_name,
         )
+        sched_id, _, _ = job_id.partition(":")
+        self._jobs_by_sched_id[sched_id].add(job_id)
+        return job
 
     def update(self) -> None:
-        """Sync scheduler `jobstore` data with db data"""
-        LOG.debug("Started updating '%s' jobstore", self.jobstore_name)
+        """
+        Sync scheduler `jobstore` data with db data.
 
-        current_jobs = {j.id for j in self.scheduler.get_jobs(self.jobstore_name)}
-        current_schedules = self._get_schedules()
-
-        jobs_by_sched_id = defaultdict(list)
-        for job_id in current_jobs:
-            sched_id, _, _ = job_id.partition(":")
-            jobs_by_sched_id[sched_id].append(job_id)
-
-        LOG.debug(
-            "Found %d jobs from %d schedules and %s schedules from the DB",
-            len(current_jobs),
-            len(jobs_by_sched_id),
-            len(current_schedules),
+        Only the id and change stamp of the schedules are read on every sync. The jobs of the schedules that are gone
+        are removed, and only the schedules that are new or whose stamp changed are fully loaded and (re)created.
+        """
+        LOG.debug("Started updating '%s' jobstore", self.jobstore_name)
+        started = monotonic()
+
+        current_stamps = self._get_schedule_stamps()
+        removed = self._synced_stamps.keys() - current_stamps.keys()
+        changed = {
+            sched_id
+            for sched_id, stamp in current_stamps.items()
+            if sched_id not in self._synced_stamps or self._synced_stamps[sched_id] != stamp
+        }
+        replaced = len(changed & self._synced_stamps.keys())
+
+        for sched_id in removed:
+            self._remove_jobs(sched_id)
+            del self._synced_stamps[sched_id]
+
+        if changed:
+            for sched in self._get_schedules_by_id(changed):
+                sched_id = str(sched.id)
+                if sched_id in self._synced_stamps:
+                    LOG.info("Replacing '%s' ID '%s' in '%s' store", type(sched).__name__, sched_id, self.jobstore_name)
+                else:
+                    LOG.info("Adding '%s' ID '%s' into '%s' store", type(sched).__name__, sched_id, self.jobstore_name)
+                # Jobs left behind by a schedule that failed to be added are also cleared here
+                self._remove_jobs(sched_id)
+                self._create_and_add_job(sched)
+                self._synced_stamps[sched_id] = current_stamps[sched_id]
+
+        self.sync_stats = SyncStats(
+            schedules=len(self._synced_stamps),
+            jobs=sum(len(job_ids) for job_ids in self._jobs_by_sched_id.values()),
+            added=len(changed) - replaced,
+            replaced=replaced,
+            removed=len(removed),
+            duration=monotonic() - started,
+        )
+        LOG.log(
+            logging.INFO if changed or removed else logging.DEBUG,
+            "Completed updating '%s' jobstore: %s",
+            self.jobstore_name,
+            self.sync_stats._asdict(),
         )
 
-        for sched_id in jobs_by_sched_id.keys() - {str(s.id) for s in current_schedules}:
-            for job_id in jobs_by_sched_id[sched_id]:
-                LOG.info("Removing job ID '%s' from '%s' store", job_id, self.jobstore_name)
+    def _remove_jobs(self, sched_id: str) -> None:
+        for job_id in self._jobs_by_sched_id.pop(sched_id, ()):
+            LOG.info("Removing job ID '%s' from '%s' store", job_id, self.jobstore_name)
+            try:
                 self.scheduler.remove_job(job_id, jobstore=self.jobstore_name)
-
-        new_schedules = [s for s in current_schedules if str(s.id) not in list(jobs_by_sched_id.keys())]
-        for sched in new_schedules:
-            LOG.info("Adding '%s' ID '%s' into '%s' store", type(sched).__name__, sched.id, self.jobstore_name)
-            self._create_and_add_job(sched)
-
-        LOG.debug("Completed updating '%s' jobstore", self.jobstore_name)
+            except JobLookupError:
+                LOG.debug("Job ID '%s' was already gone from '%s' store", job_id, self.jobstore_name)
 
     def _create_and_add_job(self, schedule: ST) -> None:
         """Create and add new scheduler job(s) based on schedule expectations or instance rule"""
@@ -113,3 +160,16 @@ class ScheduleSource(Generic[ST]):
     def _get_schedules(self) -> list[ST]:
         """Retrieve schedules from database"""
         raise NotImplementedError
+
+    def _get_schedule_stamps(self) -> dict[str, Any]:
+        """
+        Retrieve the id of every schedule along with a value that changes whenever the schedule changes.
+
+        Sources backed by a table should only read the id and `updated_on` columns. The default loads all the schedules
+        and never reports changes, which only suits sources with a handful of immutable schedules.
+        """
+        return {str(s.id): None for s in self._get_schedules()}
+
+    def _get_schedules_by_id(self, schedule_ids: set[str]) -> list[ST]:
+        """Retrieve the given schedules from database"""
+        return [s for s in self._get_schedules() if str(s.id) in schedule_ids]
@@ -1,26 +1,32 @@
 from datetime import datetime, timezone, timedelta
-from unittest.mock import patch
 
 import pytest
 
-from common.entities import Agent
+from common.entities import Agent, Project
 from common.entities.agent import AgentStatus
-from scheduler.agent_check import _update_agent_status
+from conf import settings
+from scheduler.agent_check import AgentCheckSchedule, _update_agents_status
 
 from testlib.fixtures.entities import *
 
 
+def _create_agent(project, elapsed_time, status=AgentStatus.ONLINE):
+    return Agent.create(
+        project=project,
+        key=f"ag_{elapsed_time}_{status.name}",
+        tool="tool",
+        version="vTest",
+        status=status,
+        latest_heartbeat=datetime.now(tz=timezone.utc) - timedelta(seconds=elapsed_time),
+    )
+
+
 @pytest.fixture
 def agents(project):
+    project.agent_check_interval = 30
+    project.save()
     return [
-        Agent.create(
-            project=project,
-            key=f"ag_{elapsed_time}",
-            tool="tool",
-            version="vTest",
-            status=AgentStatus.ONLINE,
-            latest_heartbeat=datetime.now(tz=timezone.utc) - timedelta(seconds=elapsed_time),
-        )
+        _create_agent(project, elapsed_time)
         for elapsed_time in (
             25,  # Below the checking threshold
             32,  # Online
@@ -30,55 +36,86 @@ def agents(project):
     ]
 
 
+@pytest.fixture
+def project_2(organization):
+    return Project.create(name="P2", organization=organization, active=True, agent_check_interval=60)
+
+
 @pytest.mark.integration
-def test_check_agents_are_online(project, agents, agent_source):
-    with patch("scheduler.agent_check._update_agent_status") as update_mock:
-        agent_source._check_agents_are_online(project)
+def test_check_agents_are_online(project, project_2, agents, agent_source, event_producer_mock):
+    agents_2 = [
+        _create_agent(project_2, 90),  # Online
+        _create_agent(project_2, 170, AgentStatus.UNHEALTHY),  # Unhealthy, unchanged
+        _create_agent(project_2, 250, AgentStatus.UNHEALTHY),  # Offline
+        _create_agent(project_2, 900, AgentStatus.OFFLINE),  # Offline, unchanged
+    ]
+
+    agent_source._check_agents_are_online()
 
-    assert update_mock.call_count == 2
-    assert update_mock.call_args_list[0][0][1] == AgentStatus.UNHEALTHY
-    assert update_mock.call_args_list[1][0][1] == AgentStatus.OFFLINE
+    statuses = {a.id: a.status for a in Agent.select()}
+    assert [statuses[a.id] for a in agents] == [
+        AgentStatus.ONLINE,
+        AgentStatus.ONLINE,
+        AgentStatus.UNHEALTHY,
+        AgentStatus.OFFLINE,
+    ]
+    assert [statuses[a.id] for a in agents_2] == [
+        AgentStatus.ONLINE,
+        AgentStatus.UNHEALTHY,
+        AgentStatus.OFFLINE,
+        AgentStatus.OFFLINE,
+    ]
+    events = [call.args[1] for call in event_producer_mock.produce.call_args_list]
+    assert {(e.agent_id, e.project_id, e.previous_status, e.current_status) for e in events} == {
+        (agents[3].id, project.id, AgentStatus.ONLINE, AgentStatus.OFFLINE),
+        (agents_2[2].id, project_2.id, AgentStatus.UNHEALTHY, AgentStatus.OFFLINE),
+    }
 
 
 @pytest.mark.integration
-def test_update_agent_status_ok(agent_2):
-    new_status = AgentStatus.UNHEALTHY
+def test_check_agents_are_online_no_projects(agent_source, event_producer_mock):
+    agent_source._check_agents_are_online()
 
-    ret = _update_agent_status(agent_2, new_status)
+    event_producer_mock.produce.assert_not_called()
 
-    assert ret, "_update_agent_status should return True on success"
-    agent_from_db = Agent.get(Agent.id == agent_2.id)
-    assert agent_from_db.status == new_status
+
+@pytest.mark.integration
+def test_sweep_follows_shortest_check_interval(project, project_2, agent_source):
+    project.agent_check_interval = 120
+    project.save()
+    assert agent_source._get_schedules() == [AgentCheckSchedule(6)]
+
+    project_2.delete_instance()
+    assert agent_source._get_schedules() == [AgentCheckSchedule(12)]
+
+
+@pytest.mark.integration
+def test_single_schedule_without_projects(agent_source):
+    assert agent_source._get_schedules() == [AgentCheckSchedule(settings.AGENT_STATUS_CHECK_SWEEP_INTERVAL_SECONDS)]
 
 
 @pytest.mark.integration
-def test_update_agent_status_blocked(agent_2):
+def test_update_agents_status_ok(agent_2):
     new_status = AgentStatus.UNHEALTHY
-    current_status = agent_2.status
-    Agent.update(latest_heartbeat=agent_2.latest_heartbeat + timedelta(minutes=3)).execute()
+    now = agent_2.latest_heartbeat + timedelta(minutes=30)
 
-    ret = _update_agent_status(agent_2, new_status)
+    updated = _update_agents_status([agent_2], 300, new_status, now)
 
-    assert not ret, "_update_agent_status should return False when blocked"
+    assert updated == [agent_2]
     agent_from_db = Agent.get(Agent.id == agent_2.id)
-    assert agent_from_db.status == current_status
+    assert agent_from_db.status == new_status
 
 
 @pytest.mark.integration
-def test_id_changes_when_interval_changes(agent_source, project):
-    schedules_1 = agent_source._get_schedules()
-    id_list_1 = [s.id for s in schedules_1]
-
-    schedules_2 = agent_source._get_schedules()
-    id_list_2 = [s.id for s in schedules_2]
-
-    project.agent_check_interval += 10
-    project.save()
+def test_update_agents_status_blocked(agent_2, project):
+    new_status = AgentStatus.UNHEALTHY
+    current_status = agent_2.status
+    now = agent_2.latest_heartbeat + timedelta(minutes=30)
+    agent_3 = _create_agent(project, 3600)
+    Agent.update(latest_heartbeat=now - timedelta(minutes=3)).where(Agent.id == agent_2.id).execute()
 
-    schedules_3 = agent_source._get_schedules()
-    id_list_3 = [s.id for s in schedules_3]
+    updated = _update_agents_status([agent_2, agent_3], 300, new_status, now)
 
-    assert len(id_list_1) == 1
-    assert len(id_list_3) == 1
-    assert id_list_1 == id_list_2
-    assert id_list_3 != id_list_1
+    assert updated == [agent_3]
+    assert Agent.get(Agent.id == agent_2.id).status == current_status
+    assert Agent.get(Agent.id == agent_3.id).status == new_status
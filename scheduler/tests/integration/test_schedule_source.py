@@ -121,6 +121,26 @@ def test_component_source_update(scheduler, component_source, pipeline):
     assert len(scheduler.get_jobs(component_source.jobstore_name)) == 1
 
 
+@pytest.mark.integration
+def test_component_source_update_changed_schedule(scheduler, component_source, pipeline):
+    s1 = create_schedule(pipeline, expectation=ScheduleExpectation.BATCH_PIPELINE_END_TIME.value)
+    component_source.update()
+    (job,) = scheduler.get_jobs(component_source.jobstore_name)
+    assert component_source.sync_stats.added == 1
+
+    # Nothing changed, the job is left untouched
+    component_source.update()
+    assert scheduler.get_jobs(component_source.jobstore_name) == [job]
+    assert component_source.sync_stats[1:5] == (1, 0, 0, 0)
+
+    Schedule.update(schedule="0 * * * *").where(Schedule.id == s1.id).execute()
+    component_source.update()
+    (new_job,) = scheduler.get_jobs(component_source.jobstore_name)
+    assert str(new_job.trigger) != str(job.trigger)
+    assert component_source.sync_stats.replaced == 1
+    assert component_source.sync_stats.schedules == 1
+
+
 @pytest.mark.integration
 def test_instance_source_empty_expression_no_update(scheduler, instance_rule_source, journey, pipeline):
     _ = InstanceRule.create(journey=journey, action=InstanceRuleAction.END, batch_pipeline_id=pipeline.id)
@@ -1,33 +1,45 @@
-import uuid
 from datetime import datetime, timezone, timedelta
 from unittest.mock import patch
 
 import pytest
 from apscheduler.triggers.interval import IntervalTrigger
 
-from common.entities import Project
 from common.entities.agent import AgentStatus
-from scheduler.agent_check import _get_agent_status, AgentCheckSchedule
+from conf import settings
+from scheduler.agent_check import _get_agent_status, _get_status_threshold, _get_sweep_interval, AgentCheckSchedule
 
 CHECK_INTERVAL = 100
 
 
 @pytest.mark.unit
 def test_add_job(agent_source):
-    schedule = AgentCheckSchedule(Project(id=uuid.uuid4(), agent_status_check_interval=300))
+    schedule = AgentCheckSchedule(12)
 
     with patch.object(agent_source, "add_job") as add_mock:
         agent_source._create_and_add_job(schedule)
 
-    print(add_mock.call_args_list)
-
     add_mock.assert_called_once()
     args = add_mock.call_args_list[0][0]
     assert args[0] == agent_source._check_agents_are_online
-    assert args[1] == f"{schedule.project.id}-300"
+    assert args[1] == "agent-sweep-12"
     assert isinstance(args[2], IntervalTrigger)
-    assert args[2].interval == timedelta(seconds=300)
-    assert args[3] == {"project": schedule.project}
+    assert args[2].interval == timedelta(seconds=12)
+    assert args[3] == {}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "min_check_interval, expected_interval",
+    [
+        (None, settings.AGENT_STATUS_CHECK_SWEEP_INTERVAL_SECONDS),
+        (10, settings.AGENT_STATUS_CHECK_MIN_SWEEP_INTERVAL_SECONDS),
+        (60, 6),
+        (120, 12),
+        (3600, settings.AGENT_STATUS_CHECK_SWEEP_INTERVAL_SECONDS),
+    ],
+)
+def test_get_sweep_interval(min_check_interval, expected_interval):
+    assert _get_sweep_interval(min_check_interval) == expected_interval
 
 
 @pytest.mark.unit
@@ -45,3 +57,13 @@ def test_add_job(agent_source):
 def test_get_agent_status(elapsed_time, expected_status):
     latest_heartbeat = datetime.now(tz=timezone.utc) - timedelta(seconds=elapsed_time)
     assert _get_agent_status(CHECK_INTERVAL, latest_heartbeat) == expected_status
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("status", list(AgentStatus))
+@pytest.mark.parametrize("elapsed_time", [1, 199, 200, 201, 399, 400, 401, 900])
+def test_get_status_threshold(status, elapsed_time):
+    now = datetime.now(tz=timezone.utc)
+    latest_heartbeat = now - timedelta(seconds=elapsed_time)
+    if _get_agent_status(CHECK_INTERVAL, latest_heartbeat, now) == status:
+        assert latest_heartbeat <= _get_status_threshold(CHECK_INTERVAL, status, now)
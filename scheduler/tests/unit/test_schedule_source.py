@@ -58,6 +58,48 @@ def test_schedule_source_add_job(schedule_source, scheduler):
     )
 
 
+class StampedScheduleSource(ScheduleSource):
+    source_name = "stamped"
+
+    def __init__(self, *args, **kwargs):
+        self.stamps = {}
+        self.created = []
+        super().__init__(*args, **kwargs)
+
+    def _create_and_add_job(self, schedule):
+        self.created.append(schedule.id)
+        self.add_job(Mock(), f"{schedule.id}:a", Mock(), None)
+        self.add_job(Mock(), f"{schedule.id}:b", Mock(), None)
+
+    def _get_schedule_stamps(self):
+        return dict(self.stamps)
+
+    def _get_schedules_by_id(self, schedule_ids):
+        return [Mock(id=sched_id) for sched_id in sorted(schedule_ids)]
+
+
+@pytest.mark.unit
+def test_schedule_source_update_diffs_stamps(scheduler, event_producer_mock):
+    source = StampedScheduleSource(scheduler, event_producer_mock)
+    assert source.sync_stats == (0, 0, 0, 0, 0, source.sync_stats.duration)
+
+    source.stamps = {"s1": 1, "s2": 1, "s3": 1}
+    source.update()
+    assert source.created == ["s1", "s2", "s3"]
+    assert source.sync_stats[:5] == (3, 6, 3, 0, 0)
+
+    source.created.clear()
+    source.update()
+    assert source.created == []
+    scheduler.remove_job.assert_not_called()
+
+    source.stamps = {"s2": 2, "s3": 1, "s4": 1}
+    source.update()
+    assert source.created == ["s2", "s4"]
+    assert {c.args[0] for c in scheduler.remove_job.call_args_list} == {"s1:a", "s1:b", "s2:a", "s2:b"}
+    assert source.sync_stats[:5] == (3, 6, 1, 1, 1)
+
+
 @pytest.mark.unit
 def test_runtime_executor_adds_runtime(run_time_executor, submit_job_mock):
     job = Mock()
@@ -63,7 +63,6 @@ import base64
 import uuid
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from unittest.mock import patch
 from uuid import UUID
 
 import pytest
@@ -92,7 +91,6 @@ from common.entities import (
     InstanceRule,
     InstanceRuleAction,
     InstanceSet,
-    InstancesInstanceSets,
     Journey,
     JourneyDagEdge,
     Organization,
@@ -118,6 +116,7 @@ from common.entities import (
     UserRole,
 )
 from common.entities.agent import AgentStatus
+from common.entities.instance import INSTANCE_SET_CACHE
 from conf import init_db
 
 AGENT_ID: UUID = UUID("fdcf7927-a43e-41ad-b8eb-e45d7b1a4d1a")
@@ -380,29 +379,10 @@ def instance_instance_set(instance, patched_instance_set):
 
 @pytest.fixture()
 def patched_instance_set(test_db):
-    def sqlite_get_or_create(instance_ids):
-        if not instance_ids:
-            raise ValueError()
-
-        is_query = (
-            InstanceSet.select(InstanceSet, InstancesInstanceSets)
-            .join(InstancesInstanceSets)
-            .where(InstancesInstanceSets.instance << instance_ids)
-        )
-
-        for instance_set in is_query:
-            if set(iis.instance_id for iis in instance_set.iis) == {*instance_ids}:
-                return instance_set
-
-        new_instance_set = InstanceSet.create()
-        InstancesInstanceSets.bulk_create(
-            [InstancesInstanceSets(instance=instance_id, instance_set=new_instance_set) for instance_id in instance_ids]
-        )
-        return new_instance_set
-
-    with patch("common.entities.instance.InstanceSet.get_or_create") as mock:
-        mock.side_effect = sqlite_get_or_create
-        yield mock
+    # InstanceSet.get_or_create used to require MySQL and had to be patched; it only needs a clean cache now
+    INSTANCE_SET_CACHE.clear()
+    yield
+    INSTANCE_SET_CACHE.clear()
 
 
 @pytest.fixture()